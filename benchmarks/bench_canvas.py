@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Canvas microbenchmark
+
+Compares the byte-mask Canvas primitives against the previous per-pixel
+loops (kept below as LegacyCanvas). Each primitive is timed on its own,
+plus a "menu frame" that draws what a menu screen draws: a title bar,
+separator, four items with icons and the selection inverted, a scrollbar and a
+progress bar. Text and icons go through the raster cache and sprites in
+Canvas and are drawn pixel by pixel in LegacyCanvas.
+
+Usage:
+    python benchmarks/bench_canvas.py [--frames N] [--min-speedup X]
+
+Exits non-zero if the menu frame speedup is below --min-speedup (default 3).
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from g13_linux.lcd.canvas import Canvas  # noqa: E402
+from g13_linux.lcd.fonts import FONT_5X7  # noqa: E402
+from g13_linux.lcd.icons import ICON_CLOCK, ICON_SETTINGS  # noqa: E402
+
+
+class LegacyCanvas(Canvas):
+    """The pre-byte-mask primitives: one set_pixel/get_pixel per pixel."""
+
+    def draw_hline(self, x, y, width, on=True):
+        for i in range(width):
+            self.set_pixel(x + i, y, on)
+
+    def draw_vline(self, x, y, height, on=True):
+        for i in range(height):
+            self.set_pixel(x, y + i, on)
+
+    def draw_rect(self, x, y, width, height, filled=False, on=True):
+        if filled:
+            for py in range(height):
+                for px in range(width):
+                    self.set_pixel(x + px, y + py, on)
+        else:
+            self.draw_hline(x, y, width, on)
+            self.draw_hline(x, y + height - 1, width, on)
+            self.draw_vline(x, y, height, on)
+            self.draw_vline(x + width - 1, y, height, on)
+
+    def draw_progress_bar(self, x, y, width, height, percent, filled=True):
+        self.draw_rect(x, y, width, height, filled=False)
+        inner_width = width - 2
+        inner_height = height - 2
+        fill_width = int((percent / 100.0) * inner_width)
+        if filled:
+            self.draw_rect(x + 1, y + 1, fill_width, inner_height, filled=True)
+        else:
+            for py in range(inner_height):
+                for px in range(fill_width):
+                    if (px + py) % 2 == 0:
+                        self.set_pixel(x + 1 + px, y + 1 + py, True)
+
+    def invert_region(self, x, y, width, height):
+        for py in range(height):
+            for px in range(width):
+                current = self.get_pixel(x + px, y + py)
+                self.set_pixel(x + px, y + py, not current)
+
+    def blit(self, other, x, y):
+        for py in range(other.height):
+            for px in range(other.width):
+                if other.get_pixel(px, py):
+                    self.set_pixel(x + px, y + py, True)
+
+    def draw_icon(self, x, y, icon, on=True):
+        for row in range(icon.height):
+            for col in range(icon.width):
+                byte_idx = col + (row // 8) * icon.width
+                if byte_idx >= len(icon.data):
+                    continue
+                pixel_on = bool(icon.data[byte_idx] & (1 << (row % 8)))
+                self.set_pixel(x + col, y + row, pixel_on if on else not pixel_on)
+
+    def draw_text(self, x, y, text, font=None, on=True):
+        font = font or FONT_5X7
+        cursor_x = x
+        for char in text:
+            glyph = font.get_glyph(char)
+            if glyph is None:
+                continue
+            for col_idx, col_data in enumerate(glyph):
+                px = cursor_x + col_idx
+                if px >= self.width:
+                    break
+                for row in range(font.char_height):
+                    py = y + row
+                    if py >= self.height:
+                        continue
+                    if col_data & (1 << row):
+                        self.set_pixel(px, py, on)
+            cursor_x += font.char_width + 1
+            if cursor_x >= self.width:
+                break
+        return cursor_x - x
+
+
+def menu_frame(canvas: Canvas, selected: int, progress: float):
+    """Draw a menu screen the way MenuScreen and its widgets do."""
+    canvas.clear()
+    canvas.draw_rect(0, 0, canvas.width, 9, filled=True)
+    canvas.draw_text(2, 1, "SETTINGS", on=False)
+    canvas.draw_hline(0, 9, canvas.width)
+    for i in range(4):
+        y = 11 + i * 8
+        canvas.draw_icon(4, y, ICON_SETTINGS)
+        canvas.draw_text(14, y, f"Item {i + 1}")
+        if i == selected:
+            canvas.invert_region(0, y - 1, canvas.width - 4, 9)
+    canvas.draw_vline(canvas.width - 2, 10, 33)
+    canvas.draw_rect(canvas.width - 3, 10 + selected * 8, 3, 8, filled=True)
+    canvas.draw_progress_bar(100, 12, 50, 6, progress, filled=False)
+
+
+def random_ops(count: int, seed: int = 13) -> list[tuple]:
+    """Random primitive calls, including ones that clip at the edges."""
+    rng = random.Random(seed)
+    ops = []
+    for _ in range(count):
+        x, y = rng.randint(-10, 165), rng.randint(-10, 48)
+        w, h = rng.randint(0, 60), rng.randint(0, 30)
+        kind = rng.choice(["hline", "vline", "rect", "fill", "clear", "invert", "bar", "dither"])
+        ops.append((kind, x, y, w, h, rng.random() * 100))
+    return ops
+
+
+def apply(canvas: Canvas, op: tuple, sprite: Canvas):
+    kind, x, y, w, h, pct = op
+    if kind == "hline":
+        canvas.draw_hline(x, y, w)
+    elif kind == "vline":
+        canvas.draw_vline(x, y, h)
+    elif kind == "rect":
+        canvas.draw_rect(x, y, w, h)
+    elif kind == "fill":
+        canvas.draw_rect(x, y, w, h, filled=True)
+    elif kind == "clear":
+        canvas.draw_rect(x, y, w, h, filled=True, on=False)
+    elif kind == "invert":
+        canvas.invert_region(x, y, w, h)
+    elif kind == "bar":
+        canvas.draw_progress_bar(x, y, w, h, pct)
+    else:
+        canvas.draw_progress_bar(x, y, w, h, pct, filled=False)
+    canvas.blit(sprite, x, y)
+    canvas.draw_text(x, y + h, f"{kind} {pct:.0f}%", on=w % 2 == 0)
+    canvas.draw_icon(x + w, y - h, ICON_CLOCK, on=h % 2 == 0)
+
+
+def check_equivalent():
+    """Both canvases must produce identical framebuffers."""
+    legacy, fast = LegacyCanvas(), Canvas()
+    legacy_sprite, sprite = LegacyCanvas(12, 10), Canvas(12, 10)
+    for s in (legacy_sprite, sprite):
+        s.draw_line(0, 0, 11, 9)
+        s.draw_rect(2, 2, 5, 5)
+    for op in random_ops(500):
+        apply(legacy, op, legacy_sprite)
+        apply(fast, op, sprite)
+        if legacy.to_bytes() != fast.to_bytes():
+            raise AssertionError(f"Canvases disagree after {op}")
+    for i in range(8):
+        menu_frame(legacy, i % 4, i * 12.5)
+        menu_frame(fast, i % 4, i * 12.5)
+        if legacy.to_bytes() != fast.to_bytes():
+            raise AssertionError(f"Menu frames disagree at step {i}")
+
+
+def bench(fn, number: int) -> float:
+    """Best-of-5 seconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Canvas microbenchmark")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--min-speedup", type=float, default=3.0)
+    args = parser.parse_args()
+
+    check_equivalent()
+
+    cases = [
+        ("invert full screen", lambda c, s: c.invert_region(0, 0, 160, 43)),
+        ("filled rect 80x20", lambda c, s: c.draw_rect(40, 10, 80, 20, filled=True)),
+        ("hline 160", lambda c, s: c.draw_hline(0, 20, 160)),
+        ("vline 43", lambda c, s: c.draw_vline(80, 0, 43)),
+        ("progress bar (dither)", lambda c, s: c.draw_progress_bar(10, 10, 140, 12, 70, False)),
+        ("blit 32x16", lambda c, s: c.blit(s, 64, 13)),
+        ("icon 8x8", lambda c, s: c.draw_icon(75, 17, ICON_CLOCK)),
+        ("text 20 chars", lambda c, s: c.draw_text(3, 21, "Profile: Default FPS")),
+    ]
+    legacy, fast = LegacyCanvas(), Canvas()
+    legacy_sprite, sprite = LegacyCanvas(32, 16), Canvas(32, 16)
+    legacy_sprite.fill()
+    sprite.fill()
+
+    for name, case in cases:
+        old = bench(lambda: case(legacy, legacy_sprite), args.frames)
+        new = bench(lambda: case(fast, sprite), args.frames)
+        print(f"{name:24s} {old * 1e6:9.1f} us -> {new * 1e6:7.1f} us  {old / new:6.1f}x")
+
+    old = bench(lambda: menu_frame(legacy, 1, 40), args.frames)
+    new = bench(lambda: menu_frame(fast, 1, 40), args.frames)
+    speedup = old / new
+    print(f"{'menu frame':24s} {old * 1e6:9.1f} us -> {new * 1e6:7.1f} us  {speedup:6.1f}x")
+
+    if speedup < args.min_speedup:
+        print(f"FAIL: expected at least {args.min_speedup:.0f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
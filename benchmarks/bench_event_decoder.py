@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+EventDecoder microbenchmark
+
+Compares the table-driven EventDecoder against the previous loop-based
+decoder (kept below as LegacyEventDecoder) on a replayed key sequence.
+Each iteration decodes one report and diffs it against the previous one,
+which is what the daemon does for every HID report. The "reused state"
+row decodes into one G13ButtonState via decode_report(out=...), as the
+report bus does.
+
+Usage:
+    python benchmarks/bench_event_decoder.py [--reports N] [--min-speedup X]
+
+Exits non-zero if the speedup is below --min-speedup (default 10).
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from g13_linux.gui.models.event_decoder import EventDecoder, G13ButtonState  # noqa: E402
+
+
+@dataclass
+class LegacyButtonState:
+    g_buttons: int
+    m_buttons: int
+    joystick_x: int
+    joystick_y: int
+    raw_data: bytes
+
+
+class LegacyEventDecoder:
+    """The pre-table decoder: BUTTON_MAP scans and set-based diffs."""
+
+    BUTTON_MAP = EventDecoder.BUTTON_MAP
+    OTHER_BUTTONS = ["BD", "L1", "L2", "L3", "L4", "MR", "LEFT", "DOWN", "STICK"]
+
+    def __init__(self):
+        self.last_state = None
+
+    def decode_report(self, data):
+        if isinstance(data, list):
+            data = bytes(data)
+        if len(data) < 8:
+            raise ValueError(f"Expected at least 8 bytes, got {len(data)}")
+        return LegacyButtonState(
+            g_buttons=self._decode_buttons(data, "G", 22),
+            m_buttons=self._decode_buttons(data, "M", 3),
+            joystick_x=data[1],
+            joystick_y=data[2],
+            raw_data=data,
+        )
+
+    def _decode_buttons(self, data, prefix, count):
+        result = 0
+        for button_name, (byte_idx, bit_pos) in self.BUTTON_MAP.items():
+            if button_name.startswith(prefix) and len(button_name) > 1:
+                try:
+                    button_num = int(button_name[1:])
+                    if 1 <= button_num <= count:
+                        if data[byte_idx] & (1 << bit_pos):
+                            result |= 1 << button_num
+                except (ValueError, IndexError):
+                    pass
+        return result
+
+    def get_pressed_buttons(self, state):
+        pressed = [f"G{i}" for i in range(1, 23) if state.g_buttons & (1 << i)]
+        pressed.extend(f"M{i}" for i in range(1, 4) if state.m_buttons & (1 << i))
+        if state.raw_data and len(state.raw_data) >= 8:
+            for button_name in self.OTHER_BUTTONS:
+                byte_idx, bit_pos = self.BUTTON_MAP[button_name]
+                if state.raw_data[byte_idx] & (1 << bit_pos):
+                    pressed.append(button_name)
+        return pressed
+
+    def get_button_changes(self, new_state):
+        if self.last_state is None:
+            pressed = self.get_pressed_buttons(new_state)
+            self.last_state = new_state
+            return (pressed, [])
+        old_pressed = set(self.get_pressed_buttons(self.last_state))
+        new_pressed = set(self.get_pressed_buttons(new_state))
+        self.last_state = new_state
+        return (list(new_pressed - old_pressed), list(old_pressed - new_pressed))
+
+
+def make_reports(count: int, seed: int = 13) -> list[bytes]:
+    """Typing-like sequence: single presses/releases with stick jitter."""
+    rng = random.Random(seed)
+    buttons = list(EventDecoder.BUTTON_MAP.values())
+    held: set[tuple[int, int]] = set()
+    reports = []
+    for _ in range(count):
+        if held and rng.random() < 0.5:
+            held.discard(rng.choice(sorted(held)))
+        else:
+            held.add(rng.choice(buttons))
+        data = bytearray(
+            [0x01, 128 + rng.randint(-3, 3), 128 + rng.randint(-3, 3), 0, 0, 0x80, 0, 0]
+        )
+        for byte_idx, bit_pos in held:
+            data[byte_idx] |= 1 << bit_pos
+        reports.append(bytes(data))
+    return reports
+
+
+def check_equivalent(reports: list[bytes]):
+    """Both decoders must produce the same events for the sequence."""
+    legacy = LegacyEventDecoder()
+    table = EventDecoder()
+    for data in reports:
+        old_p, old_r = legacy.get_button_changes(legacy.decode_report(data))
+        new_p, new_r = table.diff_buttons(table.decode_report(data))
+        if set(old_p) != set(new_p) or set(old_r) != set(new_r):
+            raise AssertionError(f"Decoders disagree on {data.hex()}")
+
+
+def bench(decoder_cls, reports: list[bytes], diff_name: str, reuse: bool = False) -> float:
+    """Best-of-5 seconds per report."""
+    decoder = decoder_cls()
+    decode = decoder.decode_report
+    diff = getattr(decoder, diff_name)
+    out = G13ButtonState(0, 0, 128, 128)
+
+    def run():
+        if reuse:
+            for data in reports:
+                diff(decode(data, out))
+        else:
+            for data in reports:
+                diff(decode(data))
+
+    best = min(timeit.repeat(run, number=1, repeat=5))
+    return best / len(reports)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="EventDecoder microbenchmark")
+    parser.add_argument("--reports", type=int, default=20000)
+    parser.add_argument("--min-speedup", type=float, default=10.0)
+    args = parser.parse_args()
+
+    reports = make_reports(args.reports)
+    check_equivalent(reports)
+
+    legacy = bench(LegacyEventDecoder, reports, "get_button_changes")
+    table = bench(EventDecoder, reports, "diff_buttons")
+    reused = bench(EventDecoder, reports, "diff_buttons", reuse=True)
+    speedup = legacy / table
+
+    print(f"legacy decoder:               {legacy * 1e6:7.2f} us/report")
+    print(f"table decoder:                {table * 1e6:7.2f} us/report")
+    print(f"table decoder (reused state): {reused * 1e6:7.2f} us/report")
+    print(f"speedup:                      {speedup:7.1f}x")
+
+    if speedup < args.min_speedup:
+        print(f"FAIL: expected at least {args.min_speedup:.0f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Image import microbenchmark
+
+Compares the vectorized image import (g13_linux.lcd.image) against a
+straightforward per-pixel version: getpixel() reads, Floyd-Steinberg
+error diffusion in Python and one Canvas.set_pixel() per pixel. Both
+scale the same 640x480 RGB test image to the 160x43 screen with Pillow;
+the conversion of the scaled image to a framebuffer is also timed alone.
+
+Requires numpy.
+
+Usage:
+    python benchmarks/bench_image.py [--frames N] [--min-speedup X]
+
+Exits non-zero if the Floyd-Steinberg conversion speedup is below
+--min-speedup (default 10).
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from g13_linux.lcd.array_canvas import pack_pixels  # noqa: E402
+from g13_linux.lcd.canvas import Canvas  # noqa: E402
+from g13_linux.lcd.image import (  # noqa: E402
+    DitherMode,
+    apply_dither,
+    image_to_frame,
+    prepare_image,
+)
+
+
+def test_image() -> Image.Image:
+    """Gradient background with shapes, like a logo on artwork."""
+    image = Image.linear_gradient("L").resize((640, 480)).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((200, 100, 440, 380), fill=(255, 200, 0))
+    draw.rectangle((40, 40, 160, 440), fill=(0, 0, 90))
+    return image
+
+
+def legacy_import(image: Image.Image, mode: DitherMode) -> bytes:
+    """Per-pixel import into a Canvas."""
+    return legacy_convert(prepare_image(image, 160, 43), mode)
+
+
+def legacy_convert(gray: Image.Image, mode: DitherMode) -> bytes:
+    """Per-pixel conversion of a scaled grayscale image."""
+    values = [[float(gray.getpixel((x, y))) for x in range(160)] for y in range(43)]
+    canvas = Canvas()
+    for y in range(43):
+        for x in range(160):
+            old = values[y][x]
+            on = old >= 128
+            canvas.set_pixel(x, y, on)
+            if mode is not DitherMode.FLOYD_STEINBERG:
+                continue
+            error = old - (255 if on else 0)
+            if x + 1 < 160:
+                values[y][x + 1] += error * 7 / 16
+            if y + 1 < 43:
+                if x > 0:
+                    values[y + 1][x - 1] += error * 3 / 16
+                values[y + 1][x] += error * 5 / 16
+                if x + 1 < 160:
+                    values[y + 1][x + 1] += error * 1 / 16
+    return canvas.to_bytes()
+
+
+def bench(func, frames: int) -> float:
+    """Average seconds per call."""
+    return timeit.timeit(func, number=frames) / frames
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Image import microbenchmark")
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--min-speedup", type=float, default=10.0)
+    args = parser.parse_args()
+
+    image = test_image()
+    # Thresholding has no diffusion to disagree on, so outputs must match
+    threshold = image_to_frame(image, dither=DitherMode.THRESHOLD)
+    assert legacy_import(image, DitherMode.THRESHOLD) == threshold
+
+    gray = prepare_image(image, 160, 43)
+    speedup = 0.0
+    for mode in (DitherMode.THRESHOLD, DitherMode.FLOYD_STEINBERG):
+        old = bench(lambda: legacy_import(image, mode), args.frames)
+        new = bench(lambda: image_to_frame(image, dither=mode), args.frames)
+        name = f"import ({mode.value})"
+        print(f"{name:32s} {old * 1e3:8.2f} ms -> {new * 1e3:6.2f} ms  {old / new:6.1f}x")
+
+        old = bench(lambda: legacy_convert(gray, mode), args.frames)
+        new = bench(lambda: pack_pixels(apply_dither(np.asarray(gray), mode)), args.frames)
+        speedup = old / new
+        name = f"convert ({mode.value})"
+        print(f"{name:32s} {old * 1e3:8.2f} ms -> {new * 1e3:6.2f} ms  {speedup:6.1f}x")
+
+    if speedup < args.min_speedup:
+        print(f"FAIL: expected at least {args.min_speedup:.0f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+LED effect frame microbenchmark
+
+Compares table-driven effects (g13_linux.led.effects) against the previous
+per-frame versions, which called math.sin / hsv_to_rgb and built new RGB
+instances every frame. Also counts the distinct RGB objects one effect
+period yields: the table versions reuse their prebuilt colors.
+
+Usage:
+    python benchmarks/bench_led_effects.py [--frames N] [--min-speedup X]
+
+Exits non-zero if the pulse speedup is below --min-speedup (default 3).
+"""
+
+import argparse
+import math
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from g13_linux.led.colors import RGB, dim, hsv_to_rgb  # noqa: E402
+from g13_linux.led.effects import pulse, rainbow  # noqa: E402
+
+
+class FrameClock:
+    """Frame clock advancing 1/30 s per read."""
+
+    def __init__(self):
+        self.frame = 0
+
+    def __call__(self) -> float:
+        self.frame += 1
+        return self.frame / 30
+
+
+def legacy_pulse(color: RGB, speed: float, clock):
+    """Per-frame pulse: sine and dim() every frame."""
+    start_time = clock()
+    while True:
+        elapsed = clock() - start_time
+        phase = (math.sin(elapsed * speed * 2 * math.pi) + 1) / 2
+        yield dim(color, 1.0 - (0.2 + phase * 0.8))
+
+
+def legacy_rainbow(speed: float, clock):
+    """Per-frame rainbow: hsv_to_rgb() every frame."""
+    start_time = clock()
+    while True:
+        hue = ((clock() - start_time) * speed) % 1.0
+        yield hsv_to_rgb(hue, 1.0, 1.0)
+
+
+def per_frame(generator, frames: int) -> float:
+    """Average seconds per frame."""
+    step = generator.__next__
+    return timeit.timeit(step, number=frames) / frames
+
+
+def distinct_objects(generator, frames: int) -> int:
+    """Distinct color objects among the yielded frames."""
+    return len({id(color) for color in [next(generator) for _ in range(frames)]})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="LED effect frame microbenchmark")
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--min-speedup", type=float, default=3.0)
+    args = parser.parse_args()
+
+    blue = RGB(0, 0, 255)
+    cases = {
+        "pulse": (
+            lambda: legacy_pulse(blue, 1.0, FrameClock()),
+            lambda: pulse(blue, 1.0, clock=FrameClock()),
+        ),
+        "rainbow": (
+            lambda: legacy_rainbow(1.0, FrameClock()),
+            lambda: rainbow(1.0, clock=FrameClock()),
+        ),
+    }
+
+    speedups = {}
+    for name, (make_old, make_new) in cases.items():
+        old = per_frame(make_old(), args.frames)
+        new = per_frame(make_new(), args.frames)
+        speedups[name] = old / new
+        print(f"{name:10s} {old * 1e6:6.2f} us -> {new * 1e6:5.2f} us  {old / new:5.1f}x")
+        old_objects = distinct_objects(make_old(), 300)
+        new_objects = distinct_objects(make_new(), 300)
+        print(f"{'':10s} RGB objects in 300 frames: {old_objects} -> {new_objects}")
+
+    if speedups["pulse"] < args.min_speedup:
+        print(f"FAIL: expected at least {args.min_speedup:.0f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
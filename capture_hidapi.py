@@ -2,30 +2,21 @@
 """
 G13 Button Capture Tool
 
-Captures raw HID reports from the G13 device for reverse engineering button mappings.
-Uses direct hidraw access which works with standard udev rules.
+Prints raw HID reports from the G13 for reverse engineering button
+mappings, and can record them for replay at the same time.
+
+Thin wrapper around g13_linux.capture (see also `g13-linux capture`).
+
+Usage:
+    python capture_hidapi.py [--output FILE.g13cap] [--libusb]
 """
 
-import glob
-import os
-import select
+import argparse
 import sys
 import time
 
-
-def find_g13_hidraw():
-    """Find the hidraw device path for the G13."""
-    for hidraw in glob.glob("/sys/class/hidraw/hidraw*"):
-        uevent_path = os.path.join(hidraw, "device", "uevent")
-        try:
-            with open(uevent_path, "r") as f:
-                content = f.read()
-                if "0000046D" in content.upper() and "0000C21C" in content.upper():
-                    device_name = os.path.basename(hidraw)
-                    return f"/dev/{device_name}"
-        except (IOError, OSError):
-            continue
-    return None
+from g13_linux.capture import CaptureWriter, capture
+from g13_linux.device import open_g13, open_g13_libusb
 
 
 def _print_event(event_count, data, last_data):
@@ -51,61 +42,61 @@ def _print_event(event_count, data, last_data):
                 print(f"  {c}")
 
 
-def _capture_loop(f):
-    """Main capture loop, returns event count."""
-    event_count = 0
-    last_data = None
-
-    while True:
-        ready, _, _ = select.select([f], [], [], 0.1)
-        if ready:
-            data = f.read(64)
-            if data and data != last_data:
-                event_count += 1
-                _print_event(event_count, data, last_data)
-                last_data = data
-
-    return event_count
-
-
 def main():
+    parser = argparse.ArgumentParser(description="Print (and optionally record) G13 reports")
+    parser.add_argument("--output", "-o", help="Also write a replayable capture log")
+    parser.add_argument("--libusb", action="store_true", help="Read via libusb")
+    args = parser.parse_args()
+
     print("=" * 70)
-    print("G13 BUTTON CAPTURE - Direct hidraw access")
+    print("G13 BUTTON CAPTURE")
     print("=" * 70)
 
-    hidraw_path = find_g13_hidraw()
-    if not hidraw_path:
-        print("ERROR: No G13 device found!")
+    try:
+        device = open_g13_libusb() if args.libusb else open_g13()
+    except PermissionError:
+        print("ERROR: Permission denied opening the G13")
+        print("Install the udev rules from udev/99-logitech-g13.rules")
+        sys.exit(1)
+    except Exception as e:
+        print(f"ERROR: No G13 device found ({e})")
         print("Make sure your G13 is connected and udev rules are installed.")
         sys.exit(1)
 
-    print(f"\nFound G13 at: {hidraw_path}")
+    print("Device opened successfully!")
+    print("\n" + "=" * 70)
+    print("INSTRUCTIONS:")
+    print("  1. Press each G-key (G1-G22) one at a time")
+    print("  2. Press M1, M2, M3 keys")
+    print("  3. Move the joystick")
+    print("  4. Press the joystick button (if any)")
+    print("  5. Press Ctrl+C when done")
+    print("=" * 70)
+    print("\nWaiting for button presses...")
+    print("-" * 70)
 
-    try:
-        f = open(hidraw_path, "rb")
-        print("Device opened successfully!")
-        print("\n" + "=" * 70)
-        print("INSTRUCTIONS:")
-        print("  1. Press each G-key (G1-G22) one at a time")
-        print("  2. Press M1, M2, M3 keys")
-        print("  3. Move the joystick")
-        print("  4. Press the joystick button (if any)")
-        print("  5. Press Ctrl+C when done")
-        print("=" * 70)
-        print("\nWaiting for button presses...")
-        print("-" * 70)
+    state = {"count": 0, "last": None}
+
+    def on_report(_timestamp_ns, data):
+        # Only show reports that differ from the previous one
+        if data != state["last"]:
+            state["count"] += 1
+            _print_event(state["count"], data, state["last"])
+            state["last"] = data
 
-        event_count = _capture_loop(f)
+    writer = CaptureWriter(args.output) if args.output else None
+    try:
+        capture(device, writer, on_report=on_report)
     except KeyboardInterrupt:
         print(f"\n\n{'=' * 70}")
-        print(f"Capture complete. Total events: {event_count}")
+        print(f"Capture complete. Total events: {state['count']}")
+        if writer:
+            print(f"Recorded {writer.count} reports to {args.output}")
         print("=" * 70)
-    except PermissionError:
-        print(f"ERROR: Permission denied for {hidraw_path}")
-        print("Run: sudo chmod 666 " + hidraw_path)
-        print("Or install the udev rules from udev/99-logitech-g13.rules")
     finally:
-        f.close()
+        if writer:
+            writer.close()
+        device.close()
 
     print("\nDone!")
 
@@ -0,0 +1,296 @@
+"""
+HID Report Capture and Replay
+
+Records raw G13 input reports with monotonic nanosecond timestamps into a
+compact binary log, and plays logs back through ReplayDevice, a stand-in
+for HidrawDevice/LibUSBDevice. Replaying a capture runs the full daemon
+pipeline (decoder, mapper, menu, broadcasts) without a G13 attached, for
+benchmarks, profiling and reproducing field issues.
+
+Log format (little endian):
+    header: 8-byte magic b"G13CAP\\x00\\x01"
+    record: u64 timestamp_ns, u16 length, then length report bytes
+
+Timestamps come from CLOCK_MONOTONIC, taken as soon as the read returns.
+Only differences between them are meaningful.
+"""
+
+import logging
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"G13CAP\x00\x01"
+_RECORD = struct.Struct("<QH")
+
+
+class CaptureFormatError(ValueError):
+    """Raised when a file is not a valid G13 capture log."""
+
+
+class CaptureWriter:
+    """Appends timestamped reports to a capture log."""
+
+    def __init__(self, path: str | Path):
+        """
+        Create (or truncate) a capture log.
+
+        Args:
+            path: Output file path
+        """
+        self.path = Path(path)
+        self._file: BinaryIO = open(self.path, "wb")
+        self._file.write(MAGIC)
+        self.count = 0
+
+    def write(self, data, timestamp_ns: int | None = None):
+        """
+        Append one report.
+
+        Args:
+            data: Raw report (bytes, bytearray, memoryview or list)
+            timestamp_ns: Monotonic timestamp (default: now)
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        if isinstance(data, list):
+            data = bytes(data)
+        self._file.write(_RECORD.pack(timestamp_ns, len(data)))
+        self._file.write(data)
+        self.count += 1
+
+    def close(self):
+        """Flush and close the log."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_capture(path: str | Path) -> Iterator[tuple[int, bytes]]:
+    """
+    Iterate over the reports in a capture log.
+
+    Args:
+        path: Capture file path
+
+    Yields:
+        (timestamp_ns, report bytes) in recorded order
+
+    Raises:
+        CaptureFormatError: If the header is wrong or a record is truncated
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise CaptureFormatError(f"Not a G13 capture log: {path}")
+
+        while True:
+            header = f.read(_RECORD.size)
+            if not header:
+                return
+            if len(header) < _RECORD.size:
+                raise CaptureFormatError(f"Truncated record header in {path}")
+            timestamp_ns, length = _RECORD.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                raise CaptureFormatError(f"Truncated record in {path}")
+            yield timestamp_ns, data
+
+
+def capture(
+    device,
+    writer: CaptureWriter | None = None,
+    on_report: Callable[[int, bytes], None] | None = None,
+    duration: float | None = None,
+    stop: threading.Event | None = None,
+    timeout_ms: int = 100,
+) -> int:
+    """
+    Read reports from a device until stopped, recording each one.
+
+    Args:
+        device: Handle with readinto(buf, timeout_ms=...) (HidrawDevice,
+            LibUSBDevice or ReplayDevice)
+        writer: Capture log to append to (optional)
+        on_report: Called with (timestamp_ns, data) for each report
+        duration: Stop after this many seconds (None runs until stop)
+        stop: Event that ends the capture when set
+        timeout_ms: Read timeout, bounds how late stop/duration are noticed
+
+    Returns:
+        Number of reports captured
+    """
+    slot = bytearray(64)
+    view = memoryview(slot)
+    deadline = None if duration is None else time.monotonic() + duration
+    count = 0
+
+    while not (stop and stop.is_set()):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        n = device.readinto(slot, timeout_ms=timeout_ms)
+        if not n:
+            continue
+        timestamp_ns = time.monotonic_ns()
+        data = view[:n]
+        if writer:
+            writer.write(data, timestamp_ns)
+        if on_report:
+            on_report(timestamp_ns, bytes(data))
+        count += 1
+
+    return count
+
+
+class ReplayDevice:
+    """
+    Plays a capture log back through the device handle interface.
+
+    Supports read()/readinto() like HidrawDevice, and accepts output
+    reports, feature reports and LCD writes so the daemon's hardware
+    controllers work unchanged. Reports are released on the recorded
+    schedule divided by speed; speed 0 replays as fast as possible.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        speed: float = 1.0,
+        loop: bool = False,
+        on_end: Callable[[], None] | None = None,
+    ):
+        """
+        Load a capture log.
+
+        Args:
+            path: Capture file path
+            speed: Playback speed multiplier (1.0 = real time, 0 = no delays)
+            loop: Start over after the last report instead of ending
+            on_end: Called once when the last report has been read
+
+        Raises:
+            CaptureFormatError: If the log is invalid
+        """
+        if speed < 0:
+            raise ValueError("speed must be >= 0")
+        self.path = Path(path)
+        self.speed = speed
+        self.loop = loop
+        self.on_end = on_end
+        self._records = list(read_capture(self.path))
+        self._index = 0
+        self._start: float | None = None
+        self.finished = threading.Event()
+
+        # Statistics / output captured for inspection
+        self.reports_read = 0
+        self.writes = 0
+        self.feature_report_count = 0
+        self.last_feature_report: bytes | None = None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def open(self):
+        """Rewind to the first report."""
+        self._index = 0
+        self._start = None
+        self.finished.clear()
+
+    def close(self):
+        """Stop playback."""
+        self._index = len(self._records)
+        self.loop = False
+
+    def _next_due(self) -> float:
+        """Seconds until the next report is due (<= 0 if it is ready)."""
+        if not self.speed:
+            return 0.0
+        now = time.monotonic()
+        first_ns = self._records[0][0]
+        if self._start is None:
+            self._start = now
+        offset = (self._records[self._index][0] - first_ns) / 1e9 / self.speed
+        return self._start + offset - now
+
+    def _end(self):
+        """Handle running past the last report."""
+        if self.loop and self._records:
+            self._index = 0
+            self._start = None
+            return
+        if not self.finished.is_set():
+            self.finished.set()
+            if self.on_end:
+                self.on_end()
+
+    def readinto(self, buf, timeout_ms=None) -> int:
+        """
+        Copy the next report into buf once it is due.
+
+        Args:
+            buf: Writable buffer of at least the report size
+            timeout_ms: Maximum wait in milliseconds (None returns
+                immediately, negative waits until the report is due)
+
+        Returns:
+            Number of bytes written into buf (0 if nothing was due)
+        """
+        if self._index >= len(self._records):
+            self._end()
+            if self._index >= len(self._records):
+                if timeout_ms:
+                    time.sleep(max(timeout_ms, 0) / 1000)
+                return 0
+
+        wait = self._next_due()
+        if wait > 0:
+            if timeout_ms is None:
+                return 0
+            if 0 <= timeout_ms < wait * 1000:
+                time.sleep(timeout_ms / 1000)
+                return 0
+            time.sleep(wait)
+
+        data = self._records[self._index][1]
+        self._index += 1
+        self.reports_read += 1
+        n = len(data)
+        buf[:n] = data
+        return n
+
+    def read(self, size=64, timeout_ms=None):
+        """
+        Read the next report once it is due.
+
+        Returns:
+            List of bytes, or None if no report was due
+        """
+        buf = bytearray(size)
+        n = self.readinto(buf, timeout_ms=timeout_ms)
+        return list(buf[:n]) if n else None
+
+    def write(self, data):
+        """Accept an output report (e.g. an LCD frame)."""
+        self.writes += 1
+        return len(data)
+
+    def send_feature_report(self, data):
+        """Accept a feature report (e.g. backlight color)."""
+        self.feature_report_count += 1
+        self.last_feature_report = bytes(data)
+        return len(data)
+
+    def get_feature_report(self, report_id, size):
+        """Return an all-zero feature report."""
+        buf = bytearray(size)
+        buf[0] = report_id
+        return bytes(buf)
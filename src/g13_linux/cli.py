@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 
 from . import __version__
 
@@ -63,14 +64,75 @@ def cmd_run(args):
         server_port = getattr(args, "server_port", 8765)
         static_dir = getattr(args, "static_dir", None)
 
+        replay = None
+        output = None
+        replay_path = getattr(args, "replay", None)
+        if replay_path:
+            from .capture import CaptureFormatError, ReplayDevice
+            from .uinput_service import RecordingOutput
+
+            try:
+                replay = ReplayDevice(replay_path, speed=getattr(args, "speed", 1.0))
+            except (OSError, CaptureFormatError, ValueError) as e:
+                print(f"Error: Could not load capture: {e}", file=sys.stderr)
+                sys.exit(1)
+            print(f"Replaying {len(replay)} reports from {replay_path}")
+            if not getattr(args, "inject", False):
+                # Record mapped keys instead of typing them into the session
+                output = RecordingOutput()
+
         print("Starting G13 daemon...")
         daemon = G13Daemon(
             enable_server=enable_server,
             server_host=server_host,
             server_port=server_port,
             static_dir=static_dir,
+            device=replay,
+            output=output,
         )
+        if replay is None:
+            daemon.run()
+            return
+
+        replay.on_end = daemon.request_stop
+        start = time.perf_counter()
         daemon.run()
+        elapsed = time.perf_counter() - start
+        rate = replay.reports_read / elapsed if elapsed else 0.0
+        print(f"Replayed {replay.reports_read} reports in {elapsed:.3f}s ({rate:.0f} reports/s)")
+        if output is not None:
+            print(f"Recorded {len(output.events)} key events (not injected)")
+
+
+def cmd_capture(args):
+    """Record raw HID reports to a capture log."""
+    from .capture import CaptureWriter, capture
+    from .device import open_g13, open_g13_libusb
+
+    try:
+        device = open_g13_libusb() if args.libusb else open_g13()
+    except Exception as e:
+        print(f"Error: Could not open G13: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    def show(timestamp_ns, data):
+        print(f"{timestamp_ns / 1e9:.6f}  {data.hex(' ')}")
+
+    limit = f" for {args.duration:g}s" if args.duration else ""
+    print(f"Capturing to {args.output}{limit}. Ctrl+C to stop.")
+    with CaptureWriter(args.output) as writer:
+        try:
+            capture(
+                device,
+                writer,
+                on_report=None if args.quiet else show,
+                duration=args.duration,
+            )
+        except KeyboardInterrupt:
+            pass
+        finally:
+            device.close()
+    print(f"\nCaptured {writer.count} reports to {args.output}")
 
 
 def cmd_lcd(args):
@@ -388,8 +450,45 @@ def main():
         "--static-dir",
         help="Directory for web GUI static files (default: auto-detect)",
     )
+    run_parser.add_argument(
+        "--replay",
+        metavar="CAPTURE",
+        help="Feed the daemon from a capture log instead of the G13 (exits at the end)",
+    )
+    run_parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Replay speed multiplier; 0 replays as fast as possible (default: 1.0)",
+    )
+    run_parser.add_argument(
+        "--inject",
+        action="store_true",
+        help="With --replay, type the mapped keys into the session through uinput",
+    )
     run_parser.set_defaults(func=cmd_run)
 
+    # capture command
+    capture_parser = subparsers.add_parser(
+        "capture", help="Record raw HID reports to a replayable capture log"
+    )
+    capture_parser.add_argument("output", help="Capture file to write")
+    capture_parser.add_argument(
+        "--duration",
+        "-d",
+        type=float,
+        help="Stop after this many seconds (default: until Ctrl+C)",
+    )
+    capture_parser.add_argument(
+        "--libusb",
+        action="store_true",
+        help="Read via libusb (needed while hid-generic holds the input reports)",
+    )
+    capture_parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Don't print each report"
+    )
+    capture_parser.set_defaults(func=cmd_capture)
+
     # lcd command
     lcd_parser = subparsers.add_parser("lcd", help="Control the LCD display")
     lcd_parser.add_argument("text", nargs="*", help="Text to display")
@@ -21,13 +21,16 @@ from .hardware.backlight import G13Backlight
 from .hardware.lcd import G13LCD
 from .input.handler import InputHandler
 from .input.navigation import NavigationController
+from .input.report_bus import DecodedReport, ReportBus
 from .led.controller import LEDController
+from .led.reactive import InputActivity
 from .mapper import G13Mapper
 from .menu.manager import ScreenManager
 from .menu.screen import InputEvent
 from .menu.screens.idle import IdleScreen
 from .server import G13Server
 from .settings import SettingsManager
+from .uinput_service import RecordingOutput, UInputService
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +40,13 @@ class G13Daemon:
     Main daemon for G13 device control.
 
     Coordinates:
-    - Key input reading and mapping
+    - Key input reading (single ReportBus reader) and mapping
     - LCD menu system with thumbstick navigation
     - LED backlight effects
     - Profile management
     """
 
-    # Update intervals
+    # Render loop: frame rate cap (the loop otherwise sleeps until needed)
     RENDER_FPS = 20
     RENDER_INTERVAL = 1.0 / RENDER_FPS
 
@@ -53,6 +56,8 @@ class G13Daemon:
         server_host: str = "127.0.0.1",
         server_port: int = 8765,
         static_dir: str | None = None,
+        device=None,
+        output: UInputService | RecordingOutput | None = None,
     ):
         """
         Initialize daemon (does not connect to device yet).
@@ -62,29 +67,43 @@ class G13Daemon:
             server_host: Host to bind server to
             server_port: Port for server
             static_dir: Directory for web GUI static files (default: auto-detect)
+            device: Device handle to use instead of opening the G13
+                (e.g. a capture.ReplayDevice)
+            output: Output for mapped keys instead of a new UInputService
+                (e.g. a RecordingOutput, so a replay types nothing)
         """
+        self._source_device = device
+        self._output = output
         self._device = None
         self._mapper: G13Mapper | None = None
+        self._uinput: UInputService | RecordingOutput | None = None
         self._lcd: G13LCD | None = None
         self._backlight: G13Backlight | None = None
         self._led_controller: LEDController | None = None
         self._screen_manager: ScreenManager | None = None
         self._input_handler: InputHandler | None = None
         self._nav_controller: NavigationController | None = None
+        self._report_bus: ReportBus | None = None
 
         self._running = False
+        # Set once stop() has cleaned up; _running only ends the main loop
+        self._stopped = False
+        self._stop_lock = threading.Lock()
         self._render_thread: threading.Thread | None = None
         self._server_thread: threading.Thread | None = None
         self._start_time: datetime | None = None
         self._key_count = 0
 
-        # Event decoder for button state tracking (WebSocket broadcasts)
+        # Event decoder for button state tracking (shared with the ReportBus)
         self._event_decoder = EventDecoder()
         self._last_joystick = (128, 128)  # Track joystick for change detection
 
         # Mode state (M1, M2, M3)
         self._current_mode = "M1"
 
+        # Key activity for reactive lighting (written by the report reader)
+        self._input_activity = InputActivity()
+
         # Server settings
         self._enable_server = enable_server
         self._server_host = server_host
@@ -127,19 +146,27 @@ class G13Daemon:
             True if connection successful
         """
         try:
-            logger.info("Opening G13 device...")
-            self._device = open_g13()
+            if self._source_device is not None:
+                self._source_device.open()
+                self._device = self._source_device
+            else:
+                logger.info("Opening G13 device...")
+                self._device = open_g13()
         except Exception as e:
             logger.error(f"Could not open G13: {e}")
             return False
 
         # Initialize hardware controllers
         self._lcd = G13LCD(self._device)
+        self._lcd.start_writer()
         self._backlight = G13Backlight(self._device)
+        self._backlight.start_writer()
         self._led_controller = LEDController(backlight=self._backlight)
 
         # Initialize mapper for key translation
-        self._mapper = G13Mapper()
+        self._uinput = self._output or UInputService()
+        self._mapper = G13Mapper(output=self._uinput)
+        self._require_profile_keys()
 
         # Initialize screen manager with LCD
         self._screen_manager = ScreenManager(lcd=self._lcd)
@@ -161,8 +188,15 @@ class G13Daemon:
         # Setup M-key profile callbacks
         self._setup_mkey_callbacks()
 
-        # Initialize input handler
-        self._input_handler = InputHandler(self._device, self._on_input_event)
+        # Single reader: decode each report once and fan it out
+        self._setup_report_bus()
+
+        # Reactive lighting subscribes its lock-free counters to the bus
+        if self.settings_manager.led_reactive:
+            self._led_controller.enable_reactive(self._input_activity, bus=self._report_bus)
+
+        # Initialize input handler (consumes decoded reports from the bus)
+        self._input_handler = InputHandler(self._device, self._on_input_event, bus=self._report_bus)
 
         # Load default profile if available
         self._load_default_profile()
@@ -170,6 +204,15 @@ class G13Daemon:
         logger.info("G13 daemon initialized")
         return True
 
+    def _setup_report_bus(self):
+        """Create the report bus and register the inline subscribers."""
+        self._report_bus = ReportBus(self._device, decoder=self._event_decoder)
+        # Mapper first so key output isn't delayed by other subscribers
+        self._report_bus.subscribe(self._mapper.handle_report)
+        self._report_bus.subscribe(self._count_keys)
+        if self._enable_server:
+            self._report_bus.subscribe(self._broadcast_report)
+
     def _broadcast_device_connected(self):
         """Broadcast device connection to WebSocket clients (called after server starts)."""
         if self._server:
@@ -215,6 +258,10 @@ class G13Daemon:
         old_mode = self._current_mode
         self._current_mode = mode
 
+        # Swap the precompiled mapping layer (releases held keys)
+        if self._mapper:
+            self._mapper.set_mode(mode)
+
         profile_name = "None"
         if self.profile_manager.current_profile:
             profile_name = self.profile_manager.current_profile.name
@@ -227,6 +274,21 @@ class G13Daemon:
 
         logger.info(f"Mode changed: {old_mode} -> {mode}")
 
+    def _require_profile_keys(self):
+        """Create the virtual keyboard with the keys of every saved profile."""
+        from dataclasses import asdict
+
+        keys: set[int] = set()
+        for name in self.profile_manager.list_profiles():
+            try:
+                profile = self.profile_manager.read_profile(name)
+            except Exception as e:
+                logger.warning(f"Could not read profile '{name}': {e}")
+                continue
+            keys |= self._mapper.profile_keycodes(asdict(profile))
+        if keys:
+            self._uinput.require_keys(keys)
+
     def _load_default_profile(self):
         """Load default/first profile if available."""
         profiles = self.profile_manager.list_profiles()
@@ -330,16 +392,10 @@ class G13Daemon:
         )
         print(f"G13 opened. Press stick for menu.{server_msg} Ctrl+C to exit.")
 
-        # Main loop - handle key mapping
+        # Main loop - this thread is the only device reader
         try:
-            while self._running:
-                try:
-                    data = self._device.read(timeout_ms=100)
-                    if data:
-                        self._handle_raw_report(data)
-                except Exception as e:
-                    logger.debug(f"Read error: {e}")
-                    time.sleep(0.01)
+            if self._running:
+                self._report_bus.run()
         except KeyboardInterrupt:
             pass
         finally:
@@ -347,12 +403,17 @@ class G13Daemon:
 
     def _stop_components(self):
         """Stop all daemon components."""
+        if self._report_bus:
+            self._report_bus.stop()
         if self._enable_server:
             self._stop_server()
         if self._input_handler:
             self._input_handler.stop()
         if self._led_controller:
-            self._led_controller.stop_effect()
+            self._led_controller.close()
+        if self._screen_manager:
+            # Let the render loop see _running is False
+            self._screen_manager.request_render()
         if self._render_thread and self._render_thread.is_alive():
             self._render_thread.join(timeout=1.0)
 
@@ -360,11 +421,19 @@ class G13Daemon:
         """Close hardware resources safely."""
         if self._mapper:
             self._mapper.close()
+        if self._uinput:
+            self._uinput.close()
         if self._lcd:
             try:
+                self._lcd.stop_writer()
                 self._lcd.clear()
             except Exception:
                 pass
+        if self._backlight:
+            try:
+                self._backlight.stop_writer()
+            except Exception:
+                pass
         if self._device:
             try:
                 self._device.close()
@@ -372,15 +441,24 @@ class G13Daemon:
                 pass
 
     def stop(self):
-        """Stop the daemon and clean up resources."""
-        if not self._running:
-            return
+        """
+        Stop the daemon and clean up resources.
+
+        Runs once, also after request_stop() already ended the main loop;
+        later calls return immediately.
+        """
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
 
         logger.info("Stopping G13 daemon...")
         self._running = False
 
         self._stop_components()
         self._close_hardware()
+        # Write any mapping edits still waiting for their debounce
+        self.profile_manager.flush()
 
         logger.info("G13 daemon stopped")
         print("\nG13 daemon stopped.")
@@ -430,7 +508,16 @@ class G13Daemon:
 
     def _handle_signal(self, signum, frame):
         """Handle shutdown signals."""
+        self.request_stop()
+
+    def request_stop(self):
+        """
+        Ask the main loop to exit; run() then calls stop() for the full
+        cleanup. Thread-safe, and usable as ReplayDevice.on_end.
+        """
         self._running = False
+        if self._report_bus:
+            self._report_bus.stop()
 
     def _on_input_event(self, event: InputEvent):
         """
@@ -448,37 +535,40 @@ class G13Daemon:
         """
         Handle raw HID report for key mapping and WebSocket broadcasting.
 
-        Passes report to mapper for key translation and broadcasts
-        button events to connected WebSocket clients.
+        Publishes the report on the ReportBus, which decodes it once and
+        delivers it to the mapper, stats, broadcaster and menu input.
 
         Args:
             data: Raw HID report bytes
         """
-        if self._mapper:
-            # Track key presses (rough count based on mapper activity)
-            self._mapper.handle_raw_report(data)
-            self._key_count += 1
+        if self._report_bus:
+            self._report_bus.publish(data)
 
-        # Decode state and broadcast button changes
-        if self._enable_server and self._server:
-            try:
-                state = self._event_decoder.decode_report(data)
-                pressed, released = self._event_decoder.get_button_changes(state)
+    def _count_keys(self, report: DecodedReport):
+        """Stats subscriber: count key presses."""
+        self._key_count += len(report.pressed)
 
-                # Broadcast button events
-                for button in pressed:
-                    self.broadcast_button_event(button, pressed=True)
-                for button in released:
-                    self.broadcast_button_event(button, pressed=False)
+    def _broadcast_report(self, report: DecodedReport):
+        """
+        Broadcast subscriber: forward button changes and joystick moves.
 
-                # Broadcast joystick position if changed significantly
-                joystick = (state.joystick_x, state.joystick_y)
-                if self._joystick_changed(joystick):
-                    self._last_joystick = joystick
-                    self._broadcast_joystick(joystick)
+        Args:
+            report: Decoded report from the ReportBus
+        """
+        if not self._server:
+            return
 
-            except Exception as e:
-                logger.debug(f"Event decode error: {e}")
+        # Broadcast button events
+        for button in report.pressed:
+            self.broadcast_button_event(button, pressed=True)
+        for button in report.released:
+            self.broadcast_button_event(button, pressed=False)
+
+        # Broadcast joystick position if changed significantly
+        joystick = (report.joystick_x, report.joystick_y)
+        if self._joystick_changed(joystick):
+            self._last_joystick = joystick
+            self._broadcast_joystick(joystick)
 
     def _joystick_changed(self, new_pos: tuple[int, int], threshold: int = 5) -> bool:
         """Check if joystick position changed enough to broadcast."""
@@ -495,24 +585,27 @@ class G13Daemon:
             )
 
     def _render_loop(self):
-        """Background thread for LCD rendering."""
-        last_update = time.time()
+        """
+        Background thread for LCD rendering.
+
+        Sleeps until a screen is marked dirty or the next screen deadline
+        (clock tick, toast expiry), then updates and renders once.
+        """
+        scheduler = self._screen_manager.scheduler
+        scheduler.min_interval = self.RENDER_INTERVAL
+        last_update = time.monotonic()
 
         while self._running:
+            scheduler.wait()
+            if not self._running:
+                break
             try:
-                now = time.time()
+                now = time.monotonic()
                 dt = now - last_update
                 last_update = now
 
-                # Update screens
-                if self._screen_manager:
-                    self._screen_manager.update(dt)
-                    self._screen_manager.render()
-
-                # Sleep for target frame time
-                elapsed = time.time() - now
-                sleep_time = max(0, self.RENDER_INTERVAL - elapsed)
-                time.sleep(sleep_time)
+                self._screen_manager.update(dt)
+                self._screen_manager.render()
 
             except Exception as e:
                 logger.error(f"Render error: {e}")
@@ -534,6 +627,9 @@ class G13Daemon:
         """
         Update a single button mapping in the current profile.
 
+        The mapper is patched immediately; the profile file is written
+        by ProfileManager after a short debounce, off the caller's thread.
+
         Args:
             button: Button ID (e.g., "G1", "G22", "LEFT")
             key: Key code string (e.g., "KEY_A") or combo dict
@@ -545,23 +641,10 @@ class G13Daemon:
             logger.warning("No profile loaded - cannot update mapping")
             return False
 
-        profile = self.profile_manager.current_profile
-
-        # Update the mapping
-        profile.mappings[button] = key
+        self.profile_manager.update_mapping(button, key)
 
-        # Save the profile
-        try:
-            self.profile_manager.save_profile(profile, self.profile_manager.current_name)
-        except Exception as e:
-            logger.error(f"Failed to save profile: {e}")
-            return False
-
-        # Reload mappings into mapper
         if self._mapper:
-            from dataclasses import asdict
-
-            self._mapper.load_profile(asdict(profile))
+            self._mapper.update_mapping(button, key)
 
         logger.info(f"Updated mapping: {button} -> {key}")
         return True
@@ -1,6 +1,9 @@
+import array
+import errno
 import fcntl
 import glob
 import os
+import select
 
 G13_VENDOR_ID = 0x046D
 G13_PRODUCT_ID = 0xC21C
@@ -23,22 +26,92 @@ class HidrawDevice:
         self.path = path
         self._fd = None
         self._file = None
+        self._poller = None
 
     def open(self):
         self._file = open(self.path, "rb+", buffering=0)
         self._fd = self._file.fileno()
         os.set_blocking(self._fd, False)
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLIN)
+
+    def fileno(self):
+        """Return the hidraw file descriptor (for select/poll/epoll)."""
+        return self._fd
+
+    def wait_readable(self, timeout_ms=None) -> bool:
+        """
+        Sleep in the kernel until an input report is queued.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds
+                (None or negative waits indefinitely)
+
+        Returns:
+            True if a report is ready, False on timeout
+
+        Raises:
+            OSError: If the device was unplugged or the fd is invalid
+        """
+        if self._poller is None:
+            return True
+
+        events = self._poller.poll(timeout_ms)
+        for _fd, mask in events:
+            if mask & (select.POLLERR | select.POLLHUP | select.POLLNVAL):
+                raise OSError(errno.ENODEV, f"G13 hidraw device lost: {self.path}")
+        return bool(events)
+
+    def read(self, size=64, timeout_ms=None):
+        """
+        Read one input report.
+
+        Args:
+            size: Maximum report size in bytes
+            timeout_ms: If given, block in poll() for up to this many
+                milliseconds until a report arrives (negative waits
+                indefinitely). If None, return immediately.
+
+        Returns:
+            List of bytes, or None if no report was available
+        """
+        if timeout_ms is not None and not self.wait_readable(timeout_ms):
+            return None
 
-    def read(self, size):
         try:
             data = self._file.read(size)
             return list(data) if data else None
         except BlockingIOError:
             return None
 
+    def readinto(self, buf, timeout_ms=None) -> int:
+        """
+        Read one input report into a caller-owned buffer.
+
+        Unlike read(), no list or bytes object is created, so a reader
+        can reuse one preallocated slot for every report.
+
+        Args:
+            buf: Writable buffer (bytearray, memoryview, array) of at
+                least the report size
+            timeout_ms: Same as read()
+
+        Returns:
+            Number of bytes written into buf (0 if no report was available)
+        """
+        if timeout_ms is not None and not self.wait_readable(timeout_ms):
+            return 0
+
+        try:
+            return self._file.readinto(buf) or 0
+        except BlockingIOError:
+            return 0
+
     def write(self, data):
         """Write an output report to the device."""
-        return self._file.write(bytes(data))
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        return self._file.write(data)
 
     def send_feature_report(self, data):
         """
@@ -77,6 +150,12 @@ class HidrawDevice:
 
     def close(self):
         if self._file:
+            if self._poller is not None:
+                try:
+                    self._poller.unregister(self._fd)
+                except (KeyError, ValueError):
+                    pass
+                self._poller = None
             self._file.close()
             self._file = None
             self._fd = None
@@ -109,9 +188,22 @@ def open_g13():
     return device
 
 
-def read_event(handle):
-    """Read a HID report from the device."""
-    data = handle.read(64)
+def read_event(handle, timeout_ms=None):
+    """
+    Read a HID report from the device.
+
+    Args:
+        handle: HidrawDevice or LibUSBDevice
+        timeout_ms: If given, wait up to this many milliseconds for a
+            report instead of returning immediately
+
+    Returns:
+        Report data, or None if nothing arrived
+    """
+    if timeout_ms is None:
+        data = handle.read(64)
+    else:
+        data = handle.read(timeout_ms=timeout_ms)
     return data if data else None
 
 
@@ -133,6 +225,9 @@ class LibUSBDevice:
     def __init__(self):
         self._dev = None
         self._reattach = False
+        # pyusb only reads in place into array.array buffers
+        self._read_buf = array.array("B", bytes(64))
+        self._read_view = memoryview(self._read_buf)
 
     def open(self):
         """Open G13 via libusb, detaching kernel driver."""
@@ -198,6 +293,28 @@ class LibUSBDevice:
         except Exception:
             return None
 
+    def readinto(self, buf, timeout_ms=100) -> int:
+        """
+        Read button/joystick report into a caller-owned buffer.
+
+        The transfer lands in a preallocated array and is copied into
+        buf, so no per-report objects are created.
+
+        Args:
+            buf: Writable buffer of at least the report size
+            timeout_ms: Transfer timeout in milliseconds
+
+        Returns:
+            Number of bytes written into buf (0 on timeout)
+        """
+        try:
+            n: int = self._ep_in.read(self._read_buf, timeout=timeout_ms)
+        except Exception:
+            return 0
+        n = min(n, len(buf))
+        buf[:n] = self._read_view[:n]
+        return n
+
     def write(self, data):
         """
         Write output data (for LCD) via interrupt transfer.
@@ -4,9 +4,11 @@ Application Controller
 Main orchestrator connecting models to views.
 """
 
+from evdev import ecodes
 from PyQt6.QtCore import QObject, pyqtSlot
 from PyQt6.QtWidgets import QMessageBox
 
+from ...uinput_service import UInputService
 from ..dialogs.calibration_dialog import CalibrationDialog
 from ..models.app_profile_rules import AppProfileRulesManager
 from ..models.event_decoder import EventDecoder
@@ -15,7 +17,7 @@ from ..models.global_hotkeys import GlobalHotkeyManager
 from ..models.hardware_controller import HardwareController
 from ..models.joystick_handler import JoystickConfig, JoystickHandler
 from ..models.macro_manager import MacroManager
-from ..models.macro_player import MacroPlayer
+from ..models.macro_player import MacroPlayer, macro_keycodes
 from ..models.macro_recorder import MacroRecorder, RecorderState
 from ..models.profile_manager import ProfileManager
 from ..models.window_monitor import WindowMonitorThread
@@ -36,12 +38,15 @@ class ApplicationController(QObject):
         self.event_decoder = EventDecoder()
         self.hardware = HardwareController()
 
+        # Virtual input devices shared by the joystick handler and macro player
+        self.uinput = UInputService()
+
         # Joystick handler
-        self.joystick_handler = JoystickHandler()
+        self.joystick_handler = JoystickHandler(output=self.uinput)
 
         # Macro system
         self.macro_recorder = MacroRecorder()
-        self.macro_player = MacroPlayer()
+        self.macro_player = MacroPlayer(output=self.uinput)
         self.macro_manager = MacroManager()
         self.hotkey_manager = GlobalHotkeyManager()
 
@@ -101,6 +106,8 @@ class ApplicationController(QObject):
 
         # Macro editor signals - refresh hotkeys when macros are saved
         self.main_window.macro_widget.macro_saved.connect(self._on_macro_saved)
+        # Test playback from the editor uses the shared keyboard too
+        self.main_window.macro_widget.set_output(self.uinput)
 
         # Joystick settings
         self.main_window.joystick_widget.config_changed.connect(self._on_joystick_config_changed)
@@ -484,15 +491,19 @@ class ApplicationController(QObject):
     # Global hotkey methods
 
     def _register_all_macro_hotkeys(self) -> None:
-        """Load all macros and register their hotkeys."""
+        """Load all macros and register their hotkeys and keys."""
         self.hotkey_manager.clear_all()
+        keys: set[int] = set()
         for macro_id in self.macro_manager.list_macros():
             try:
                 macro = self.macro_manager.load_macro(macro_id)
+                keys |= macro_keycodes(macro, ecodes)
                 if macro.global_hotkey:
                     self.hotkey_manager.register_hotkey(macro.global_hotkey, macro.id)
             except FileNotFoundError:
                 pass
+        # One virtual keyboard for every saved macro, created up front
+        self.uinput.require_keys(keys)
 
     @pyqtSlot(str)
     def _on_hotkey_triggered(self, macro_id: str) -> None:
@@ -507,6 +518,8 @@ class ApplicationController(QObject):
     @pyqtSlot(object)
     def _on_macro_saved(self, macro) -> None:
         """Handle macro save - update hotkey registrations."""
+        self.uinput.require_keys(macro_keycodes(macro, ecodes))
+
         # Unregister old hotkey for this macro
         self.hotkey_manager.unregister_macro(macro.id)
 
@@ -579,6 +592,7 @@ class ApplicationController(QObject):
 
         # Stop joystick handler
         self.joystick_handler.stop()
+        self.uinput.close()
 
         # Stop hotkey listener
         self.hotkey_manager.stop()
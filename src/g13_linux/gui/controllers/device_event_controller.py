@@ -6,12 +6,14 @@ Background thread for reading G13 USB events.
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from ...device import LibUSBDevice, read_event
-
 
 class DeviceEventThread(QThread):
     """Background thread for reading device events"""
 
+    # How long a read may sleep waiting for a report before the
+    # running flag is re-checked
+    READ_TIMEOUT_MS = 100
+
     event_received = pyqtSignal(bytes)
     error_occurred = pyqtSignal(str)
 
@@ -19,22 +21,20 @@ class DeviceEventThread(QThread):
         super().__init__()
         self.device_handle = device_handle
         self.running = True
-        # Check if this is a libusb device (has different read method)
-        self._is_libusb = isinstance(device_handle, LibUSBDevice)
+        # Reused read slot (HidrawDevice and LibUSBDevice both support readinto)
+        self._slot = bytearray(64)
+        self._slot_view = memoryview(self._slot)
 
     def run(self):
         """Event loop - runs in background thread"""
         while self.running:
             try:
-                if self._is_libusb:
-                    # LibUSBDevice.read() returns list or None
-                    data = self.device_handle.read(timeout_ms=100)
-                else:
-                    # HidrawDevice via read_event()
-                    data = read_event(self.device_handle)
-
-                if data:
-                    self.event_received.emit(bytes(data))
+                # Sleeps in poll()/the USB transfer until a report arrives
+                n = self.device_handle.readinto(self._slot, timeout_ms=self.READ_TIMEOUT_MS)
+
+                if n:
+                    # Single copy: the signal crosses threads, the slot is reused
+                    self.event_received.emit(bytes(self._slot_view[:n]))
             except Exception as e:
                 self.error_occurred.emit(f"Event read error: {e}")
                 self.running = False
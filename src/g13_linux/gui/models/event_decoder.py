@@ -12,15 +12,21 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class G13ButtonState:
-    """Represents decoded button and joystick states from a USB HID report"""
+    """
+    Represents decoded button and joystick states from a USB HID report.
+
+    Slotted and mutable so a consumer can pass the same instance back to
+    EventDecoder.decode_report(out=...) for every report.
+    """
 
     g_buttons: int  # Bitmask for G1-G22 (bit 1-22)
     m_buttons: int  # Bitmask for M1-M3 (bit 1-3)
     joystick_x: int  # Analog X position (0-255)
     joystick_y: int  # Analog Y position (0-255)
-    raw_data: bytes  # Original raw report for debugging
+    raw_data: bytes = b""  # Raw report, only kept by EventDecoder(keep_raw=True)
+    buttons: Optional[int] = None  # Packed button bytes 3-7 (set by decode_report)
 
 
 class EventDecoder:
@@ -90,111 +96,208 @@ class EventDecoder:
     JOYSTICK_X_BYTE = 1  # Byte 1: X-axis (centered at ~120)
     JOYSTICK_Y_BYTE = 2  # Byte 2: Y-axis (centered at ~127)
 
-    def __init__(self):
+    # Button bytes 3-7 are packed little-endian into one 40-bit integer:
+    # packed bit = (byte_index - 3) * 8 + bit_position
+    FIRST_BUTTON_BYTE = 3
+    LAST_BUTTON_BYTE = 7
+
+    # Packed layout of the G/M bitmasks (must agree with BUTTON_MAP)
+    G_BUTTONS_MASK = 0x3FFFFF  # G1-G22 = packed bits 0-21
+    M_BUTTONS_SHIFT = 29  # M1-M3 = packed bits 29-31 (byte 6 bits 5-7)
+
+    # Buttons to check directly from raw data (not G1-G22 or M1-M3)
+    OTHER_BUTTONS = ["BD", "L1", "L2", "L3", "L4", "MR", "LEFT", "DOWN", "STICK"]
+
+    def __init__(self, keep_raw: bool = False):
+        """
+        Initialize decoder.
+
+        Args:
+            keep_raw: Copy each raw report into state.raw_data (for
+                debugging/monitor tools; costs one bytes object per report)
+        """
+        self.keep_raw = keep_raw
         self.last_state: Optional[G13ButtonState] = None
+        self._last_buttons = 0
+        self._button_mask, self._byte_tables = self._compile_button_tables(self.BUTTON_MAP)
+        self._other_mask = self.button_mask(*self.OTHER_BUTTONS)
+
+    @classmethod
+    def _compile_button_tables(
+        cls, button_map: dict[str, tuple[int, int]]
+    ) -> tuple[int, tuple[tuple[tuple[str, ...], ...], ...]]:
+        """
+        Build the packed button mask and per-byte name lookup tables.
 
-    def decode_report(self, data: Union[bytes, list]) -> G13ButtonState:
+        Entries outside bytes 3-7 or bits 0-7 are ignored.
+
+        Args:
+            button_map: Mapping of button ID to (byte_index, bit_position)
+
+        Returns:
+            (mask of all known button bits, tables) where tables[i][value]
+            is the tuple of button IDs set in packed byte i
+        """
+        bit_names: dict[int, str] = {}
+        for name, (byte_idx, bit_pos) in button_map.items():
+            if cls.FIRST_BUTTON_BYTE <= byte_idx <= cls.LAST_BUTTON_BYTE and 0 <= bit_pos < 8:
+                bit_names[(byte_idx - cls.FIRST_BUTTON_BYTE) * 8 + bit_pos] = name
+
+        mask = 0
+        for bit in bit_names:
+            mask |= 1 << bit
+
+        tables = []
+        for byte_num in range(cls.LAST_BUTTON_BYTE - cls.FIRST_BUTTON_BYTE + 1):
+            names = [bit_names.get(byte_num * 8 + bit) for bit in range(8)]
+            tables.append(
+                tuple(
+                    tuple(
+                        name
+                        for bit, name in enumerate(names)
+                        if name is not None and value & (1 << bit)
+                    )
+                    for value in range(256)
+                )
+            )
+        return mask, tuple(tables)
+
+    @classmethod
+    def button_mask(cls, *button_ids: str) -> int:
+        """
+        Packed bitmask for button IDs from BUTTON_MAP.
+
+        Args:
+            *button_ids: Button IDs (unknown IDs are ignored)
+
+        Returns:
+            Mask to test against G13ButtonState.buttons
+        """
+        mask = 0
+        for name in button_ids:
+            if name in cls.BUTTON_MAP:
+                byte_idx, bit_pos = cls.BUTTON_MAP[name]
+                if cls.FIRST_BUTTON_BYTE <= byte_idx <= cls.LAST_BUTTON_BYTE:
+                    mask |= 1 << ((byte_idx - cls.FIRST_BUTTON_BYTE) * 8 + bit_pos)
+        return mask
+
+    def decode_report(
+        self,
+        data: Union[bytes, bytearray, memoryview, list],
+        out: Optional[G13ButtonState] = None,
+    ) -> G13ButtonState:
         """
         Decode 8-byte HID report into structured data.
 
         Args:
-            data: Raw 8-byte report from device (or padded to 64 bytes)
+            data: Raw 8-byte report from device (or padded to 64 bytes).
+                Any buffer-protocol object is decoded in place.
+            out: State object to overwrite instead of allocating a new one.
+                Only reuse it within a single consumer/thread.
 
         Returns:
-            Decoded button and joystick state
+            Decoded button and joystick state (out, if given)
 
         Raises:
             ValueError: If data is less than 8 bytes
         """
-        # Convert list to bytes if needed
-        if isinstance(data, list):
-            data = bytes(data)
-
         if len(data) < 8:
             raise ValueError(f"Expected at least 8 bytes, got {len(data)}")
 
-        # Decode button states
-        g_buttons = self._decode_g_buttons(data)
-        m_buttons = self._decode_m_buttons(data)
-
-        # Decode joystick (if bytes are within range)
-        joystick_x = data[self.JOYSTICK_X_BYTE] if len(data) > self.JOYSTICK_X_BYTE else 128
-        joystick_y = data[self.JOYSTICK_Y_BYTE] if len(data) > self.JOYSTICK_Y_BYTE else 128
+        # One integer for all buttons; masking drops the byte 5 status bit
+        buttons = int.from_bytes(data[3:8], "little") & self._button_mask
+        g_buttons = (buttons & self.G_BUTTONS_MASK) << 1
+        m_buttons = ((buttons >> self.M_BUTTONS_SHIFT) & 0x7) << 1
+        joystick_x = data[self.JOYSTICK_X_BYTE]
+        joystick_y = data[self.JOYSTICK_Y_BYTE]
 
-        state = G13ButtonState(
-            g_buttons=g_buttons,
-            m_buttons=m_buttons,
-            joystick_x=joystick_x,
-            joystick_y=joystick_y,
-            raw_data=data,
-        )
+        # The caller's buffer may be a reused read slot, so raw data is only
+        # kept (as an immutable copy) when asked for
+        raw_data = b""
+        if self.keep_raw:
+            raw_data = data if isinstance(data, bytes) else bytes(data)
 
         # NOTE: Don't update last_state here - let get_button_changes do it
         # so it can compare old vs new properly
-        return state
-
-    def _decode_g_buttons(self, data: bytes) -> int:
+        if out is None:
+            return G13ButtonState(g_buttons, m_buttons, joystick_x, joystick_y, raw_data, buttons)
+
+        out.g_buttons = g_buttons
+        out.m_buttons = m_buttons
+        out.joystick_x = joystick_x
+        out.joystick_y = joystick_y
+        out.raw_data = raw_data
+        out.buttons = buttons
+        return out
+
+    def _packed_buttons(self, state: G13ButtonState) -> int:
         """
-        Extract G1-G22 button states as bitmask.
+        Get the packed button integer for a state.
 
-        Returns:
-            Integer bitmask where bit N represents button G{N}
+        States from decode_report carry it already; states built by hand
+        are packed from their G/M bitmasks plus the other buttons in raw_data.
         """
-        result = 0
-
-        # STUB IMPLEMENTATION - needs hardware testing
-        # Iterate through BUTTON_MAP to extract bits
-        for button_name, (byte_idx, bit_pos) in self.BUTTON_MAP.items():
-            if button_name.startswith("G") and len(button_name) > 1:
-                try:
-                    button_num = int(button_name[1:])
-                    if 1 <= button_num <= 22:
-                        # Check if bit is set in the specified byte
-                        if data[byte_idx] & (1 << bit_pos):
-                            result |= 1 << button_num
-                except (ValueError, IndexError):
-                    pass
+        if state.buttons is not None:
+            return state.buttons
 
-        return result
+        buttons = (state.g_buttons >> 1) & self.G_BUTTONS_MASK
+        buttons |= ((state.m_buttons >> 1) & 0x7) << self.M_BUTTONS_SHIFT
+        if state.raw_data and len(state.raw_data) >= 8:
+            buttons |= int.from_bytes(state.raw_data[3:8], "little") & self._other_mask
+        return buttons
 
-    def _decode_m_buttons(self, data: bytes) -> int:
+    def buttons_to_ids(self, buttons: int) -> tuple[str, ...]:
         """
-        Extract M1-M3 button states as bitmask.
+        Map set bits of a packed button integer to button IDs.
+
+        Args:
+            buttons: Packed bytes 3-7 (see decode_report)
 
         Returns:
-            Integer bitmask where bit N represents button M{N}
+            Tuple of button IDs in report bit order
         """
-        result = 0
-
-        # STUB IMPLEMENTATION - needs hardware testing
-        for button_name, (byte_idx, bit_pos) in self.BUTTON_MAP.items():
-            if button_name.startswith("M") and len(button_name) > 1:
-                try:
-                    button_num = int(button_name[1:])
-                    if 1 <= button_num <= 3:
-                        if data[byte_idx] & (1 << bit_pos):
-                            result |= 1 << button_num
-                except (ValueError, IndexError):
-                    pass
-
+        if not buttons:
+            return ()
+
+        tables = self._byte_tables
+        low = buttons & 0xFF
+        if buttons == low:
+            return tables[0][low]
+
+        result: tuple[str, ...] = ()
+        for table in tables:
+            value = buttons & 0xFF
+            if value:
+                result += table[value]
+            buttons >>= 8
+            if not buttons:
+                break
         return result
 
-    # Buttons to check directly from raw data (not G1-G22 or M1-M3)
-    OTHER_BUTTONS = ["BD", "L1", "L2", "L3", "L4", "MR", "LEFT", "DOWN", "STICK"]
+    def diff_buttons(self, new_state: G13ButtonState) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """
+        Detect press/release events against the previous state.
+
+        XORs the packed button integers, so the cost depends only on the
+        number of changed bytes. Updates last_state. The previous value is
+        tracked separately, so new_state may be an object reused via
+        decode_report(out=...).
+
+        Args:
+            new_state: New button state
 
-    def _get_bitmask_buttons(self, bitmask: int, prefix: str, count: int) -> List[str]:
-        """Extract pressed button names from a bitmask."""
-        return [f"{prefix}{i}" for i in range(1, count + 1) if bitmask & (1 << i)]
+        Returns:
+            Tuple of (pressed_buttons, released_buttons) as tuples
+        """
+        old = self._last_buttons
+        new = self._packed_buttons(new_state)
+        self._last_buttons = new
+        self.last_state = new_state
 
-    def _get_other_pressed(self, raw_data: bytes) -> List[str]:
-        """Extract pressed 'other' buttons from raw data."""
-        pressed = []
-        for button_name in self.OTHER_BUTTONS:
-            if button_name in self.BUTTON_MAP:
-                byte_idx, bit_pos = self.BUTTON_MAP[button_name]
-                if byte_idx < len(raw_data) and raw_data[byte_idx] & (1 << bit_pos):
-                    pressed.append(button_name)
-        return pressed
+        changed = new ^ old
+        if not changed:
+            return (), ()
+        return self.buttons_to_ids(changed & new), self.buttons_to_ids(changed & old)
 
     def get_pressed_buttons(self, state: G13ButtonState | None = None) -> List[str]:
         """
@@ -211,40 +314,22 @@ class EventDecoder:
         if state is None:
             return []
 
-        pressed = self._get_bitmask_buttons(state.g_buttons, "G", 22)
-        pressed.extend(self._get_bitmask_buttons(state.m_buttons, "M", 3))
-
-        if state.raw_data and len(state.raw_data) >= 8:
-            pressed.extend(self._get_other_pressed(state.raw_data))
-
-        return pressed
+        return list(self.buttons_to_ids(self._packed_buttons(state)))
 
     def get_button_changes(self, new_state: G13ButtonState) -> Tuple[List[str], List[str]]:
         """
         Compare with previous state to detect button press/release events.
 
+        List-returning wrapper around diff_buttons().
+
         Args:
             new_state: New button state
 
         Returns:
             Tuple of (pressed_buttons, released_buttons)
         """
-        if self.last_state is None:
-            # First state - consider all pressed buttons as new
-            pressed = self.get_pressed_buttons(new_state)
-            self.last_state = new_state
-            return (pressed, [])
-
-        old_pressed = set(self.get_pressed_buttons(self.last_state))
-        new_pressed = set(self.get_pressed_buttons(new_state))
-
-        pressed = list(new_pressed - old_pressed)
-        released = list(old_pressed - new_pressed)
-
-        # Update last_state for next comparison
-        self.last_state = new_state
-
-        return (pressed, released)
+        pressed, released = self.diff_buttons(new_state)
+        return (list(pressed), list(released))
 
     def analyze_raw_report(self, data: bytes) -> str:
         """
@@ -298,7 +383,7 @@ def analyze_sample_data(sample_data: bytes):
         g1_data = bytes([...])
         analyze_sample_data(g1_data)
     """
-    decoder = EventDecoder()
+    decoder = EventDecoder(keep_raw=True)
 
     print("Raw Data Analysis:")
     print(decoder.analyze_raw_report(sample_data))
@@ -79,14 +79,19 @@ class JoystickHandler:
 
     Analog mode creates a virtual joystick device that games can use.
     Digital mode converts stick position to keyboard arrow keys.
+
+    Given a UInputService, the virtual joystick is a device of that
+    service and digital mode sends through its shared keyboard device.
     """
 
     # G13 joystick is centered at approximately these values
     CENTER_X = 128
     CENTER_Y = 128
 
-    def __init__(self, config: Optional[JoystickConfig] = None):
+    def __init__(self, config: Optional[JoystickConfig] = None, output=None):
         self.config = config or JoystickConfig()
+        # Shared UInputService (optional; otherwise devices are created here)
+        self._output = output
         self._analog_device: Optional[UInput] = None
         self._key_device: Optional[UInput] = None
 
@@ -125,9 +130,11 @@ class JoystickHandler:
             e.EV_KEY: [e.BTN_JOYSTICK],  # Joystick button (stick click)
         }
 
-        self._analog_device = UInput(
-            capabilities, name="G13 Joystick", vendor=0x046D, product=0xC21C
-        )
+        options = {"name": "G13 Joystick", "vendor": 0x046D, "product": 0xC21C}
+        if self._output:
+            self._analog_device = self._output.open_device("joystick", capabilities, **options)
+        else:
+            self._analog_device = UInput(capabilities, **options)
 
     def _start_digital(self):
         """Create keyboard device for direction keys"""
@@ -143,7 +150,10 @@ class JoystickHandler:
                 keys.add(getattr(e, key_name))
 
         if keys:
-            self._key_device = UInput({e.EV_KEY: list(keys)}, name="G13 Joystick Keys")
+            if self._output:
+                self._key_device = self._output.keyboard(keys)
+            else:
+                self._key_device = UInput({e.EV_KEY: list(keys)}, name="G13 Joystick Keys")
 
     def stop(self):
         """Close joystick devices"""
@@ -9,6 +9,47 @@ from PyQt6.QtCore import QObject, QThread, pyqtSignal
 from .macro_types import Macro, MacroStep, MacroStepType, PlaybackMode
 
 
+def resolve_keycode(ecodes, key_code: str) -> Optional[int]:
+    """
+    Convert a key code string to an evdev keycode.
+
+    Args:
+        ecodes: evdev.ecodes module
+        key_code: Key name with or without the KEY_ prefix
+
+    Returns:
+        evdev keycode, or None if the name is unknown
+    """
+    evdev_code = getattr(ecodes, key_code, None)
+    if evdev_code is None:
+        # Try without KEY_ prefix
+        if key_code.startswith("KEY_"):
+            evdev_code = getattr(ecodes, key_code, None)
+        else:
+            evdev_code = getattr(ecodes, f"KEY_{key_code}", None)
+    return evdev_code
+
+
+def macro_keycodes(macro: Macro, ecodes) -> set[int]:
+    """
+    Keycodes of all key steps in a macro.
+
+    Args:
+        macro: Macro to scan
+        ecodes: evdev.ecodes module
+
+    Returns:
+        evdev keycodes the macro presses or releases
+    """
+    keycodes = set()
+    for step in macro.steps:
+        if step.step_type in (MacroStepType.KEY_PRESS, MacroStepType.KEY_RELEASE):
+            keycode = resolve_keycode(ecodes, str(step.value))
+            if keycode is not None:
+                keycodes.add(keycode)
+    return keycodes
+
+
 class PlaybackState(Enum):
     """Playback state machine states."""
 
@@ -25,12 +66,14 @@ class MacroPlayerThread(QThread):
     playback_complete = pyqtSignal()
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, macro: Macro, parent: Optional[QObject] = None):
+    def __init__(self, macro: Macro, parent: Optional[QObject] = None, output=None):
         super().__init__(parent)
         self.macro = macro
         self._stop_requested = False
         self._pause_requested = False
         self._uinput = None
+        # Shared UInputService; without one, each playback opens its own UInput
+        self._output = output
 
     def run(self) -> None:
         """Execute macro with timing."""
@@ -62,14 +105,27 @@ class MacroPlayerThread(QThread):
             from evdev import UInput
             from evdev import ecodes as e
 
+            self._ecodes = e
+            if self._output:
+                # Shared keyboard device, limited to the keys this macro sends
+                self._uinput = self._output.keyboard(self._macro_keycodes())
+                return
+
             # Create UInput with common keys
             self._uinput = UInput()
-            self._ecodes = e
         except ImportError:
             raise RuntimeError("evdev not installed")
         except PermissionError:
             raise RuntimeError("Permission denied - need root or uinput access")
 
+    def _macro_keycodes(self) -> set[int]:
+        """Keycodes of all key steps in the macro."""
+        return macro_keycodes(self.macro, self._ecodes)
+
+    def _resolve_keycode(self, key_code: str) -> Optional[int]:
+        """Convert a key code string to an evdev keycode."""
+        return resolve_keycode(self._ecodes, key_code)
+
     def _cleanup_uinput(self) -> None:
         """Cleanup UInput."""
         if self._uinput:
@@ -144,15 +200,7 @@ class MacroPlayerThread(QThread):
         if self._uinput is None or self._ecodes is None:
             return
 
-        # Convert key code string to evdev keycode
-        evdev_code = getattr(self._ecodes, key_code, None)
-        if evdev_code is None:
-            # Try without KEY_ prefix
-            if key_code.startswith("KEY_"):
-                evdev_code = getattr(self._ecodes, key_code, None)
-            else:
-                evdev_code = getattr(self._ecodes, f"KEY_{key_code}", None)
-
+        evdev_code = self._resolve_keycode(key_code)
         if evdev_code is not None:
             state = 1 if is_press else 0
             self._uinput.write(self._ecodes.EV_KEY, evdev_code, state)
@@ -193,8 +241,16 @@ class MacroPlayer(QObject):
     playback_complete = pyqtSignal()
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, parent: Optional[QObject] = None):
+    def __init__(self, parent: Optional[QObject] = None, output=None):
+        """
+        Initialize player.
+
+        Args:
+            parent: Parent QObject
+            output: Shared UInputService to send keys through (optional)
+        """
         super().__init__(parent)
+        self.output = output
         self._state = PlaybackState.IDLE
         self._player_thread: Optional[MacroPlayerThread] = None
         self._current_macro: Optional[Macro] = None
@@ -232,7 +288,7 @@ class MacroPlayer(QObject):
         self._current_macro = macro
 
         # Create and start player thread
-        self._player_thread = MacroPlayerThread(macro, self)
+        self._player_thread = MacroPlayerThread(macro, self, output=self.output)
         self._player_thread.step_executed.connect(self._on_step_executed)
         self._player_thread.playback_complete.connect(self._on_playback_complete)
         self._player_thread.error_occurred.connect(self._on_error)
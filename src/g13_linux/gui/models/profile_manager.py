@@ -5,10 +5,29 @@ Manages CRUD operations for G13 button mapping profiles.
 """
 
 import json
+import logging
+import os
+import stat
+import tempfile
+import threading
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+logger = logging.getLogger(__name__)
+
+
+def _umask() -> int:
+    """Get the process umask (os.umask can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode of newly created profiles, as open() would have created them
+# (mkstemp always creates 0600)
+_NEW_FILE_MODE = 0o666 & ~_umask()
+
 
 @dataclass
 class ProfileData:
@@ -25,12 +44,17 @@ class ProfileData:
     - MR: Macro record button
     - LEFT, DOWN: Thumb buttons adjacent to joystick
     - STICK: Joystick click (press down on stick)
+
+    mode_mappings holds optional per-mode layers keyed by "M1"/"M2"/"M3"
+    ({'M2': {'G1': 'KEY_F1'}}); a layer only lists the buttons it changes,
+    everything else falls through to mappings.
     """
 
     name: str
     description: str = ""
     version: str = "0.1.0"
     mappings: dict = field(default_factory=dict)  # str | dict values
+    mode_mappings: dict = field(default_factory=dict)  # mode -> mappings overrides
     lcd: dict = field(default_factory=lambda: {"enabled": True, "default_text": ""})
     backlight: dict = field(default_factory=lambda: {"color": "#FFFFFF", "brightness": 100})
     joystick: dict = field(
@@ -48,7 +72,18 @@ class ProfileData:
 
 
 class ProfileManager:
-    """Manages profile CRUD operations"""
+    """
+    Manages profile CRUD operations
+
+    Profiles are written atomically (temp file + rename), so a crash
+    mid-save never leaves a truncated profile behind. Frequent small edits
+    (e.g. remapping keys from the web GUI) go through schedule_save(),
+    which batches dirty profiles and writes them from a timer thread once
+    the edits settle.
+    """
+
+    # Seconds without further edits before dirty profiles are written
+    SAVE_DEBOUNCE = 0.5
 
     def __init__(self, profiles_dir: Optional[str] = None):
         if profiles_dir is None:
@@ -60,6 +95,11 @@ class ProfileManager:
         self.current_profile: Optional[ProfileData] = None
         self.current_name: Optional[str] = None  # Filename (without .json)
 
+        # Deferred saves: profile name -> ProfileData awaiting flush()
+        self._lock = threading.Lock()
+        self._dirty: dict[str, ProfileData] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+
         # Ensure profiles directory exists
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
 
@@ -69,7 +109,7 @@ class ProfileManager:
 
     def load_profile(self, name: str) -> ProfileData:
         """
-        Load profile from JSON file
+        Load profile from JSON file and make it the current profile
 
         Args:
             name: Profile name (without .json extension)
@@ -81,6 +121,29 @@ class ProfileManager:
             FileNotFoundError: If profile doesn't exist
             ValueError: If profile JSON is invalid
         """
+        profile = self.read_profile(name)
+        self.current_profile = profile
+        self.current_name = name  # Track the filename
+        return profile
+
+    def read_profile(self, name: str) -> ProfileData:
+        """
+        Read profile from JSON file without changing the current profile
+
+        Args:
+            name: Profile name (without .json extension)
+
+        Returns:
+            Loaded ProfileData
+
+        Raises:
+            FileNotFoundError: If profile doesn't exist
+            ValueError: If profile JSON is invalid
+        """
+        if name in self._dirty:
+            # Don't read back a file that is older than the pending edits
+            self.flush()
+
         path = self.profiles_dir / f"{name}.json"
 
         if not path.exists():
@@ -89,10 +152,7 @@ class ProfileManager:
         try:
             with open(path, "r") as f:
                 data = json.load(f)
-            profile = ProfileData(**data)
-            self.current_profile = profile
-            self.current_name = name  # Track the filename
-            return profile
+            return ProfileData(**data)
         except (json.JSONDecodeError, TypeError) as e:
             raise ValueError(f"Invalid profile JSON in '{name}': {e}")
 
@@ -105,13 +165,112 @@ class ProfileManager:
             name: Optional profile name (uses profile.name if not provided)
         """
         save_name = name or profile.name
-        path = self.profiles_dir / f"{save_name}.json"
 
-        with open(path, "w") as f:
-            json.dump(asdict(profile), f, indent=2)
+        with self._lock:
+            # An explicit save supersedes any pending deferred write
+            self._dirty.pop(save_name, None)
+            data = asdict(profile)
+        self._write_atomic(save_name, data)
 
         self.current_profile = profile
 
+    def update_mapping(self, button: str, mapping) -> ProfileData:
+        """
+        Change one mapping in the current profile and schedule a save.
+
+        Args:
+            button: Button ID (e.g., "G1")
+            mapping: Key code string or combo dict
+
+        Returns:
+            The updated current profile
+
+        Raises:
+            ValueError: If no profile is loaded
+        """
+        profile = self.current_profile
+        if profile is None:
+            raise ValueError("No profile loaded")
+
+        # Mutate under the lock so a concurrent flush() never serializes
+        # a half-updated mappings dict
+        with self._lock:
+            profile.mappings[button] = mapping
+        self.schedule_save(profile, self.current_name)
+        return profile
+
+    def schedule_save(self, profile: ProfileData, name: Optional[str] = None):
+        """
+        Mark a profile dirty and write it after SAVE_DEBOUNCE seconds.
+
+        Every call restarts the debounce, so a burst of edits results in
+        one write per profile. The write runs on a timer thread.
+
+        Args:
+            profile: ProfileData to save
+            name: Optional profile name (uses profile.name if not provided)
+        """
+        save_name = name or profile.name
+
+        with self._lock:
+            self._dirty[save_name] = profile
+            if self._flush_timer:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.SAVE_DEBOUNCE, self.flush)
+            self._flush_timer.name = "ProfileFlush"
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    @property
+    def has_pending_saves(self) -> bool:
+        """Check if any profile is waiting for a deferred save."""
+        return bool(self._dirty)
+
+    def flush(self):
+        """Write all profiles marked dirty by schedule_save() now."""
+        with self._lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending = {name: asdict(profile) for name, profile in self._dirty.items()}
+            self._dirty.clear()
+
+        for name, data in pending.items():
+            try:
+                self._write_atomic(name, data)
+            except OSError as e:
+                logger.error(f"Failed to save profile '{name}': {e}")
+
+    def _write_atomic(self, name: str, data: dict):
+        """
+        Write profile JSON via a temp file renamed over the target.
+
+        Args:
+            name: Profile name (without .json extension)
+            data: Profile dict to serialize
+        """
+        path = self.profiles_dir / f"{name}.json"
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=self.profiles_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                # Keep the replaced file's permissions
+                os.fchmod(f.fileno(), mode)
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def create_profile(self, name: str) -> ProfileData:
         """
         Create new empty profile with default mappings
@@ -166,6 +325,8 @@ class ProfileManager:
         if not path.exists():
             raise FileNotFoundError(f"Profile '{name}' not found")
 
+        with self._lock:
+            self._dirty.pop(name, None)
         path.unlink()
 
         # Clear current profile if it was the deleted one
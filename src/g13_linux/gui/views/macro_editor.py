@@ -50,11 +50,11 @@ class MacroEditorWidget(QWidget):
     macro_assigned = pyqtSignal(str, str)  # (button_id, macro_id)
     macro_saved = pyqtSignal(object)  # Emits Macro when saved
 
-    def __init__(self, parent: Optional[QWidget] = None):
+    def __init__(self, parent: Optional[QWidget] = None, output=None):
         super().__init__(parent)
         self.macro_manager = MacroManager()
         self.macro_recorder = MacroRecorder()
-        self.macro_player = MacroPlayer()
+        self.macro_player = MacroPlayer(output=output)
         self._current_macro: Optional[Macro] = None
         self._init_ui()
         self._connect_signals()
@@ -481,3 +481,7 @@ class MacroEditorWidget(QWidget):
     def refresh_macro_list(self) -> None:
         """Public method to refresh macro list."""
         self._refresh_macro_list()
+
+    def set_output(self, output) -> None:
+        """Send test playback through a shared UInputService."""
+        self.macro_player.output = output
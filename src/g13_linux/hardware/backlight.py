@@ -6,14 +6,22 @@ Controls the G13's RGB backlight via USB HID feature reports.
 Protocol:
 - Report ID: 0x07
 - Format: [0x07, R, G, B, 0x00] (5 bytes)
+
+The last report actually sent is remembered and unchanged writes are
+dropped. With start_writer() reports go out from a rate-limited writer
+thread, so bursts (slider drags, profile loads) collapse into the latest
+color.
 """
 
+from .writer import LatestValueWriter
+
 
 class G13Backlight:
     """RGB backlight controller for G13"""
 
     REPORT_ID = 0x07
     REPORT_SIZE = 5
+    WRITE_INTERVAL = 0.02  # Writer rate limit: 50 reports/s
 
     def __init__(self, device_handle=None):
         """
@@ -25,6 +33,13 @@ class G13Backlight:
         self.device = device_handle
         self._current_color = (255, 255, 255)  # Default white
         self._current_brightness = 100
+        self._writer: LatestValueWriter | None = None
+
+        # Last report the device accepted (None = unknown, always send)
+        self._last_sent: bytes | None = None
+        self.sent_reports = 0
+        self.suppressed_reports = 0
+        self.errors = 0
 
     def set_color(self, r: int, g: int, b: int):
         """
@@ -35,18 +50,13 @@ class G13Backlight:
             g: Green value (0-255)
             b: Blue value (0-255)
         """
-        if not all(0 <= val <= 255 for val in (r, g, b)):
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
             raise ValueError("RGB values must be 0-255")
 
         self._current_color = (r, g, b)
 
         if self.device:
-            # Send feature report: [report_id, R, G, B, 0x00]
-            report = bytes([self.REPORT_ID, r, g, b, 0x00])
-            try:
-                self.device.send_feature_report(report)
-            except OSError as e:
-                print(f"[Backlight] Failed to set color: {e}")
+            self._send_report(bytes([self.REPORT_ID, r, g, b, 0x00]), "set color")
         else:
             print(f"[Backlight] No device - would set RGB({r}, {g}, {b})")
 
@@ -93,10 +103,99 @@ class G13Backlight:
 
         if self.device:
             report = bytes([self.REPORT_ID, scaled_r, scaled_g, scaled_b, 0x00])
-            try:
-                self.device.send_feature_report(report)
-            except OSError as e:
-                print(f"[Backlight] Failed to apply color: {e}")
+            self._send_report(report, "apply color")
+
+    def _send_report(self, report: bytes, action: str):
+        """Send a report now, or hand it to the writer thread if running."""
+        if self._writer and self._writer.is_running:
+            self._writer.submit((report, action))
+        else:
+            self._write_report((report, action))
+
+    def _write_report(self, item: tuple[bytes, str]):
+        """
+        Send a feature report unless it matches the last one sent.
+
+        Args:
+            item: (report, action) where action names the caller in errors
+        """
+        report, action = item
+        if report == self._last_sent:
+            self.suppressed_reports += 1
+            return
+        try:
+            self.device.send_feature_report(report)
+        except OSError as e:
+            # Device state is unknown now; resend next time
+            self._last_sent = None
+            self.errors += 1
+            print(f"[Backlight] Failed to {action}: {e}")
+            return
+        self._last_sent = report
+        self.sent_reports += 1
+
+    def invalidate(self):
+        """Forget the last sent report so the next write always goes out."""
+        self._last_sent = None
+
+    @property
+    def writer_running(self) -> bool:
+        """Check if reports are sent by the background writer thread."""
+        return self._writer is not None and self._writer.is_running
+
+    def start_writer(self, min_interval: float | None = None):
+        """
+        Send reports from a dedicated "BacklightWriter" thread.
+
+        Color changes then only replace the pending report and return; at
+        most one report per min_interval reaches the device, always the
+        newest.
+
+        Args:
+            min_interval: Seconds between reports (default WRITE_INTERVAL)
+        """
+        if self._writer is None:
+            self._writer = LatestValueWriter(
+                self._write_report,
+                name="BacklightWriter",
+                min_interval=self.WRITE_INTERVAL if min_interval is None else min_interval,
+            )
+        self._writer.start()
+
+    def stop_writer(self, timeout: float = 1.0):
+        """
+        Send the pending report and go back to synchronous writes.
+
+        Args:
+            timeout: Seconds to wait for the writer thread
+        """
+        if self._writer:
+            self._writer.stop(timeout)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until the last submitted report has been sent.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if no report is pending
+        """
+        if not self._writer:
+            return True
+        return self._writer.flush(timeout)
+
+    def stats(self) -> dict:
+        """Report counters: sent, suppressed duplicates, errors."""
+        stats = {
+            "sent": self.sent_reports,
+            "suppressed": self.suppressed_reports,
+            "errors": self.errors,
+        }
+        if self._writer:
+            stats["writer"] = self._writer.stats()
+        return stats
 
     def get_color(self) -> tuple[int, int, int]:
         """Get current RGB color"""
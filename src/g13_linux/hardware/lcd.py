@@ -10,6 +10,12 @@ Protocol (from g13-rs/libg13):
 - Total packet: 992 bytes via interrupt transfer to endpoint 2
 """
 
+import time
+
+from ..lcd.fonts import Font
+from ..lcd.text_cache import draw_text
+from .writer import LatestValueWriter
+
 # 5x7 font table - each character is 5 columns of 7 bits (stored as 5 bytes)
 # Characters 32-126 (space to ~)
 FONT_5X7 = {
@@ -110,6 +116,118 @@ FONT_5X7 = {
     126: [0x08, 0x08, 0x2A, 0x1C, 0x08],  # ~
 }
 
+_FONT = Font(char_width=5, char_height=7, glyphs=FONT_5X7)
+
+
+class LCDSession:
+    """
+    Long-lived LCD output channel for one device handle.
+
+    The LCD endpoint is configured once (SET_CONFIGURATION on libusb) and
+    again only after a failed write. Frames are copied into a preallocated
+    992-byte packet whose header is written once, and write latency is
+    tracked per frame.
+    """
+
+    HEADER_SIZE = 32
+    FRAMEBUFFER_SIZE = 960
+    PACKET_SIZE = HEADER_SIZE + FRAMEBUFFER_SIZE
+    COMMAND_BYTE = 0x03
+
+    def __init__(self, device):
+        """
+        Initialize session.
+
+        Args:
+            device: Device instance (HidrawDevice, LibUSBDevice or ReplayDevice)
+        """
+        self.device = device
+        self._packet = bytearray(self.PACKET_SIZE)
+        self._packet[0] = self.COMMAND_BYTE
+        self._frame_view = memoryview(self._packet)[self.HEADER_SIZE :]
+        self._configured: bool = False
+
+        # Statistics
+        self.frames = 0
+        self.errors = 0
+        self.configure_count = 0
+        self.last_write_ns = 0
+        self.max_write_ns = 0
+        self.total_write_ns = 0
+
+    @property
+    def configured(self) -> bool:
+        """Check if the endpoint is configured for the next write."""
+        return self._configured
+
+    @property
+    def avg_write_ms(self) -> float:
+        """Mean frame write latency in milliseconds."""
+        return self.total_write_ns / self.frames / 1e6 if self.frames else 0.0
+
+    def configure(self):
+        """
+        Configure the LCD endpoint.
+
+        Sends SET_CONFIGURATION on libusb handles; hidraw needs no setup.
+        """
+        self.configure_count += 1
+        dev = getattr(self.device, "_dev", None)
+        if dev:
+            try:
+                # Control transfer: SET_CONFIGURATION
+                # bmRequestType=0, bRequest=9, wValue=1, wIndex=0
+                dev.ctrl_transfer(0, 9, 1, 0, None, 1000)
+            except Exception as e:
+                print(f"[LCD] init_lcd failed: {e}")
+                return
+        self._configured = True
+
+    def send(self, framebuffer) -> int:
+        """
+        Send one frame.
+
+        Args:
+            framebuffer: 960-byte framebuffer (any buffer-protocol object)
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            Exception: Whatever the device write raised; the endpoint is
+                reconfigured before the next frame
+        """
+        if not self._configured:
+            self.configure()
+
+        self._frame_view[:] = framebuffer
+        start = time.perf_counter_ns()
+        try:
+            written: int = self.device.write(self._packet)
+        except Exception:
+            self.errors += 1
+            self._configured = False
+            raise
+        elapsed = time.perf_counter_ns() - start
+
+        self.frames += 1
+        self.last_write_ns = elapsed
+        self.total_write_ns += elapsed
+        if elapsed > self.max_write_ns:
+            self.max_write_ns = elapsed
+        return written
+
+    def stats(self) -> dict:
+        """Frame and latency counters."""
+        return {
+            "frames": self.frames,
+            "errors": self.errors,
+            "configures": self.configure_count,
+            "last_write_ms": self.last_write_ns / 1e6,
+            "avg_write_ms": self.avg_write_ms,
+            "max_write_ms": self.max_write_ns / 1e6,
+        }
+
 
 class G13LCD:
     """
@@ -149,6 +267,80 @@ class G13LCD:
         """
         self.device = device_handle
         self._framebuffer = bytearray(self.FRAMEBUFFER_SIZE)
+        self._session: LCDSession | None = None
+        # Copy of the last frame the device acknowledged (None = unknown)
+        self._last_frame: bytearray | None = None
+
+        # Background writer (None = frames are sent on the calling thread)
+        self._writer: LatestValueWriter | None = None
+
+        # Identical-frame skipping: hits were skipped, misses were sent
+        self.skip_hits = 0
+        self.skip_misses = 0
+
+    @property
+    def session(self) -> LCDSession | None:
+        """Output session for the current device (None without a device)."""
+        if not self.device:
+            return None
+        if self._session is None or self._session.device is not self.device:
+            self._session = LCDSession(self.device)
+            self._last_frame = None
+        return self._session
+
+    @property
+    def stats(self) -> dict:
+        """Frame write counters, latency and identical-frame skips."""
+        session = self.session
+        stats = session.stats() if session else {}
+        stats["skip_hits"] = self.skip_hits
+        stats["skip_misses"] = self.skip_misses
+        if self._writer:
+            stats["writer"] = self._writer.stats()
+        return stats
+
+    @property
+    def writer_running(self) -> bool:
+        """Check if frames are sent by the background writer thread."""
+        return self._writer is not None and self._writer.is_running
+
+    def start_writer(self):
+        """
+        Send frames from a dedicated "LCDWriter" thread.
+
+        Drawing calls then only copy the framebuffer into a one-slot
+        mailbox and return; a newer frame replaces an unsent one, so a
+        stalled USB transfer can't block rendering or queue up frames.
+        """
+        if self._writer is None:
+            self._writer = LatestValueWriter(
+                self._write_frame, name="LCDWriter", merge=self._merge_frames
+            )
+        self._writer.start()
+
+    def stop_writer(self, timeout: float = 1.0):
+        """
+        Send the pending frame and go back to synchronous writes.
+
+        Args:
+            timeout: Seconds to wait for the writer thread
+        """
+        if self._writer:
+            self._writer.stop(timeout)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until the last submitted frame has been sent.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if no frame is pending
+        """
+        if not self._writer:
+            return True
+        return self._writer.flush(timeout)
 
     def clear(self):
         """Clear LCD display (all pixels off)."""
@@ -170,35 +362,8 @@ class G13LCD:
             y: Y position (0-42)
             send: If True, send framebuffer to device after rendering
         """
-        cursor_x = x
-        char_width = 6  # 5 pixels + 1 pixel spacing
-
-        for char in text:
-            code = ord(char)
-            if code not in FONT_5X7:
-                code = 63  # '?' for unknown characters
-
-            glyph = FONT_5X7[code]
-
-            # Render each column of the character
-            for col_idx, col_data in enumerate(glyph):
-                px = cursor_x + col_idx
-                if px >= self.WIDTH:
-                    break
-
-                # Render 7 rows of this column
-                for row in range(7):
-                    py = y + row
-                    if py >= self.HEIGHT:
-                        continue
-
-                    # Bit 0 is top row, bit 6 is bottom
-                    if col_data & (1 << row):
-                        self.set_pixel(px, py, True)
-
-            cursor_x += char_width
-            if cursor_x >= self.WIDTH:
-                break
+        # Cached raster: unknown characters render as '?'
+        draw_text(self._framebuffer, x, y, text, _FONT, width=self.WIDTH, height=self.HEIGHT)
 
         if send:
             self._send_framebuffer()
@@ -217,19 +382,23 @@ class G13LCD:
         x = max(0, (self.WIDTH - text_width) // 2)
         self.write_text(text, x, y, send)
 
-    def write_bitmap(self, bitmap: bytes):
+    def write_bitmap(self, bitmap: bytes, force: bool = False):
         """
         Write raw bitmap to LCD.
 
+        The USB transfer is skipped if the resulting frame is identical
+        to the last one sent.
+
         Args:
             bitmap: Raw bitmap data (960 bytes for full frame)
+            force: Send even if the frame is unchanged
         """
         if len(bitmap) > self.FRAMEBUFFER_SIZE:
             raise ValueError(f"Bitmap too large: max {self.FRAMEBUFFER_SIZE} bytes")
 
         # Copy bitmap to framebuffer
         self._framebuffer[: len(bitmap)] = bitmap
-        self._send_framebuffer()
+        self._send_framebuffer(force=force)
 
     def set_pixel(self, x: int, y: int, on: bool = True):
         """
@@ -272,45 +441,72 @@ class G13LCD:
         """
         Initialize LCD endpoint before writing.
 
-        Sends SET_CONFIGURATION control transfer (required before each write).
+        Sends SET_CONFIGURATION control transfer. The session does this
+        once and again after a write error, not before every frame.
         """
-        if hasattr(self.device, "_dev") and self.device._dev:
-            try:
-                # Control transfer: SET_CONFIGURATION
-                # bmRequestType=0, bRequest=9, wValue=1, wIndex=0
-                self.device._dev.ctrl_transfer(0, 9, 1, 0, None, 1000)
-            except Exception as e:
-                print(f"[LCD] init_lcd failed: {e}")
+        session = self.session
+        if session:
+            session.configure()
 
-    def _send_framebuffer(self):
+    def _send_framebuffer(self, force: bool = False):
         """
         Send the framebuffer to the device.
 
         Protocol: 32-byte header (0x03 + zeros) + 960-byte framebuffer
         Total: 992 bytes sent via interrupt transfer to endpoint 2.
+
+        Args:
+            force: Send even if the device already shows this frame
         """
         if not self.device:
             print("[LCD] No device connected")
             return
 
-        try:
-            # Initialize LCD endpoint (required before each write)
-            self._init_lcd()
+        writer = self._writer
+        if writer is not None and writer.is_running:
+            writer.submit((bytes(self._framebuffer), force))
+            return
+        self._write_frame((self._framebuffer, force))
+
+    @staticmethod
+    def _merge_frames(unsent: tuple, new: tuple) -> tuple:
+        """Keep the newest frame, but remember if a dropped one was forced."""
+        return (new[0], new[1] or unsent[1])
+
+    def _write_frame(self, item: tuple):
+        """
+        Send one frame unless the device already shows it.
+
+        Runs on the writer thread when it is started, otherwise on the
+        caller's. Only this method touches the last-frame copy.
 
-            # Build packet: 32-byte header + 960-byte framebuffer
-            # First byte of header is command 0x03
-            header = bytearray(self.HEADER_SIZE)
-            header[0] = self.COMMAND_BYTE
+        Args:
+            item: (960-byte frame, force) tuple
+        """
+        frame, force = item
+        session = self.session
+        if not session:
+            return
 
-            # Full packet is 992 bytes
-            packet = bytes(header) + bytes(self._framebuffer)
+        if not force and self._last_frame == frame:
+            self.skip_hits += 1
+            return
+        self.skip_misses += 1
 
-            # Send to device - LibUSBDevice.write() sends to OUT endpoint
-            bytes_written = self.device.write(packet)
-            if bytes_written != len(packet):
-                print(f"[LCD] Partial write: {bytes_written}/{len(packet)} bytes")
+        try:
+            bytes_written = session.send(frame)
         except Exception as e:
+            self._last_frame = None
             print(f"[LCD] Failed to send framebuffer: {e}")
+            return
+
+        if bytes_written != session.PACKET_SIZE:
+            self._last_frame = None
+            print(f"[LCD] Partial write: {bytes_written}/{session.PACKET_SIZE} bytes")
+        elif self._last_frame is None:
+            self._last_frame = bytearray(frame)
+        else:
+            self._last_frame[:] = frame
 
     def set_brightness(self, level: int):
         """
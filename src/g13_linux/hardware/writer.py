@@ -0,0 +1,192 @@
+"""
+Latest-Value Writer
+
+Background thread that delivers values to a slow sink (LCD frames, LED
+colors) through a one-slot mailbox. A value submitted while an older one
+is still waiting replaces it, so producers never block on USB and a
+stalled device can never build a backlog: once it recovers it gets the
+newest value only. An optional minimum interval between writes rate-limits
+the sink; values submitted during it are merged the same way.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class LatestValueWriter:
+    """
+    One-slot mailbox drained by a dedicated writer thread.
+
+    submit() never blocks on the sink. Replaced values are counted as
+    dropped, and the time from submit() to the end of the sink call is
+    tracked as latency.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[Any], None],
+        name: str = "Writer",
+        merge: Callable[[Any, Any], Any] | None = None,
+        min_interval: float = 0.0,
+    ):
+        """
+        Initialize writer. The thread is started by start().
+
+        Args:
+            sink: Called with each value on the writer thread
+            name: Writer thread name
+            merge: Combines (unsent, new) into the value to keep when a
+                pending value is replaced (default: keep new)
+            min_interval: Minimum seconds between the starts of two sink
+                calls (0 = no rate limit)
+        """
+        self._sink = sink
+        self._name = name
+        self._merge = merge
+        self.min_interval = min_interval
+        self._cond = threading.Condition()
+        self._pending: Any = None
+        self._pending_ns = 0
+        self._has_pending = False
+        self._busy = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+        # Statistics
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_latency_ns = 0
+        self.max_latency_ns = 0
+        self.total_latency_ns = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the writer thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Mean submit-to-written latency in milliseconds."""
+        return self.total_latency_ns / self.written / 1e6 if self.written else 0.0
+
+    def start(self):
+        """Start the writer thread."""
+        if self.is_running:
+            return
+        with self._cond:
+            self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name=self._name)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Write the pending value, if any, and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def submit(self, value) -> bool:
+        """
+        Hand a value to the writer thread, replacing any unsent one.
+
+        Args:
+            value: Value for the sink (must not be modified afterwards)
+
+        Returns:
+            True if an unsent value was replaced (dropped)
+        """
+        with self._cond:
+            self.submitted += 1
+            replaced = self._has_pending
+            if replaced:
+                self.dropped += 1
+                if self._merge:
+                    value = self._merge(self._pending, value)
+            self._pending = value
+            self._pending_ns = time.perf_counter_ns()
+            self._has_pending = True
+            self._cond.notify()
+        return replaced
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until the pending value has been written.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the writer went idle in time
+        """
+        with self._cond:
+            if not self.is_running:
+                return not self._has_pending
+            return self._cond.wait_for(lambda: not (self._has_pending or self._busy), timeout)
+
+    def stats(self) -> dict:
+        """Delivery counters and latency."""
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "last_latency_ms": self.last_latency_ns / 1e6,
+            "avg_latency_ms": self.avg_latency_ms,
+            "max_latency_ms": self.max_latency_ns / 1e6,
+        }
+
+    def _run(self):
+        """Writer loop: wait for a value, deliver it, repeat."""
+        cond = self._cond
+        next_write = 0.0
+        while True:
+            with cond:
+                while not (self._has_pending or self._stopping):
+                    cond.wait()
+                if not self._has_pending:
+                    return
+                # Rate limit: newer values may still replace this one
+                delay = next_write - time.monotonic()
+                while delay > 0 and not self._stopping:
+                    cond.wait(delay)
+                    delay = next_write - time.monotonic()
+                value = self._pending
+                submitted_ns = self._pending_ns
+                self._pending = None
+                self._has_pending = False
+                self._busy = True
+
+            next_write = time.monotonic() + self.min_interval
+            try:
+                self._sink(value)
+            except Exception as e:
+                logger.error(f"{self._name} sink failed: {e}")
+                with cond:
+                    self._busy = False
+                    self.errors += 1
+                    cond.notify_all()
+                continue
+            elapsed = time.perf_counter_ns() - submitted_ns
+
+            with cond:
+                self._busy = False
+                self.written += 1
+                self.last_latency_ns = elapsed
+                self.total_latency_ns += elapsed
+                if elapsed > self.max_latency_ns:
+                    self.max_latency_ns = elapsed
+                cond.notify_all()
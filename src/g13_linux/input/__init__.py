@@ -6,9 +6,13 @@ Processes thumbstick and button input for menu navigation.
 
 from .handler import InputHandler
 from .navigation import NavigationController, NavigationState
+from .report_bus import DecodedReport, ReportBus, ReportRing
 
 __all__ = [
     "InputHandler",
     "NavigationController",
     "NavigationState",
+    "ReportBus",
+    "ReportRing",
+    "DecodedReport",
 ]
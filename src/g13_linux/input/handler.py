@@ -7,11 +7,14 @@ Processes G13 input and emits InputEvents for menu navigation.
 import logging
 import threading
 import time
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from ..gui.models.event_decoder import EventDecoder
+from ..gui.models.event_decoder import EventDecoder, G13ButtonState
 from ..menu.screen import InputEvent
 
+if TYPE_CHECKING:
+    from .report_bus import ReportBus, ReportRing
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,42 +22,63 @@ class InputHandler:
     """
     Handles G13 input for menu navigation.
 
-    Reads from device and emits InputEvents based on thumbstick
-    and button states.
+    Emits InputEvents based on thumbstick and button states. When a
+    ReportBus is given, reports are taken from the bus (which owns the
+    device); otherwise the handler reads the device itself.
     """
 
+    # Buttons that emit events on their rising edge, in emit order
+    EDGE_BUTTONS = (
+        (EventDecoder.button_mask("STICK"), InputEvent.STICK_PRESS),
+        (EventDecoder.button_mask("BD"), InputEvent.BUTTON_BD),
+        (EventDecoder.button_mask("LEFT"), InputEvent.BUTTON_LEFT),
+        (EventDecoder.button_mask("M1"), InputEvent.BUTTON_M1),
+        (EventDecoder.button_mask("M2"), InputEvent.BUTTON_M2),
+        (EventDecoder.button_mask("M3"), InputEvent.BUTTON_M3),
+        (EventDecoder.button_mask("MR"), InputEvent.BUTTON_MR),
+    )
+    EDGE_MASK = EventDecoder.button_mask("STICK", "BD", "LEFT", "M1", "M2", "M3", "MR")
+
     # Thumbstick thresholds
     STICK_CENTER = 128
     STICK_THRESHOLD = 50  # Dead zone from center
     STICK_REPEAT_DELAY = 0.4  # Seconds before repeat starts
     STICK_REPEAT_RATE = 0.15  # Seconds between repeats
 
-    def __init__(self, device, callback: Callable[[InputEvent], None]):
+    def __init__(
+        self,
+        device,
+        callback: Callable[[InputEvent], None],
+        bus: "ReportBus | None" = None,
+    ):
         """
         Initialize input handler.
 
         Args:
             device: G13 device handle with read() method
             callback: Function to call with InputEvents
+            bus: Shared ReportBus to consume decoded reports from
         """
         self.device = device
         self.callback = callback
+        self.bus = bus
         self._decoder = EventDecoder()
+        self._state = G13ButtonState(0, 0, self.STICK_CENTER, self.STICK_CENTER)
+        self._ring: "ReportRing | None" = None
         self._running = False
         self._thread: threading.Thread | None = None
 
         # Thumbstick state
         self._stick_x = self.STICK_CENTER
         self._stick_y = self.STICK_CENTER
-        self._stick_pressed = False
 
         # Direction repeat tracking
         self._repeat_direction: InputEvent | None = None
         self._repeat_start_time: float = 0
         self._last_repeat_time: float = 0
 
-        # Button state for edge detection
-        self._button_state: dict[str, bool] = {}
+        # Packed button state for edge detection
+        self._buttons = 0
 
     def start(self):
         """Start input polling thread."""
@@ -62,18 +86,51 @@ class InputHandler:
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._poll_loop, daemon=True, name="InputHandler")
+        if self.bus is not None:
+            self._ring = self.bus.subscribe_ring()
+            target = self._consume_loop
+        else:
+            target = self._poll_loop
+        self._thread = threading.Thread(target=target, daemon=True, name="InputHandler")
         self._thread.start()
         logger.info("Input handler started")
 
     def stop(self):
         """Stop input polling."""
         self._running = False
+        if self._ring is not None:
+            self.bus.unsubscribe_ring(self._ring)
+            self._ring.close()
         if self._thread:
             self._thread.join(timeout=1.0)
             self._thread = None
+        self._ring = None
         logger.info("Input handler stopped")
 
+    def _consume_loop(self):
+        """Consume decoded reports from the shared report bus."""
+        ring = self._ring
+        while self._running:
+            report = ring.get(timeout=self._repeat_timeout())
+            if report is not None:
+                self._process_input(report.buttons, report.joystick_x, report.joystick_y)
+            self._check_stick_repeat()
+
+    def _repeat_timeout(self) -> float | None:
+        """
+        Time until the next stick repeat is due.
+
+        Returns:
+            Seconds to wait, or None to sleep until the next report
+        """
+        if not self._repeat_direction:
+            return None
+
+        now = time.time()
+        first_repeat = self._repeat_start_time + self.STICK_REPEAT_DELAY
+        next_repeat = max(first_repeat, self._last_repeat_time + self.STICK_REPEAT_RATE)
+        return max(0.0, next_repeat - now)
+
     def _poll_loop(self):
         """Main polling loop."""
         while self._running:
@@ -96,19 +153,28 @@ class InputHandler:
             data: Raw HID report bytes
         """
         try:
-            state = self._decoder.decode_report(data)
+            state = self._decoder.decode_report(data, out=self._state)
         except ValueError as e:
             logger.warning(f"Invalid report: {e}")
             return
 
-        # Process thumbstick
-        self._process_thumbstick(state.joystick_x, state.joystick_y)
+        assert state.buttons is not None  # Always set by decode_report
+        self._process_input(state.buttons, state.joystick_x, state.joystick_y)
 
-        # Process stick button
-        self._process_stick_button(state.raw_data)
+    def _process_input(self, buttons: int, x: int, y: int):
+        """
+        Emit events for a decoded report.
 
-        # Process navigation buttons
-        self._process_buttons(state.raw_data)
+        Args:
+            buttons: Packed button state (see EventDecoder.button_mask)
+            x: Thumbstick X position
+            y: Thumbstick Y position
+        """
+        # Process thumbstick
+        self._process_thumbstick(x, y)
+
+        # Process stick button and navigation buttons
+        self._process_buttons(buttons)
 
     def _process_thumbstick(self, x: int, y: int):
         """
@@ -166,54 +232,23 @@ class InputHandler:
             self._emit(self._repeat_direction)
             self._last_repeat_time = now
 
-    def _process_stick_button(self, data: bytes):
+    def _process_buttons(self, buttons: int):
         """
-        Process thumbstick button press.
+        Process stick click and navigation buttons (BD, LEFT, M1-M3, MR).
 
         Args:
-            data: Raw HID report
+            buttons: Packed button state
         """
-        if len(data) < 8:
+        # Emit on rising edge only
+        rising = buttons & ~self._buttons & self.EDGE_MASK
+        self._buttons = buttons
+        if not rising:
             return
 
-        # STICK button is byte 7, bit 3
-        is_pressed = bool(data[7] & 0x08)
-
-        if is_pressed and not self._stick_pressed:
-            self._emit(InputEvent.STICK_PRESS)
-
-        self._stick_pressed = is_pressed
-
-    def _process_buttons(self, data: bytes):
-        """
-        Process navigation buttons (BD, M1-M3, MR).
-
-        Args:
-            data: Raw HID report
-        """
-        if len(data) < 8:
-            return
-
-        # Button mappings from EventDecoder
-        button_map = {
-            "BD": (6, 0, InputEvent.BUTTON_BD),
-            "LEFT": (7, 1, InputEvent.BUTTON_LEFT),
-            "M1": (6, 5, InputEvent.BUTTON_M1),
-            "M2": (6, 6, InputEvent.BUTTON_M2),
-            "M3": (6, 7, InputEvent.BUTTON_M3),
-            "MR": (7, 0, InputEvent.BUTTON_MR),
-        }
-
-        for name, (byte_idx, bit_pos, event) in button_map.items():
-            is_pressed = bool(data[byte_idx] & (1 << bit_pos))
-            was_pressed = self._button_state.get(name, False)
-
-            # Emit on rising edge only
-            if is_pressed and not was_pressed:
+        for mask, event in self.EDGE_BUTTONS:
+            if rising & mask:
                 self._emit(event)
 
-            self._button_state[name] = is_pressed
-
     def _emit(self, event: InputEvent):
         """
         Emit input event to callback.
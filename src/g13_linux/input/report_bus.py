@@ -0,0 +1,283 @@
+"""
+Report Bus
+
+Single reader for G13 HID reports with fan-out to subscribers.
+
+One thread owns the device handle, decodes each report exactly once and
+hands the decoded result to every registered subscriber (key mapper,
+menu input, WebSocket broadcasts, stats). This replaces the previous
+design where several threads read the same handle and raced for reports.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+from ..gui.models.event_decoder import EventDecoder, G13ButtonState
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedReport:
+    """
+    A HID report decoded once and shared by all subscribers.
+
+    Holds only immutable scalars and tuples, so it can be handed to other
+    threads while the bus keeps reusing its own decode state.
+    """
+
+    buttons: int  # Packed button bytes 3-7 (see EventDecoder.button_mask)
+    joystick_x: int  # Analog X position (0-255)
+    joystick_y: int  # Analog Y position (0-255)
+    pressed: tuple[str, ...]  # Buttons that went down in this report
+    released: tuple[str, ...]  # Buttons that went up in this report
+
+
+class ReportRing:
+    """
+    Bounded single-producer/single-consumer ring of decoded reports.
+
+    The producer (reader thread) never blocks: if the consumer falls
+    behind, the oldest report is overwritten and counted as dropped.
+    deque.append/popleft are atomic in CPython, so the ring holds no
+    lock; the Event is only used to wake a consumer that is idle.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize ring.
+
+        Args:
+            capacity: Maximum number of undelivered reports kept
+        """
+        self._items: deque[DecodedReport] = deque(maxlen=capacity)
+        self._ready = threading.Event()
+        self._closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, report: DecodedReport):
+        """
+        Append a report (producer side, never blocks).
+
+        Args:
+            report: Decoded report to deliver
+        """
+        if len(self._items) == self._items.maxlen:
+            self.dropped += 1
+        self._items.append(report)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get(self, timeout: float | None = None) -> DecodedReport | None:
+        """
+        Pop the oldest report, waiting if the ring is empty.
+
+        Args:
+            timeout: Seconds to wait (None waits until a report or close())
+
+        Returns:
+            Oldest report, or None on timeout or after close()
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            pass
+        if self._closed:
+            return None
+
+        self._ready.clear()
+        # Re-check after clearing so a racing put()/close() isn't missed
+        try:
+            return self._items.popleft()
+        except IndexError:
+            pass
+        if self._closed:
+            return None
+
+        self._ready.wait(timeout)
+        try:
+            return self._items.popleft()
+        except IndexError:
+            return None
+
+    @property
+    def closed(self) -> bool:
+        """Check if the ring has been closed."""
+        return self._closed
+
+    def close(self):
+        """Close the ring and wake a consumer blocked in get()."""
+        self._closed = True
+        self._ready.set()
+
+
+class ReportBus:
+    """
+    Reads the G13 from a single thread and fans decoded reports out.
+
+    Subscribers registered with subscribe() run on the reader thread and
+    must be quick and non-blocking (key mapping, scheduling broadcasts,
+    counters). Consumers that may do slower work (menu navigation) should
+    use subscribe_ring() and drain the ring from their own thread.
+    """
+
+    # How long a read may sleep before the running flag is re-checked
+    READ_TIMEOUT_MS = 100
+
+    def __init__(self, device, decoder: EventDecoder | None = None):
+        """
+        Initialize report bus.
+
+        Args:
+            device: G13 device handle with readinto(buf, timeout_ms=...) method
+            decoder: EventDecoder to use (default: new instance)
+        """
+        self.device = device
+        self.decoder = decoder or EventDecoder()
+        self._subscribers: tuple[Callable[[DecodedReport], None], ...] = ()
+        # Preallocated read slot and decode state reused for every report
+        self._slot = bytearray(64)
+        self._slot_view = memoryview(self._slot)
+        self._state = G13ButtonState(0, 0, 128, 128)
+        self._running = False
+        # Set by stop(), cleared only by start(), so an early stop() sticks
+        self._stop_requested = False
+        self._thread: threading.Thread | None = None
+
+        # Statistics
+        self.report_count = 0
+        self.error_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the reader loop is active."""
+        return self._running
+
+    def subscribe(self, callback: Callable[[DecodedReport], None]):
+        """
+        Register a callback invoked on the reader thread for each report.
+
+        Args:
+            callback: Function taking a DecodedReport
+        """
+        # Copy-on-write so the reader can iterate without locking
+        self._subscribers = self._subscribers + (callback,)
+
+    def unsubscribe(self, callback: Callable[[DecodedReport], None]):
+        """
+        Remove a previously registered callback.
+
+        Args:
+            callback: Callback passed to subscribe()
+        """
+        self._subscribers = tuple(cb for cb in self._subscribers if cb != callback)
+
+    def subscribe_ring(self, capacity: int = 64) -> ReportRing:
+        """
+        Register a ring buffer subscriber for consumption on another thread.
+
+        Args:
+            capacity: Ring capacity
+
+        Returns:
+            ReportRing receiving every decoded report
+        """
+        ring = ReportRing(capacity)
+        self.subscribe(ring.put)
+        return ring
+
+    def unsubscribe_ring(self, ring: ReportRing):
+        """
+        Remove a ring registered with subscribe_ring().
+
+        Args:
+            ring: Ring to remove
+        """
+        self.unsubscribe(ring.put)
+
+    def publish(self, data) -> DecodedReport | None:
+        """
+        Decode a raw report once and deliver it to all subscribers.
+
+        Must only be called from one thread at a time (normally the
+        reader loop), since the decode state is reused.
+
+        Args:
+            data: Raw HID report (bytes, list or any buffer-protocol object)
+
+        Returns:
+            The decoded report, or None if the report was invalid
+        """
+        try:
+            state = self.decoder.decode_report(data, out=self._state)
+        except ValueError as e:
+            logger.debug(f"Invalid report: {e}")
+            return None
+
+        assert state.buttons is not None  # Always set by decode_report
+        pressed, released = self.decoder.diff_buttons(state)
+        report = DecodedReport(state.buttons, state.joystick_x, state.joystick_y, pressed, released)
+        self.report_count += 1
+
+        for callback in self._subscribers:
+            try:
+                callback(report)
+            except Exception as e:
+                logger.error(f"Report subscriber error: {e}")
+
+        return report
+
+    def run(self):
+        """
+        Read and publish reports until stop() is called.
+
+        Blocks the calling thread. Returns at once if stop() was called
+        before; start() clears that.
+        """
+        self._running = True
+        slot = self._slot
+        view = self._slot_view
+        try:
+            while not self._stop_requested:
+                try:
+                    n = self.device.readinto(slot, timeout_ms=self.READ_TIMEOUT_MS)
+                except Exception as e:
+                    self.error_count += 1
+                    logger.debug(f"Read error: {e}")
+                    time.sleep(0.01)
+                    continue
+
+                if n:
+                    self.publish(view[:n])
+        finally:
+            self._running = False
+
+    def start(self):
+        """Start the reader loop in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_requested = False
+        self._running = True
+        self._thread = threading.Thread(target=self.run, daemon=True, name="HIDReader")
+        self._thread.start()
+        logger.info("Report bus started")
+
+    def stop(self):
+        """Stop the reader loop (also if it hasn't entered run() yet)."""
+        self._stop_requested = True
+        self._running = False
+        if (
+            self._thread
+            and self._thread.is_alive()
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join(timeout=1.0)
+        self._thread = None
@@ -26,6 +26,7 @@ from .icons import (
     ICON_STOP,
     Icon,
 )
+from .sprites import Sprite, SpriteMode
 
 __all__ = [
     "Canvas",
@@ -54,4 +55,6 @@ __all__ = [
     "ICON_STOP",
     "ICON_CLOCK",
     "ICON_KEYBOARD",
+    "Sprite",
+    "SpriteMode",
 ]
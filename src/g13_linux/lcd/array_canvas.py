@@ -0,0 +1,249 @@
+"""
+NumPy Canvas
+
+Optional NumPy-backed canvas: pixels live in a (48, 160) boolean array
+(one entry per framebuffer bit, hidden rows 43-47 included), so whole
+images and regions are drawn with array operations. Conversion to and
+from the 960-byte row-block framebuffer is lossless and uses
+np.packbits / np.unpackbits on a (6 blocks, 8 rows, 160 columns) view.
+
+Requires numpy (pip install numpy).
+"""
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("ArrayCanvas requires numpy. Run: pip install numpy") from e
+
+from .canvas import Canvas
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from .image import DitherMode
+
+_BLOCKS = Canvas.BUFFER_ROWS // 8
+
+
+def unpack_frame(data: bytes) -> "np.ndarray":
+    """
+    Convert a row-block framebuffer to a pixel array.
+
+    Args:
+        data: 960-byte framebuffer (shorter data is zero-padded)
+
+    Returns:
+        (48, 160) bool array, [y, x]
+    """
+    frame = np.zeros(Canvas.FRAMEBUFFER_SIZE, dtype=np.uint8)
+    raw = np.frombuffer(bytes(data[: Canvas.FRAMEBUFFER_SIZE]), dtype=np.uint8)
+    frame[: raw.size] = raw
+    # Byte (block, x) holds rows block*8 .. block*8+7, bit 0 = top
+    bits = np.unpackbits(frame.reshape(_BLOCKS, 1, Canvas.WIDTH), axis=1, bitorder="little")
+    return bits.reshape(Canvas.BUFFER_ROWS, Canvas.WIDTH).astype(bool)
+
+
+def pack_pixels(pixels: "np.ndarray") -> bytes:
+    """
+    Convert a pixel array to a row-block framebuffer.
+
+    Args:
+        pixels: Array of up to (48, 160) pixels, [y, x]; missing rows
+            and columns are off
+
+    Returns:
+        960-byte framebuffer
+    """
+    full = np.zeros((Canvas.BUFFER_ROWS, Canvas.WIDTH), dtype=bool)
+    rows, cols = pixels.shape
+    full[:rows, :cols] = pixels[: Canvas.BUFFER_ROWS, : Canvas.WIDTH]
+    packed = np.packbits(full.reshape(_BLOCKS, 8, Canvas.WIDTH), axis=1, bitorder="little")
+    return packed.tobytes()
+
+
+class ArrayCanvas:
+    """
+    Canvas with NumPy pixel storage.
+
+    Shares Canvas's framebuffer format (to_bytes/from_bytes) and basic
+    primitives; use to_canvas()/from_canvas() to mix with text, icons and
+    sprites drawn by Canvas.
+    """
+
+    WIDTH = Canvas.WIDTH
+    HEIGHT = Canvas.HEIGHT
+    BUFFER_ROWS = Canvas.BUFFER_ROWS
+    FRAMEBUFFER_SIZE = Canvas.FRAMEBUFFER_SIZE
+
+    def __init__(self, width: int = 160, height: int = 43):
+        """Initialize canvas with given dimensions."""
+        self.width = width
+        self.height = height
+        self.pixels = np.zeros((self.BUFFER_ROWS, self.WIDTH), dtype=bool)
+
+    @property
+    def visible(self) -> "np.ndarray":
+        """Writable view of the width x height drawing area, [y, x]."""
+        return self.pixels[: self.height, : self.width]
+
+    def clear(self):
+        """Clear canvas (all pixels off)."""
+        self.pixels[:] = False
+
+    def fill(self):
+        """Fill canvas (all pixels on)."""
+        self.pixels[:] = True
+
+    def set_pixel(self, x: int, y: int, on: bool = True):
+        """
+        Set a single pixel.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            on: True for pixel on, False for off
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[y, x] = on
+
+    def get_pixel(self, x: int, y: int) -> bool:
+        """
+        Get pixel state.
+
+        Returns:
+            True if pixel is on
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.pixels[y, x])
+        return False
+
+    def _region(self, x: int, y: int, width: int, height: int) -> "np.ndarray":
+        """View of a rectangle clipped to the canvas (may be empty)."""
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        return self.pixels[y0 : max(y0, y1), x0 : max(x0, x1)]
+
+    def draw_rect(
+        self, x: int, y: int, width: int, height: int, filled: bool = False, on: bool = True
+    ):
+        """
+        Draw rectangle.
+
+        Args:
+            x, y: Top-left corner
+            width, height: Dimensions
+            filled: Fill rectangle
+            on: Pixel state
+        """
+        if width <= 0 or height <= 0:
+            return
+        if filled:
+            self._region(x, y, width, height)[:] = on
+            return
+        self._region(x, y, width, 1)[:] = on
+        self._region(x, y + height - 1, width, 1)[:] = on
+        self._region(x, y, 1, height)[:] = on
+        self._region(x + width - 1, y, 1, height)[:] = on
+
+    def invert_region(self, x: int, y: int, width: int, height: int):
+        """Invert pixels in a rectangle."""
+        region = self._region(x, y, width, height)
+        np.logical_not(region, out=region)
+
+    def draw_pixels(self, x: int, y: int, pixels: "np.ndarray", on: bool | None = None):
+        """
+        Copy a pixel array onto the canvas, clipped at the edges.
+
+        Args:
+            x, y: Top-left position (may be negative)
+            pixels: 2D array, [y, x]; nonzero = on
+            on: None to copy on and off pixels, True to only turn on set
+                pixels, False to only turn them off
+        """
+        rows, cols = pixels.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + cols, self.width), min(y + rows, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        source = pixels[y0 - y : y1 - y, x0 - x : x1 - x].astype(bool, copy=False)
+        target = self.pixels[y0:y1, x0:x1]
+        if on is None:
+            target[:] = source
+        elif on:
+            target |= source
+        else:
+            target &= ~source
+
+    def draw_image(
+        self,
+        x: int,
+        y: int,
+        image: "Image.Image",
+        width: int | None = None,
+        height: int | None = None,
+        dither: "DitherMode | None" = None,
+        **options,
+    ):
+        """
+        Scale, dither and draw a Pillow image.
+
+        Args:
+            x, y: Top-left position
+            image: Source image (any mode)
+            width, height: Target size (default: the rest of the canvas)
+            dither: Dithering mode (default: Floyd-Steinberg)
+            **options: Further image_to_pixels() options
+        """
+        from .image import DitherMode, image_to_pixels
+
+        if width is None:
+            width = self.width - x
+        if height is None:
+            height = self.height - y
+        # Nothing visible: don't scale an image only to clip all of it
+        if width <= 0 or height <= 0 or x >= self.width or y >= self.height:
+            return
+        if x + width <= 0 or y + height <= 0:
+            return
+
+        pixels = image_to_pixels(
+            image,
+            width,
+            height,
+            dither=dither or DitherMode.FLOYD_STEINBERG,
+            **options,
+        )
+        self.draw_pixels(x, y, pixels)
+
+    def to_bytes(self) -> bytes:
+        """
+        Get framebuffer as bytes.
+
+        Returns:
+            960-byte row-block framebuffer
+        """
+        return pack_pixels(self.pixels)
+
+    def from_bytes(self, data: bytes):
+        """
+        Load framebuffer from bytes.
+
+        Args:
+            data: 960-byte framebuffer
+        """
+        self.pixels = unpack_frame(data)
+
+    def to_canvas(self) -> Canvas:
+        """Copy into a Canvas (for text, icons and sprites)."""
+        canvas = Canvas(self.width, self.height)
+        canvas.from_bytes(self.to_bytes())
+        return canvas
+
+    @classmethod
+    def from_canvas(cls, canvas: Canvas) -> "ArrayCanvas":
+        """Create an ArrayCanvas holding a Canvas's pixels."""
+        array_canvas = cls(canvas.width, canvas.height)
+        array_canvas.from_bytes(canvas.to_bytes())
+        return array_canvas
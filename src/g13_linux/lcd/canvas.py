@@ -10,6 +10,82 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .fonts import Font
     from .icons import Icon
+    from .sprites import Sprite, SpriteMode
+
+# Byte operations for Canvas._apply_mask() and blend_columns()
+BLEND_SET = 0
+BLEND_CLEAR = 1
+BLEND_INVERT = 2
+BLEND_COPY = 3  # Replace the pixels under a box mask (blend_columns only)
+
+# Bytes per row block (the framebuffer is always 160 columns wide)
+_STRIDE = 160
+
+
+def blend_columns(
+    buffer: bytearray,
+    x: int,
+    block: int,
+    columns: bytes,
+    op: int = BLEND_SET,
+    width: int = _STRIDE,
+    height: int = 43,
+    box: bytes | None = None,
+):
+    """
+    Combine a run of column masks into one 8-row block of a framebuffer.
+
+    Columns and rows outside width x height are clipped, so prebuilt
+    rasters (text, sprites) can be drawn anywhere with one integer
+    operation per block.
+
+    Args:
+        buffer: 960-byte row-block framebuffer
+        x: X of the first column (may be negative)
+        block: Row block index (row // 8, may be out of range)
+        columns: One bit mask per column, bit 0 = top row of the block
+        op: BLEND_SET, BLEND_CLEAR, BLEND_INVERT or BLEND_COPY
+        width: Clip width
+        height: Clip height
+        box: Pixels BLEND_COPY replaces (same length as columns)
+    """
+    if block < 0 or block << 3 >= height:
+        return
+    x0 = max(x, 0)
+    x1 = min(x + len(columns), width)
+    if x0 >= x1:
+        return
+    n = x1 - x0
+
+    bits = int.from_bytes(columns[x0 - x : x1 - x], "little")
+    clip = None
+    visible = height - (block << 3)
+    if visible < 8:
+        clip = int.from_bytes(bytes(((1 << visible) - 1,)) * n, "little")
+        bits &= clip
+
+    if op == BLEND_COPY:
+        if box is None:
+            raise ValueError("BLEND_COPY needs a box")
+        cover = int.from_bytes(box[x0 - x : x1 - x], "little")
+        if clip is not None:
+            cover &= clip
+        if not cover:
+            return
+    elif not bits:
+        return
+
+    start = block * _STRIDE + x0
+    row = int.from_bytes(buffer[start : start + n], "little")
+    if op == BLEND_SET:
+        row |= bits
+    elif op == BLEND_CLEAR:
+        row &= ~bits
+    elif op == BLEND_INVERT:
+        row ^= bits
+    else:
+        row = (row & ~cover) | bits
+    buffer[start : start + n] = row.to_bytes(n, "little")
 
 
 @dataclass
@@ -78,6 +154,81 @@ class Canvas:
         bit_in_byte = y % 8
         return bool(self._buffer[byte_idx] & (1 << bit_in_byte))
 
+    def _row_spans(self, y: int, height: int) -> list[tuple[int, int]]:
+        """
+        Split rows y..y+height-1 into 8-row blocks, clipped to the canvas.
+
+        Returns:
+            (block byte offset, bit mask) per block the rows touch
+        """
+        y0 = max(y, 0)
+        y1 = min(y + height, self.height)
+        spans = []
+        while y0 < y1:
+            block = y0 >> 3
+            end = min(y1, (block + 1) << 3)
+            spans.append((block * self.WIDTH, ((1 << (end - y0)) - 1) << (y0 & 7)))
+            y0 = end
+        return spans
+
+    def _apply_mask(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        op: int,
+        pattern: tuple[int, int] | None = None,
+    ):
+        """
+        Set, clear or invert a clipped rectangle a byte at a time.
+
+        Each 8-row block of the rectangle is one run of bytes, combined
+        with a repeated bit mask as a single integer operation.
+
+        Args:
+            x, y: Top-left corner
+            width, height: Dimensions
+            op: BLEND_SET, BLEND_CLEAR or BLEND_INVERT
+            pattern: Row masks for even/odd columns (None = all rows)
+        """
+        x0 = max(x, 0)
+        x1 = min(x + width, self.width)
+        if x0 >= x1:
+            return
+        n = x1 - x0
+        buf = self._buffer
+
+        for offset, mask in self._row_spans(y, height):
+            start = offset + x0
+            end = offset + x1
+            if n == 1 and pattern is None:
+                if op == BLEND_SET:
+                    buf[start] |= mask
+                elif op == BLEND_CLEAR:
+                    buf[start] &= ~mask
+                else:
+                    buf[start] ^= mask
+                continue
+            if pattern is None:
+                if mask == 0xFF and op != BLEND_INVERT:
+                    buf[start:end] = (b"\xff" if op == BLEND_SET else b"\x00") * n
+                    continue
+                lanes = bytes((mask,)) * n
+            else:
+                first, second = pattern[x0 & 1] & mask, pattern[~x0 & 1] & mask
+                lanes = (bytes((first, second)) * ((n + 1) >> 1))[:n]
+
+            row = int.from_bytes(buf[start:end], "little")
+            lanes_int = int.from_bytes(lanes, "little")
+            if op == BLEND_SET:
+                row |= lanes_int
+            elif op == BLEND_CLEAR:
+                row &= ~lanes_int
+            else:
+                row ^= lanes_int
+            buf[start:end] = row.to_bytes(n, "little")
+
     def draw_hline(self, x: int, y: int, width: int, on: bool = True):
         """
         Draw horizontal line.
@@ -88,8 +239,7 @@ class Canvas:
             width: Line width
             on: Pixel state
         """
-        for i in range(width):
-            self.set_pixel(x + i, y, on)
+        self._apply_mask(x, y, width, 1, BLEND_SET if on else BLEND_CLEAR)
 
     def draw_vline(self, x: int, y: int, height: int, on: bool = True):
         """
@@ -101,8 +251,7 @@ class Canvas:
             height: Line height
             on: Pixel state
         """
-        for i in range(height):
-            self.set_pixel(x, y + i, on)
+        self._apply_mask(x, y, 1, height, BLEND_SET if on else BLEND_CLEAR)
 
     def draw_line(self, x1: int, y1: int, x2: int, y2: int, on: bool = True):
         """
@@ -144,9 +293,7 @@ class Canvas:
             on: Pixel state
         """
         if filled:
-            for py in range(height):
-                for px in range(width):
-                    self.set_pixel(x + px, y + py, on)
+            self._apply_mask(x, y, width, height, BLEND_SET if on else BLEND_CLEAR)
         else:
             # Top and bottom
             self.draw_hline(x, y, width, on)
@@ -171,36 +318,13 @@ class Canvas:
             Width of rendered text in pixels
         """
         from .fonts import FONT_5X7
+        from .text_cache import draw_text
 
         if font is None:
             font = FONT_5X7
 
-        cursor_x = x
-        char_spacing = 1
-
-        for char in text:
-            glyph = font.get_glyph(char)
-            if glyph is None:
-                continue
-
-            # Render each column of the glyph
-            for col_idx, col_data in enumerate(glyph):
-                px = cursor_x + col_idx
-                if px >= self.width:
-                    break
-
-                for row in range(font.char_height):
-                    py = y + row
-                    if py >= self.height:
-                        continue
-                    if col_data & (1 << row):
-                        self.set_pixel(px, py, on)
-
-            cursor_x += font.char_width + char_spacing
-            if cursor_x >= self.width:
-                break
-
-        return cursor_x - x
+        # Rendered once per (font, text, y % 8), then OR'd in a block at a time
+        return draw_text(self._buffer, x, y, text, font, on, self.width, self.height)
 
     def draw_text_centered(self, y: int, text: str, font: "Font | None" = None, on: bool = True):
         """
@@ -230,17 +354,23 @@ class Canvas:
             icon: Icon to draw
             on: Pixel state (inverts icon if False)
         """
-        for row in range(icon.height):
-            for col in range(icon.width):
-                byte_idx = col + (row // 8) * icon.width
-                if byte_idx >= len(icon.data):
-                    continue
-                bit = row % 8
-                pixel_on = bool(icon.data[byte_idx] & (1 << bit))
-                if on:
-                    self.set_pixel(x + col, y + row, pixel_on)
-                else:
-                    self.set_pixel(x + col, y + row, not pixel_on)
+        from .sprites import SpriteMode, icon_sprite
+
+        mode = SpriteMode.OPAQUE if on else SpriteMode.INVERTED
+        icon_sprite(icon).draw(self._buffer, x, y, mode, self.width, self.height)
+
+    def draw_sprite(self, x: int, y: int, sprite: "Sprite", mode: "SpriteMode | None" = None):
+        """
+        Draw a sprite at position.
+
+        Args:
+            x, y: Position (may be partly off canvas)
+            sprite: Sprite to draw
+            mode: How pixels combine (default: transparent)
+        """
+        from .sprites import SpriteMode
+
+        sprite.draw(self._buffer, x, y, mode or SpriteMode.TRANSPARENT, self.width, self.height)
 
     def draw_progress_bar(
         self,
@@ -272,11 +402,11 @@ class Canvas:
         if filled:
             self.draw_rect(x + 1, y + 1, fill_width, inner_height, filled=True)
         else:
-            # Dithered fill
-            for py in range(inner_height):
-                for px in range(fill_width):
-                    if (px + py) % 2 == 0:
-                        self.set_pixel(x + 1 + px, y + 1 + py, True)
+            # Dithered fill: checkerboard starting with the inner top-left pixel
+            first = 0x55 if (x + y) % 2 == 0 else 0xAA
+            self._apply_mask(
+                x + 1, y + 1, fill_width, inner_height, BLEND_SET, pattern=(first, first ^ 0xFF)
+            )
 
     def invert_region(self, x: int, y: int, width: int, height: int):
         """
@@ -286,10 +416,7 @@ class Canvas:
             x, y: Top-left corner
             width, height: Dimensions
         """
-        for py in range(height):
-            for px in range(width):
-                current = self.get_pixel(x + px, y + py)
-                self.set_pixel(x + px, y + py, not current)
+        self._apply_mask(x, y, width, height, BLEND_INVERT)
 
     def blit(self, other: "Canvas", x: int, y: int):
         """
@@ -299,10 +426,23 @@ class Canvas:
             other: Source canvas
             x, y: Position to place source
         """
-        for py in range(other.height):
-            for px in range(other.width):
-                if other.get_pixel(px, py):
-                    self.set_pixel(x + px, y + py, True)
+        # Work column by column: buf[c::WIDTH] is the 6 bytes of column c,
+        # so a column is one 48-bit integer that shifts into place.
+        src_mask = (1 << min(other.height, self.BUFFER_ROWS)) - 1
+        dst_mask = (1 << self.height) - 1
+        src = other._buffer
+        dst = self._buffer
+        stride = self.WIDTH
+
+        for px in range(max(0, -x), min(other.width, self.width - x, stride)):
+            column = int.from_bytes(src[px::stride], "little") & src_mask
+            if not column:
+                continue
+            column = (column << y if y >= 0 else column >> -y) & dst_mask
+            if column:
+                dx = x + px
+                column |= int.from_bytes(dst[dx::stride], "little")
+                dst[dx::stride] = column.to_bytes(self.BUFFER_ROWS // 8, "little")
 
     def to_bytes(self) -> bytes:
         """
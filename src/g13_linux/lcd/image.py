@@ -0,0 +1,147 @@
+"""
+LCD Image Import
+
+Converts Pillow images (logos, charts, artwork) to monochrome LCD pixels:
+alpha is flattened onto black, the image is scaled to the target box and
+reduced to 1 bit per pixel by thresholding, ordered (Bayer) dithering or
+Floyd-Steinberg error diffusion. Everything runs as array operations or
+inside Pillow's C code; no per-pixel Python loops.
+
+Requires numpy (pip install numpy).
+"""
+
+from enum import Enum
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("LCD image import requires numpy. Run: pip install numpy") from e
+
+from PIL import Image, ImageOps
+
+from .array_canvas import pack_pixels
+
+
+class DitherMode(Enum):
+    """How grayscale is reduced to on/off pixels."""
+
+    THRESHOLD = "threshold"  # On where brighter than the threshold
+    ORDERED = "ordered"  # 8x8 Bayer matrix; stable under animation
+    FLOYD_STEINBERG = "floyd_steinberg"  # Error diffusion; best for photos
+
+
+def _bayer(n: int) -> "np.ndarray":
+    """Bayer index matrix of size n x n (n a power of 2), values 0..n*n-1."""
+    matrix = np.zeros((1, 1), dtype=np.int32)
+    while matrix.shape[0] < n:
+        matrix = np.block([[4 * matrix, 4 * matrix + 2], [4 * matrix + 3, 4 * matrix + 1]])
+    return matrix
+
+
+# Per-cell thresholds in 0..255, centered in each of the 64 levels
+_BAYER_8 = (_bayer(8) + 0.5) * (256 / 64)
+
+
+def prepare_image(
+    image: Image.Image, width: int, height: int, keep_aspect: bool = True
+) -> Image.Image:
+    """
+    Flatten and scale an image to an 8-bit grayscale width x height image.
+
+    Args:
+        image: Source image (any mode)
+        width, height: Target size
+        keep_aspect: Letterbox on black instead of stretching
+
+    Returns:
+        Mode "L" image of exactly width x height
+    """
+    if image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGBA", rgba.size, (0, 0, 0, 255))
+        image = Image.alpha_composite(background, rgba)
+    gray = image.convert("L")
+
+    if gray.size == (width, height):
+        return gray
+    if not keep_aspect:
+        return gray.resize((width, height), Image.Resampling.LANCZOS)
+
+    scaled = ImageOps.contain(gray, (width, height), Image.Resampling.LANCZOS)
+    boxed = Image.new("L", (width, height), 0)
+    boxed.paste(scaled, ((width - scaled.width) // 2, (height - scaled.height) // 2))
+    return boxed
+
+
+def apply_dither(
+    gray: "np.ndarray", mode: DitherMode = DitherMode.FLOYD_STEINBERG, threshold: int = 128
+) -> "np.ndarray":
+    """
+    Reduce a grayscale array to on/off pixels.
+
+    Args:
+        gray: 2D uint8 array, [y, x]
+        mode: Dithering mode
+        threshold: Brightness (0-255) at which pixels turn on; for the
+            dithered modes it shifts overall brightness
+
+    Returns:
+        2D bool array, True = pixel on
+    """
+    if mode is DitherMode.THRESHOLD:
+        return gray >= threshold
+
+    # Move the midpoint so `threshold` maps to 50% coverage
+    biased = gray.astype(np.int16) + (128 - threshold)
+
+    if mode is DitherMode.ORDERED:
+        rows, cols = gray.shape
+        tiles = np.tile(_BAYER_8, ((rows + 7) // 8, (cols + 7) // 8))[:rows, :cols]
+        return biased >= tiles
+
+    # Error diffusion is sequential; Pillow implements it in C
+    source = Image.fromarray(np.clip(biased, 0, 255).astype(np.uint8), "L")
+    return np.asarray(source.convert("1", dither=Image.Dither.FLOYDSTEINBERG), dtype=bool)
+
+
+def image_to_pixels(
+    image: Image.Image,
+    width: int = 160,
+    height: int = 43,
+    dither: DitherMode = DitherMode.FLOYD_STEINBERG,
+    threshold: int = 128,
+    keep_aspect: bool = True,
+    invert: bool = False,
+) -> "np.ndarray":
+    """
+    Convert an image to LCD pixels.
+
+    Args:
+        image: Source image (any mode)
+        width, height: Target size
+        dither: Dithering mode
+        threshold: Brightness (0-255) at which pixels turn on
+        keep_aspect: Letterbox on black instead of stretching
+        invert: Turn on dark pixels instead of light ones
+
+    Returns:
+        (height, width) bool array, True = pixel on
+    """
+    gray = np.asarray(prepare_image(image, width, height, keep_aspect), dtype=np.uint8)
+    if invert:
+        gray = 255 - gray
+    return apply_dither(gray, dither, threshold)
+
+
+def image_to_frame(image: Image.Image, **options) -> bytes:
+    """
+    Convert an image to a full-screen 960-byte framebuffer.
+
+    Args:
+        image: Source image (any mode)
+        **options: image_to_pixels() options (dither, threshold, ...)
+
+    Returns:
+        Row-block framebuffer for G13LCD.write_bitmap()
+    """
+    return pack_pixels(image_to_pixels(image, **options))
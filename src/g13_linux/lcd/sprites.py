@@ -0,0 +1,181 @@
+"""
+LCD Sprites
+
+Small bitmaps prepared for the row-block framebuffer. A sprite stores
+its columns pre-shifted for all 8 vertical bit offsets, split into the
+8-row blocks each offset touches, so drawing at any (x, y) is one masked
+integer operation per block with clipping at the screen edges.
+
+Sprites are built from icons, font glyphs or a Canvas (e.g. a rendered
+progress indicator).
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from .canvas import BLEND_CLEAR, BLEND_COPY, BLEND_INVERT, BLEND_SET, blend_columns
+
+if TYPE_CHECKING:
+    from .canvas import Canvas
+    from .fonts import Font
+    from .icons import Icon
+
+
+class SpriteMode(Enum):
+    """How sprite pixels combine with the framebuffer."""
+
+    TRANSPARENT = "transparent"  # Set pixels turn on, others untouched
+    OPAQUE = "opaque"  # Sprite box replaced: set pixels on, others off
+    INVERTED = "inverted"  # Sprite box replaced: set pixels off, others on
+    ERASE = "erase"  # Set pixels turn off, others untouched
+    XOR = "xor"  # Set pixels toggle
+
+
+class Sprite:
+    """Bitmap with precomputed shift variants for fast blitting."""
+
+    __slots__ = ("width", "height", "_shifts")
+
+    def __init__(self, columns: list[int], height: int, coverage: list[int] | None = None):
+        """
+        Build a sprite from column bitmaps.
+
+        Args:
+            columns: One int per column, bit 0 = top row
+            height: Rows in the sprite
+            coverage: Pixels per column the sprite owns in opaque and
+                inverted modes (default: the full width x height box)
+        """
+        self.width = len(columns)
+        self.height = height
+        full = (1 << height) - 1
+        if coverage is None:
+            coverage = [full] * self.width
+        columns = [col & cover for col, cover in zip(columns, coverage)]
+        inverted = [cover & ~col for col, cover in zip(columns, coverage)]
+
+        # Per bit offset: (pixels, inverted pixels, coverage) per row block
+        self._shifts = []
+        for shift in range(8):
+            block_count = (shift + height + 7) >> 3
+            self._shifts.append(
+                tuple(
+                    tuple(
+                        bytes(((col << shift) >> (8 * block)) & 0xFF for col in source)
+                        for block in range(block_count)
+                    )
+                    for source in (columns, inverted, coverage)
+                )
+            )
+
+    @classmethod
+    def from_icon(cls, icon: "Icon") -> "Sprite":
+        """
+        Build a sprite from an icon's row-block data.
+
+        Rows missing from short icon data are left out of the sprite's
+        coverage, matching Canvas.draw_icon which skips them.
+        """
+        columns = []
+        coverage = []
+        for col in range(icon.width):
+            bits = cover = 0
+            for row in range(icon.height):
+                byte_idx = col + (row // 8) * icon.width
+                if byte_idx >= len(icon.data):
+                    continue
+                cover |= 1 << row
+                if icon.data[byte_idx] & (1 << (row % 8)):
+                    bits |= 1 << row
+            columns.append(bits)
+            coverage.append(cover)
+        return cls(columns, icon.height, coverage)
+
+    @classmethod
+    def from_glyph(cls, font: "Font", char: str) -> "Sprite | None":
+        """
+        Build a sprite from one font glyph.
+
+        Returns:
+            Sprite, or None if the font has no glyph (and no '?')
+        """
+        glyph = font.get_glyph(char)
+        if glyph is None:
+            return None
+        return cls(list(glyph), font.char_height)
+
+    @classmethod
+    def from_canvas(cls, canvas: "Canvas") -> "Sprite":
+        """Build a sprite from a (small) canvas's visible pixels."""
+        stride = canvas.WIDTH
+        buf = canvas._buffer
+        return cls(
+            [int.from_bytes(buf[col::stride], "little") for col in range(canvas.width)],
+            canvas.height,
+        )
+
+    def draw(
+        self,
+        buffer: bytearray,
+        x: int,
+        y: int,
+        mode: SpriteMode = SpriteMode.TRANSPARENT,
+        width: int = 160,
+        height: int = 43,
+    ):
+        """
+        Draw into a row-block framebuffer, clipped to width x height.
+
+        Args:
+            buffer: 960-byte framebuffer
+            x, y: Top-left position (may be partly off screen)
+            mode: How pixels combine with the framebuffer
+            width, height: Clip size
+        """
+        pixels, inverted, coverage = self._shifts[y & 7]
+        block = y >> 3
+
+        if mode is SpriteMode.OPAQUE or mode is SpriteMode.INVERTED:
+            source = pixels if mode is SpriteMode.OPAQUE else inverted
+            for i, columns in enumerate(source):
+                blend_columns(
+                    buffer, x, block + i, columns, BLEND_COPY, width, height, box=coverage[i]
+                )
+            return
+
+        op = _MODE_OPS[mode]
+        for i, columns in enumerate(pixels):
+            blend_columns(buffer, x, block + i, columns, op, width, height)
+
+
+_MODE_OPS = {
+    SpriteMode.TRANSPARENT: BLEND_SET,
+    SpriteMode.ERASE: BLEND_CLEAR,
+    SpriteMode.XOR: BLEND_INVERT,
+}
+
+# Icon sprites built on first use, keyed by icon identity. Entries hold
+# the icon so its id can't be reused while cached.
+_ICON_SPRITES: dict[int, tuple["Icon", tuple, Sprite]] = {}
+_ICON_CACHE_SIZE = 128
+
+
+def icon_sprite(icon: "Icon") -> Sprite:
+    """
+    Get the (cached) sprite for an icon.
+
+    Args:
+        icon: Icon to convert
+
+    Returns:
+        Sprite, rebuilt if the icon has been changed
+    """
+    signature = (icon.width, icon.height, bytes(icon.data))
+    entry = _ICON_SPRITES.get(id(icon))
+    if entry is not None and entry[0] is icon and entry[1] == signature:
+        return entry[2]
+    sprite = Sprite.from_icon(icon)
+    if len(_ICON_SPRITES) >= _ICON_CACHE_SIZE:
+        _ICON_SPRITES.clear()
+    _ICON_SPRITES[id(icon)] = (icon, signature, sprite)
+    return sprite
@@ -0,0 +1,182 @@
+"""
+LCD Text Cache
+
+Rasterized strings for the row-block framebuffer. A string is rendered
+once per (font, text, y % 8) into column masks for each 8-row block it
+touches, and kept in a bounded LRU cache. Drawing it again is one masked
+integer OR per block (see canvas.blend_columns), so labels redrawn every
+frame - profile names, clocks, menu items - cost almost nothing.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .canvas import BLEND_CLEAR, BLEND_SET, blend_columns
+from .fonts import Font
+
+
+@dataclass(frozen=True, slots=True)
+class TextRaster:
+    """A string rendered at one vertical bit offset."""
+
+    blocks: tuple[bytes, ...]  # Column masks per row block, top block first
+    chars: int  # Glyphs drawn (characters without a glyph are skipped)
+    advance: int  # Pixels per character (glyph width + 1 spacing)
+
+    def drawn_width(self, x: int, clip_width: int) -> int:
+        """
+        Width Canvas.draw_text reports when drawing at x.
+
+        Drawing stops after the first character whose advance reaches the
+        clip edge, so the width is a whole number of advances.
+
+        Args:
+            x: Start X
+            clip_width: Canvas width
+
+        Returns:
+            Width in pixels
+        """
+        if not self.chars:
+            return 0
+        reached = -(-(clip_width - x) // self.advance)
+        return min(self.chars, max(1, reached)) * self.advance
+
+
+def rasterize(font: Font, text: str, shift: int) -> TextRaster:
+    """
+    Render a string into per-block column masks.
+
+    Args:
+        font: Font to render with
+        text: String to render
+        shift: Vertical bit offset (y % 8) of the top row
+
+    Returns:
+        TextRaster with ceil((shift + font.char_height) / 8) blocks
+    """
+    advance = font.char_width + 1
+    row_mask = (1 << font.char_height) - 1
+    columns: list[int] = []
+    chars = 0
+
+    for char in text:
+        glyph = font.get_glyph(char)
+        if glyph is None:
+            continue
+        base = chars * advance
+        end = base + max(advance, len(glyph))
+        if len(columns) < end:
+            columns.extend([0] * (end - len(columns)))
+        for i, col in enumerate(glyph):
+            columns[base + i] |= (col & row_mask) << shift
+        chars += 1
+
+    block_count = (shift + font.char_height + 7) >> 3
+    blocks = tuple(
+        bytes((col >> (8 * block)) & 0xFF for col in columns) for block in range(block_count)
+    )
+    return TextRaster(blocks, chars, advance)
+
+
+class TextCache:
+    """
+    Bounded LRU cache of TextRaster objects.
+
+    Safe to share between threads. Fonts are keyed by identity; cached
+    entries keep a reference to their font so the key stays valid.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached rasters
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[Font, TextRaster]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, font: Font, text: str, shift: int) -> TextRaster:
+        """
+        Get a string's raster, rendering it on a miss.
+
+        Args:
+            font: Font to render with
+            text: String to render
+            shift: Vertical bit offset (y % 8)
+
+        Returns:
+            Cached or freshly rendered TextRaster
+        """
+        key = (id(font), text, shift)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        raster = rasterize(font, text, shift)
+        with self._lock:
+            self._entries[key] = (font, raster)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return raster
+
+    def clear(self):
+        """Drop all cached rasters."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Cache size and hit/miss counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Shared by every Canvas and G13LCD
+TEXT_CACHE = TextCache()
+
+
+def draw_text(
+    buffer: bytearray,
+    x: int,
+    y: int,
+    text: str,
+    font: Font,
+    on: bool = True,
+    width: int = 160,
+    height: int = 43,
+    cache: TextCache = TEXT_CACHE,
+) -> int:
+    """
+    Draw a string into a row-block framebuffer through the cache.
+
+    Args:
+        buffer: 960-byte framebuffer
+        x, y: Top-left position (may be partly off screen)
+        text: String to draw
+        font: Font to use
+        on: Pixel state
+        width, height: Clip size
+        cache: Raster cache to use
+
+    Returns:
+        Width of rendered text in pixels (as Canvas.draw_text)
+    """
+    raster = cache.get(font, text, y & 7)
+    op = BLEND_SET if on else BLEND_CLEAR
+    block = y >> 3
+    for i, columns in enumerate(raster.blocks):
+        blend_columns(buffer, x, block + i, columns, op, width, height)
+    return raster.drawn_width(x, width)
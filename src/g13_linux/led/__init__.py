@@ -5,8 +5,12 @@ Provides RGB color management, effects engine, and LED controller.
 """
 
 from .colors import NAMED_COLORS, RGB, blend, brighten, dim
+from .compositor import BlendMode, EffectLayer, LEDCompositor
 from .controller import LEDController
-from .effects import EffectType, alert, fade, pulse, rainbow, solid
+from .effects import EffectType, alert, candle, fade, pulse, rainbow, solid, strobe
+from .reactive import InputActivity, key_flash, record_indicator, typing_heat
+from .scheduler import FrameScheduler
+from .tables import ColorTable
 
 __all__ = [
     "RGB",
@@ -20,5 +24,16 @@ __all__ = [
     "rainbow",
     "fade",
     "alert",
+    "strobe",
+    "candle",
+    "FrameScheduler",
+    "ColorTable",
+    "BlendMode",
+    "EffectLayer",
+    "LEDCompositor",
+    "InputActivity",
+    "key_flash",
+    "typing_heat",
+    "record_indicator",
     "LEDController",
 ]
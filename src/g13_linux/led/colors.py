@@ -2,12 +2,15 @@
 RGB Color Utilities
 
 Provides RGB dataclass and color manipulation functions.
+
+RGB uses __slots__ and converts to and from a packed 0xRRGGBB int, the
+form effect lookup tables and comparisons use.
 """
 
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class RGB:
     """RGB color with 0-255 components."""
 
@@ -44,6 +47,19 @@ class RGB:
         except ValueError:
             raise ValueError(f"Invalid hex color: {hex_string}")
 
+    @classmethod
+    def from_packed(cls, value: int) -> "RGB":
+        """
+        Create RGB from a packed 0xRRGGBB int.
+
+        Args:
+            value: Packed color
+
+        Returns:
+            RGB instance
+        """
+        return cls((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
     @classmethod
     def from_name(cls, name: str) -> "RGB":
         """
@@ -65,6 +81,11 @@ class RGB:
         """Convert to hex string with # prefix."""
         return f"#{self.r:02X}{self.g:02X}{self.b:02X}"
 
+    @property
+    def packed(self) -> int:
+        """Color as a packed 0xRRGGBB int."""
+        return (self.r << 16) | (self.g << 8) | self.b
+
     def to_tuple(self) -> tuple[int, int, int]:
         """Convert to (r, g, b) tuple."""
         return (self.r, self.g, self.b)
@@ -0,0 +1,375 @@
+"""
+LED Compositor
+
+Blends a stack of effect layers into one backlight color per frame. A
+layer is a static color or an effect generator plus a blend mode; layers
+are drawn bottom (lowest z) to top, so a notification flash can play over
+the user's rainbow and the rainbow carries on when it ends. An effect
+yielding None is transparent for that frame.
+
+One persistent "LEDCompositor" thread renders frames on a FrameScheduler
+while any layer is animated and parks on an event otherwise. Passive
+layers (e.g. input-reactive effects) only change after wake(), so while
+every animated layer is passive and transparent the thread parks too. The layer
+stack is an immutable tuple replaced on every change, so adding or
+removing layers never restarts the thread and the frame loop reads the
+stack without locking.
+"""
+
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Callable, Iterator
+
+from .colors import RGB
+from .scheduler import FrameScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class BlendMode(Enum):
+    """How a layer combines with the layers below it."""
+
+    REPLACE = "replace"  # Layer color
+    ADD = "add"  # Sum, clamped at 255
+    MULTIPLY = "multiply"  # Product; white keeps, black clears
+    ALPHA = "alpha"  # Layer color mixed in by opacity
+
+
+class EffectLayer:
+    """One entry in the compositor stack."""
+
+    def __init__(
+        self,
+        name: str,
+        source: RGB | Iterator[RGB | None],
+        mode: BlendMode = BlendMode.REPLACE,
+        z: int = 0,
+        opacity: float = 1.0,
+        passive: bool = False,
+    ):
+        """
+        Initialize layer.
+
+        Args:
+            name: Unique layer name
+            source: Static color, or effect generator (advanced once per frame)
+            mode: Blend mode
+            z: Stacking order; higher layers are drawn later (on top)
+            opacity: Strength of the layer (0.0-1.0); the result is mixed
+                with the layers below by this factor
+            passive: The effect stays transparent until something calls
+                LEDCompositor.wake(), so it needs no frames while it is
+        """
+        self.name = name
+        self.mode = mode
+        self.z = z
+        self.opacity = max(0.0, min(1.0, opacity))
+        self.passive = passive
+        self.animated = not isinstance(source, RGB)
+        self._effect: Iterator[RGB | None] | None = None
+        # Last color produced (None until an animated layer's first frame)
+        self.color: RGB | None = None
+        if isinstance(source, RGB):
+            self.color = source
+        else:
+            self._effect = source
+        # Set once the layer left the stack (effect ended, removed or replaced)
+        self.finished = threading.Event()
+
+    def step(self) -> RGB | None:
+        """
+        Advance the layer by one frame.
+
+        Returns:
+            The layer's color (None = transparent this frame)
+
+        Raises:
+            StopIteration: The layer's effect has ended
+        """
+        if self._effect is not None:
+            self.color = next(self._effect)
+        return self.color
+
+
+def blend(below: tuple[int, int, int], layer: EffectLayer, color: RGB) -> tuple[int, int, int]:
+    """
+    Blend a layer color onto the color below it.
+
+    Args:
+        below: (r, g, b) of the layers below
+        layer: Layer supplying mode and opacity
+        color: The layer's color this frame
+
+    Returns:
+        Blended (r, g, b)
+    """
+    mode = layer.mode
+    r0, g0, b0 = below
+    r, g, b = color.r, color.g, color.b
+    if mode is BlendMode.ADD:
+        r, g, b = min(r0 + r, 255), min(g0 + g, 255), min(b0 + b, 255)
+    elif mode is BlendMode.MULTIPLY:
+        r, g, b = r0 * r // 255, g0 * g // 255, b0 * b // 255
+
+    opacity = layer.opacity
+    if opacity >= 1.0:
+        return r, g, b
+    return (
+        int(r0 + (r - r0) * opacity),
+        int(g0 + (g - g0) * opacity),
+        int(b0 + (b - b0) * opacity),
+    )
+
+
+class LEDCompositor:
+    """Persistent frame loop over a stack of effect layers."""
+
+    def __init__(self, output: Callable[[RGB], None], fps: float = 30.0):
+        """
+        Initialize compositor. The thread starts with the first animated layer.
+
+        Args:
+            output: Called with each composed color
+            fps: Frame rate while any layer is animated
+        """
+        self._output = output
+        self.fps = fps
+
+        self._layers: tuple[EffectLayer, ...] = ()
+        self._layers_lock = threading.Lock()  # Serializes stack changes
+        self._render_lock = threading.Lock()  # Serializes compose + output
+
+        self._thread: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._scheduler: FrameScheduler | None = None
+        # Plain flags for wake(): the loop is parked on _wake / a wake()
+        # arrived while it was running
+        self._parked = False
+        self._woken = False
+        # Monotonic time of the first frame; clock() counts from here
+        self._epoch: float | None = None
+        self.frames = 0
+
+    @property
+    def layers(self) -> tuple[EffectLayer, ...]:
+        """Current stack, bottom to top."""
+        return self._layers
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the compositor thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def animated(self) -> bool:
+        """Check if any layer needs per-frame rendering."""
+        return any(layer.animated for layer in self._layers)
+
+    def clock(self) -> float:
+        """Frame clock for effects played on this compositor; never goes back."""
+        scheduler = self._scheduler
+        return scheduler.clock() if scheduler else 0.0
+
+    def frame_stats(self) -> dict | None:
+        """Timing statistics of the current (or last) animated run."""
+        scheduler = self._scheduler
+        return scheduler.stats() if scheduler else None
+
+    def get_layer(self, name: str) -> EffectLayer | None:
+        """Get a layer by name."""
+        for layer in self._layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def add_layer(self, layer: EffectLayer) -> EffectLayer:
+        """
+        Add a layer, replacing any layer with the same name.
+
+        Args:
+            layer: Layer to add
+
+        Returns:
+            The added layer
+        """
+        with self._layers_lock:
+            replaced = self.get_layer(layer.name)
+            others = [existing for existing in self._layers if existing is not replaced]
+            others.append(layer)
+            # Stable sort: equal z keeps insertion order
+            self._layers = tuple(sorted(others, key=lambda entry: entry.z))
+        if replaced:
+            replaced.finished.set()
+        self.refresh()
+        return layer
+
+    def remove_layer(self, name: str) -> bool:
+        """
+        Remove a layer by name.
+
+        Args:
+            name: Layer name
+
+        Returns:
+            True if a layer was removed
+        """
+        with self._layers_lock:
+            removed = self.get_layer(name)
+            if removed is None:
+                return False
+            self._layers = tuple(layer for layer in self._layers if layer is not removed)
+        removed.finished.set()
+        self.refresh()
+        return True
+
+    def refresh(self):
+        """
+        Show stack changes: on the next frame if anything is animated,
+        otherwise by composing once on the calling thread.
+        """
+        if self.animated:
+            self._start()
+            self._wake.set()
+            return
+        with self._render_lock:
+            self._render_frame()
+
+    def wake(self):
+        """
+        Resume frames after passive layers went transparent. Thread-safe.
+
+        Cheap enough for the input path: while frames are running it only
+        stores a flag, and the event (and its lock) is used only when the
+        loop is parked.
+        """
+        # Flag first: if the loop parks after the check below, it sees it
+        self._woken = True
+        if self._parked:
+            self._wake.set()
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Stop the compositor thread. Layers are kept; refresh() restarts it.
+
+        Args:
+            timeout: Seconds to wait for the thread
+        """
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def _start(self):
+        """Start the compositor thread if it isn't running."""
+        with self._layers_lock:
+            if self.is_running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True, name="LEDCompositor")
+            self._thread.start()
+
+    def _run(self):
+        """Compositor loop: frames while animated, parked while static or idle."""
+        idle = False
+        while not self._stop.is_set():
+            if idle or not self.animated:
+                self._parked = True
+                if idle and self._woken:
+                    # wake() saw the loop running; don't park on a missed event
+                    self._parked = False
+                    idle = False
+                    continue
+                # A layer added or wake() since the last frame returns at once
+                self._wake.wait()
+                self._wake.clear()
+                self._parked = False
+                idle = False
+                continue
+
+            # Fresh deadlines after idling, so parked time isn't skipped frames,
+            # but one time base, so effect clocks never jump back
+            scheduler = FrameScheduler(self.fps, wait=self._stop.wait, offset=self._clock_offset())
+            self._scheduler = scheduler
+            while scheduler.wait():
+                # Cleared before the frame, so a wake() during it is kept
+                self._wake.clear()
+                self._woken = False
+                with self._render_lock:
+                    active = self._render_frame()
+                if not self.animated:
+                    break
+                if not active:
+                    idle = True
+                    break
+
+    def _clock_offset(self) -> float:
+        """Clock value for the first frame of a new run: time since the first run."""
+        now = time.monotonic()
+        if self._epoch is None:
+            self._epoch = now
+        offset = now - self._epoch
+        previous = self._scheduler
+        if previous is not None:
+            # Frame -1 of the new run must not read earlier than the last frame
+            offset = max(offset, previous.clock() + 1.0 / self.fps)
+        return offset
+
+    def _render_frame(self) -> bool:
+        """
+        Advance every layer one frame and output the blended color.
+
+        Returns:
+            False if every animated layer is passive and was transparent,
+            so no further frames are needed until wake()
+        """
+        layers = self._layers
+        if not layers:
+            return False
+
+        active = False
+        ended = []
+        color: RGB | None = None
+        mixed: tuple[int, int, int] | None = None
+        for layer in layers:
+            try:
+                layer_color = layer.step()
+            except StopIteration:
+                ended.append(layer)
+                continue
+            except Exception as e:
+                logger.error(f"LED layer {layer.name} failed: {e}")
+                ended.append(layer)
+                continue
+            if layer.animated and (layer_color is not None or not layer.passive):
+                active = True
+            if layer_color is None:
+                continue
+            if layer.mode is BlendMode.REPLACE and layer.opacity >= 1.0:
+                # Covers everything below; keep the shared color object
+                color, mixed = layer_color, None
+            else:
+                below = mixed or (color.to_tuple() if color else (0, 0, 0))
+                mixed = blend(below, layer, layer_color)
+                color = None
+
+        if ended:
+            with self._layers_lock:
+                self._layers = tuple(layer for layer in self._layers if layer not in ended)
+
+        # With every layer ended there is nothing to show; the LED keeps its last color
+        if mixed is not None:
+            color = RGB(*mixed)
+        if color is not None:
+            self._output(color)
+            self.frames += 1
+
+        # Signalled after the frame below the ended layers is out
+        for layer in ended:
+            logger.debug(f"LED layer finished: {layer.name}")
+            layer.finished.set()
+        return active
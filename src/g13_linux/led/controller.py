@@ -6,12 +6,17 @@ High-level LED control with effects support.
 
 import logging
 import threading
-import time
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
 from ..hardware.backlight import G13Backlight
 from .colors import RGB
-from .effects import EffectType, alert, fade, pulse, rainbow, solid
+from .compositor import BlendMode, EffectLayer, LEDCompositor
+from .effects import EffectType, alert, candle, fade, pulse, rainbow, solid, strobe
+from .reactive import InputActivity, key_flash, record_indicator, typing_heat
+from .tables import DEFAULT_STEPS
+
+if TYPE_CHECKING:
+    from ..input.report_bus import ReportBus
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +25,30 @@ class LEDController:
     """
     LED controller with effects engine.
 
-    Wraps G13Backlight and adds support for animated effects.
+    Wraps G13Backlight and adds support for animated effects. Colors and
+    effects are layers on an LEDCompositor: the user's color or effect is
+    the "base" layer, alerts and tints play on layers above it without
+    stopping it.
     """
 
     # Effect frame rate
     FPS = 30
     FRAME_INTERVAL = 1.0 / FPS
 
+    # Layer names and stacking order
+    BASE_LAYER = "base"
+    HEAT_LAYER = "typing_heat"
+    TINT_LAYER = "tint"
+    FLASH_LAYER = "key_flash"
+    RECORD_LAYER = "recording"
+    ALERT_LAYER = "alert"
+    BASE_Z = 0
+    HEAT_Z = 40
+    TINT_Z = 50
+    FLASH_Z = 60
+    RECORD_Z = 90
+    ALERT_Z = 100
+
     def __init__(self, device=None, backlight: G13Backlight = None):
         """
         Initialize LED controller.
@@ -44,21 +66,39 @@ class LEDController:
 
         self._current_color = RGB(255, 255, 255)
         self._current_effect: EffectType | None = None
-        self._effect_thread: threading.Thread | None = None
-        self._effect_stop = threading.Event()
-        self._effect_generator: Generator[RGB, None, None] | None = None
+        self._effect_layer: EffectLayer | None = None
         self._lock = threading.Lock()
+        self._compositor = LEDCompositor(self._apply_color, fps=self.FPS)
+        # Activity (and the bus feeding it) while reactive layers are enabled
+        self._reactive: tuple[InputActivity, "ReportBus | None"] | None = None
+
+    @property
+    def compositor(self) -> LEDCompositor:
+        """Layer compositor driving the backlight."""
+        return self._compositor
 
     @property
     def current_color(self) -> RGB:
-        """Get current LED color."""
+        """Get current LED color (the base layer's latest frame)."""
+        # A finished effect has left the stack but still shows its last frame
+        base = self._compositor.get_layer(self.BASE_LAYER) or self._effect_layer
+        if base is not None and base.color is not None:
+            return base.color
         return self._current_color
 
     @property
     def current_effect(self) -> EffectType | None:
         """Get currently running effect type."""
+        layer = self._effect_layer
+        if layer is None or layer.finished.is_set():
+            return None
         return self._current_effect
 
+    @property
+    def frame_stats(self) -> dict | None:
+        """Timing statistics of the running (or last) effect, if any."""
+        return self._compositor.frame_stats()
+
     def set_color(self, r: int, g: int, b: int):
         """
         Set LED to solid color.
@@ -68,9 +108,9 @@ class LEDController:
             g: Green (0-255)
             b: Blue (0-255)
         """
-        self.stop_effect()
         self._current_color = RGB(r, g, b)
-        self._apply_color(self._current_color)
+        self._effect_layer = None
+        self._compositor.add_layer(EffectLayer(self.BASE_LAYER, self._current_color, z=self.BASE_Z))
 
     def set_rgb(self, color: RGB):
         """
@@ -107,7 +147,7 @@ class LEDController:
 
     def get_current(self) -> RGB:
         """Get current color."""
-        return self._current_color
+        return self.current_color
 
     @property
     def brightness(self) -> int:
@@ -125,92 +165,223 @@ class LEDController:
 
     def start_effect(self, effect_type: EffectType, **params):
         """
-        Start an LED effect.
+        Start an LED effect on the base layer.
+
+        Replaces the current color or effect; layers above it keep playing.
 
         Args:
             effect_type: Type of effect to run
             **params: Effect-specific parameters
         """
-        self.stop_effect()
+        generator = self._create_effect(effect_type, self._compositor.clock, params)
+        if generator is None:
+            logger.warning(f"Unknown effect type: {effect_type}")
+            return
 
-        # Create generator for effect
+        self._current_effect = effect_type
+        self._effect_layer = EffectLayer(self.BASE_LAYER, generator, z=self.BASE_Z)
+        self._compositor.add_layer(self._effect_layer)
+        logger.debug(f"Started effect: {effect_type.value}")
+
+    def _create_effect(
+        self, effect_type: EffectType, clock, params: dict
+    ) -> Generator[RGB, None, None] | None:
+        """
+        Create the generator for an effect.
+
+        Args:
+            effect_type: Type of effect
+            clock: Frame clock for time-based effects
+            params: Effect-specific parameters ("steps" sets the lookup
+                table resolution of periodic effects)
+
+        Returns:
+            Effect generator, or None for an unknown type
+        """
+        steps = params.get("steps", DEFAULT_STEPS)
+        current = self.current_color
         if effect_type == EffectType.SOLID:
-            color = params.get("color", self._current_color)
-            self._effect_generator = solid(color)
+            return solid(params.get("color", current))
         elif effect_type == EffectType.PULSE:
-            color = params.get("color", self._current_color)
-            speed = params.get("speed", 1.0)
-            self._effect_generator = pulse(color, speed)
+            color = params.get("color", current)
+            return pulse(color, params.get("speed", 1.0), clock=clock, steps=steps)
         elif effect_type == EffectType.RAINBOW:
-            speed = params.get("speed", 1.0)
-            self._effect_generator = rainbow(speed)
+            return rainbow(params.get("speed", 1.0), clock=clock, steps=steps)
         elif effect_type == EffectType.FADE:
             color1 = params.get("color1", RGB(255, 0, 0))
             color2 = params.get("color2", RGB(0, 0, 255))
-            speed = params.get("speed", 1.0)
-            self._effect_generator = fade(color1, color2, speed)
+            return fade(color1, color2, params.get("speed", 1.0), clock=clock, steps=steps)
         elif effect_type == EffectType.ALERT:
             color = params.get("color", RGB(255, 0, 0))
-            count = params.get("count", 3)
-            self._effect_generator = alert(color, count)
-        else:
-            logger.warning(f"Unknown effect type: {effect_type}")
-            return
-
-        self._current_effect = effect_type
-        self._effect_stop.clear()
-        self._effect_thread = threading.Thread(
-            target=self._effect_loop, daemon=True, name="LEDEffect"
-        )
-        self._effect_thread.start()
-        logger.debug(f"Started effect: {effect_type.value}")
+            return alert(color, params.get("count", 3), clock=clock)
+        elif effect_type == EffectType.STROBE:
+            color = params.get("color", current)
+            return strobe(color, params.get("frequency", 10.0), clock=clock)
+        elif effect_type == EffectType.CANDLE:
+            return candle(params.get("color"), params.get("intensity", 0.3))
+        return None
 
     def stop_effect(self):
-        """Stop any running effect."""
-        if self._effect_thread and self._effect_thread.is_alive():
-            self._effect_stop.set()
-            self._effect_thread.join(timeout=1.0)
-            self._effect_thread = None
-
+        """Stop the base effect, holding its last color."""
+        layer = self._effect_layer
+        self._effect_layer = None
         self._current_effect = None
-        self._effect_generator = None
+        if layer is not None and not layer.finished.is_set():
+            self._current_color = layer.color or self._current_color
+            # Swap in a static layer; the LED already shows this color
+            self._compositor.add_layer(
+                EffectLayer(self.BASE_LAYER, self._current_color, z=self.BASE_Z)
+            )
         logger.debug("Effect stopped")
 
     def run_alert(self, color: RGB = None, count: int = 3, blocking: bool = True):
         """
-        Run alert effect.
+        Flash an alert over the current color or effect.
 
         Args:
             color: Flash color (default red)
             count: Number of flashes
             blocking: If True, wait for completion
         """
+        layer = self.add_layer(
+            self.ALERT_LAYER,
+            alert(color, count, clock=self._compositor.clock),
+            z=self.ALERT_Z,
+        )
         if blocking:
-            # Run synchronously
-            gen = alert(color, count)
-            for rgb in gen:
-                self._apply_color(rgb)
-                time.sleep(self.FRAME_INTERVAL)
-        else:
-            self.start_effect(EffectType.ALERT, color=color, count=count)
-
-    def _effect_loop(self):
-        """Background thread for running effects."""
-        while not self._effect_stop.is_set():
-            try:
-                if self._effect_generator:
-                    color = next(self._effect_generator)
-                    self._apply_color(color)
-                    self._current_color = color
-                time.sleep(self.FRAME_INTERVAL)
-            except StopIteration:
-                # Finite effect completed
-                logger.debug("Effect completed")
-                self._current_effect = None
-                break
-            except Exception as e:
-                logger.error(f"Effect error: {e}")
-                break
+            # 0.3 s per flash plus slack for a slow device
+            layer.finished.wait(count * 0.3 + 1.0)
+
+    def set_tint(self, color: RGB, opacity: float = 0.3, mode: BlendMode = BlendMode.ALPHA):
+        """
+        Tint whatever plays below (e.g. to mark the active mode).
+
+        Args:
+            color: Tint color
+            opacity: Tint strength (0.0-1.0)
+            mode: Blend mode of the tint layer
+        """
+        self.add_layer(self.TINT_LAYER, color, mode=mode, z=self.TINT_Z, opacity=opacity)
+
+    def clear_tint(self):
+        """Remove the tint layer."""
+        self.remove_layer(self.TINT_LAYER)
+
+    def enable_reactive(
+        self,
+        activity: InputActivity,
+        bus: "ReportBus | None" = None,
+        flash: bool = True,
+        heat: bool = True,
+        recording: bool = True,
+    ):
+        """
+        Light up on input: key press flashes, typing heat, record mode color.
+
+        Flashes and heat are added on top of the base; the record color
+        replaces it while record mode is on. The layers are passive: while
+        they are all transparent the compositor idles until activity wakes
+        it.
+
+        Args:
+            activity: Input activity the layers watch
+            bus: ReportBus feeding activity; subscribed until
+                disable_reactive() (None = the caller feeds activity)
+            flash: Flash on each key press
+            heat: Glow with typing speed
+            recording: Show record mode
+        """
+        self._detach_reactive()
+        activity.listener = self._compositor.wake
+        if bus is not None:
+            bus.subscribe(activity.on_report)
+        self._reactive = (activity, bus)
+
+        clock = self._compositor.clock
+        if heat:
+            self.add_layer(
+                self.HEAT_LAYER,
+                typing_heat(activity, clock=clock),
+                BlendMode.ADD,
+                self.HEAT_Z,
+                passive=True,
+            )
+        if flash:
+            self.add_layer(
+                self.FLASH_LAYER,
+                key_flash(activity, clock=clock),
+                BlendMode.ADD,
+                self.FLASH_Z,
+                passive=True,
+            )
+        if recording:
+            self.add_layer(
+                self.RECORD_LAYER,
+                record_indicator(activity, clock=clock),
+                z=self.RECORD_Z,
+                passive=True,
+            )
+
+    def disable_reactive(self):
+        """Remove the input-reactive layers and stop following the report bus."""
+        self._detach_reactive()
+        for name in (self.HEAT_LAYER, self.FLASH_LAYER, self.RECORD_LAYER):
+            self.remove_layer(name)
+
+    def _detach_reactive(self):
+        """Unsubscribe the activity from the report bus and stop its wakeups."""
+        reactive = self._reactive
+        if reactive is None:
+            return
+        self._reactive = None
+        activity, bus = reactive
+        activity.listener = None
+        if bus is not None:
+            bus.unsubscribe(activity.on_report)
+
+    def add_layer(
+        self,
+        name: str,
+        source: RGB | Generator[RGB | None, None, None],
+        mode: BlendMode = BlendMode.REPLACE,
+        z: int = 0,
+        opacity: float = 1.0,
+        passive: bool = False,
+    ) -> EffectLayer:
+        """
+        Add (or replace) a compositor layer.
+
+        Effects should be created with clock=controller.compositor.clock.
+
+        Args:
+            name: Layer name
+            source: Static color or effect generator
+            mode: Blend mode
+            z: Stacking order (base is BASE_Z, alerts ALERT_Z)
+            opacity: Layer strength (0.0-1.0)
+            passive: The effect stays transparent until compositor.wake()
+
+        Returns:
+            The new layer (its finished event is set when it leaves the stack)
+        """
+        return self._compositor.add_layer(EffectLayer(name, source, mode, z, opacity, passive))
+
+    def remove_layer(self, name: str) -> bool:
+        """
+        Remove a compositor layer.
+
+        Args:
+            name: Layer name
+
+        Returns:
+            True if the layer existed
+        """
+        return self._compositor.remove_layer(name)
+
+    def close(self):
+        """Stop effects and the compositor thread."""
+        self.stop_effect()
+        self._compositor.stop()
 
     def _apply_color(self, color: RGB):
         """Send color to hardware."""
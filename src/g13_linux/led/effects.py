@@ -2,14 +2,25 @@
 LED Effects Engine
 
 Generator-based effects for LED animations.
+
+Time-based effects take a clock; LEDController passes its
+FrameScheduler's frame clock so each frame is computed for its due time.
+Periodic effects compile one period into a ColorTable when they start
+(`steps` sets the resolution) and then only look colors up.
 """
 
 import math
+import random
 import time
 from enum import Enum
-from typing import Generator
+from typing import Callable, Generator
 
 from .colors import RGB, blend, dim, hsv_to_rgb
+from .tables import DEFAULT_STEPS, ColorTable
+
+# Frame times can land exactly on a flash boundary; keep float error from
+# putting them just before it
+_EPSILON = 1e-9
 
 
 class EffectType(Enum):
@@ -20,6 +31,8 @@ class EffectType(Enum):
     RAINBOW = "rainbow"
     FADE = "fade"
     ALERT = "alert"
+    STROBE = "strobe"
+    CANDLE = "candle"
 
 
 def solid(color: RGB) -> Generator[RGB, None, None]:
@@ -36,64 +49,121 @@ def solid(color: RGB) -> Generator[RGB, None, None]:
         yield color
 
 
-def pulse(color: RGB, speed: float = 1.0) -> Generator[RGB, None, None]:
+def play(
+    table: ColorTable, clock: Callable[[], float] = time.monotonic
+) -> Generator[RGB, None, None]:
+    """
+    Loop a compiled table forever.
+
+    Args:
+        table: Effect table
+        clock: Time source in seconds
+
+    Yields:
+        The table's shared RGB for the current time
+    """
+    colors = table.colors
+    index = table.index
+    start_time = clock()
+    while True:
+        yield colors[index(clock() - start_time)]
+
+
+def _periodic(
+    sample: Callable[[float], RGB],
+    speed: float,
+    clock: Callable[[], float],
+    steps: int,
+) -> Generator[RGB, None, None]:
+    """
+    Compile and loop one period of an effect.
+
+    Args:
+        sample: Color at a phase in [0, 1)
+        speed: Cycles per second; <= 0 holds the phase 0 color
+        clock: Time source in seconds
+        steps: Table resolution per cycle
+
+    Yields:
+        The effect's colors
+    """
+    if speed <= 0:
+        return solid(sample(0.0))
+    return play(ColorTable.compile(sample, 1.0 / speed, steps), clock)
+
+
+def _wave(phase: float) -> float:
+    """Sine wave from 0 to 1 and back over one phase cycle."""
+    return (math.sin(phase * 2 * math.pi) + 1) / 2
+
+
+def pulse(
+    color: RGB,
+    speed: float = 1.0,
+    clock: Callable[[], float] = time.monotonic,
+    steps: int = DEFAULT_STEPS,
+) -> Generator[RGB, None, None]:
     """
     Breathing/pulse effect - fades in and out.
 
     Args:
         color: Base color to pulse
-        speed: Cycles per second (default 1.0)
+        speed: Cycles per second (default 1.0; <= 0 holds a steady color)
+        clock: Time source in seconds
+        steps: Table resolution per cycle
 
     Yields:
         RGB colors varying in brightness
     """
-    start_time = time.time()
-    while True:
-        elapsed = time.time() - start_time
-        # Sine wave oscillation between 0.2 and 1.0 brightness
-        phase = (math.sin(elapsed * speed * 2 * math.pi) + 1) / 2
-        brightness = 0.2 + phase * 0.8
-        yield dim(color, 1.0 - brightness)
+    # Sine wave oscillation between 0.2 and 1.0 brightness
+    return _periodic(
+        lambda phase: dim(color, 1.0 - (0.2 + _wave(phase) * 0.8)), speed, clock, steps
+    )
 
 
-def rainbow(speed: float = 1.0) -> Generator[RGB, None, None]:
+def rainbow(
+    speed: float = 1.0, clock: Callable[[], float] = time.monotonic, steps: int = DEFAULT_STEPS
+) -> Generator[RGB, None, None]:
     """
     Rainbow effect - cycles through the color spectrum.
 
     Args:
-        speed: Full cycles per second (default 1.0)
+        speed: Full cycles per second (default 1.0; <= 0 holds a steady color)
+        clock: Time source in seconds
+        steps: Table resolution per cycle
 
     Yields:
         RGB colors cycling through hue
     """
-    start_time = time.time()
-    while True:
-        elapsed = time.time() - start_time
-        hue = (elapsed * speed) % 1.0
-        yield hsv_to_rgb(hue, 1.0, 1.0)
+    return _periodic(lambda hue: hsv_to_rgb(hue, 1.0, 1.0), speed, clock, steps)
 
 
-def fade(color1: RGB, color2: RGB, speed: float = 1.0) -> Generator[RGB, None, None]:
+def fade(
+    color1: RGB,
+    color2: RGB,
+    speed: float = 1.0,
+    clock: Callable[[], float] = time.monotonic,
+    steps: int = DEFAULT_STEPS,
+) -> Generator[RGB, None, None]:
     """
     Fade effect - transitions between two colors.
 
     Args:
         color1: First color
         color2: Second color
-        speed: Full fade cycles per second (default 1.0)
+        speed: Full fade cycles per second (default 1.0; <= 0 holds a steady color)
+        clock: Time source in seconds
+        steps: Table resolution per cycle
 
     Yields:
         RGB colors blending between the two
     """
-    start_time = time.time()
-    while True:
-        elapsed = time.time() - start_time
-        # Oscillate between 0 and 1
-        phase = (math.sin(elapsed * speed * 2 * math.pi) + 1) / 2
-        yield blend(color1, color2, phase)
+    return _periodic(lambda phase: blend(color1, color2, _wave(phase)), speed, clock, steps)
 
 
-def alert(color: RGB = None, count: int = 3) -> Generator[RGB, None, None]:
+def alert(
+    color: RGB = None, count: int = 3, clock: Callable[[], float] = time.monotonic
+) -> Generator[RGB, None, None]:
     """
     Alert effect - flashes color on/off.
 
@@ -102,6 +172,7 @@ def alert(color: RGB = None, count: int = 3) -> Generator[RGB, None, None]:
     Args:
         color: Flash color (default red)
         count: Number of flashes (default 3)
+        clock: Time source in seconds
 
     Yields:
         RGB colors alternating between color and black
@@ -109,59 +180,65 @@ def alert(color: RGB = None, count: int = 3) -> Generator[RGB, None, None]:
     if color is None:
         color = RGB(255, 0, 0)
 
-    black = RGB(0, 0, 0)
     flash_duration = 0.15  # seconds
+    total = count * 2 * flash_duration
+    # On for the first half of each flash period, off for the second
+    table = _flash_table(color, 2 * flash_duration)
 
-    for _ in range(count):
-        # Flash on
-        on_start = time.time()
-        while time.time() - on_start < flash_duration:
-            yield color
-        # Flash off
-        off_start = time.time()
-        while time.time() - off_start < flash_duration:
-            yield black
+    start_time = clock()
+    while True:
+        elapsed = clock() - start_time
+        if elapsed + _EPSILON >= total:
+            return
+        yield table.color_at(elapsed)
 
 
-def strobe(color: RGB, frequency: float = 10.0) -> Generator[RGB, None, None]:
+def strobe(
+    color: RGB, frequency: float = 10.0, clock: Callable[[], float] = time.monotonic
+) -> Generator[RGB, None, None]:
     """
     Strobe effect - rapid on/off flashing.
 
     Args:
         color: Strobe color
-        frequency: Flashes per second (default 10)
+        frequency: Flashes per second (default 10; <= 0 holds the color)
+        clock: Time source in seconds
 
     Yields:
         RGB colors alternating rapidly
     """
-    black = RGB(0, 0, 0)
-    period = 1.0 / frequency
-    start_time = time.time()
+    if frequency <= 0:
+        return solid(color)
+    # On during first half of period
+    return play(_flash_table(color, 1.0 / frequency), clock)
 
-    while True:
-        elapsed = time.time() - start_time
-        # On during first half of period
-        phase = (elapsed % period) / period
-        yield color if phase < 0.5 else black
+
+def _flash_table(color: RGB, period: float) -> ColorTable:
+    """Two-step table: color for the first half of period, black after."""
+    return ColorTable.compile(lambda phase: color if phase < 0.5 else RGB(0, 0, 0), period, 2)
 
 
-def candle(base_color: RGB = None, flicker_intensity: float = 0.3) -> Generator[RGB, None, None]:
+def candle(
+    base_color: RGB | None = None, flicker_intensity: float = 0.3, steps: int = 64
+) -> Generator[RGB, None, None]:
     """
     Candle flicker effect - simulates flickering flame.
 
     Args:
         base_color: Base flame color (default warm orange)
         flicker_intensity: How much brightness varies (0.0-1.0)
+        steps: Number of precomputed brightness levels
 
     Yields:
         RGB colors simulating candle flicker
     """
-    import random
-
     if base_color is None:
         base_color = RGB(255, 100, 20)
 
+    # Brightness levels from full down to 1 - intensity; frames pick one at random
+    levels = ColorTable.compile(
+        lambda level: dim(base_color, level * flicker_intensity), 1.0, steps
+    ).colors
+    choice = random.choice
     while True:
-        # Random brightness variation
-        flicker = 1.0 - random.random() * flicker_intensity
-        yield dim(base_color, 1.0 - flicker)
+        yield choice(levels)
@@ -0,0 +1,189 @@
+"""
+Input-Reactive LED Effects
+
+Backlight effects driven by key input: a flash on each G-key press, a
+glow that heats up with typing speed and a breathing color while MR
+record mode is on.
+
+The ReportBus reader thread feeds an InputActivity (plain counter and flag
+stores, no allocation); the effects poll it once per compositor frame.
+The input path never waits on the LED side, so reactive lighting adds no
+input latency. Effects yield None while they have nothing to show, which
+leaves their layer transparent. They only light up again after a key
+press or an MR toggle, which wake the compositor through
+InputActivity.listener, so a transparent reactive layer needs no frames.
+The listener (LEDCompositor.wake) takes no lock while frames are running;
+it only signals the compositor's event while the compositor is parked.
+"""
+
+import time
+from typing import TYPE_CHECKING, Callable, Generator
+
+from .colors import RGB, dim
+from .effects import pulse
+
+if TYPE_CHECKING:
+    from ..input.report_bus import DecodedReport
+
+# Keys that count as typing
+_TYPING_KEYS = frozenset(f"G{n}" for n in range(1, 23))
+
+
+class InputActivity:
+    """
+    Key activity shared between the report reader and LED effects.
+
+    Only the reader thread writes the press counter; effects read it and
+    diff against the value they saw last frame. Int and bool attribute
+    stores are atomic in CPython, so neither side locks.
+    """
+
+    RECORD_BUTTON = "MR"
+
+    def __init__(self):
+        """Initialize with no presses and record mode off."""
+        self.presses = 0  # G-key presses since start (only ever grows)
+        self.recording = False
+        # Called after each change (e.g. LEDCompositor.wake); must not block or lock
+        self.listener: Callable[[], None] | None = None
+
+    def on_report(self, report: "DecodedReport"):
+        """
+        ReportBus subscriber: count G-key presses, toggle record mode on MR.
+
+        Args:
+            report: Decoded report
+        """
+        changed = False
+        for button in report.pressed:
+            if button in _TYPING_KEYS:
+                self.presses += 1
+                changed = True
+            elif button == self.RECORD_BUTTON:
+                self.recording = not self.recording
+                changed = True
+        if changed and self.listener:
+            self.listener()
+
+    def set_recording(self, recording: bool):
+        """
+        Set record mode directly (e.g. from a macro recorder).
+
+        Args:
+            recording: True while recording
+        """
+        self.recording = recording
+        if self.listener:
+            self.listener()
+
+
+def _levels(color: RGB, steps: int) -> tuple[RGB, ...]:
+    """Color at steps brightness levels, from black (0) to full (steps - 1)."""
+    return tuple(dim(color, 1.0 - i / (steps - 1)) for i in range(steps))
+
+
+def key_flash(
+    activity: InputActivity,
+    color: RGB | None = None,
+    duration: float = 0.25,
+    clock: Callable[[], float] = time.monotonic,
+    steps: int = 32,
+) -> Generator[RGB | None, None, None]:
+    """
+    Flash on each key press, fading out over duration.
+
+    Args:
+        activity: Input activity to watch
+        color: Flash color (default white)
+        duration: Seconds a flash takes to fade out
+        clock: Time source in seconds
+        steps: Precomputed fade levels
+
+    Yields:
+        Flash color, or None when no flash is showing
+    """
+    levels = _levels(color or RGB(255, 255, 255), steps)
+    top = steps - 1
+    seen = activity.presses
+    flash_start = None
+    while True:
+        now = clock()
+        presses = activity.presses
+        if presses != seen:
+            seen = presses
+            flash_start = now
+        if flash_start is None:
+            yield None
+            continue
+
+        fade = (now - flash_start) / duration
+        if fade >= 1.0:
+            flash_start = None
+            yield None
+            continue
+        yield levels[top - int(fade * top)]
+
+
+def typing_heat(
+    activity: InputActivity,
+    color: RGB | None = None,
+    full_rate: float = 8.0,
+    response: float = 1.0,
+    clock: Callable[[], float] = time.monotonic,
+    steps: int = 32,
+) -> Generator[RGB | None, None, None]:
+    """
+    Glow that brightens with typing speed.
+
+    Args:
+        activity: Input activity to watch
+        color: Glow color at full heat (default orange-red)
+        full_rate: Key presses per second for full heat
+        response: Seconds the rate estimate averages over
+        clock: Time source in seconds
+        steps: Precomputed heat levels
+
+    Yields:
+        Glow color, or None when cold
+    """
+    levels = _levels(color or RGB(255, 64, 0), steps)
+    top = steps - 1
+    seen = activity.presses
+    last = clock()
+    rate = 0.0
+    while True:
+        now = clock()
+        presses = activity.presses
+        dt = now - last
+        if dt > 0:
+            # Exponential moving average of presses per second
+            sample = (presses - seen) / dt
+            rate += (sample - rate) * min(1.0, dt / response)
+        seen = presses
+        last = now
+
+        level = int(min(rate / full_rate, 1.0) * top)
+        yield levels[level] if level else None
+
+
+def record_indicator(
+    activity: InputActivity,
+    color: RGB | None = None,
+    speed: float = 1.5,
+    clock: Callable[[], float] = time.monotonic,
+) -> Generator[RGB | None, None, None]:
+    """
+    Breathing color while record mode is on.
+
+    Args:
+        activity: Input activity to watch
+        color: Indicator color (default red)
+        speed: Breaths per second
+        clock: Time source in seconds
+
+    Yields:
+        Indicator color, or None while not recording
+    """
+    breathing = pulse(color or RGB(255, 0, 0), speed, clock=clock)
+    while True:
+        yield next(breathing) if activity.recording else None
@@ -0,0 +1,129 @@
+"""
+LED Frame Scheduler
+
+Paces effect frames from absolute monotonic deadlines. Frame n is due at
+start + n / fps, so time spent producing and sending a frame doesn't push
+later frames back (no drift). When the loop falls more than a frame
+behind, the missed frames are skipped rather than played back to back.
+
+Effects should read time from FrameScheduler.clock, which returns the
+due time of the current frame: their output then depends only on the
+frame index, so a slow HID write doesn't make the animation uneven.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class FrameScheduler:
+    """Deadline-based frame pacing with skip and timing statistics."""
+
+    def __init__(
+        self,
+        fps: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        wait: Callable[[float], bool] | None = None,
+        late_tolerance: float = 0.002,
+        offset: float = 0.0,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            fps: Target frames per second
+            clock: Monotonic clock in seconds
+            wait: Sleeps up to a timeout and returns True to stop the loop
+                (e.g. threading.Event.wait); default sleeps uninterrupted
+            late_tolerance: Seconds after its deadline a frame may start
+                before it counts as late
+            offset: Added to clock(), to carry on an earlier scheduler's
+                time base
+        """
+        self.fps = fps
+        self.interval = 1.0 / fps
+        self.late_tolerance = late_tolerance
+        self._clock = clock
+        self._wait = wait or threading.Event().wait
+        self.offset = offset
+
+        self._start: float | None = None
+        self._frame = -1
+
+        # Statistics
+        self.frames = 0
+        self.skipped_frames = 0
+        self.late_frames = 0
+        self.max_lateness = 0.0
+
+    @property
+    def frame_index(self) -> int:
+        """Index of the current frame (-1 before the first)."""
+        return self._frame
+
+    @property
+    def frame_time(self) -> float:
+        """Due time of the current frame (the clock's now before the first)."""
+        if self._start is None:
+            return self._clock()
+        return self._start + self._frame * self.interval
+
+    def clock(self) -> float:
+        """
+        Effect clock: the current frame's due time, in seconds since the
+        first frame (plus offset).
+
+        Computed as frame / fps, so frames on a period boundary land on it
+        exactly instead of just before it.
+        """
+        return self.offset + self._frame / self.fps
+
+    def wait(self) -> bool:
+        """
+        Sleep until the next frame is due.
+
+        Returns:
+            True to produce a frame, False if the wait was interrupted
+        """
+        now = self._clock()
+        if self._start is None:
+            self._start = now
+        self._frame += 1
+        deadline = self._start + self._frame * self.interval
+
+        if now >= deadline + self.interval:
+            # More than a frame behind: jump to the latest due frame
+            missed = int((now - deadline) / self.interval)
+            self._frame += missed
+            self.skipped_frames += missed
+            deadline += missed * self.interval
+
+        delay = deadline - now
+        # Called even when late, so a stop request is seen on every frame
+        if self._wait(max(delay, 0.0)):
+            return False
+        if -delay > self.late_tolerance:
+            self.late_frames += 1
+            self.max_lateness = max(self.max_lateness, -delay)
+
+        self.frames += 1
+        return True
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames produced per second since the first frame."""
+        if self._start is None or self.frames < 2:
+            return 0.0
+        elapsed = self._clock() - self._start
+        return (self.frames - 1) / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> dict:
+        """Get timing statistics."""
+        return {
+            "fps": self.fps,
+            "achieved_fps": self.achieved_fps,
+            "frames": self.frames,
+            "skipped_frames": self.skipped_frames,
+            "late_frames": self.late_frames,
+            "max_lateness_ms": self.max_lateness * 1000,
+        }
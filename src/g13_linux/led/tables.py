@@ -0,0 +1,92 @@
+"""
+Effect Lookup Tables
+
+Periodic effects are compiled once, when they start, into a ColorTable:
+one period sampled at a fixed number of steps, with one prebuilt RGB per
+step. Each frame then only turns the clock into a step index and yields
+that step's RGB - no trigonometry, blending or new color objects while
+the effect runs.
+"""
+
+from typing import Callable, Sequence
+
+from .colors import RGB
+
+# Default samples per period; 256 steps keep a 1 s rainbow smooth at 30 FPS
+DEFAULT_STEPS = 256
+
+# Frame times can land exactly on a step boundary; keep float error from
+# putting them just before it
+_EPSILON = 1e-9
+
+
+class ColorTable:
+    """One period of an effect, sampled into RGB steps."""
+
+    __slots__ = ("period", "steps", "colors", "_rate")
+
+    def __init__(self, colors: Sequence[RGB], period: float):
+        """
+        Initialize table.
+
+        Args:
+            colors: Color of each step
+            period: Seconds one pass through the table takes
+        """
+        if not colors:
+            raise ValueError("Table needs at least one step")
+        if period <= 0:
+            raise ValueError("Period must be positive")
+
+        self.period = period
+        self.steps = len(colors)
+        self._rate = self.steps / period
+
+        # One RGB per step, shared between steps with the same color
+        shared: dict[int, RGB] = {}
+        self.colors: tuple[RGB, ...] = tuple(
+            shared.setdefault(color.packed, RGB.from_packed(color.packed)) for color in colors
+        )
+
+    @classmethod
+    def compile(
+        cls, sample: Callable[[float], RGB], period: float, steps: int = DEFAULT_STEPS
+    ) -> "ColorTable":
+        """
+        Sample one period of an effect.
+
+        Args:
+            sample: Color at a phase in [0, 1)
+            period: Seconds per period
+            steps: Samples per period
+
+        Returns:
+            Compiled table
+        """
+        if steps < 1:
+            raise ValueError("Steps must be at least 1")
+        return cls([sample(i / steps) for i in range(steps)], period)
+
+    def __len__(self) -> int:
+        """Number of steps."""
+        return self.steps
+
+    def index(self, elapsed: float) -> int:
+        """
+        Get the step shown after elapsed seconds.
+
+        Args:
+            elapsed: Seconds since the effect started
+
+        Returns:
+            Step index (wraps every period)
+        """
+        return int(elapsed * self._rate + _EPSILON) % self.steps
+
+    def color_at(self, elapsed: float) -> RGB:
+        """
+        Get the color shown after elapsed seconds.
+
+        The returned RGB is shared; don't modify it.
+        """
+        return self.colors[self.index(elapsed)]
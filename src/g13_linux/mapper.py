@@ -1,27 +1,148 @@
-from typing import Union
+import os
+import threading
+from typing import Iterable, Union
 
 from evdev import UInput
 from evdev import ecodes as e
 
 from g13_linux.gui.models.event_decoder import EventDecoder
+from g13_linux.uinput_service import SYN_REPORT as _SYN_REPORT
+from g13_linux.uinput_service import RecordingOutput, UInputService
+from g13_linux.uinput_service import pack_events as _pack_events
+
+# Packed bit index (see EventDecoder.button_mask) for each button ID
+_BUTTON_BITS = {
+    button_id: EventDecoder.button_mask(button_id).bit_length() - 1
+    for button_id in EventDecoder.BUTTON_MAP
+}
+_BUTTON_BIT_COUNT = max(_BUTTON_BITS.values()) + 1
+
+
+class _Keymap:
+    """Prebuilt uinput events for one mapping layer."""
+
+    __slots__ = ("button_map", "press_payload", "release_payload", "press_bits", "release_bits")
+
+    def __init__(self, button_map: dict[str, list[int]]):
+        """
+        Compile a layer.
+
+        Args:
+            button_map: Button ID -> list of evdev keycodes (press order)
+        """
+        self.button_map = button_map
+        self.press_payload: dict[str, bytes] = {}
+        self.release_payload: dict[str, bytes] = {}
+        self.press_bits = [b""] * _BUTTON_BIT_COUNT
+        self.release_bits = [b""] * _BUTTON_BIT_COUNT
+
+        for button_id, keycodes in button_map.items():
+            self._compile(button_id, keycodes)
+
+    def _compile(self, button_id: str, keycodes: list[int]):
+        """Build the press/release events for one button."""
+        # Press in order (modifiers first), release in reverse order
+        press = tuple((e.EV_KEY, keycode, 1) for keycode in keycodes)
+        release = tuple((e.EV_KEY, keycode, 0) for keycode in reversed(keycodes))
+        self.press_payload[button_id] = _pack_events(press)
+        self.release_payload[button_id] = _pack_events(release)
+
+        bit = _BUTTON_BITS.get(button_id)
+        if bit is not None:
+            self.press_bits[bit] = self.press_payload[button_id]
+            self.release_bits[bit] = self.release_payload[button_id]
+
+    def update(self, button_id: str, keycodes: list[int]):
+        """
+        Recompile one button in place.
+
+        Args:
+            button_id: Button ID (e.g., "G1")
+            keycodes: New keycodes, or an empty list to unmap the button
+        """
+        if keycodes:
+            self.button_map[button_id] = keycodes
+            self._compile(button_id, keycodes)
+            return
+
+        self.button_map.pop(button_id, None)
+        self.press_payload.pop(button_id, None)
+        self.release_payload.pop(button_id, None)
+        bit = _BUTTON_BITS.get(button_id)
+        if bit is not None:
+            self.press_bits[bit] = b""
+            self.release_bits[bit] = b""
 
 
 class G13Mapper:
     """
     G13 event mapper - converts button presses to keyboard events.
 
-    Supports both simple keys and key combinations (e.g., Ctrl+B).
+    Supports both simple keys and key combinations (e.g., Ctrl+B), and
+    per-mode layers (M1/M2/M3) that override the base mappings.
+
+    Mappings are compiled when loaded: every layer gets prebuilt press
+    and release events, indexed by button bit in the packed button state.
+    Switching modes swaps the active layer; update_mapping() recompiles a
+    single button without rebuilding the layers. All key events caused by one
+    HID report are written to uinput in a single write() followed by one
+    SYN_REPORT, so they arrive in the same input frame.
+
+    Given a UInputService, the mapper sends through the shared keyboard
+    device and registers only the keys its layers use; otherwise it owns
+    a full-capability UInput device of its own.
     """
 
-    def __init__(self):
-        self.ui = UInput()
-        # button_id (str) -> list of evdev keycodes (for combos)
-        self.button_map: dict[str, list[int]] = {}
+    MODES = ("M1", "M2", "M3")
+
+    def __init__(self, output: UInputService | RecordingOutput | None = None):
+        """
+        Initialize mapper.
+
+        Args:
+            output: Shared uinput service, or a RecordingOutput that only
+                records (default: private UInput device)
+        """
+        self._output = output
+        self.ui: UInput | None = None if output else UInput()
         # Decoder for raw HID reports
         self.decoder = EventDecoder()
+        # Guards layer swaps against emission from the reader thread
+        self._lock = threading.Lock()
+        self._mode = "M1"
+        empty = _Keymap({})
+        self._keymap = empty
+        # Base layer, per-mode layers and the buttons each mode layer overrides
+        self._base = empty
+        self._layers: dict[str, _Keymap] = dict.fromkeys(self.MODES, empty)
+        self._overrides: dict[str, frozenset[str]] = {}
+        # Last packed button state seen by handle_report/handle_raw_report
+        self._buttons = 0
+        # Buttons held across a layer swap (their release is already sent)
+        self._stale = 0
+        # button_id (str) -> list of evdev keycodes (for combos)
+        self.button_map = {}
+
+    @property
+    def button_map(self) -> dict[str, list[int]]:
+        """Button ID -> list of evdev keycodes for the active layer."""
+        return self._keymap.button_map
+
+    @button_map.setter
+    def button_map(self, button_map: dict[str, list[int]]):
+        """Replace the mappings for every mode with a single layer."""
+        keymap = _Keymap(button_map)
+        self._set_layers(keymap, {mode: keymap for mode in self.MODES}, {})
+
+    @property
+    def mode(self) -> str:
+        """Active mode (M1, M2 or M3)."""
+        return self._mode
 
     def close(self):
-        self.ui.close()
+        # A shared output service is closed by its owner
+        if self.ui:
+            self.ui.close()
 
     def load_profile(self, profile_data: dict):
         """
@@ -30,14 +151,150 @@ class G13Mapper:
         Supports two formats:
         - Simple: {'G1': 'KEY_1', ...}
         - Combo:  {'G1': {'keys': ['KEY_LEFTCTRL', 'KEY_B'], 'label': '...'}, ...}
+
+        Optional 'mode_mappings' ({'M2': {'G1': 'KEY_F1'}, ...}) override
+        the base mappings while that mode is active. All layers are
+        compiled here so set_mode() only swaps tables.
         """
-        self.button_map = {}
-        mappings = profile_data.get("mappings", {})
+        base = self._parse_mappings(profile_data.get("mappings", {}))
+        base_keymap = _Keymap(base)
+
+        layers = {}
+        overridden = {}
+        mode_mappings = profile_data.get("mode_mappings") or {}
+        for mode in self.MODES:
+            overrides = self._parse_mappings(mode_mappings.get(mode, {}))
+            layers[mode] = _Keymap({**base, **overrides}) if overrides else base_keymap
+            overridden[mode] = frozenset(overrides)
+
+        self._set_layers(base_keymap, layers, overridden)
+
+    def profile_keycodes(self, profile_data: dict) -> set[int]:
+        """
+        Collect every keycode a profile can send, without loading it.
 
+        Args:
+            profile_data: Profile dict as accepted by load_profile()
+
+        Returns:
+            Keycodes used by the base and per-mode mappings
+        """
+        keys: set[int] = set()
+        mapping_sets = [profile_data.get("mappings", {})]
+        mapping_sets.extend((profile_data.get("mode_mappings") or {}).values())
+        for mappings in mapping_sets:
+            for mapping in mappings.values():
+                keys.update(self._parse_mapping(mapping))
+        return keys
+
+    def _parse_mappings(self, mappings: dict) -> dict[str, list[int]]:
+        """Parse a mappings dict, dropping entries without valid keys."""
+        button_map = {}
         for button_id, mapping in mappings.items():
             keycodes = self._parse_mapping(mapping)
             if keycodes:
-                self.button_map[button_id] = keycodes
+                button_map[button_id] = keycodes
+        return button_map
+
+    def _set_layers(
+        self,
+        base: _Keymap,
+        layers: dict[str, _Keymap],
+        overrides: dict[str, frozenset[str]],
+    ):
+        """Install compiled layers and activate the current mode's layer."""
+        with self._lock:
+            self._base = base
+            self._layers = layers
+            self._overrides = overrides
+            self._require_keys()
+            self._swap(layers[self._mode])
+
+    def update_mapping(self, button_id: str, mapping: Union[str, dict]) -> bool:
+        """
+        Change one base mapping without recompiling the whole profile.
+
+        The button is patched in the base layer and in every mode layer
+        that doesn't override it. If the button is held while its active
+        mapping changes, the old keys are released now and the button
+        stays silent until it is pressed again.
+
+        Args:
+            button_id: Button ID (e.g., "G1")
+            mapping: Key code string or combo dict; one without valid
+                keys unmaps the button
+
+        Returns:
+            True if the button now has a mapping
+        """
+        keycodes = self._parse_mapping(mapping)
+
+        with self._lock:
+            targets = {id(self._base): self._base}
+            for mode, layer in self._layers.items():
+                if button_id not in self._overrides.get(mode, ()):
+                    targets[id(layer)] = layer
+
+            keymap = self._keymap
+            bit = _BUTTON_BITS.get(button_id)
+            if id(keymap) in targets and bit is not None:
+                mask = 1 << bit
+                if self._buttons & ~self._stale & mask:
+                    payload = keymap.release_bits[bit]
+                    if payload:
+                        self._write_batch([payload])
+                    self._stale |= mask
+
+            for layer in targets.values():
+                layer.update(button_id, keycodes)
+            if keycodes:
+                self._require_keys()
+
+        return bool(keycodes)
+
+    def set_mode(self, mode: str) -> bool:
+        """
+        Switch the active mapping layer.
+
+        Keys still held from the previous layer are released first; the
+        physical buttons stay silent until they are pressed again.
+
+        Args:
+            mode: Mode name ("M1", "M2", or "M3")
+
+        Returns:
+            True if the mode is valid
+        """
+        if mode not in self.MODES:
+            return False
+
+        with self._lock:
+            self._mode = mode
+            self._swap(self._layers[mode])
+        return True
+
+    def _swap(self, keymap: _Keymap):
+        """Activate keymap, releasing keys held under the old one. Lock held."""
+        old_keymap = self._keymap
+        self._keymap = keymap
+        if old_keymap is keymap:
+            return
+
+        held = self._buttons & ~self._stale
+        chunks: list[bytes] = []
+        self._collect(chunks, old_keymap.release_bits, held)
+        if chunks:
+            self._write_batch(chunks)
+        self._stale = self._buttons
+
+    def _require_keys(self):
+        """Register every keycode used by the layers with the output service."""
+        if self._output:
+            keys = set()
+            for layer in {id(layer): layer for layer in self._layers.values()}.values():
+                for keycodes in layer.button_map.values():
+                    keys.update(keycodes)
+            self._output.require_keys(keys)
 
     def _parse_mapping(self, mapping: Union[str, dict]) -> list[int]:
         """Parse a mapping entry into a list of keycodes."""
@@ -58,6 +315,14 @@ class G13Mapper:
 
         return []
 
+    def _write_batch(self, chunks: list[bytes]):
+        """Write prebuilt events plus one SYN_REPORT in a single write()."""
+        chunks.append(_SYN_REPORT)
+        if self._output:
+            self._output.write(b"".join(chunks))
+        elif self.ui:
+            os.write(self.ui.fd, b"".join(chunks))
+
     def handle_button_event(self, button_id: str, is_pressed: bool):
         """
         Handle decoded button event from GUI.
@@ -65,47 +330,108 @@ class G13Mapper:
         For key combinations, press all keys in order on press,
         and release all keys in reverse order on release.
         """
-        if button_id not in self.button_map:
-            return
-
-        keycodes = self.button_map[button_id]
-        state = 1 if is_pressed else 0
-
         if is_pressed:
-            # Press in order (modifiers first)
-            for keycode in keycodes:
-                self.ui.write(e.EV_KEY, keycode, state)
+            self.handle_button_changes((button_id,), ())
         else:
-            # Release in reverse order
-            for keycode in reversed(keycodes):
-                self.ui.write(e.EV_KEY, keycode, state)
-
-        self.ui.syn()
+            self.handle_button_changes((), (button_id,))
 
     def send_key(self, keycode):
         """Emit a single key press + release."""
-        self.ui.write(e.EV_KEY, keycode, 1)
-        self.ui.write(e.EV_KEY, keycode, 0)
-        self.ui.syn()
+        if self._output:
+            self._output.require_keys((keycode,))
+        self._write_batch([_pack_events(((e.EV_KEY, keycode, 1), (e.EV_KEY, keycode, 0)))])
+
+    def handle_button_changes(self, pressed: Iterable[str], released: Iterable[str]):
+        """
+        Emit mapped keys for a set of button changes as one input frame.
+
+        Args:
+            pressed: Button IDs that went down
+            released: Button IDs that went up
+        """
+        with self._lock:
+            keymap = self._keymap
+            buttons = self._buttons
+            chunks: list[bytes] = []
+            for button_id in pressed:
+                bit = _BUTTON_BITS.get(button_id)
+                if bit is not None:
+                    buttons |= 1 << bit
+                    self._stale &= ~(1 << bit)
+                payload = keymap.press_payload.get(button_id)
+                if payload:
+                    chunks.append(payload)
+            for button_id in released:
+                bit = _BUTTON_BITS.get(button_id)
+                if bit is not None:
+                    buttons &= ~(1 << bit)
+                    if self._stale & (1 << bit):
+                        # Held across a layer swap; its release is already sent
+                        continue
+                payload = keymap.release_payload.get(button_id)
+                if payload:
+                    chunks.append(payload)
+
+            self._buttons = buttons
+            self._stale &= buttons
+            if chunks:
+                self._write_batch(chunks)
+
+    def handle_buttons(self, buttons: int):
+        """
+        Emit mapped keys for a new packed button state.
+
+        Args:
+            buttons: Packed button state (see EventDecoder.button_mask)
+        """
+        if buttons == self._buttons:
+            return
+
+        with self._lock:
+            old = self._buttons
+            changed = buttons ^ old
+            self._buttons = buttons
+            keymap = self._keymap
+            chunks: list[bytes] = []
+            self._collect(chunks, keymap.press_bits, changed & buttons)
+            # Buttons held across a layer swap were already released
+            self._collect(chunks, keymap.release_bits, changed & old & ~self._stale)
+            self._stale &= buttons
+            if chunks:
+                self._write_batch(chunks)
+
+    @staticmethod
+    def _collect(chunks: list[bytes], table: list[bytes], bits: int):
+        """Append the table entries for each set bit, lowest bit first."""
+        while bits:
+            low = bits & -bits
+            payload = table[low.bit_length() - 1]
+            if payload:
+                chunks.append(payload)
+            bits ^= low
+
+    def handle_report(self, report):
+        """
+        Handle a report already decoded by the daemon's ReportBus.
+
+        Args:
+            report: DecodedReport with the packed button state
+        """
+        self.handle_buttons(report.buttons)
 
     def handle_raw_report(self, data: bytes | list[int]):
         """
         Given a raw G13 report (list of bytes), decode which logical button
         changed and emit the mapped key, if any.
 
-        NOTE: This is the legacy CLI interface. The GUI uses handle_button_event instead.
+        NOTE: This is the legacy CLI interface. The daemon feeds decoded
+        reports through handle_report; the GUI uses handle_button_event.
         """
         try:
             state = self.decoder.decode_report(data)
-            pressed, released = self.decoder.get_button_changes(state)
-
-            # Emit key events for button changes
-            for button_id in pressed:
-                self.handle_button_event(button_id, is_pressed=True)
-
-            for button_id in released:
-                self.handle_button_event(button_id, is_pressed=False)
-
         except ValueError:
             # Invalid report length - ignore
-            pass
+            return
+
+        assert state.buttons is not None  # Always set by decode_report
+        self.handle_buttons(state.buttons)
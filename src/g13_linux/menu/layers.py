@@ -0,0 +1,103 @@
+"""
+Screen Layers
+
+Retained per-screen framebuffers for the ScreenManager compositor.
+
+Each layer keeps the last rendering of its screen. Overlay layers are
+rendered twice, onto an all-off and an all-on canvas: pixels that come
+out the same both times were drawn by the screen, pixels that differ
+were left alone and show the layers below. The frame is then composed
+with whole-buffer integer operations, so showing or dismissing a toast
+never re-renders the screen underneath.
+
+Opaque layers keep their canvas between frames, so screens that track
+their own dirty regions (see Screen.render_partial) only redraw those.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lcd.canvas import Canvas
+
+if TYPE_CHECKING:
+    from .screen import Screen
+
+_FRAME_BYTES = Canvas.FRAMEBUFFER_SIZE
+
+
+class Layer:
+    """One screen's cached rendering."""
+
+    def __init__(self, name: str, opaque: bool = False):
+        """
+        Initialize layer.
+
+        Args:
+            name: Layer name (for logging/debugging)
+            opaque: Layer covers everything below it (no transparency pass)
+        """
+        self.name = name
+        self.opaque = opaque
+        self.screen: "Screen | None" = None
+        self._canvas = Canvas()
+        # Framebuffers as integers: drawn pixels, and pixels left transparent
+        self.pixels = 0
+        self.transparent = 0 if opaque else (1 << (8 * _FRAME_BYTES)) - 1
+        self.render_count = 0
+        # Canvas doesn't hold the attached screen's last frame
+        self._stale = True
+
+    def attach(self, screen: "Screen | None") -> bool:
+        """
+        Show a different screen in this layer.
+
+        Args:
+            screen: Screen to show, or None to clear the layer
+
+        Returns:
+            True if the screen changed
+        """
+        if screen is self.screen:
+            return False
+        self.screen = screen
+        self._stale = True
+        if screen is None:
+            self.pixels = 0
+            self.transparent = 0 if self.opaque else (1 << (8 * _FRAME_BYTES)) - 1
+        return True
+
+    def render(self):
+        """Re-render the attached screen into the layer's buffers."""
+        screen = self.screen
+        if screen is None:
+            return
+        canvas = self._canvas
+
+        if not self.opaque or self._stale or not screen.render_partial(canvas):
+            canvas.clear()
+            screen.render(canvas)
+        # The transparency pass leaves the all-on canvas behind
+        self._stale = not self.opaque
+        self.pixels = int.from_bytes(canvas._buffer, "little")
+
+        if not self.opaque:
+            canvas.fill()
+            screen.render(canvas)
+            self.transparent = self.pixels ^ int.from_bytes(canvas._buffer, "little")
+        self.render_count += 1
+
+
+def compose(layers: list[Layer]) -> bytes:
+    """
+    Stack layers bottom to top into one framebuffer.
+
+    Args:
+        layers: Layers in drawing order (screen-less layers are skipped)
+
+    Returns:
+        960-byte framebuffer
+    """
+    frame = 0
+    for layer in layers:
+        if layer.screen is not None:
+            frame = (frame & layer.transparent) | layer.pixels
+    return frame.to_bytes(_FRAME_BYTES, "little")
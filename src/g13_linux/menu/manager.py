@@ -6,9 +6,12 @@ Manages screen stack and rendering for G13 LCD menu system.
 
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING
 
 from ..lcd.canvas import Canvas
+from .layers import Layer, compose
+from .scheduler import RenderScheduler
 from .screen import InputEvent, Screen
 
 if TYPE_CHECKING:
@@ -22,6 +25,12 @@ class ScreenManager:
     Manages screen stack and coordinates rendering.
 
     Provides navigation between screens and overlay support for toasts.
+    The current screen, the overlay and a transient indicator each render
+    into their own cached layer; a frame is a composite of the layers, and
+    only dirty layers are re-rendered.
+
+    The render loop waits on ``scheduler``: marking a screen dirty wakes it
+    immediately, otherwise it sleeps until the next screen deadline.
     """
 
     def __init__(self, lcd: "G13LCD | None" = None):
@@ -35,9 +44,18 @@ class ScreenManager:
         self._canvas = Canvas()
         self._stack: list[Screen] = []
         self._overlay: Screen | None = None
-        self._overlay_timer: threading.Timer | None = None
+        self._overlay_expires: float | None = None
+        self._indicator: Screen | None = None
         self._lock = threading.Lock()
 
+        # Cached renderings, bottom to top
+        self._base_layer = Layer("base", opaque=True)
+        self._overlay_layer = Layer("overlay")
+        self._indicator_layer = Layer("indicator")
+        self._layers = [self._base_layer, self._overlay_layer, self._indicator_layer]
+
+        self.scheduler = RenderScheduler(self.next_deadline)
+
         # Injected dependencies (set by daemon)
         self.led_controller = None
         self.profile_manager = None
@@ -131,22 +149,45 @@ class ScreenManager:
         logger.debug(f"Showing overlay: {screen.__class__.__name__}")
 
         if duration is not None:
-            self._overlay_timer = threading.Timer(duration, self.dismiss_overlay)
-            self._overlay_timer.daemon = True
-            self._overlay_timer.start()
+            # Dismissed by update() once the render loop reaches the deadline
+            self._overlay_expires = time.monotonic() + duration
 
     def dismiss_overlay(self):
         """Dismiss current overlay."""
-        if self._overlay_timer:
-            self._overlay_timer.cancel()
-            self._overlay_timer = None
+        self._overlay_expires = None
 
         if self._overlay:
             self._overlay.on_exit()
             self._overlay = None
-            if self.current:
-                self.current.mark_dirty()
             logger.debug("Overlay dismissed")
+            self.request_render()
+
+    @property
+    def overlay(self) -> Screen | None:
+        """Get the overlay screen, if one is shown."""
+        return self._overlay
+
+    def show_indicator(self, screen: Screen):
+        """
+        Show a transient indicator above the screen and any overlay.
+
+        Indicators (e.g. a recording marker) are drawn only and never
+        receive input.
+
+        Args:
+            screen: Indicator screen to show
+        """
+        self.hide_indicator()
+        self._indicator = screen
+        screen.on_enter()
+        screen.mark_dirty()
+
+    def hide_indicator(self):
+        """Remove the current indicator."""
+        if self._indicator:
+            self._indicator.on_exit()
+            self._indicator = None
+            self.request_render()
 
     def handle_input(self, event: InputEvent):
         """
@@ -164,46 +205,72 @@ class ScreenManager:
         if self.current:
             self.current.on_input(event)
 
+    def request_render(self):
+        """Wake the render loop (called when a screen is marked dirty)."""
+        self.scheduler.wake()
+
+    def next_deadline(self) -> float | None:
+        """
+        Get the earliest time the render loop must run.
+
+        Returns:
+            time.monotonic() deadline of the visible screens or the overlay
+            timeout, or None if nothing is pending
+        """
+        deadlines = [self._overlay_expires]
+        for screen in (self.current, self._overlay, self._indicator):
+            if screen is not None:
+                deadlines.append(screen.next_deadline())
+        pending = [deadline for deadline in deadlines if deadline is not None]
+        return min(pending) if pending else None
+
     def update(self, dt: float):
         """
-        Update all active screens.
+        Update all active screens and expire a timed overlay.
 
         Args:
             dt: Time delta since last update
         """
+        if self._overlay_expires is not None and time.monotonic() >= self._overlay_expires:
+            self.dismiss_overlay()
+
         if self.current:
             self.current.update(dt)
         if self._overlay:
             self._overlay.update(dt)
+        if self._indicator:
+            self._indicator.update(dt)
 
     def render(self) -> bool:
         """
-        Render current screen and overlay if dirty.
+        Re-render dirty layers and send the composite if anything changed.
+
+        Showing or dismissing an overlay only re-composes the cached
+        layers; the screen underneath is not rendered again.
 
         Returns:
             True if rendering occurred
         """
-        needs_render = False
-
-        # Check if anything needs rendering
-        if self.current and self.current.is_dirty:
-            needs_render = True
-        if self._overlay and self._overlay.is_dirty:
-            needs_render = True
-
-        if not needs_render:
+        changed = False
+        for layer, screen in (
+            (self._base_layer, self.current),
+            (self._overlay_layer, self._overlay),
+            (self._indicator_layer, self._indicator),
+        ):
+            if layer.attach(screen):
+                changed = True
+                if screen is not None:
+                    screen.mark_dirty()
+            if screen is not None and screen.is_dirty:
+                # Clear first so a mark_dirty() during render isn't lost
+                screen._dirty = False
+                layer.render()
+                changed = True
+
+        if not changed:
             return False
 
-        # Render current screen
-        if self.current and self.current.is_dirty:
-            self._canvas.clear()
-            self.current.render(self._canvas)
-            self.current._dirty = False
-
-        # Render overlay on top
-        if self._overlay and self._overlay.is_dirty:
-            self._overlay.render(self._canvas)
-            self._overlay._dirty = False
+        self._canvas.from_bytes(compose(self._layers))
 
         # Send to LCD
         if self.lcd:
@@ -217,4 +284,6 @@ class ScreenManager:
             self.current.mark_dirty()
         if self._overlay:
             self._overlay.mark_dirty()
+        if self._indicator:
+            self._indicator.mark_dirty()
         self.render()
@@ -0,0 +1,119 @@
+"""
+Render Scheduler
+
+Decides when the LCD render loop runs. Instead of polling at a fixed
+frame rate, the loop sleeps until a screen asks for a render
+(Screen.mark_dirty wakes it immediately) or until the earliest deadline
+a screen reports, such as the next clock second or a toast expiry.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+def next_wall_tick(period: float, clock: Callable[[], float] = time.monotonic) -> float:
+    """
+    Get the deadline just after the next wall-clock multiple of period.
+
+    Args:
+        period: Tick length in seconds (1 = every second, 60 = every minute)
+        clock: Clock the deadline is expressed in
+
+    Returns:
+        Deadline on the given clock
+    """
+    remaining = period - (time.time() % period)
+    # Land just past the boundary so the new second/minute is visible
+    return clock() + remaining + 0.002
+
+
+class RenderScheduler:
+    """Event/deadline driven wakeups for a render loop."""
+
+    def __init__(
+        self,
+        next_deadline: Callable[[], float | None],
+        min_interval: float = 0.0,
+        max_sleep: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            next_deadline: Returns the earliest deadline (on clock) at which
+                the loop must run, or None if nothing is time-based
+            min_interval: Minimum time between wakeups (frame rate cap)
+            max_sleep: Upper bound on one sleep (None = unbounded)
+            clock: Monotonic clock in seconds
+        """
+        self._next_deadline = next_deadline
+        self.min_interval = min_interval
+        self.max_sleep = max_sleep
+        self._clock = clock
+        self._event = threading.Event()
+        self._last_wakeup: float | None = None
+        self._loop_thread: int | None = None
+
+        # Statistics
+        self.requested_wakeups = 0
+        self.deadline_wakeups = 0
+
+    def wake(self):
+        """
+        Request a render as soon as possible (thread-safe).
+
+        Requests from the loop thread itself are ignored: they come from
+        its own update/render pass, which renders the change anyway.
+        """
+        if threading.get_ident() != self._loop_thread:
+            self._event.set()
+
+    def sleep_time(self) -> float | None:
+        """
+        Get how long the loop may sleep without missing a deadline.
+
+        Returns:
+            Seconds, or None to sleep until woken
+        """
+        timeout = self.max_sleep
+        deadline = self._next_deadline()
+        if deadline is not None:
+            delay = max(0.0, deadline - self._clock())
+            timeout = delay if timeout is None else min(timeout, delay)
+        return timeout
+
+    def wait(self) -> bool:
+        """
+        Block until a render is requested or a deadline is reached.
+
+        Wakeups closer together than min_interval are delayed, and
+        requests made meanwhile are merged into that one wakeup.
+
+        Returns:
+            True if woken by a request, False by a deadline
+        """
+        self._loop_thread = threading.get_ident()
+        requested = self._event.wait(self.sleep_time())
+
+        if self._last_wakeup is not None and self.min_interval > 0:
+            early = self._last_wakeup + self.min_interval - self._clock()
+            if early > 0:
+                time.sleep(early)
+
+        # Cleared before rendering, so requests made during it wake us again
+        self._event.clear()
+        self._last_wakeup = self._clock()
+        if requested:
+            self.requested_wakeups += 1
+        else:
+            self.deadline_wakeups += 1
+        return requested
+
+    def stats(self) -> dict:
+        """Get wakeup counts."""
+        return {
+            "requested_wakeups": self.requested_wakeups,
+            "deadline_wakeups": self.deadline_wakeups,
+        }
@@ -49,6 +49,13 @@ class Screen(ABC):
     def mark_dirty(self):
         """Mark screen as needing re-render."""
         self._dirty = True
+        self._request_render()
+
+    def _request_render(self):
+        """Wake the manager's render loop, if it has one."""
+        request = getattr(self.manager, "request_render", None)
+        if request is not None:
+            request()
 
     @property
     def is_dirty(self) -> bool:
@@ -94,6 +101,21 @@ class Screen(ABC):
         """
         pass
 
+    def render_partial(self, canvas: "Canvas") -> bool:
+        """
+        Update a canvas that still holds this screen's previous frame.
+
+        Screens that track which regions changed override this to redraw
+        only those regions.
+
+        Args:
+            canvas: Canvas with the last rendered frame
+
+        Returns:
+            True if the canvas was updated, False if a full render is needed
+        """
+        return False
+
     def update(self, dt: float):
         """
         Update screen state (called periodically).
@@ -104,3 +126,15 @@ class Screen(ABC):
         Override for time-based updates (animations, clock, etc.)
         """
         pass
+
+    def next_deadline(self) -> float | None:
+        """
+        Get when update() next needs to run.
+
+        The render loop sleeps until a screen is marked dirty or the
+        earliest deadline of the visible screens.
+
+        Returns:
+            time.monotonic() deadline, or None if nothing is time-based
+        """
+        return None
@@ -7,14 +7,16 @@ Reusable menu screen with navigation support.
 from ...lcd.canvas import Canvas
 from ...lcd.fonts import FONT_4X6, FONT_5X7
 from ..items import MenuItem
-from ..screen import InputEvent, Screen
+from ..screen import InputEvent
+from ..widgets import ListView, WidgetScreen
 
 
-class MenuScreen(Screen):
+class MenuScreen(WidgetScreen):
     """
     Base class for menu screens with item navigation.
 
     Provides standard up/down navigation, selection, and back button handling.
+    Items are drawn by a ListView, so moving the selection redraws two rows.
     """
 
     # Display constants
@@ -38,6 +40,21 @@ class MenuScreen(Screen):
         self.selected_index = 0
         self.scroll_offset = 0
 
+        self.list = self.add(
+            ListView(
+                0,
+                self.TITLE_HEIGHT + 1,
+                Canvas.WIDTH - self.SCROLL_INDICATOR_WIDTH,
+                self.ITEM_HEIGHT,
+                self.VISIBLE_ITEMS,
+                row_count=lambda: len(self.items),
+                row_key=self._row_key,
+                draw_row=self._draw_row,
+                first_row=lambda: self.scroll_offset,
+                scrollbar_x=Canvas.WIDTH - self.SCROLL_INDICATOR_WIDTH,
+            )
+        )
+
     def on_input(self, event: InputEvent) -> bool:
         """Handle navigation input."""
         if event == InputEvent.STICK_UP:
@@ -73,7 +90,7 @@ class MenuScreen(Screen):
         elif self.selected_index >= self.scroll_offset + self.VISIBLE_ITEMS:
             self.scroll_offset = self.selected_index - self.VISIBLE_ITEMS + 1
 
-        self.mark_dirty()
+        self.list.invalidate()
 
     def _select_current(self):
         """Activate current selection."""
@@ -92,7 +109,8 @@ class MenuScreen(Screen):
         elif item.action:
             # Execute action
             item.action()
-            self.mark_dirty()
+            # Values shown in the list may have changed
+            self.list.invalidate()
 
     def _render_item(self, canvas: Canvas, item: MenuItem, y: int, is_selected: bool):
         """Render a single menu item."""
@@ -124,40 +142,23 @@ class MenuScreen(Screen):
             arrow_x = canvas.WIDTH - self.SCROLL_INDICATOR_WIDTH - 6
             canvas.draw_text(arrow_x, y, ">", FONT_4X6, on=on)
 
-    def render(self, canvas: Canvas):
-        """Render menu to canvas."""
-        canvas.draw_text(0, 0, self.title.upper(), FONT_5X7)
-        canvas.draw_hline(0, 9, canvas.WIDTH)
-
-        y = self.TITLE_HEIGHT + 2
-        for i in range(self.VISIBLE_ITEMS):
-            item_idx = self.scroll_offset + i
-            if item_idx >= len(self.items):
-                break
-            self._render_item(canvas, self.items[item_idx], y, item_idx == self.selected_index)
-            y += self.ITEM_HEIGHT
-
-        self._draw_scroll_indicators(canvas)
-
-    def _draw_scroll_indicators(self, canvas: Canvas):
-        """Draw scroll bar/indicators on right side."""
-        if len(self.items) <= self.VISIBLE_ITEMS:
-            return
-
-        # Scroll area
-        scroll_x = canvas.WIDTH - 3
-        scroll_y = self.TITLE_HEIGHT + 2
-        scroll_height = self.VISIBLE_ITEMS * self.ITEM_HEIGHT
-
-        # Draw track
-        canvas.draw_vline(scroll_x, scroll_y, scroll_height)
-
-        # Draw thumb
-        thumb_height = max(4, scroll_height * self.VISIBLE_ITEMS // len(self.items))
-        thumb_offset = (
-            (scroll_height - thumb_height)
-            * self.scroll_offset
-            // (len(self.items) - self.VISIBLE_ITEMS)
+    def _row_key(self, index: int) -> tuple:
+        """Summarize what a row shows, so unchanged rows aren't redrawn."""
+        item = self.items[index]
+        return (
+            index == self.selected_index,
+            item.label,
+            item.enabled,
+            item.get_display_value(),
+            item.submenu is not None,
+            item.icon is not None,
         )
 
-        canvas.draw_rect(scroll_x - 1, scroll_y + thumb_offset, 3, thumb_height, filled=True)
+    def _draw_row(self, canvas: Canvas, index: int, y: int):
+        """Draw one list row (text sits one pixel below the row top)."""
+        self._render_item(canvas, self.items[index], y + 1, index == self.selected_index)
+
+    def render_static(self, canvas: Canvas):
+        """Render title and separator."""
+        canvas.draw_text(0, 0, self.title.upper(), FONT_5X7)
+        canvas.draw_hline(0, 9, canvas.WIDTH)
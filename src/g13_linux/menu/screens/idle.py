@@ -8,10 +8,12 @@ from datetime import datetime
 
 from ...lcd.canvas import Canvas
 from ...lcd.fonts import FONT_4X6, FONT_5X7, FONT_8X8
-from ..screen import InputEvent, Screen
+from ..scheduler import next_wall_tick
+from ..screen import InputEvent
+from ..widgets import Clock, Counter, Label, WidgetScreen
 
 
-class IdleScreen(Screen):
+class IdleScreen(WidgetScreen):
     """
     Default idle screen showing current profile and status.
 
@@ -20,6 +22,8 @@ class IdleScreen(Screen):
     - Current time
     - M-key mode indicator
     - Optional: first few keybinds
+
+    Each field is a widget, so a clock tick redraws only the time.
     """
 
     def __init__(self, manager, profile_manager=None, settings_manager=None):
@@ -34,7 +38,7 @@ class IdleScreen(Screen):
         super().__init__(manager)
         self.profile_manager = profile_manager
         self.settings_manager = settings_manager
-        self._last_second = -1
+        self._layout_key: tuple[str, bool] | None = None
 
     def on_input(self, event: InputEvent) -> bool:
         """
@@ -51,25 +55,93 @@ class IdleScreen(Screen):
         return False
 
     def update(self, dt: float):
-        """Update time display based on settings."""
-        now = datetime.now()
-        # Update every second if showing seconds, else every minute
-        show_seconds = True
-        if self.settings_manager:
-            show_seconds = self.settings_manager.clock_show_seconds
+        """Refresh widget values; only changed fields are redrawn."""
+        if self._refresh():
+            self.mark_dirty()
 
-        if show_seconds:
-            if now.second != self._last_second:
-                self._last_second = now.second
-                self.mark_dirty()
-        else:
-            if now.minute != self._last_second:
-                self._last_second = now.minute
-                self.mark_dirty()
+    def next_deadline(self) -> float | None:
+        """Next second (seconds or uptime shown), else next minute."""
+        time_format, has_daemon = self._layout_key or ("%S", True)
+        if has_daemon or "%S" in time_format:
+            return next_wall_tick(1)
+        return next_wall_tick(60)
 
     def render(self, canvas: Canvas):
         """Render idle screen."""
-        # Get current profile name
+        self._refresh()
+        # Everything refreshed above is drawn now; don't ask for another frame
+        self._dirty = False
+        super().render(canvas)
+
+    def render_static(self, canvas: Canvas):
+        """Render separator line and hint."""
+        canvas.draw_hline(0, 9, canvas.WIDTH)
+        if self.uptime_label is None:
+            canvas.draw_text_centered(18, "Press stick for menu", FONT_4X6)
+
+    def _layout(self, time_format: str, has_daemon: bool):
+        """
+        Create the widgets for a clock format and daemon availability.
+
+        Args:
+            time_format: strftime() format of the clock
+            has_daemon: Whether daemon status fields are shown
+        """
+        self.widgets = []
+        # Header: profile name, time on the right side
+        time_width = len(datetime.now().strftime(time_format)) * 6
+        self.profile_label = self.add(
+            Label(0, 0, min(18 * 6, Canvas.WIDTH - time_width), font=FONT_5X7)
+        )
+        self.clock = self.add(
+            Clock(
+                Canvas.WIDTH - time_width, 0, time_width, time_format, font=FONT_5X7, align="right"
+            )
+        )
+
+        # Center area - daemon status (or a static hint)
+        self.uptime_label = self.key_counter = None
+        if has_daemon:
+            self.uptime_label = self.add(Label(4, 14, Canvas.WIDTH - 4))
+            self.key_counter = self.add(Counter(4, 22, Canvas.WIDTH - 4, "Keys: {:,}"))
+
+        # Footer: M-key indicators
+        self.m_labels = [
+            self.add(Label(8 + i * 50, 34, 20, f"M{i + 1}", height=8, padding=(2, 1)))
+            for i in range(3)
+        ]
+        self._layout_key = (time_format, has_daemon)
+        # New widgets: a partial render can't draw them
+        self._full_redraw = True
+
+    def _refresh(self) -> bool:
+        """
+        Push current values into the widgets.
+
+        Returns:
+            True if the layout was rebuilt and needs a full render
+        """
+        time_format = self._time_format()
+        daemon = self.manager.daemon
+        relayout = (time_format, bool(daemon)) != self._layout_key
+        if relayout:
+            self._layout(time_format, bool(daemon))
+
+        profile_name, m_state = self._profile_state()
+        self.profile_label.set_text(profile_name[:18])
+        self.clock.set_time(datetime.now())
+
+        if self.uptime_label is not None:
+            self.uptime_label.set_text(f"Uptime: {getattr(daemon, 'uptime', '0:00')}")
+        if self.key_counter is not None:
+            self.key_counter.set_value(getattr(daemon, "key_count", 0))
+
+        for i, label in enumerate(self.m_labels, start=1):
+            label.set_inverted(i == m_state)
+        return relayout
+
+    def _profile_state(self) -> tuple[str, int]:
+        """Get current profile name and M-key mode."""
         profile_name = "No Profile"
         m_state = 1
 
@@ -82,61 +154,22 @@ class IdleScreen(Screen):
             elif hasattr(self.profile_manager, "current_name"):
                 profile_name = self.profile_manager.current_name or "No Profile"
 
-        # Header: Profile name and time
-        canvas.draw_text(0, 0, profile_name[:18], FONT_5X7)
-
-        # Time on right side (respects clock settings)
-        time_str = self._format_time()
-        time_width = len(time_str) * 6
-        canvas.draw_text(canvas.WIDTH - time_width, 0, time_str, FONT_5X7)
-
-        # Separator line
-        canvas.draw_hline(0, 9, canvas.WIDTH)
-
-        # Center area - could show keybinds or status
-        if self.manager.daemon:
-            # Show daemon status
-            uptime = getattr(self.manager.daemon, "uptime", "0:00")
-            key_count = getattr(self.manager.daemon, "key_count", 0)
-
-            canvas.draw_text(4, 14, f"Uptime: {uptime}", FONT_4X6)
-            canvas.draw_text(4, 22, f"Keys: {key_count:,}", FONT_4X6)
-        else:
-            # Show hint
-            canvas.draw_text_centered(18, "Press stick for menu", FONT_4X6)
+        return profile_name, m_state
 
-        # Footer: M-key indicators
-        y = 35
-        for i in range(1, 4):
-            x = 10 + (i - 1) * 50
-            if i == m_state:
-                # Active mode - draw inverted
-                canvas.draw_rect(x - 2, y - 1, 20, 8, filled=True)
-                canvas.draw_text(x, y, f"M{i}", FONT_4X6, on=False)
-            else:
-                canvas.draw_text(x, y, f"M{i}", FONT_4X6)
-
-    def _format_time(self) -> str:
-        """Format current time based on settings."""
-        now = datetime.now()
-
-        # Get settings
+    def _time_format(self) -> str:
+        """Get the strftime() format for the clock settings."""
         use_24h = True
         show_seconds = True
         if self.settings_manager:
             use_24h = self.settings_manager.clock_format == "24h"
             show_seconds = self.settings_manager.clock_show_seconds
 
-        # Build format string
         if use_24h:
-            fmt = "%H:%M:%S" if show_seconds else "%H:%M"
-        else:
-            fmt = "%I:%M:%S %p" if show_seconds else "%I:%M %p"
-
-        return now.strftime(fmt)
+            return "%H:%M:%S" if show_seconds else "%H:%M"
+        return "%I:%M:%S %p" if show_seconds else "%I:%M %p"
 
 
-class ClockScreen(Screen):
+class ClockScreen(WidgetScreen):
     """
     Large clock display screen.
 
@@ -155,7 +188,17 @@ class ClockScreen(Screen):
         super().__init__(manager)
         self.show_seconds = show_seconds
         self.show_date = show_date
-        self._last_second = -1
+
+        # Centered time in large font, date below
+        time_format = "%H:%M:%S" if show_seconds else "%H:%M"
+        self.time_label = self.add(
+            Clock(0, 12, Canvas.WIDTH, time_format, font=FONT_8X8, align="center")
+        )
+        self.date_label = None
+        if show_date:
+            self.date_label = self.add(
+                Clock(0, 30, Canvas.WIDTH, "%a %b %d", font=FONT_5X7, align="center")
+            )
 
     def on_input(self, event: InputEvent) -> bool:
         """Any input returns to previous screen."""
@@ -165,31 +208,21 @@ class ClockScreen(Screen):
         return False
 
     def update(self, dt: float):
-        """Update every second if showing seconds."""
-        now = datetime.now()
-        if self.show_seconds:
-            if now.second != self._last_second:
-                self._last_second = now.second
-                self.mark_dirty()
-        else:
-            if now.minute != self._last_second:
-                self._last_second = now.minute
-                self.mark_dirty()
+        """Update the time; only changed labels are redrawn."""
+        self._set_time(datetime.now())
+
+    def next_deadline(self) -> float | None:
+        """Next second or minute, whichever the clock shows."""
+        return next_wall_tick(1 if self.show_seconds else 60)
 
     def render(self, canvas: Canvas):
         """Render large clock."""
-        now = datetime.now()
-
-        # Time format
-        if self.show_seconds:
-            time_str = now.strftime("%H:%M:%S")
-        else:
-            time_str = now.strftime("%H:%M")
-
-        # Draw centered time in large font
-        canvas.draw_text_centered(12, time_str, FONT_8X8)
-
-        # Date below
-        if self.show_date:
-            date_str = now.strftime("%a %b %d")
-            canvas.draw_text_centered(30, date_str, FONT_5X7)
+        self._set_time(datetime.now())
+        self._dirty = False
+        super().render(canvas)
+
+    def _set_time(self, now: datetime):
+        """Show a time in the labels."""
+        self.time_label.set_time(now)
+        if self.date_label is not None:
+            self.date_label.set_time(now)
@@ -5,11 +5,12 @@ LED color and effect configuration.
 """
 
 from ...lcd.canvas import Canvas
-from ...lcd.fonts import FONT_4X6, FONT_5X7
+from ...lcd.fonts import FONT_5X7
 from ...led.colors import RGB
 from ...led.effects import EffectType
 from ..items import MenuItem
-from ..screen import InputEvent, Screen
+from ..screen import InputEvent
+from ..widgets import Label, ProgressBar, WidgetScreen
 from .base_menu import MenuScreen
 from .toast import ToastScreen
 
@@ -84,7 +85,7 @@ class LEDSettingsScreen(MenuScreen):
         self.mark_dirty()
 
 
-class ColorPickerScreen(Screen):
+class ColorPickerScreen(WidgetScreen):
     """
     Color picker with preset colors.
 
@@ -123,6 +124,12 @@ class ColorPickerScreen(Screen):
                     self.selected = i
                     break
 
+        self.name_label = self.add(Label(0, 18, Canvas.WIDTH, font=FONT_5X7, align="center"))
+        self.hint_label = self.add(Label(0, 30, Canvas.WIDTH, align="center"))
+        # Proportional RGB bars showing the approximate color
+        self.bars = [self.add(ProgressBar(x, 38, 50, 4, maximum=255)) for x in (10, 60, 110)]
+        self._show_selected()
+
     def on_input(self, event: InputEvent) -> bool:
         """Handle navigation input."""
         if event == InputEvent.STICK_LEFT:
@@ -147,7 +154,7 @@ class ColorPickerScreen(Screen):
         if self.led:
             _, color = self.PRESETS[self.selected]
             self.led.set_rgb(color)
-        self.mark_dirty()
+        self._show_selected()
 
     def _apply_color(self):
         """Apply selected color permanently."""
@@ -158,31 +165,18 @@ class ColorPickerScreen(Screen):
             toast = ToastScreen(self.manager, f"Color: {name}")
             self.manager.show_overlay(toast, duration=1.5)
 
-    def render(self, canvas: Canvas):
-        """Render color picker."""
-        canvas.draw_text(0, 0, "SELECT COLOR", FONT_5X7)
-        canvas.draw_hline(0, 9, canvas.WIDTH)
-
+    def _show_selected(self):
+        """Show the selected preset in the widgets."""
         name, color = self.PRESETS[self.selected]
+        self.name_label.set_text(name)
+        self.hint_label.set_text(f"< {color.to_hex()} >")
+        for bar, value in zip(self.bars, (color.r, color.g, color.b)):
+            bar.set_value(value)
 
-        # Draw color name large
-        canvas.draw_text_centered(18, name, FONT_5X7)
-
-        # Draw hex value and navigation hints
-        hint = f"< {color.to_hex()} >"
-        canvas.draw_text_centered(30, hint, FONT_4X6)
-
-        # Color indicator (simple bar showing approximate color)
-        bar_y = 38
-        bar_height = 4
-        # Draw proportional RGB bars
-        r_width = color.r * 50 // 255
-        g_width = color.g * 50 // 255
-        b_width = color.b * 50 // 255
-
-        canvas.draw_rect(10, bar_y, r_width, bar_height, filled=True)
-        canvas.draw_rect(60, bar_y, g_width, bar_height, filled=True)
-        canvas.draw_rect(110, bar_y, b_width, bar_height, filled=True)
+    def render_static(self, canvas: Canvas):
+        """Render title and separator."""
+        canvas.draw_text(0, 0, "SELECT COLOR", FONT_5X7)
+        canvas.draw_hline(0, 9, canvas.WIDTH)
 
 
 class EffectSelectScreen(MenuScreen):
@@ -269,7 +263,7 @@ class EffectSelectScreen(MenuScreen):
         self.manager.show_overlay(toast, duration=1.5)
 
 
-class BrightnessScreen(Screen):
+class BrightnessScreen(WidgetScreen):
     """
     Brightness adjustment screen.
 
@@ -289,6 +283,12 @@ class BrightnessScreen(Screen):
         if self.led:
             self.brightness = self.led.brightness
 
+        # Percentage large, navigation hint and bar below
+        self.value_label = self.add(Label(0, 18, Canvas.WIDTH, font=FONT_5X7, align="center"))
+        self.add(Label(0, 30, Canvas.WIDTH, "< Adjust >", align="center"))
+        self.bar = self.add(ProgressBar(10, 38, 140, 4, outline=True))
+        self._show_brightness()
+
     def on_input(self, event: InputEvent) -> bool:
         """Handle navigation input."""
         if event == InputEvent.STICK_LEFT:
@@ -315,7 +315,7 @@ class BrightnessScreen(Screen):
         """Apply brightness preview."""
         if self.led:
             self.led.set_brightness(self.brightness)
-        self.mark_dirty()
+        self._show_brightness()
 
     def _apply_brightness(self):
         """Apply selected brightness."""
@@ -324,26 +324,12 @@ class BrightnessScreen(Screen):
             toast = ToastScreen(self.manager, f"Brightness: {self.brightness}%")
             self.manager.show_overlay(toast, duration=1.5)
 
-    def render(self, canvas: Canvas):
-        """Render brightness screen."""
+    def _show_brightness(self):
+        """Show the selected brightness in the widgets."""
+        self.value_label.set_text(f"{self.brightness}%")
+        self.bar.set_value(self.brightness)
+
+    def render_static(self, canvas: Canvas):
+        """Render title and separator."""
         canvas.draw_text(0, 0, "BRIGHTNESS", FONT_5X7)
         canvas.draw_hline(0, 9, canvas.WIDTH)
-
-        # Draw percentage large
-        canvas.draw_text_centered(18, f"{self.brightness}%", FONT_5X7)
-
-        # Draw navigation hint
-        canvas.draw_text_centered(30, "< Adjust >", FONT_4X6)
-
-        # Draw brightness bar
-        bar_x = 10
-        bar_y = 38
-        bar_width = 140
-        bar_height = 4
-        fill_width = int(bar_width * self.brightness / 100)
-
-        # Outline
-        canvas.draw_rect(bar_x, bar_y, bar_width, bar_height, filled=False)
-        # Fill
-        if fill_width > 0:
-            canvas.draw_rect(bar_x, bar_y, fill_width, bar_height, filled=True)
@@ -0,0 +1,409 @@
+"""
+Screen Widgets
+
+Retained widgets for LCD screens. Each widget owns a bounding box and a
+dirty flag; changing a widget's value invalidates only that widget, and
+the next frame clears and redraws just its box instead of the whole
+screen. WidgetScreen ties widgets to the ScreenManager's cached layers.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Hashable, TypeVar
+
+from ..lcd.fonts import FONT_4X6, Font
+from ..lcd.text_cache import draw_text
+from .screen import Screen
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from ..lcd.canvas import Canvas
+
+
+class Widget(ABC):
+    """Base widget: a box that is cleared and redrawn when invalidated."""
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        """
+        Initialize widget.
+
+        Args:
+            x, y: Top-left corner of the bounding box
+            width, height: Bounding box size
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.dirty = True
+        self.render_count = 0
+        self._owner: "WidgetScreen | None" = None
+
+    def invalidate(self):
+        """Mark the widget for redraw on the next frame."""
+        self.dirty = True
+        if self._owner is not None:
+            self._owner._dirty = True
+            self._owner._request_render()
+
+    def reset(self):
+        """Forget what was drawn (the canvas under the widget was cleared)."""
+        self.dirty = True
+
+    def render(self, canvas: "Canvas"):
+        """
+        Clear the bounding box and redraw the widget.
+
+        Args:
+            canvas: Canvas to draw on
+        """
+        # Cleared first, so an invalidate() during draw() is kept for next frame
+        self.dirty = False
+        canvas.draw_rect(self.x, self.y, self.width, self.height, filled=True, on=False)
+        self.draw(canvas)
+        self.render_count += 1
+
+    @abstractmethod
+    def draw(self, canvas: "Canvas"):
+        """
+        Draw widget contents into its (cleared) box.
+
+        Args:
+            canvas: Canvas to draw on
+        """
+        pass
+
+
+W = TypeVar("W", bound=Widget)
+
+
+class Label(Widget):
+    """Single line of text, clipped to its box."""
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        text: str = "",
+        font: Font = FONT_4X6,
+        align: str = "left",
+        inverted: bool = False,
+        height: int | None = None,
+        padding: tuple[int, int] = (0, 0),
+    ):
+        """
+        Initialize label.
+
+        Args:
+            x, y: Top-left corner of the box
+            width: Box width
+            text: Initial text
+            font: Font to draw with
+            align: "left", "center" or "right" within the box
+            inverted: Fill the box and draw the text off
+            height: Box height (default: font height plus vertical padding)
+            padding: (x, y) offset of the text inside the box
+        """
+        if height is None:
+            height = font.char_height + padding[1]
+        super().__init__(x, y, width, height)
+        self.text = text
+        self.font = font
+        self.align = align
+        self.inverted = inverted
+        self.padding = padding
+
+    def set_text(self, text: str):
+        """Change the text, invalidating the label only if it differs."""
+        if text != self.text:
+            self.text = text
+            self.invalidate()
+
+    def set_inverted(self, inverted: bool):
+        """Switch between normal and inverted drawing."""
+        if inverted != self.inverted:
+            self.inverted = inverted
+            self.invalidate()
+
+    def draw(self, canvas: "Canvas"):
+        """Draw the text, clipped to the box."""
+        if self.inverted:
+            canvas.draw_rect(self.x, self.y, self.width, self.height, filled=True)
+
+        text_width = len(self.text) * (self.font.char_width + 1)
+        if self.align == "right":
+            tx = self.x + self.width - text_width
+        elif self.align == "center":
+            tx = self.x + max(0, (self.width - text_width) // 2)
+        else:
+            tx = self.x + self.padding[0]
+
+        draw_text(
+            canvas._buffer,
+            tx,
+            self.y + self.padding[1],
+            self.text,
+            self.font,
+            on=not self.inverted,
+            width=min(canvas.width, self.x + self.width),
+            height=min(canvas.height, self.y + self.height),
+        )
+
+
+class Counter(Label):
+    """Label showing a formatted number."""
+
+    def __init__(self, x: int, y: int, width: int, fmt: str = "{:,}", value=0, **kwargs):
+        """
+        Initialize counter.
+
+        Args:
+            x, y, width: Label box
+            fmt: str.format() pattern for the value
+            value: Initial value
+            **kwargs: Label options (font, align, ...)
+        """
+        self.fmt = fmt
+        self.value = value
+        super().__init__(x, y, width, fmt.format(value), **kwargs)
+
+    def set_value(self, value):
+        """Change the value; redraws only if the formatted text changes."""
+        self.value = value
+        self.set_text(self.fmt.format(value))
+
+
+class Clock(Label):
+    """Label showing a time formatted with strftime()."""
+
+    def __init__(self, x: int, y: int, width: int, fmt: str = "%H:%M:%S", **kwargs):
+        """
+        Initialize clock.
+
+        Args:
+            x, y, width: Label box
+            fmt: strftime() format
+            **kwargs: Label options (font, align, ...)
+        """
+        self.fmt = fmt
+        super().__init__(x, y, width, **kwargs)
+
+    def set_time(self, now: "datetime"):
+        """Show a time; redraws only when the formatted text changes."""
+        self.set_text(now.strftime(self.fmt))
+
+
+class ProgressBar(Widget):
+    """Horizontal bar filled in proportion to value / maximum."""
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        value: int = 0,
+        maximum: int = 100,
+        outline: bool = False,
+    ):
+        """
+        Initialize progress bar.
+
+        Args:
+            x, y: Top-left corner
+            width, height: Bar size
+            value: Initial value
+            maximum: Value that fills the bar
+            outline: Draw the bar outline
+        """
+        super().__init__(x, y, width, height)
+        self.value = value
+        self.maximum = maximum
+        self.outline = outline
+
+    @property
+    def fill_width(self) -> int:
+        """Width of the filled part in pixels."""
+        if self.maximum <= 0:
+            return 0
+        return self.width * max(0, min(self.value, self.maximum)) // self.maximum
+
+    def set_value(self, value: int):
+        """Change the value, invalidating only if the fill changes."""
+        if value != self.value:
+            old_fill = self.fill_width
+            self.value = value
+            if self.fill_width != old_fill:
+                self.invalidate()
+
+    def draw(self, canvas: "Canvas"):
+        """Draw outline and fill."""
+        if self.outline:
+            canvas.draw_rect(self.x, self.y, self.width, self.height, filled=False)
+        fill = self.fill_width
+        if fill > 0:
+            canvas.draw_rect(self.x, self.y, fill, self.height, filled=True)
+
+
+class ListView(Widget):
+    """
+    Scrolling list that redraws only the rows that changed.
+
+    Each visible row is summarized by row_key(); a row is redrawn when its
+    key differs from the one drawn last time, so moving the selection
+    touches two rows. An optional scrollbar is drawn to the right.
+    """
+
+    SCROLLBAR_WIDTH = 3
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        row_height: int,
+        visible_rows: int,
+        row_count: Callable[[], int],
+        row_key: Callable[[int], Hashable],
+        draw_row: Callable[["Canvas", int, int], None],
+        first_row: Callable[[], int] = lambda: 0,
+        scrollbar_x: int | None = None,
+    ):
+        """
+        Initialize list.
+
+        Args:
+            x, y: Top-left corner of the first row
+            width: Row width (excluding the scrollbar)
+            row_height: Pixels per row
+            visible_rows: Rows shown at once
+            row_count: Returns the number of rows
+            row_key: Returns a hashable summary of everything a row shows
+            draw_row: Draws row index at top y: draw_row(canvas, index, y)
+            first_row: Returns the index of the first visible row
+            scrollbar_x: Left edge of the scrollbar (None = no scrollbar)
+        """
+        super().__init__(x, y, width, row_height * visible_rows)
+        self.row_height = row_height
+        self.visible_rows = visible_rows
+        self._row_count = row_count
+        self._row_key = row_key
+        self._draw_row = draw_row
+        self._first_row = first_row
+        self.scrollbar_x = scrollbar_x
+        self._drawn: list = [None] * visible_rows
+        self._drawn_scroll: tuple[int, int] | None = None
+        self.rows_drawn = 0
+
+    def reset(self):
+        """Forget the drawn rows so the next render redraws all of them."""
+        super().reset()
+        self._drawn = [None] * self.visible_rows
+        self._drawn_scroll = None
+
+    def render(self, canvas: "Canvas"):
+        """Redraw rows (and scrollbar) whose content changed, without clearing the box."""
+        self.dirty = False
+        self.draw(canvas)
+        self.render_count += 1
+
+    def draw(self, canvas: "Canvas"):
+        """
+        Draw the rows and scrollbar that differ from what was drawn last.
+
+        Args:
+            canvas: Canvas to draw on
+        """
+        count = self._row_count()
+        first = self._first_row()
+
+        for slot in range(self.visible_rows):
+            index = first + slot
+            key = (index, self._row_key(index)) if index < count else ()
+            if key == self._drawn[slot]:
+                continue
+            row_y = self.y + slot * self.row_height
+            canvas.draw_rect(self.x, row_y, self.width, self.row_height, filled=True, on=False)
+            if index < count:
+                self._draw_row(canvas, index, row_y)
+            self._drawn[slot] = key
+            self.rows_drawn += 1
+
+        if self.scrollbar_x is not None and (count, first) != self._drawn_scroll:
+            self._draw_scrollbar(canvas, self.scrollbar_x, count, first)
+            self._drawn_scroll = (count, first)
+
+    def _draw_scrollbar(self, canvas: "Canvas", x: int, count: int, first: int):
+        """Draw track and thumb at x; nothing if all rows fit."""
+        canvas.draw_rect(x, self.y + 1, self.SCROLLBAR_WIDTH, self.height, filled=True, on=False)
+        if count <= self.visible_rows:
+            return
+
+        track_y = self.y + 1
+        canvas.draw_vline(x + 1, track_y, self.height)
+        thumb_height = max(4, self.height * self.visible_rows // count)
+        thumb_offset = (self.height - thumb_height) * first // (count - self.visible_rows)
+        canvas.draw_rect(x, track_y + thumb_offset, 3, thumb_height, filled=True)
+
+
+class WidgetScreen(Screen):
+    """
+    Screen built from retained widgets.
+
+    mark_dirty() still requests a full redraw (static parts included);
+    widget changes only redraw the invalidated widgets.
+    """
+
+    def __init__(self, manager):
+        """
+        Initialize widget screen.
+
+        Args:
+            manager: ScreenManager instance
+        """
+        super().__init__(manager)
+        self.widgets: list[Widget] = []
+        self._full_redraw = True
+
+    def add(self, widget: W) -> W:
+        """
+        Add a widget, drawn in the order added.
+
+        Returns:
+            The widget
+        """
+        widget._owner = self
+        self.widgets.append(widget)
+        return widget
+
+    def mark_dirty(self):
+        """Request a full redraw."""
+        self._full_redraw = True
+        super().mark_dirty()
+
+    def render_static(self, canvas: "Canvas"):
+        """
+        Draw the parts that only change on a full redraw (titles, lines).
+
+        Args:
+            canvas: Cleared canvas
+        """
+        pass
+
+    def render(self, canvas: "Canvas"):
+        """Full redraw: static parts, then every widget."""
+        self._full_redraw = False
+        self.render_static(canvas)
+        for widget in self.widgets:
+            widget.reset()
+            widget.render(canvas)
+
+    def render_partial(self, canvas: "Canvas") -> bool:
+        """Redraw only invalidated widgets on top of the previous frame."""
+        if self._full_redraw:
+            return False
+        for widget in self.widgets:
+            if widget.dirty:
+                widget.render(canvas)
+        return True
@@ -36,6 +36,7 @@ class Settings:
     # Display settings
     lcd_brightness: int = 100  # 0-100 (if supported)
     led_brightness: int = 100  # 0-100
+    led_reactive: bool = False  # Key flash, typing heat and MR record color
 
     # Last loaded profile
     last_profile: str = ""
@@ -195,3 +196,12 @@ class SettingsManager:
     def led_brightness(self, value: int):
         self.settings.led_brightness = value
         self.save()
+
+    @property
+    def led_reactive(self) -> bool:
+        return self.settings.led_reactive
+
+    @led_reactive.setter
+    def led_reactive(self, value: bool):
+        self.settings.led_reactive = value
+        self.save()
@@ -0,0 +1,453 @@
+"""
+UInput Output Service
+
+One long-lived set of virtual input devices shared by everything that
+injects input: the key mapper, the macro player and the joystick handler.
+
+Creating a uinput device costs tens to hundreds of milliseconds, so each
+device is created once and kept. Writes from any thread go through one
+queue to a single writer thread, which keeps them in order and joins
+consecutive writes for the same device into one write() call.
+
+The shared keyboard device only advertises the keys callers asked for
+with require_keys(). Owners register the keys of every saved profile
+and macro at startup, so the set normally grows only when a profile or
+macro is loaded that uses a new key. Recreating the device would drop
+keys held at that moment, so the writer puts a recreation off until
+every key it pressed on the keyboard has been released.
+"""
+
+import logging
+import os
+import queue
+import struct
+import threading
+from typing import Callable, Iterable
+
+from evdev import UInput
+from evdev import ecodes as e
+
+logger = logging.getLogger(__name__)
+
+# Kernel struct input_event: timeval (two native longs), type, code, value.
+# The input core stamps uinput events itself, so the timeval is left zero.
+INPUT_EVENT = struct.Struct("llHHi")
+SYN_REPORT = INPUT_EVENT.pack(0, 0, e.EV_SYN, e.SYN_REPORT, 0)
+
+# Name of the shared keyboard device
+KEYBOARD = "keyboard"
+
+# Writer queue commands
+_WRITE = 0
+_CONFIGURE = 1
+_REMOVE = 2
+_FLUSH = 3
+_STOP = 4
+
+
+def pack_events(events: Iterable[tuple[int, int, int]]) -> bytes:
+    """
+    Pack (type, code, value) tuples into input_event records.
+
+    Args:
+        events: Events to pack (no SYN_REPORT is added)
+
+    Returns:
+        Packed records ready for write()
+    """
+    return b"".join(INPUT_EVENT.pack(0, 0, etype, code, value) for etype, code, value in events)
+
+
+class UInputHandle:
+    """
+    UInput-like (write/syn/close) view of one service device.
+
+    Events written between two syn() calls are queued as one batch. A
+    handle is meant to be used from a single thread.
+    """
+
+    __slots__ = ("_service", "_device", "_events", "_owned")
+
+    def __init__(self, service: "UInputService | RecordingOutput", device: str, owned: bool):
+        self._service = service
+        self._device = device
+        self._events: list[bytes] = []
+        self._owned = owned
+
+    def write(self, etype: int, code: int, value: int):
+        """Buffer one event until the next syn()."""
+        self._events.append(INPUT_EVENT.pack(0, 0, etype, code, value))
+
+    def syn(self):
+        """Queue the buffered events plus a SYN_REPORT."""
+        self._events.append(SYN_REPORT)
+        self._service.write(b"".join(self._events), self._device)
+        self._events.clear()
+
+    def close(self):
+        """Remove the device if this handle created it."""
+        self._events.clear()
+        if self._owned:
+            self._service.remove(self._device)
+
+
+class UInputService:
+    """
+    Shared uinput devices fed by a single ordered writer thread.
+
+    Devices are created, recreated and written on the writer thread only,
+    so a configuration change takes effect exactly between the writes
+    queued before and after it.
+    """
+
+    KEYBOARD_NAME = "G13 Virtual Keyboard"
+
+    def __init__(self, uinput_factory: Callable[..., UInput] = UInput):
+        """
+        Initialize service. No device is created until one is needed.
+
+        Args:
+            uinput_factory: Callable creating a device (default: evdev.UInput)
+        """
+        self._factory = uinput_factory
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._keys: frozenset[int] = frozenset()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Only touched by the writer thread
+        self._devices: dict[str, UInput] = {}
+        # Keyboard keys pressed and not yet released, and a keyboard
+        # configuration waiting for them to be released
+        self._held: set[int] = set()
+        self._pending: tuple[dict, dict] | None = None
+
+        # Statistics
+        self.write_count = 0
+        self.error_count = 0
+
+    @property
+    def keys(self) -> frozenset[int]:
+        """Keycodes the keyboard device advertises."""
+        return self._keys
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the writer thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def require_keys(self, keycodes: Iterable[int]) -> bool:
+        """
+        Make sure the keyboard device can emit keycodes.
+
+        The key set only grows. If keys are held on the keyboard when
+        it has to be recreated, the new device replaces it after they
+        are released.
+
+        Args:
+            keycodes: evdev keycodes a profile or macro may send
+
+        Returns:
+            True if the keyboard device is (re)created for new keys
+        """
+        with self._lock:
+            keys = self._keys.union(keycodes)
+            if keys == self._keys:
+                return False
+            self._keys = keys
+            capabilities = {e.EV_KEY: sorted(keys)}
+            self._submit((_CONFIGURE, KEYBOARD, capabilities, {"name": self.KEYBOARD_NAME}))
+        logger.debug(f"Keyboard capabilities: {len(keys)} keys")
+        return True
+
+    def keyboard(self, keycodes: Iterable[int] = ()) -> UInputHandle:
+        """
+        Get a handle for the shared keyboard device.
+
+        Args:
+            keycodes: Keys the caller will send (see require_keys)
+
+        Returns:
+            Handle whose close() leaves the shared device alone
+        """
+        self.require_keys(keycodes)
+        return UInputHandle(self, KEYBOARD, owned=False)
+
+    def open_device(self, device: str, capabilities: dict, **options) -> UInputHandle:
+        """
+        Create (or recreate) a separate named device, e.g. a joystick.
+
+        Args:
+            device: Service-local device name
+            capabilities: evdev capabilities dict for UInput
+            **options: Extra UInput arguments (name, vendor, product, ...)
+
+        Returns:
+            Handle whose close() removes the device
+        """
+        self._submit((_CONFIGURE, device, capabilities, options))
+        return UInputHandle(self, device, owned=True)
+
+    def remove(self, device: str):
+        """
+        Close a named device after the writes queued before this call.
+
+        Args:
+            device: Device name passed to open_device()
+        """
+        self._submit((_REMOVE, device, None, None))
+
+    def write(self, payload: bytes, device: str = KEYBOARD):
+        """
+        Queue packed input_event records (ending in SYN_REPORT).
+
+        Args:
+            payload: Records built with pack_events() / SYN_REPORT
+            device: Target device name
+        """
+        self._submit((_WRITE, device, payload, None))
+
+    def write_events(self, events: Iterable[tuple[int, int, int]], device: str = KEYBOARD):
+        """
+        Queue (type, code, value) events as one frame.
+
+        Args:
+            events: Events to send, followed by one SYN_REPORT
+            device: Target device name
+        """
+        self.write(pack_events(events) + SYN_REPORT, device)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """
+        Wait until everything queued so far has been written.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the queue drained in time
+        """
+        if not self.is_running:
+            return True
+        done = threading.Event()
+        self._submit((_FLUSH, None, done, None))
+        return done.wait(timeout)
+
+    def close(self):
+        """Write what is queued, close all devices and stop the writer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._queue.put((_STOP, None, None, None))
+
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _submit(self, item: tuple):
+        """Queue an item, starting the writer thread on first use."""
+        if self._closed:
+            return
+        self._queue.put(item)
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        """Start the writer thread (at most once)."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="UInputWriter")
+                self._thread.start()
+
+    def _run(self):
+        """Writer loop: drain the queue in order, batching writes per device."""
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        while True:
+            batch = [get()]
+            # Take whatever else is already queued so it shares write() calls
+            while True:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+
+            device = None
+            chunks: list[bytes] = []
+            for kind, name, arg, options in batch:
+                if kind == _WRITE:
+                    if name != device and chunks:
+                        self._write(device, chunks)
+                        chunks = []
+                    device = name
+                    chunks.append(arg)
+                    if name == KEYBOARD and self._track_keys(arg):
+                        # Last held key released: apply the deferred keyboard
+                        self._write(device, chunks)
+                        chunks = []
+                        self._configure(KEYBOARD, *self._pending)
+                        self._pending = None
+                    continue
+
+                if chunks:
+                    self._write(device, chunks)
+                    chunks = []
+
+                if kind == _CONFIGURE:
+                    if name == KEYBOARD and self._held and KEYBOARD in self._devices:
+                        self._pending = (arg, options)
+                        logger.debug(f"Keyboard update deferred: {len(self._held)} keys held")
+                    else:
+                        self._configure(name, arg, options)
+                elif kind == _REMOVE:
+                    self._remove(name)
+                elif kind == _FLUSH:
+                    arg.set()
+                elif kind == _STOP:
+                    for name in list(self._devices):
+                        self._remove(name)
+                    return
+
+            if chunks:
+                self._write(device, chunks)
+
+    def _track_keys(self, payload: bytes) -> bool:
+        """
+        Update the held keyboard keys from a write. Writer thread only.
+
+        Args:
+            payload: Packed records queued for the keyboard
+
+        Returns:
+            True if a deferred configuration can now be applied
+        """
+        held = self._held
+        for _, _, etype, code, value in INPUT_EVENT.iter_unpack(payload):
+            if etype == e.EV_KEY:
+                if value == 1:
+                    held.add(code)
+                elif value == 0:
+                    held.discard(code)
+        return self._pending is not None and not held
+
+    def _write(self, device: str, chunks: list[bytes]):
+        """Write chunks to a device in one call. Writer thread only."""
+        ui = self._devices.get(device)
+        if ui is None:
+            logger.debug(f"Dropping events for missing device '{device}'")
+            return
+        try:
+            os.write(ui.fd, b"".join(chunks))
+            self.write_count += 1
+        except OSError as ex:
+            self.error_count += 1
+            logger.error(f"uinput write to '{device}' failed: {ex}")
+
+    def _configure(self, device: str, capabilities: dict, options: dict):
+        """Replace a device with one using new capabilities. Writer thread only."""
+        if device == KEYBOARD:
+            self._held.clear()
+        self._remove(device)
+        try:
+            self._devices[device] = self._factory(capabilities, **options)
+            logger.info(f"Created uinput device '{device}'")
+        except Exception as ex:
+            self.error_count += 1
+            logger.error(f"Could not create uinput device '{device}': {ex}")
+
+    def _remove(self, device: str):
+        """Close a device if it exists. Writer thread only."""
+        ui = self._devices.pop(device, None)
+        if ui is None:
+            return
+        try:
+            ui.close()
+        except Exception as ex:
+            logger.debug(f"Error closing uinput device '{device}': {ex}")
+
+
+class RecordingOutput:
+    """
+    Stand-in for UInputService that records events instead of injecting them.
+
+    Used for capture replays, so replayed key presses are not typed into
+    the live session and no /dev/uinput access is needed.
+    """
+
+    def __init__(self):
+        """Initialize with no keys and no recorded events."""
+        self._lock = threading.Lock()
+        self._keys: frozenset[int] = frozenset()
+        # (device, type, code, value) for every event except SYN_REPORT
+        self.events: list[tuple[str, int, int, int]] = []
+        self.write_count = 0
+        self.error_count = 0
+
+    @property
+    def keys(self) -> frozenset[int]:
+        """Keycodes registered with require_keys()."""
+        return self._keys
+
+    @property
+    def is_running(self) -> bool:
+        """Always False: there is no writer thread."""
+        return False
+
+    def require_keys(self, keycodes: Iterable[int]) -> bool:
+        """
+        Record the keys a profile or macro may send.
+
+        Args:
+            keycodes: evdev keycodes
+
+        Returns:
+            True if the key set grew
+        """
+        with self._lock:
+            keys = self._keys.union(keycodes)
+            if keys == self._keys:
+                return False
+            self._keys = keys
+        return True
+
+    def keyboard(self, keycodes: Iterable[int] = ()) -> UInputHandle:
+        """Get a handle recording to the keyboard device."""
+        self.require_keys(keycodes)
+        return UInputHandle(self, KEYBOARD, owned=False)
+
+    def open_device(self, device: str, capabilities: dict, **options) -> UInputHandle:
+        """Get a handle recording to a named device."""
+        return UInputHandle(self, device, owned=True)
+
+    def remove(self, device: str):
+        """Nothing to close."""
+
+    def write(self, payload: bytes, device: str = KEYBOARD):
+        """
+        Record packed input_event records.
+
+        Args:
+            payload: Records built with pack_events() / SYN_REPORT
+            device: Target device name
+        """
+        events = [
+            (device, etype, code, value)
+            for _, _, etype, code, value in INPUT_EVENT.iter_unpack(payload)
+            if etype != e.EV_SYN
+        ]
+        with self._lock:
+            self.events.extend(events)
+            self.write_count += 1
+
+    def write_events(self, events: Iterable[tuple[int, int, int]], device: str = KEYBOARD):
+        """Record (type, code, value) events as one frame."""
+        self.write(pack_events(events) + SYN_REPORT, device)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Writes are recorded synchronously; always True."""
+        return True
+
+    def close(self):
+        """Nothing to close."""
@@ -134,6 +134,12 @@ class TestApplicationControllerInit:
         assert controller.macro_manager is mock_dependencies["macro_mgr"]
         assert controller.hotkey_manager is mock_dependencies["hotkey"]
 
+    def test_init_shares_output_with_macro_editor(self, mock_main_window, mock_dependencies):
+        """Test the macro editor plays through the shared uinput service."""
+        controller = ApplicationController(mock_main_window)
+
+        mock_main_window.macro_widget.set_output.assert_called_once_with(controller.uinput)
+
     def test_init_state(self, mock_main_window, mock_dependencies):
         """Test init sets default state."""
         controller = ApplicationController(mock_main_window)
@@ -533,6 +539,25 @@ class TestApplicationControllerHotkeys:
         mock_dependencies["hotkey"].clear_all.assert_called()
         mock_dependencies["hotkey"].register_hotkey.assert_called_with("ctrl+shift+a", "macro-1")
 
+    def test_register_all_macro_hotkeys_requires_keys(self, mock_main_window, mock_dependencies):
+        """The keys of every saved macro are registered with the keyboard at once."""
+        from evdev import ecodes
+
+        from g13_linux.gui.models.macro_types import Macro, MacroStepType
+
+        macros = {}
+        for macro_id, key in (("m1", "KEY_A"), ("m2", "B")):
+            macros[macro_id] = Macro(id=macro_id)
+            macros[macro_id].add_step(MacroStepType.KEY_PRESS, key)
+        mock_dependencies["macro_mgr"].list_macros.return_value = list(macros)
+        mock_dependencies["macro_mgr"].load_macro.side_effect = macros.__getitem__
+
+        controller = ApplicationController(mock_main_window)
+        controller.uinput = MagicMock()
+        controller._register_all_macro_hotkeys()
+
+        controller.uinput.require_keys.assert_called_once_with({ecodes.KEY_A, ecodes.KEY_B})
+
     def test_on_hotkey_triggered(self, mock_main_window, mock_dependencies):
         """Test hotkey triggers macro playback."""
         mock_macro = MagicMock()
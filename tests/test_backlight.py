@@ -219,3 +219,100 @@ class TestGetters:
         result = backlight.get_brightness()
 
         assert result == 75
+
+
+class TestRedundantWrites:
+    """Test suppression of unchanged reports."""
+
+    def test_same_color_sent_once(self):
+        """Setting the color already on the device sends nothing."""
+        mock_device = Mock()
+        backlight = G13Backlight(mock_device)
+
+        backlight.set_color(10, 20, 30)
+        backlight.set_color(10, 20, 30)
+
+        mock_device.send_feature_report.assert_called_once()
+        assert backlight.stats()["suppressed"] == 1
+
+    def test_full_brightness_after_color_suppressed(self):
+        """set_brightness(100) right after set_color is a no-op on the wire."""
+        mock_device = Mock()
+        backlight = G13Backlight(mock_device)
+
+        backlight.set_color(255, 0, 0)
+        backlight.set_brightness(100)
+
+        assert mock_device.send_feature_report.call_count == 1
+
+    def test_changed_color_sent(self):
+        """A different color is always sent."""
+        mock_device = Mock()
+        backlight = G13Backlight(mock_device)
+
+        backlight.set_color(1, 2, 3)
+        backlight.set_color(4, 5, 6)
+
+        assert mock_device.send_feature_report.call_count == 2
+        assert backlight.stats()["sent"] == 2
+
+    def test_failed_write_is_retried(self, capsys):
+        """After an error the same color is sent again."""
+        mock_device = Mock()
+        mock_device.send_feature_report.side_effect = [OSError("busy"), None]
+        backlight = G13Backlight(mock_device)
+
+        backlight.set_color(1, 2, 3)
+        backlight.set_color(1, 2, 3)
+
+        assert mock_device.send_feature_report.call_count == 2
+        assert backlight.stats()["errors"] == 1
+
+    def test_invalidate_forces_resend(self):
+        """invalidate() makes the next identical write go out."""
+        mock_device = Mock()
+        backlight = G13Backlight(mock_device)
+        backlight.set_color(1, 2, 3)
+
+        backlight.invalidate()
+        backlight.set_color(1, 2, 3)
+
+        assert mock_device.send_feature_report.call_count == 2
+
+
+class TestBacklightWriter:
+    """Test coalesced writes on the writer thread."""
+
+    def test_burst_sends_latest_color(self):
+        """A burst of updates reaches the device as the newest color."""
+        mock_device = Mock()
+        backlight = G13Backlight(mock_device)
+        backlight.start_writer(min_interval=0.05)
+        assert backlight.writer_running
+
+        backlight.set_color(0, 0, 0)
+        backlight.flush()
+        for level in range(1, 101):
+            backlight.set_color(level, level, level)
+        assert backlight.flush()
+        backlight.stop_writer()
+
+        sent = [c.args[0] for c in mock_device.send_feature_report.call_args_list]
+        assert sent[0] == bytes([0x07, 0, 0, 0, 0x00])
+        assert sent[-1] == bytes([0x07, 100, 100, 100, 0x00])
+        assert len(sent) < 10
+        assert backlight.stats()["writer"]["dropped"] > 0
+
+    def test_stop_writer_sends_pending(self):
+        """Stopping the writer delivers the last color."""
+        mock_device = Mock()
+        backlight = G13Backlight(mock_device)
+        backlight.start_writer(min_interval=5.0)
+        backlight.set_color(1, 1, 1)
+        backlight.flush()
+
+        backlight.set_color(9, 9, 9)
+        backlight.stop_writer()
+
+        assert not backlight.writer_running
+        mock_device.send_feature_report.assert_called_with(bytes([0x07, 9, 9, 9, 0x00]))
@@ -0,0 +1,192 @@
+"""Tests for HID report capture and replay."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from g13_linux.capture import (
+    MAGIC,
+    CaptureFormatError,
+    CaptureWriter,
+    ReplayDevice,
+    capture,
+    read_capture,
+)
+from g13_linux.input.report_bus import ReportBus
+
+REPORT_A = bytes([0x01, 128, 128, 0x01, 0, 0x80, 0, 0])
+REPORT_B = bytes([0x01, 128, 128, 0x00, 0, 0x80, 0, 0])
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Capture with two reports 50 ms apart."""
+    path = tmp_path / "session.g13cap"
+    with CaptureWriter(path) as writer:
+        writer.write(REPORT_A, timestamp_ns=1_000_000_000)
+        writer.write(list(REPORT_B), timestamp_ns=1_050_000_000)
+    return path
+
+
+class TestCaptureLog:
+    """Test the binary log format."""
+
+    def test_round_trip(self, log_path):
+        """Reports and timestamps read back unchanged."""
+        assert list(read_capture(log_path)) == [
+            (1_000_000_000, REPORT_A),
+            (1_050_000_000, REPORT_B),
+        ]
+
+    def test_compact_records(self, log_path):
+        """Each record is a 10-byte header plus the report."""
+        assert log_path.stat().st_size == len(MAGIC) + 2 * (10 + 8)
+
+    def test_default_timestamp_is_monotonic(self, tmp_path):
+        """Reports written without a timestamp get monotonic_ns()."""
+        path = tmp_path / "now.g13cap"
+        before = time.monotonic_ns()
+        with CaptureWriter(path) as writer:
+            writer.write(REPORT_A)
+        after = time.monotonic_ns()
+
+        ((timestamp_ns, _),) = read_capture(path)
+        assert before <= timestamp_ns <= after
+
+    def test_bad_magic(self, tmp_path):
+        """Files without the header are rejected."""
+        path = tmp_path / "bad.g13cap"
+        path.write_bytes(b"not a capture")
+
+        with pytest.raises(CaptureFormatError):
+            list(read_capture(path))
+
+    def test_truncated_record(self, log_path):
+        """A cut-off record is reported, not silently dropped."""
+        log_path.write_bytes(log_path.read_bytes()[:-3])
+
+        with pytest.raises(CaptureFormatError):
+            list(read_capture(log_path))
+
+
+class TestCapture:
+    """Test the capture loop."""
+
+    def test_records_reports(self, tmp_path):
+        """Every report read is written and passed to on_report."""
+        reports = [REPORT_A, REPORT_B]
+        stop = threading.Event()
+        device = MagicMock()
+
+        def readinto(buf, timeout_ms=None):
+            if not reports:
+                stop.set()
+                return 0
+            data = reports.pop(0)
+            buf[: len(data)] = data
+            return len(data)
+
+        device.readinto.side_effect = readinto
+        seen = []
+        path = tmp_path / "out.g13cap"
+
+        with CaptureWriter(path) as writer:
+            count = capture(device, writer, on_report=lambda ts, d: seen.append(d), stop=stop)
+
+        assert count == 2
+        assert seen == [REPORT_A, REPORT_B]
+        assert [data for _, data in read_capture(path)] == [REPORT_A, REPORT_B]
+
+    def test_duration(self):
+        """The loop ends once the duration has passed."""
+        device = MagicMock()
+        device.readinto.return_value = 0
+
+        assert capture(device, duration=0.02, timeout_ms=1) == 0
+
+
+class TestReplayDevice:
+    """Test playback through the device interface."""
+
+    def test_fast_replay(self, log_path):
+        """Speed 0 returns reports back to back."""
+        device = ReplayDevice(log_path, speed=0)
+        buf = bytearray(64)
+
+        assert device.readinto(buf) == 8
+        assert bytes(buf[:8]) == REPORT_A
+        assert device.read() == list(REPORT_B)
+        assert device.read() is None
+        assert device.finished.is_set()
+        assert device.reports_read == 2
+
+    def test_realtime_schedule(self, log_path):
+        """Reports are released on the recorded schedule divided by speed."""
+        device = ReplayDevice(log_path, speed=5.0)  # 50 ms gap -> 10 ms
+        buf = bytearray(64)
+
+        start = time.monotonic()
+        device.readinto(buf, timeout_ms=-1)
+        device.readinto(buf, timeout_ms=-1)
+        elapsed = time.monotonic() - start
+
+        assert 0.008 <= elapsed < 0.5
+
+    def test_timeout_before_due(self, log_path):
+        """A read that times out before the next report returns nothing."""
+        device = ReplayDevice(log_path, speed=1.0)
+        buf = bytearray(64)
+        device.readinto(buf, timeout_ms=-1)
+
+        assert device.readinto(buf, timeout_ms=1) == 0
+        assert device.readinto(buf) == 0  # Non-blocking
+        assert device.reports_read == 1
+
+    def test_on_end_called_once(self, log_path):
+        """on_end fires once after the last report."""
+        on_end = MagicMock()
+        device = ReplayDevice(log_path, speed=0, on_end=on_end)
+
+        for _ in range(5):
+            device.read()
+
+        on_end.assert_called_once()
+
+    def test_loop(self, log_path):
+        """Looping replays start over instead of ending."""
+        device = ReplayDevice(log_path, speed=0, loop=True)
+
+        reports = [bytes(device.read()) for _ in range(4)]
+
+        assert reports == [REPORT_A, REPORT_B, REPORT_A, REPORT_B]
+        assert not device.finished.is_set()
+
+    def test_accepts_output(self, log_path):
+        """LCD writes and feature reports are accepted and counted."""
+        device = ReplayDevice(log_path)
+
+        assert device.write(bytes(992)) == 992
+        assert device.send_feature_report(b"\x07\xff\x00\x00\x00") == 5
+        assert device.writes == 1
+        assert device.last_feature_report == b"\x07\xff\x00\x00\x00"
+        assert device.get_feature_report(0x07, 5) == b"\x07\x00\x00\x00\x00"
+
+    def test_negative_speed_rejected(self, log_path):
+        """Speeds below zero are invalid."""
+        with pytest.raises(ValueError):
+            ReplayDevice(log_path, speed=-1)
+
+    def test_drives_report_bus(self, log_path):
+        """A replay feeds the report bus like real hardware."""
+        device = ReplayDevice(log_path, speed=0)
+        bus = ReportBus(device)
+        device.on_end = bus.stop
+        reports = []
+        bus.subscribe(reports.append)
+
+        bus.run()
+
+        assert [r.pressed for r in reports] == [("G1",), ()]
+        assert reports[1].released == ("G1",)
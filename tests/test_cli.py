@@ -7,6 +7,7 @@ import pytest
 
 from g13_linux.cli import (
     COLOR_PRESETS,
+    cmd_capture,
     cmd_color,
     cmd_lcd,
     cmd_profile,
@@ -104,6 +105,101 @@ class TestCmdRun:
         assert mock_mapper.handle_raw_report.call_count == 2
 
 
+class TestCmdCapture:
+    """Tests for the capture command and replayed runs."""
+
+    def test_cmd_capture_writes_log(self, tmp_path, capsys):
+        """Reports read from the device end up in the capture log."""
+        from g13_linux.capture import read_capture
+
+        report = bytes([0x01, 128, 128, 0x01, 0, 0x80, 0, 0])
+        mock_device = MagicMock()
+
+        def readinto(buf, timeout_ms=None):
+            if mock_device.readinto.call_count > 1:
+                raise KeyboardInterrupt
+            buf[:8] = report
+            return 8
+
+        mock_device.readinto.side_effect = readinto
+        output = tmp_path / "cap.g13cap"
+        args = MagicMock(output=str(output), duration=None, libusb=False, quiet=True)
+
+        with patch("g13_linux.device.open_g13", return_value=mock_device):
+            cmd_capture(args)
+
+        assert [data for _, data in read_capture(output)] == [report]
+        mock_device.close.assert_called_once()
+        assert "Captured 1 reports" in capsys.readouterr().out
+
+    def test_cmd_capture_device_error(self, tmp_path, capsys):
+        """A missing device exits with an error."""
+        args = MagicMock(output=str(tmp_path / "x"), duration=None, libusb=True, quiet=True)
+
+        with patch("g13_linux.device.open_g13_libusb", side_effect=RuntimeError("none")):
+            with pytest.raises(SystemExit):
+                cmd_capture(args)
+
+        assert "Could not open G13" in capsys.readouterr().err
+
+    def test_cmd_run_replay(self, tmp_path, capsys):
+        """run --replay feeds the daemon from the log and stops at the end."""
+        from g13_linux.capture import CaptureWriter, ReplayDevice
+        from g13_linux.uinput_service import RecordingOutput
+
+        path = tmp_path / "cap.g13cap"
+        with CaptureWriter(path) as writer:
+            writer.write(bytes(8), timestamp_ns=0)
+
+        args = MagicMock(
+            simple=False,
+            no_server=True,
+            server_host="127.0.0.1",
+            server_port=8765,
+            static_dir=None,
+            replay=str(path),
+            speed=0.0,
+            inject=False,
+        )
+
+        with patch("g13_linux.daemon.G13Daemon") as mock_daemon_cls:
+            cmd_run(args)
+
+        device = mock_daemon_cls.call_args.kwargs["device"]
+        assert isinstance(device, ReplayDevice)
+        assert isinstance(mock_daemon_cls.call_args.kwargs["output"], RecordingOutput)
+        assert device.speed == 0.0
+        assert device.on_end is mock_daemon_cls.return_value.request_stop
+        mock_daemon_cls.return_value.run.assert_called_once()
+        assert "Replaying 1 reports" in capsys.readouterr().out
+
+    def test_cmd_run_replay_inject(self, tmp_path):
+        """run --replay --inject uses the daemon's real uinput output."""
+        from g13_linux.capture import CaptureWriter
+
+        path = tmp_path / "cap.g13cap"
+        with CaptureWriter(path) as writer:
+            writer.write(bytes(8), timestamp_ns=0)
+        args = MagicMock(simple=False, replay=str(path), speed=0.0, inject=True)
+
+        with patch("g13_linux.daemon.G13Daemon") as mock_daemon_cls:
+            cmd_run(args)
+
+        assert mock_daemon_cls.call_args.kwargs["output"] is None
+
+    def test_cmd_run_replay_bad_file(self, tmp_path, capsys):
+        """An invalid capture exits with an error."""
+        path = tmp_path / "bad.g13cap"
+        path.write_bytes(b"junk")
+        args = MagicMock(simple=False, replay=str(path), speed=1.0)
+
+        with patch("g13_linux.daemon.G13Daemon"):
+            with pytest.raises(SystemExit):
+                cmd_run(args)
+
+        assert "Could not load capture" in capsys.readouterr().err
+
+
 class TestCmdLcd:
     """Tests for cmd_lcd command."""
 
@@ -140,6 +140,16 @@ class TestRGBConversions:
         assert g == 20
         assert b == 30
 
+    def test_packed_round_trip(self):
+        """packed and from_packed convert to and from 0xRRGGBB."""
+        color = RGB(0x12, 0x34, 0x56)
+        assert color.packed == 0x123456
+        assert RGB.from_packed(0x123456) == color
+
+    def test_slots(self):
+        """RGB instances have no per-instance __dict__."""
+        assert not hasattr(RGB(1, 2, 3), "__dict__")
+
 
 class TestBlend:
     """Tests for blend function."""
@@ -0,0 +1,174 @@
+"""Tests for the G13 daemon lifecycle."""
+
+import json
+import signal
+from unittest.mock import patch
+
+import pytest
+
+from g13_linux.capture import CaptureWriter, ReplayDevice
+from g13_linux.gui.models.profile_manager import ProfileData, ProfileManager
+
+REPORT = bytes([0x01, 128, 128, 0x00, 0, 0x80, 0, 0])
+
+
+@pytest.fixture
+def capture_path(tmp_path):
+    """Capture log with a few idle reports."""
+    path = tmp_path / "session.g13cap"
+    with CaptureWriter(path) as writer:
+        for i in range(3):
+            writer.write(REPORT, timestamp_ns=i * 1_000_000)
+    return path
+
+
+@pytest.fixture
+def make_daemon(tmp_path, monkeypatch):
+    """Build a daemon on a replay device, with config under tmp_path."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    def make(device, **kwargs):
+        from g13_linux.daemon import G13Daemon
+
+        daemon = G13Daemon(enable_server=False, device=device, **kwargs)
+        daemon.profile_manager = ProfileManager(str(tmp_path / "profiles"))
+        daemon.profile_manager.SAVE_DEBOUNCE = 60  # Only flush() writes
+        return daemon
+
+    with (
+        patch("g13_linux.daemon.UInputService") as mock_service_cls,
+        patch("g13_linux.daemon.signal.signal"),
+    ):
+        make.uinput_cls = mock_service_cls
+        make.uinput = mock_service_cls.return_value
+        yield make
+
+
+class TestDaemonShutdown:
+    """Test that every way of stopping the daemon cleans up."""
+
+    def test_signal_flushes_pending_save(self, make_daemon, capture_path, tmp_path):
+        """A signal during the main loop still writes debounced mapping edits."""
+        daemon = make_daemon(ReplayDevice(capture_path, speed=0, loop=True))
+        manager = daemon.profile_manager
+        manager.save_profile(ProfileData(name="live", mappings={"G1": "KEY_1"}), "live")
+
+        assert daemon.connect()
+        manager.current_name = "live"
+        manager.current_profile = manager.load_profile("live")
+        assert daemon.set_button_mapping("G1", "KEY_A")
+        assert manager.has_pending_saves
+
+        # Delivered from the reader, as a signal interrupting the main loop
+        daemon._report_bus.subscribe(lambda report: daemon._handle_signal(signal.SIGTERM, None))
+        daemon.run()
+
+        assert not manager.has_pending_saves
+        data = json.loads((tmp_path / "profiles" / "live.json").read_text())
+        assert data["mappings"]["G1"] == "KEY_A"
+
+    def test_stop_runs_once(self, make_daemon, capture_path):
+        """stop() after a completed shutdown does nothing."""
+        daemon = make_daemon(ReplayDevice(capture_path, speed=0))
+        assert daemon.connect()
+
+        daemon.stop()
+        daemon.stop()
+
+        make_daemon.uinput.close.assert_called_once()
+
+
+class TestKeyboardKeys:
+    """Test the virtual keyboard's key set."""
+
+    def test_connect_requires_keys_of_all_profiles(self, make_daemon, capture_path):
+        """Every saved profile's keys are registered up front, in one call."""
+        from evdev import ecodes as e
+
+        daemon = make_daemon(ReplayDevice(capture_path, speed=0))
+        manager = daemon.profile_manager
+        manager.save_profile(ProfileData(name="a", mappings={"G1": "KEY_1"}), "a")
+        manager.save_profile(
+            ProfileData(
+                name="b",
+                mappings={"G2": {"keys": ["KEY_LEFTCTRL", "KEY_B"]}},
+                mode_mappings={"M2": {"G1": "KEY_F1"}},
+            ),
+            "b",
+        )
+
+        assert daemon.connect()
+
+        calls = [set(c[0][0]) for c in make_daemon.uinput.require_keys.call_args_list]
+        assert {e.KEY_1, e.KEY_LEFTCTRL, e.KEY_B, e.KEY_F1} in calls
+        daemon.stop()
+
+
+class TestReplayShutdown:
+    """Test the end of a replayed capture."""
+
+    def test_replay_end_cleans_up(self, make_daemon, capture_path):
+        """Running out of reports stops the writers and the uinput service."""
+        replay = ReplayDevice(capture_path, speed=0)
+        daemon = make_daemon(replay)
+        # Wired like `g13-linux run --replay`
+        replay.on_end = daemon.request_stop
+
+        assert daemon.connect()
+        lcd, backlight = daemon._lcd, daemon._backlight
+        assert lcd.writer_running and backlight.writer_running
+
+        daemon.run()
+
+        assert replay.finished.is_set()
+        assert replay.reports_read == 3
+        assert not lcd.writer_running
+        assert not backlight.writer_running
+        assert not daemon._led_controller.compositor.is_running
+        make_daemon.uinput.close.assert_called_once()
+
+    def test_replay_records_mapped_keys(self, make_daemon, tmp_path):
+        """With a RecordingOutput, replayed presses are recorded, not injected."""
+        from evdev import ecodes as e
+
+        from g13_linux.uinput_service import RecordingOutput
+
+        g1 = bytearray(REPORT)
+        g1[3] = 0x01
+        path = tmp_path / "keys.g13cap"
+        with CaptureWriter(path) as writer:
+            for i, report in enumerate((REPORT, bytes(g1), REPORT)):
+                writer.write(report, timestamp_ns=i * 1_000_000)
+
+        replay = ReplayDevice(path, speed=0)
+        output = RecordingOutput()
+        daemon = make_daemon(replay, output=output)
+        replay.on_end = daemon.request_stop
+        daemon.profile_manager.save_profile(
+            ProfileData(name="default", mappings={"G1": "KEY_1"}), "default"
+        )
+
+        assert daemon.connect()
+        daemon.run()
+
+        make_daemon.uinput_cls.assert_not_called()
+        assert output.events == [
+            ("keyboard", e.EV_KEY, e.KEY_1, 1),
+            ("keyboard", e.EV_KEY, e.KEY_1, 0),
+        ]
+
+
+class TestReactiveLighting:
+    """Test how reactive lighting is fed."""
+
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_activity_subscribed_with_setting(self, make_daemon, capture_path, enabled):
+        """The report bus feeds key activity only with reactive lighting on."""
+        daemon = make_daemon(ReplayDevice(capture_path, speed=0))
+        daemon.settings_manager.led_reactive = enabled
+
+        assert daemon.connect()
+
+        subscribed = daemon._input_activity.on_report in daemon._report_bus._subscribers
+        assert subscribed is enabled
+        daemon.stop()
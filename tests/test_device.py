@@ -1,5 +1,9 @@
 """Tests for g13_linux.device module."""
 
+import array
+import os
+import select
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -119,6 +123,107 @@ class TestHidrawDevice:
         device.close()
 
 
+class TestHidrawDevicePolling:
+    """Tests for timeout-aware reads built on poll()."""
+
+    def _pipe_device(self):
+        """Create a HidrawDevice backed by a non-blocking pipe."""
+        read_fd, write_fd = os.pipe()
+        device = HidrawDevice("/dev/hidraw-test")
+        device._file = os.fdopen(read_fd, "rb", buffering=0)
+        device._fd = read_fd
+        os.set_blocking(read_fd, False)
+        device._poller = select.poll()
+        device._poller.register(read_fd, select.POLLIN)
+        return device, write_fd
+
+    def test_open_registers_poller(self):
+        mock_file = MagicMock()
+        mock_file.fileno.return_value = 42
+        with patch("builtins.open", return_value=mock_file), patch("os.set_blocking"):
+            with patch("select.poll") as mock_poll:
+                device = HidrawDevice("/dev/hidraw0")
+                device.open()
+                mock_poll.return_value.register.assert_called_once_with(42, select.POLLIN)
+                assert device.fileno() == 42
+
+    def test_read_timeout_returns_none(self):
+        device, write_fd = self._pipe_device()
+        try:
+            start = time.monotonic()
+            assert device.read(timeout_ms=30) is None
+            # Slept in the kernel instead of returning immediately
+            assert time.monotonic() - start >= 0.02
+        finally:
+            device.close()
+            os.close(write_fd)
+
+    def test_read_returns_queued_report(self):
+        device, write_fd = self._pipe_device()
+        try:
+            os.write(write_fd, bytes([1, 128, 127, 1, 0, 0x80, 0, 0]))
+            assert device.read(timeout_ms=1000) == [1, 128, 127, 1, 0, 0x80, 0, 0]
+        finally:
+            device.close()
+            os.close(write_fd)
+
+    def test_read_wakes_when_report_arrives(self):
+        import threading
+
+        device, write_fd = self._pipe_device()
+        try:
+            timer = threading.Timer(0.02, os.write, args=(write_fd, b"\x01\x02"))
+            timer.start()
+            start = time.monotonic()
+            assert device.read(timeout_ms=5000) == [1, 2]
+            assert time.monotonic() - start < 1.0
+            timer.join()
+        finally:
+            device.close()
+            os.close(write_fd)
+
+    def test_readinto_fills_slot(self):
+        device, write_fd = self._pipe_device()
+        try:
+            slot = bytearray(64)
+            os.write(write_fd, bytes([1, 128, 127, 1, 0, 0x80, 0, 0]))
+            assert device.readinto(slot, timeout_ms=1000) == 8
+            assert slot[:8] == bytes([1, 128, 127, 1, 0, 0x80, 0, 0])
+        finally:
+            device.close()
+            os.close(write_fd)
+
+    def test_readinto_timeout_returns_zero(self):
+        device, write_fd = self._pipe_device()
+        try:
+            assert device.readinto(bytearray(64), timeout_ms=10) == 0
+            # Non-blocking read with nothing queued
+            assert device.readinto(bytearray(64)) == 0
+        finally:
+            device.close()
+            os.close(write_fd)
+
+    def test_wait_readable_raises_on_hangup(self):
+        device, write_fd = self._pipe_device()
+        os.close(write_fd)
+        try:
+            with pytest.raises(OSError):
+                device.wait_readable(100)
+        finally:
+            device.close()
+
+    def test_wait_readable_without_poller(self):
+        device = HidrawDevice("/dev/hidraw0")
+        assert device.wait_readable(100) is True
+
+    def test_close_unregisters_poller(self):
+        device, write_fd = self._pipe_device()
+        device.close()
+        os.close(write_fd)
+        assert device._poller is None
+        assert device.fileno() is None
+
+
 class TestFindG13Hidraw:
     """Tests for find_g13_hidraw function."""
 
@@ -181,6 +286,13 @@ class TestReadEvent:
         result = read_event(mock_handle)
         assert result is None
 
+    def test_read_event_with_timeout(self):
+        mock_handle = MagicMock()
+        mock_handle.read.return_value = [1, 2]
+        result = read_event(mock_handle, timeout_ms=100)
+        mock_handle.read.assert_called_once_with(timeout_ms=100)
+        assert result == [1, 2]
+
 
 class TestLibUSBDevice:
     """Tests for LibUSBDevice class."""
@@ -347,6 +459,28 @@ class TestLibUSBDevice:
         result = device.read(100)
         assert result is None
 
+    def test_readinto_copies_transfer(self):
+        device = LibUSBDevice()
+        device._ep_in = MagicMock()
+
+        def ep_read(buf, timeout):
+            buf[:4] = array.array("B", [1, 2, 3, 4])
+            return 4
+
+        device._ep_in.read.side_effect = ep_read
+        slot = bytearray(64)
+        assert device.readinto(slot, timeout_ms=50) == 4
+        assert slot[:4] == bytes([1, 2, 3, 4])
+        # Transfer reuses the device's preallocated array
+        assert device._ep_in.read.call_args[0][0] is device._read_buf
+        assert device._ep_in.read.call_args[1] == {"timeout": 50}
+
+    def test_readinto_timeout(self):
+        device = LibUSBDevice()
+        device._ep_in = MagicMock()
+        device._ep_in.read.side_effect = Exception("Timeout")
+        assert device.readinto(bytearray(64)) == 0
+
     def test_write(self):
         device = LibUSBDevice()
         device._dev = MagicMock()
@@ -17,10 +17,9 @@ class TestDeviceEventThreadInit:
 
         assert thread.device_handle is mock_handle
         assert thread.running is True
-        assert thread._is_libusb is False
 
-    def test_init_with_libusb_device(self, qtbot):
-        """Test init with LibUSBDevice."""
+    def test_init_preallocates_read_slot(self, qtbot):
+        """Test init allocates the reusable read slot once."""
         from g13_linux.device import LibUSBDevice
         from g13_linux.gui.controllers.device_event_controller import DeviceEventThread
 
@@ -29,7 +28,8 @@ class TestDeviceEventThreadInit:
         thread = DeviceEventThread(mock_handle)
 
         assert thread.device_handle is mock_handle
-        assert thread._is_libusb is True
+        assert isinstance(thread._slot, bytearray)
+        assert len(thread._slot) == 64
 
 
 class TestDeviceEventThreadRun:
@@ -44,15 +44,16 @@ class TestDeviceEventThreadRun:
         # Return data once, then stop
         call_count = [0]
 
-        def mock_read(timeout_ms=100):
+        def mock_readinto(buf, timeout_ms=100):
             call_count[0] += 1
             if call_count[0] == 1:
-                return [0x01, 0x02, 0x03]
+                buf[:3] = bytes([0x01, 0x02, 0x03])
+                return 3
             else:
                 thread.running = False
-                return None
+                return 0
 
-        mock_handle.read.side_effect = mock_read
+        mock_handle.readinto.side_effect = mock_readinto
 
         thread = DeviceEventThread(mock_handle)
 
@@ -66,32 +67,39 @@ class TestDeviceEventThreadRun:
 
     def test_run_with_hidraw_device(self, qtbot):
         """Test run loop with hidraw device."""
+        from g13_linux.device import HidrawDevice
         from g13_linux.gui.controllers.device_event_controller import DeviceEventThread
 
-        mock_handle = MagicMock()
+        mock_handle = MagicMock(spec=HidrawDevice)
         call_count = [0]
+        timeouts = []
+        slots = []
 
-        def mock_read_event(handle):
+        def mock_readinto(buf, timeout_ms=None):
+            timeouts.append(timeout_ms)
+            slots.append(buf)
             call_count[0] += 1
-            if call_count[0] == 1:
-                return bytes([0xAA, 0xBB])
+            if call_count[0] <= 2:
+                buf[:2] = bytes([0xAA, call_count[0]])
+                return 2
             else:
                 thread.running = False
-                return None
+                return 0
+
+        mock_handle.readinto.side_effect = mock_readinto
 
         thread = DeviceEventThread(mock_handle)
 
         events = []
         thread.event_received.connect(events.append)
 
-        with patch(
-            "g13_linux.gui.controllers.device_event_controller.read_event",
-            side_effect=mock_read_event,
-        ):
-            thread.run()
+        thread.run()
 
-        assert len(events) == 1
-        assert events[0] == bytes([0xAA, 0xBB])
+        # Each emitted report is an independent copy of the reused slot
+        assert events == [bytes([0xAA, 1]), bytes([0xAA, 2])]
+        assert slots[0] is slots[1]
+        # Reads must block with a timeout rather than spin
+        assert timeouts[0] == DeviceEventThread.READ_TIMEOUT_MS
 
     def test_run_emits_error_on_exception(self, qtbot):
         """Test run emits error on exception."""
@@ -99,7 +107,7 @@ class TestDeviceEventThreadRun:
         from g13_linux.gui.controllers.device_event_controller import DeviceEventThread
 
         mock_handle = MagicMock(spec=LibUSBDevice)
-        mock_handle.read.side_effect = Exception("USB read failed")
+        mock_handle.readinto.side_effect = Exception("USB read failed")
 
         thread = DeviceEventThread(mock_handle)
 
@@ -113,24 +121,25 @@ class TestDeviceEventThreadRun:
         assert thread.running is False
 
     def test_run_continues_on_empty_data(self, qtbot):
-        """Test run loop continues when data is None/empty."""
+        """Test run loop continues when no report arrived."""
         from g13_linux.device import LibUSBDevice
         from g13_linux.gui.controllers.device_event_controller import DeviceEventThread
 
         mock_handle = MagicMock(spec=LibUSBDevice)
         call_count = [0]
 
-        def mock_read(timeout_ms=100):
+        def mock_readinto(buf, timeout_ms=100):
             call_count[0] += 1
             if call_count[0] < 3:
-                return None  # Empty read
+                return 0  # Timed out
             elif call_count[0] == 3:
-                return [0xFF]  # Valid data
+                buf[0] = 0xFF  # Valid data
+                return 1
             else:
                 thread.running = False
-                return None
+                return 0
 
-        mock_handle.read.side_effect = mock_read
+        mock_handle.readinto.side_effect = mock_readinto
 
         thread = DeviceEventThread(mock_handle)
 
@@ -207,11 +216,11 @@ class TestDeviceEventThreadIntegration:
 
         mock_handle = MagicMock(spec=LibUSBDevice)
 
-        def slow_read(timeout_ms=100):
+        def slow_readinto(buf, timeout_ms=100):
             time.sleep(0.01)
-            return None
+            return 0
 
-        mock_handle.read.side_effect = slow_read
+        mock_handle.readinto.side_effect = slow_readinto
 
         thread = DeviceEventThread(mock_handle)
 
@@ -27,6 +27,14 @@ class TestG13ButtonState:
         assert state.joystick_y == 128
         assert len(state.raw_data) == 8
 
+    def test_slotted(self):
+        """State uses __slots__ (no per-instance dict)."""
+        state = G13ButtonState(g_buttons=0, m_buttons=0, joystick_x=128, joystick_y=128)
+
+        assert not hasattr(state, "__dict__")
+        assert state.raw_data == b""
+        assert state.buttons is None
+
 
 class TestEventDecoderInit:
     """Tests for EventDecoder initialization."""
@@ -79,6 +87,59 @@ class TestDecodeReport:
         assert state.joystick_x == 0x80
         assert state.joystick_y == 0x80
 
+    def test_decode_report_from_reused_buffer(self):
+        """Test decoding a memoryview slot that is overwritten afterwards."""
+        decoder = EventDecoder()
+        slot = bytearray([0x00, 0x80, 0x80, 0x01, 0x00, 0x00, 0x01, 0x00])
+        state = decoder.decode_report(memoryview(slot)[:8])
+
+        assert state.g_buttons == 1 << 1
+        # State must not change when the slot is reused for the next report
+        slot[6] = 0x00
+        assert decoder.get_pressed_buttons(state) == ["G1", "BD"]
+
+    def test_decode_report_drops_raw_by_default(self):
+        """Raw data is not retained unless keep_raw is set."""
+        decoder = EventDecoder()
+        state = decoder.decode_report(bytearray([0x00, 0x80, 0x80, 0x01, 0, 0x80, 0, 0]))
+
+        assert state.raw_data == b""
+        assert state.buttons == 0x01
+
+    def test_decode_report_keep_raw(self):
+        """keep_raw stores an immutable copy of the report."""
+        decoder = EventDecoder(keep_raw=True)
+        slot = bytearray([0x00, 0x80, 0x80, 0x01, 0, 0x80, 0, 0])
+        state = decoder.decode_report(memoryview(slot))
+        slot[3] = 0x00
+
+        assert state.raw_data == bytes([0x00, 0x80, 0x80, 0x01, 0, 0x80, 0, 0])
+
+    def test_decode_report_reuses_out_state(self):
+        """decode_report(out=...) overwrites and returns the given state."""
+        decoder = EventDecoder()
+        out = G13ButtonState(g_buttons=0, m_buttons=0, joystick_x=0, joystick_y=0)
+
+        state = decoder.decode_report(bytes([0x00, 0x10, 0x20, 0x01, 0, 0x80, 0x20, 0]), out=out)
+
+        assert state is out
+        assert out.g_buttons == 1 << 1
+        assert out.m_buttons == 1 << 1
+        assert (out.joystick_x, out.joystick_y) == (0x10, 0x20)
+
+    def test_diff_with_reused_state(self):
+        """Changes are detected even when the same state object is reused."""
+        decoder = EventDecoder()
+        out = G13ButtonState(g_buttons=0, m_buttons=0, joystick_x=0, joystick_y=0)
+
+        decoder.diff_buttons(decoder.decode_report(bytes([0, 128, 128, 0x01, 0, 0x80, 0, 0]), out))
+        pressed, released = decoder.diff_buttons(
+            decoder.decode_report(bytes([0, 128, 128, 0x00, 0, 0x80, 0, 0]), out)
+        )
+
+        assert pressed == ()
+        assert released == ("G1",)
+
     def test_decode_g1_pressed(self):
         """Test decoding G1 button press (byte 3, bit 0)."""
         decoder = EventDecoder()
@@ -432,111 +493,78 @@ class TestHelperFunction:
 class TestEventDecoderMissingCoverage:
     """Tests for edge cases to achieve 100% coverage."""
 
-    def test_decode_g_buttons_out_of_range(self):
-        """Test _decode_g_buttons with button number outside 1-22 (line 155->151)."""
-        from unittest.mock import patch
-
-        decoder = EventDecoder()
-        data = bytes([0x00, 0x80, 0x80, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-
-        # Patch BUTTON_MAP to include out-of-range G button
+    def test_compile_ignores_bytes_outside_button_range(self):
+        """Entries outside bytes 3-7 don't reach the lookup tables."""
         patched_map = dict(EventDecoder.BUTTON_MAP)
-        patched_map["G0"] = (3, 0)  # G0 is out of range (< 1)
-        patched_map["G25"] = (3, 1)  # G25 is out of range (> 22)
+        patched_map["G23"] = (99, 0)  # byte 99 doesn't exist
+        patched_map["M4"] = (1, 0)  # joystick byte, not a button byte
 
-        with patch.object(EventDecoder, "BUTTON_MAP", patched_map):
-            result = decoder._decode_g_buttons(data)
+        mask, tables = EventDecoder._compile_button_tables(patched_map)
+        default_mask, _ = EventDecoder._compile_button_tables(EventDecoder.BUTTON_MAP)
 
-        # Should still decode valid G buttons, ignore invalid ones
-        assert result & (1 << 1)  # G1 should be set
+        assert mask == default_mask
+        assert all("G23" not in names and "M4" not in names for t in tables for names in t)
 
-    def test_decode_g_buttons_value_error(self):
-        """Test _decode_g_buttons handles ValueError (lines 159-160)."""
-        from unittest.mock import patch
+    def test_compile_ignores_invalid_bit_positions(self):
+        """Bit positions outside 0-7 are skipped."""
+        patched_map = {"G1": (3, 0), "Gx": (3, 9), "G0": (4, -1)}
 
-        decoder = EventDecoder()
-        data = bytes([0x00, 0x80, 0x80, 0xFF, 0x00, 0x00, 0x00, 0x00])
+        mask, tables = EventDecoder._compile_button_tables(patched_map)
 
-        # Patch BUTTON_MAP to include invalid button name (non-numeric suffix)
-        patched_map = dict(EventDecoder.BUTTON_MAP)
-        patched_map["Gx"] = (3, 0)  # "x" can't be converted to int
-
-        with patch.object(EventDecoder, "BUTTON_MAP", patched_map):
-            # Should not raise - exception is caught
-            result = decoder._decode_g_buttons(data)
-
-        # Result should still be valid (G1-G8 from byte 3 = 0xFF)
-        assert result > 0
-
-    def test_decode_g_buttons_index_error(self):
-        """Test _decode_g_buttons handles IndexError (lines 159-160)."""
-        from unittest.mock import patch
+        assert mask == 1
+        assert tables[0][0xFF] == ("G1",)
 
+    def test_status_bit_is_masked(self):
+        """Byte 5 bit 7 (always-set status flag) never decodes as a button."""
         decoder = EventDecoder()
-        data = bytes([0x00, 0x80, 0x80, 0x01, 0x00, 0x00, 0x00, 0x00])
-
-        # Patch BUTTON_MAP to include button at invalid byte index
-        patched_map = dict(EventDecoder.BUTTON_MAP)
-        patched_map["G23"] = (99, 0)  # byte 99 doesn't exist in 8-byte data
-
-        with patch.object(EventDecoder, "BUTTON_MAP", patched_map):
-            # Should not raise - exception is caught
-            result = decoder._decode_g_buttons(data)
-
-        # G1 should still be detected
-        assert result & (1 << 1)
+        state = decoder.decode_report(bytes([0x00, 0x80, 0x80, 0x00, 0x00, 0x80, 0x00, 0x00]))
 
-    def test_decode_m_buttons_out_of_range(self):
-        """Test _decode_m_buttons with button number outside 1-3 (line 178->174)."""
-        from unittest.mock import patch
+        assert state.buttons == 0
+        assert decoder.get_pressed_buttons(state) == []
 
+    def test_table_matches_button_map(self):
+        """Every BUTTON_MAP entry decodes to exactly its own button ID."""
         decoder = EventDecoder()
-        data = bytes([0x00, 0x80, 0x80, 0x00, 0x00, 0x00, 0xFF, 0x00])
+        for name, (byte_idx, bit_pos) in EventDecoder.BUTTON_MAP.items():
+            data = bytearray([0x00, 0x80, 0x80, 0x00, 0x00, 0x80, 0x00, 0x00])
+            data[byte_idx] |= 1 << bit_pos
+            state = decoder.decode_report(data)
 
-        # Patch BUTTON_MAP to include out-of-range M button
-        patched_map = dict(EventDecoder.BUTTON_MAP)
-        patched_map["M0"] = (6, 0)  # M0 is out of range (< 1)
-        patched_map["M5"] = (6, 1)  # M5 is out of range (> 3)
+            assert decoder.get_pressed_buttons(state) == [name]
+            if name.startswith("G"):
+                assert state.g_buttons == 1 << int(name[1:])
+            elif name in ("M1", "M2", "M3"):
+                assert state.m_buttons == 1 << int(name[1:])
 
-        with patch.object(EventDecoder, "BUTTON_MAP", patched_map):
-            result = decoder._decode_m_buttons(data)
+    def test_diff_buttons_returns_tuples(self):
+        """diff_buttons reports changed bits only, as tuples."""
+        decoder = EventDecoder()
+        decoder.diff_buttons(decoder.decode_report(bytes([0, 128, 128, 0x01, 0, 0x80, 0, 0])))
 
-        # Should decode valid M buttons, ignore invalid ones
-        assert result & (1 << 1)  # M1 should be set (byte 6 bit 5)
+        pressed, released = decoder.diff_buttons(
+            decoder.decode_report(bytes([0, 128, 128, 0x02, 0, 0x80, 0x01, 0x01]))
+        )
 
-    def test_decode_m_buttons_value_error(self):
-        """Test _decode_m_buttons handles ValueError (lines 181-182)."""
-        from unittest.mock import patch
+        assert pressed == ("G2", "BD", "MR")
+        assert released == ("G1",)
 
+    def test_diff_buttons_no_change(self):
+        """Joystick-only reports produce no button events."""
         decoder = EventDecoder()
-        data = bytes([0x00, 0x80, 0x80, 0x00, 0x00, 0x00, 0x20, 0x00])
-
-        # Patch BUTTON_MAP to include invalid button name
-        patched_map = dict(EventDecoder.BUTTON_MAP)
-        patched_map["Mx"] = (6, 0)  # "x" can't be converted to int
-
-        with patch.object(EventDecoder, "BUTTON_MAP", patched_map):
-            result = decoder._decode_m_buttons(data)
+        decoder.diff_buttons(decoder.decode_report(bytes([0, 128, 128, 0x01, 0, 0x80, 0, 0])))
 
-        # M1 should still be detected
-        assert result & (1 << 1)
+        changes = decoder.diff_buttons(
+            decoder.decode_report(bytes([0, 10, 250, 0x01, 0, 0x80, 0, 0]))
+        )
 
-    def test_decode_m_buttons_index_error(self):
-        """Test _decode_m_buttons handles IndexError (lines 181-182)."""
-        from unittest.mock import patch
+        assert changes == ((), ())
 
+    def test_buttons_to_ids_spanning_bytes(self):
+        """Bits from several packed bytes map in report order."""
         decoder = EventDecoder()
-        data = bytes([0x00, 0x80, 0x80, 0x00, 0x00, 0x00, 0x20, 0x00])
-
-        # Patch BUTTON_MAP to include button at invalid byte index
-        patched_map = dict(EventDecoder.BUTTON_MAP)
-        patched_map["M4"] = (99, 0)  # byte 99 doesn't exist
-
-        with patch.object(EventDecoder, "BUTTON_MAP", patched_map):
-            result = decoder._decode_m_buttons(data)
+        packed = (1 << 0) | (1 << 8) | (1 << 21) | (1 << 29) | (1 << 35)
 
-        # M1 should still be detected
-        assert result & (1 << 1)
+        assert decoder.buttons_to_ids(packed) == ("G1", "G9", "G22", "M1", "STICK")
 
     def test_get_pressed_buttons_short_raw_data(self):
         """Test get_pressed_buttons with raw_data < 8 bytes (line 218->226)."""
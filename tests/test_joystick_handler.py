@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+from evdev import ecodes as e
+
 from g13_linux.gui.models.joystick_handler import (
     JoystickConfig,
     JoystickHandler,
@@ -140,6 +142,36 @@ class TestJoystickHandlerStart:
         assert result is False
 
 
+class TestJoystickHandlerOutputService:
+    """Tests for JoystickHandler on a shared UInputService"""
+
+    @patch("g13_linux.gui.models.joystick_handler.UInput")
+    def test_analog_uses_service_device(self, mock_uinput):
+        output = MagicMock()
+        handler = JoystickHandler(JoystickConfig(mode=JoystickMode.ANALOG), output=output)
+
+        assert handler.start() is True
+
+        mock_uinput.assert_not_called()
+        name, _capabilities = output.open_device.call_args.args
+        assert name == "joystick"
+        assert output.open_device.call_args.kwargs["name"] == "G13 Joystick"
+        assert handler._analog_device is output.open_device.return_value
+
+    @patch("g13_linux.gui.models.joystick_handler.UInput")
+    def test_digital_uses_shared_keyboard(self, mock_uinput):
+        output = MagicMock()
+        handler = JoystickHandler(JoystickConfig(mode=JoystickMode.DIGITAL), output=output)
+
+        handler.start()
+        handler.update(128, 0)  # Up
+
+        mock_uinput.assert_not_called()
+        keys = set(output.keyboard.call_args.args[0])
+        assert keys == {e.KEY_UP, e.KEY_DOWN, e.KEY_LEFT, e.KEY_RIGHT}
+        output.keyboard.return_value.write.assert_called_with(e.EV_KEY, e.KEY_UP, 1)
+
+
 class TestJoystickHandlerStop:
     """Tests for JoystickHandler.stop()"""
 
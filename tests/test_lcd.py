@@ -1,10 +1,11 @@
 """Tests for G13 LCD module."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from g13_linux.hardware.lcd import FONT_5X7, G13LCD
+from g13_linux.hardware.lcd import FONT_5X7, G13LCD, LCDSession
 
 
 class TestFont5x7:
@@ -308,6 +309,241 @@ class TestG13LCDSendFramebuffer:
         assert "Failed to send framebuffer" in captured.out
 
 
+class TestLCDSession:
+    """Tests for the persistent LCD output session."""
+
+    def test_configures_once(self):
+        """SET_CONFIGURATION is sent before the first frame only."""
+        mock_device = MagicMock()
+        mock_device.write.return_value = 992
+        lcd = G13LCD(mock_device)
+
+        for _ in range(3):
+            lcd._send_framebuffer(force=True)
+
+        mock_device._dev.ctrl_transfer.assert_called_once_with(0, 9, 1, 0, None, 1000)
+        assert mock_device.write.call_count == 3
+
+    def test_reconfigures_after_error(self):
+        """A failed write makes the next frame reconfigure the endpoint."""
+        mock_device = MagicMock()
+        mock_device.write.side_effect = [IOError("USB error"), 992, 992]
+        lcd = G13LCD(mock_device)
+
+        for _ in range(3):
+            lcd._send_framebuffer(force=True)
+
+        assert mock_device._dev.ctrl_transfer.call_count == 2
+        assert lcd.stats["errors"] == 1
+        assert lcd.stats["frames"] == 2
+        assert lcd.stats["configures"] == 2
+
+    def test_failed_configure_retries(self):
+        """A failed SET_CONFIGURATION is retried on the next frame."""
+        mock_device = MagicMock()
+        mock_device.write.return_value = 992
+        mock_device._dev.ctrl_transfer.side_effect = [Exception("busy"), None, None]
+        lcd = G13LCD(mock_device)
+
+        lcd._send_framebuffer(force=True)
+        lcd._send_framebuffer(force=True)
+        lcd._send_framebuffer(force=True)
+
+        assert mock_device._dev.ctrl_transfer.call_count == 2
+
+    def test_packet_reused_in_place(self):
+        """Frames are written into one preallocated packet."""
+        mock_device = MagicMock(spec=["write"])
+        mock_device.write.return_value = 992
+        lcd = G13LCD(mock_device)
+
+        lcd._send_framebuffer()
+        first = mock_device.write.call_args[0][0]
+        lcd._framebuffer[0] = 0xAA
+        lcd._send_framebuffer()
+        second = mock_device.write.call_args[0][0]
+
+        assert first is second
+        assert second[0] == 0x03
+        assert second[32] == 0xAA
+
+    def test_latency_counters(self):
+        """Write latency is recorded per frame."""
+        mock_device = MagicMock(spec=["write"])
+        mock_device.write.return_value = 992
+        session = LCDSession(mock_device)
+
+        session.send(bytes(960))
+        session.send(bytes(960))
+
+        stats = session.stats()
+        assert stats["frames"] == 2
+        assert stats["max_write_ms"] >= stats["last_write_ms"] >= 0
+        assert session.avg_write_ms >= 0
+
+    def test_new_device_gets_new_session(self):
+        """Replacing the device handle starts a fresh session."""
+        lcd = G13LCD(MagicMock())
+        first = lcd.session
+        lcd.device = MagicMock()
+
+        assert lcd.session is not first
+        assert lcd.session.device is lcd.device
+
+
+class TestG13LCDSkipIdentical:
+    """Tests for skipping frames the device already shows."""
+
+    def _lcd(self):
+        mock_device = MagicMock(spec=["write"])
+        mock_device.write.return_value = 992
+        return G13LCD(mock_device), mock_device
+
+    def test_identical_frame_skipped(self):
+        """A byte-identical frame is not sent again."""
+        lcd, mock_device = self._lcd()
+
+        lcd.write_bitmap(bytes(960))
+        lcd.write_bitmap(bytes(960))
+
+        assert mock_device.write.call_count == 1
+        assert lcd.skip_hits == 1
+        assert lcd.skip_misses == 1
+
+    def test_changed_frame_sent(self):
+        """Any changed byte sends the frame."""
+        lcd, mock_device = self._lcd()
+        frame = bytearray(960)
+
+        lcd.write_bitmap(frame)
+        frame[959] = 0x01
+        lcd.write_bitmap(frame)
+
+        assert mock_device.write.call_count == 2
+        assert lcd.skip_hits == 0
+
+    def test_force_sends_identical_frame(self):
+        """force=True bypasses the check."""
+        lcd, mock_device = self._lcd()
+
+        lcd.write_bitmap(bytes(960))
+        lcd.write_bitmap(bytes(960), force=True)
+
+        assert mock_device.write.call_count == 2
+
+    def test_failed_send_not_remembered(self):
+        """A frame that failed to send is retried."""
+        lcd, mock_device = self._lcd()
+        mock_device.write.side_effect = [IOError("USB error"), 992]
+
+        lcd.write_bitmap(bytes(960))
+        lcd.write_bitmap(bytes(960))
+
+        assert mock_device.write.call_count == 2
+        assert lcd.skip_hits == 0
+
+    def test_partial_send_not_remembered(self):
+        """A partially written frame is retried."""
+        lcd, mock_device = self._lcd()
+        mock_device.write.side_effect = [500, 992]
+
+        lcd.write_bitmap(bytes(960))
+        lcd.write_bitmap(bytes(960))
+
+        assert mock_device.write.call_count == 2
+
+    def test_new_device_resends(self):
+        """A replaced device handle gets the next frame unconditionally."""
+        lcd, _ = self._lcd()
+        lcd.write_bitmap(bytes(960))
+        new_device = MagicMock(spec=["write"])
+        new_device.write.return_value = 992
+        lcd.device = new_device
+
+        lcd.write_bitmap(bytes(960))
+
+        new_device.write.assert_called_once()
+
+    def test_stats_include_skip_counters(self):
+        """Hit/miss counters are reported with the session stats."""
+        lcd, _ = self._lcd()
+        lcd.clear()
+        lcd.clear()
+
+        stats = lcd.stats
+        assert stats["skip_hits"] == 1
+        assert stats["skip_misses"] == 1
+        assert stats["frames"] == 1
+
+
+class TestG13LCDWriterThread:
+    """Tests for sending frames from the background writer."""
+
+    def test_frames_sent_from_writer_thread(self):
+        """Drawing returns immediately; the writer thread sends."""
+        mock_device = MagicMock(spec=["write"])
+        threads = []
+
+        def write(packet):
+            threads.append(threading.current_thread().name)
+            return 992
+
+        mock_device.write.side_effect = write
+        lcd = G13LCD(mock_device)
+        lcd.start_writer()
+
+        lcd.fill()
+        assert lcd.flush()
+        lcd.stop_writer()
+
+        assert threads == ["LCDWriter"]
+        assert not lcd.writer_running
+
+    def test_stalled_write_drops_stale_frames(self):
+        """Frames drawn during a stalled write collapse to the newest one."""
+        mock_device = MagicMock(spec=["write"])
+        stalled = threading.Event()
+        release = threading.Event()
+        packets = []
+
+        def write(packet):
+            stalled.set()
+            release.wait(2.0)
+            packets.append(bytes(packet[32:]))
+            return 992
+
+        mock_device.write.side_effect = write
+        lcd = G13LCD(mock_device)
+        lcd.start_writer()
+
+        lcd.write_bitmap(bytes([1]) * 960)
+        assert stalled.wait(1.0)
+        for value in (2, 3, 4):
+            lcd.write_bitmap(bytes([value]) * 960)
+        release.set()
+        lcd.flush()
+        lcd.stop_writer()
+
+        assert [p[0] for p in packets] == [1, 4]
+        assert lcd.stats["writer"]["dropped"] == 2
+
+    def test_forced_frame_not_lost_when_replaced(self):
+        """A dropped force=True frame makes its replacement forced too."""
+        assert G13LCD._merge_frames((b"a", True), (b"b", False)) == (b"b", True)
+
+    def test_stop_writer_returns_to_sync(self):
+        """After stop_writer() frames are sent on the calling thread."""
+        mock_device = MagicMock(spec=["write"])
+        mock_device.write.return_value = 992
+        lcd = G13LCD(mock_device)
+        lcd.start_writer()
+        lcd.stop_writer()
+
+        lcd.fill()
+
+        mock_device.write.assert_called_once()
+
+
 class TestG13LCDSetBrightness:
     """Tests for set_brightness method."""
 
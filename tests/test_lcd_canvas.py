@@ -1,5 +1,7 @@
 """Tests for LCD Canvas drawing primitives."""
 
+import pytest
+
 from g13_linux.lcd.canvas import Canvas
 
 
@@ -266,3 +268,101 @@ class TestSerialization:
         assert len(canvas._buffer) == Canvas.FRAMEBUFFER_SIZE
         assert canvas._buffer[99] == 0xFF
         assert canvas._buffer[100] == 0x00
+
+
+def reference_pixels(ops, width=160, height=43):
+    """Apply (kind, x, y, w, h) ops one pixel at a time with set/get_pixel."""
+    canvas = Canvas(width, height)
+    for kind, x, y, w, h in ops:
+        for py in range(y, y + h):
+            for px in range(x, x + w):
+                if kind == "set":
+                    canvas.set_pixel(px, py, True)
+                elif kind == "clear":
+                    canvas.set_pixel(px, py, False)
+                else:
+                    canvas.set_pixel(px, py, not canvas.get_pixel(px, py))
+    return canvas.to_bytes()
+
+
+class TestByteMaskPrimitives:
+    """Byte-mask primitives must match per-pixel drawing exactly."""
+
+    @pytest.mark.parametrize(
+        "x,y,w,h",
+        [
+            (0, 0, 160, 43),  # Whole screen, partial last block
+            (3, 5, 20, 4),  # Inside one 8-row block
+            (10, 6, 30, 12),  # Spans three blocks
+            (-5, -3, 12, 10),  # Clipped at top-left
+            (150, 38, 30, 20),  # Clipped at bottom-right
+            (7, 9, 1, 1),  # Single pixel
+            (20, 20, 0, 5),  # Empty
+        ],
+    )
+    def test_rect_ops_match_reference(self, x, y, w, h):
+        """Filled rect, clear and invert match set_pixel loops."""
+        canvas = Canvas()
+        canvas.draw_rect(x, y, w, h, filled=True)
+        canvas.draw_rect(x + 2, y + 2, w // 2, h // 2, filled=True, on=False)
+        canvas.invert_region(x + 1, y - 1, w, h)
+
+        assert canvas.to_bytes() == reference_pixels(
+            [
+                ("set", x, y, w, h),
+                ("clear", x + 2, y + 2, w // 2, h // 2),
+                ("invert", x + 1, y - 1, w, h),
+            ]
+        )
+
+    def test_hidden_rows_untouched(self):
+        """Rows 43-47 of the buffer are never drawn."""
+        canvas = Canvas()
+        canvas.invert_region(0, 0, 160, 48)
+
+        assert all(b == 0x07 for b in canvas.to_bytes()[800:])
+
+    def test_custom_canvas_size_clips(self):
+        """Drawing clips to a smaller canvas's width and height."""
+        canvas = Canvas(width=20, height=10)
+        canvas.draw_rect(0, 0, 50, 50, filled=True)
+
+        assert canvas.to_bytes() == reference_pixels([("set", 0, 0, 50, 50)], 20, 10)
+
+    def test_vline_spans_blocks(self):
+        """A vertical line sets one bit per row across blocks."""
+        canvas = Canvas()
+        canvas.draw_vline(5, 4, 10)
+
+        assert canvas.to_bytes() == reference_pixels([("set", 5, 4, 1, 10)])
+
+    def test_dithered_progress_checkerboard(self):
+        """The dithered fill starts with the inner top-left pixel on."""
+        for x, y in [(10, 10), (11, 10), (3, 7)]:
+            canvas = Canvas()
+            canvas.draw_progress_bar(x, y, 30, 8, 100, filled=False)
+            for py in range(6):
+                for px in range(28):
+                    expected = (px + py) % 2 == 0
+                    assert canvas.get_pixel(x + 1 + px, y + 1 + py) is expected
+
+    @pytest.mark.parametrize("x,y", [(20, 20), (0, 3), (-4, -5), (155, 40), (30, 8)])
+    def test_blit_matches_reference(self, x, y):
+        """Blit ORs the source's visible pixels, shifted and clipped."""
+        source = Canvas(width=12, height=10)
+        source.draw_line(0, 0, 11, 9)
+        source.draw_rect(2, 2, 5, 5)
+        source._buffer[100] = 0xFF  # Outside the source's width: ignored
+        dest = Canvas()
+        dest.draw_hline(0, y + 1, 160)
+
+        expected = Canvas()
+        expected.draw_hline(0, y + 1, 160)
+        for py in range(source.height):
+            for px in range(source.width):
+                if source.get_pixel(px, py):
+                    expected.set_pixel(x + px, y + py, True)
+
+        dest.blit(source, x, y)
+
+        assert dest.to_bytes() == expected.to_bytes()
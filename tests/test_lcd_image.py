@@ -0,0 +1,200 @@
+"""Tests for the NumPy canvas and image import."""
+
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from PIL import Image  # noqa: E402
+
+from g13_linux.lcd.array_canvas import ArrayCanvas, pack_pixels, unpack_frame  # noqa: E402
+from g13_linux.lcd.canvas import Canvas  # noqa: E402
+from g13_linux.lcd.image import (  # noqa: E402
+    DitherMode,
+    apply_dither,
+    image_to_frame,
+    image_to_pixels,
+    prepare_image,
+)
+
+
+def canvas_pixels(canvas) -> list[list[bool]]:
+    """Read every visible pixel through get_pixel()."""
+    return [[canvas.get_pixel(x, y) for x in range(160)] for y in range(43)]
+
+
+class TestFrameConversion:
+    """Test row-block <-> array conversion."""
+
+    def test_round_trip_lossless(self):
+        """Any 960 bytes, hidden rows included, survive a round trip."""
+        data = os.urandom(960)
+
+        assert pack_pixels(unpack_frame(data)) == data
+
+    def test_bit_layout_matches_canvas(self):
+        """Array [y, x] matches Canvas.get_pixel(x, y)."""
+        canvas = Canvas()
+        for x, y in [(0, 0), (159, 42), (7, 8), (80, 15), (1, 41)]:
+            canvas.set_pixel(x, y)
+
+        pixels = unpack_frame(canvas.to_bytes())
+
+        assert pixels[:43].tolist() == canvas_pixels(canvas)
+
+    def test_short_data_padded(self):
+        """Short framebuffers are zero-padded."""
+        assert not unpack_frame(b"\xff" * 10)[:, 10:].any()
+
+    def test_pack_small_array(self):
+        """Arrays smaller than the screen pack into the top-left corner."""
+        frame = pack_pixels(np.ones((3, 2), dtype=bool))
+
+        assert frame[0] == frame[1] == 0b111
+        assert frame[2] == 0
+
+
+class TestArrayCanvas:
+    """ArrayCanvas primitives match Canvas."""
+
+    @pytest.mark.parametrize(
+        "draw",
+        [
+            lambda c: c.draw_rect(5, 3, 40, 20),
+            lambda c: c.draw_rect(-5, 30, 200, 20, filled=True),
+            lambda c: c.draw_rect(10, 10, 1, 1),
+            lambda c: c.invert_region(20, 5, 100, 30),
+            lambda c: (c.fill(), c.draw_rect(0, 0, 160, 43, filled=True, on=False)),
+            lambda c: (c.set_pixel(3, 4), c.set_pixel(200, 4), c.set_pixel(159, 42)),
+        ],
+    )
+    def test_matches_canvas(self, draw):
+        """Same drawing calls give the same framebuffer."""
+        canvas = Canvas()
+        array_canvas = ArrayCanvas()
+
+        draw(canvas)
+        draw(array_canvas)
+
+        assert array_canvas.to_bytes() == canvas.to_bytes()
+
+    @pytest.mark.parametrize(
+        "x, y, size",
+        [(160, 0, None), (0, 43, None), (200, 50, None), (-30, 0, (20, 20)), (10, 10, (0, 5))],
+    )
+    def test_draw_image_off_canvas_matches_canvas(self, x, y, size):
+        """An image with nothing on screen leaves the canvas as it was."""
+        array_canvas = ArrayCanvas()
+        width, height = size or (None, None)
+
+        array_canvas.draw_image(x, y, Image.new("L", (8, 8), 255), width, height)
+
+        assert array_canvas.to_bytes() == Canvas().to_bytes()
+
+    def test_canvas_interop(self):
+        """Text drawn on a Canvas comes across unchanged."""
+        canvas = Canvas()
+        canvas.draw_text(2, 2, "Hello")
+
+        array_canvas = ArrayCanvas.from_canvas(canvas)
+
+        assert array_canvas.get_pixel(2, 3) == canvas.get_pixel(2, 3)
+        assert array_canvas.to_canvas().to_bytes() == canvas.to_bytes()
+
+    def test_draw_pixels_clips(self):
+        """Pixel arrays are clipped at every edge."""
+        array_canvas = ArrayCanvas()
+
+        array_canvas.draw_pixels(-2, 40, np.ones((10, 10), dtype=bool))
+
+        assert array_canvas.visible[40:, :8].all()
+        assert array_canvas.pixels.sum() == 3 * 8
+
+    def test_draw_pixels_modes(self):
+        """on=True only sets pixels, on=False only clears them."""
+        array_canvas = ArrayCanvas()
+        array_canvas.fill()
+        mask = np.array([[True, False]])
+
+        array_canvas.draw_pixels(0, 0, mask, on=False)
+
+        assert not array_canvas.get_pixel(0, 0)
+        assert array_canvas.get_pixel(1, 0)
+
+
+class TestImageImport:
+    """Test scaling and dithering."""
+
+    def test_letterbox(self):
+        """A wide image keeps its aspect ratio, centered on black."""
+        image = Image.new("L", (160, 20), 255)
+
+        gray = np.asarray(prepare_image(image, 160, 43))
+
+        assert gray[:11].max() == 0
+        assert gray[12:31].min() == 255
+        assert gray[32:].max() == 0
+
+    def test_stretch(self):
+        """keep_aspect=False fills the whole box."""
+        gray = np.asarray(prepare_image(Image.new("L", (16, 2), 255), 160, 43, keep_aspect=False))
+
+        assert gray.min() == 255
+
+    def test_alpha_flattened_on_black(self):
+        """Transparent pixels are off."""
+        image = Image.new("RGBA", (160, 43), (255, 255, 255, 0))
+
+        assert not image_to_pixels(image, dither=DitherMode.THRESHOLD).any()
+
+    def test_threshold(self):
+        """Thresholding splits at the given level."""
+        gray = np.array([[0, 99, 100, 255]], dtype=np.uint8)
+
+        assert apply_dither(gray, DitherMode.THRESHOLD, 100).tolist() == [
+            [False, False, True, True]
+        ]
+
+    @pytest.mark.parametrize("mode", [DitherMode.ORDERED, DitherMode.FLOYD_STEINBERG])
+    @pytest.mark.parametrize("level", [0, 64, 128, 192, 255])
+    def test_dither_preserves_brightness(self, mode, level):
+        """A flat gray dithers to roughly the same share of lit pixels."""
+        gray = np.full((43, 160), level, dtype=np.uint8)
+
+        coverage = apply_dither(gray, mode).mean()
+
+        assert abs(coverage - level / 255) < 0.03
+
+    def test_ordered_is_tiled(self):
+        """Ordered dithering repeats every 8 pixels."""
+        gray = np.full((16, 16), 100, dtype=np.uint8)
+
+        pixels = apply_dither(gray, DitherMode.ORDERED)
+
+        assert (pixels[:8, :8] == pixels[8:, 8:]).all()
+
+    def test_invert(self):
+        """invert=True lights dark areas."""
+        image = Image.new("L", (160, 43), 0)
+
+        assert image_to_pixels(image, dither=DitherMode.THRESHOLD, invert=True).all()
+
+    def test_image_to_frame(self):
+        """A white image is a fully lit screen."""
+        frame = image_to_frame(Image.new("RGB", (320, 86), "white"))
+
+        canvas = Canvas()
+        canvas.from_bytes(frame)
+        assert all(all(row) for row in canvas_pixels(canvas))
+
+    def test_draw_image_on_canvas(self):
+        """draw_image() places a scaled image at a position."""
+        array_canvas = ArrayCanvas()
+
+        array_canvas.draw_image(
+            100, 10, Image.new("L", (8, 8), 255), 20, 20, dither=DitherMode.THRESHOLD
+        )
+
+        assert array_canvas.visible[10:30, 100:120].all()
+        assert array_canvas.pixels.sum() == 400
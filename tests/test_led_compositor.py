@@ -0,0 +1,353 @@
+"""Tests for the layered LED compositor."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from g13_linux.led.colors import RGB
+from g13_linux.led.compositor import BlendMode, EffectLayer, LEDCompositor, blend
+from g13_linux.led.controller import LEDController
+from g13_linux.led.effects import EffectType
+
+
+def manual_compositor():
+    """Compositor whose frames are stepped by the test instead of a thread."""
+    outputs = []
+    compositor = LEDCompositor(outputs.append)
+    compositor._start = lambda: None
+    return compositor, outputs
+
+
+def wait_until(condition, timeout=2.0):
+    """Poll until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestBlend:
+    """Test the blend modes."""
+
+    @pytest.mark.parametrize(
+        "mode,expected",
+        [
+            (BlendMode.REPLACE, (200, 0, 100)),
+            (BlendMode.ADD, (255, 100, 200)),
+            (BlendMode.MULTIPLY, (156, 0, 39)),
+            (BlendMode.ALPHA, (200, 0, 100)),
+        ],
+    )
+    def test_modes(self, mode, expected):
+        """Each mode combines (200, 100, 100) below with (200, 0, 100)."""
+        layer = EffectLayer("top", RGB(200, 0, 100), mode=mode)
+
+        assert blend((200, 100, 100), layer, layer.color) == expected
+
+    def test_opacity_mixes_with_below(self):
+        """Opacity mixes the blended result with the color below."""
+        layer = EffectLayer("tint", RGB(255, 0, 0), mode=BlendMode.ALPHA, opacity=0.25)
+
+        assert blend((0, 0, 200), layer, layer.color) == (63, 0, 150)
+
+
+class TestLayerStack:
+    """Test adding, removing and ordering layers."""
+
+    def test_static_layers_compose_immediately(self):
+        """Static stacks are composed on the caller's thread, no frame loop."""
+        compositor = LEDCompositor(MagicMock())
+        compositor.add_layer(EffectLayer("base", RGB(0, 0, 200)))
+        compositor.add_layer(
+            EffectLayer("tint", RGB(255, 0, 0), BlendMode.ALPHA, z=50, opacity=0.5)
+        )
+
+        compositor._output.assert_called_with(RGB(127, 0, 100))
+        assert not compositor.is_running
+
+    def test_remove_restores_below(self):
+        """Removing a layer shows the layers below again."""
+        compositor, outputs = manual_compositor()
+        compositor.add_layer(EffectLayer("base", RGB(1, 2, 3)))
+        compositor.add_layer(EffectLayer("top", RGB(9, 9, 9), z=10))
+
+        assert compositor.remove_layer("top") is True
+        assert compositor.remove_layer("top") is False
+        assert outputs[-1] == RGB(1, 2, 3)
+
+    def test_z_order(self):
+        """Layers are kept bottom to top regardless of insertion order."""
+        compositor, _ = manual_compositor()
+        compositor.add_layer(EffectLayer("top", RGB(0, 0, 0), z=100))
+        compositor.add_layer(EffectLayer("base", RGB(0, 0, 0), z=0))
+        compositor.add_layer(EffectLayer("middle", RGB(0, 0, 0), z=50))
+
+        assert [layer.name for layer in compositor.layers] == ["base", "middle", "top"]
+
+    def test_replace_by_name(self):
+        """A layer with an existing name replaces it and finishes the old one."""
+        compositor, _ = manual_compositor()
+        old = compositor.add_layer(EffectLayer("base", RGB(1, 1, 1)))
+
+        compositor.add_layer(EffectLayer("base", RGB(2, 2, 2)))
+
+        assert old.finished.is_set()
+        assert len(compositor.layers) == 1
+
+    def test_finite_layer_drops_out(self):
+        """A finished effect leaves the stack and the base shows through."""
+        compositor, outputs = manual_compositor()
+        compositor.add_layer(EffectLayer("base", RGB(0, 0, 255)))
+        flash = compositor.add_layer(EffectLayer("flash", iter([RGB(255, 0, 0)]), z=100))
+
+        compositor._render_frame()
+        compositor._render_frame()
+
+        assert outputs[-2:] == [RGB(255, 0, 0), RGB(0, 0, 255)]
+        assert flash.finished.is_set()
+        assert compositor.get_layer("flash") is None
+
+    def test_failing_layer_removed(self):
+        """An effect raising an error is dropped, the rest keeps rendering."""
+
+        def broken():
+            yield RGB(1, 1, 1)
+            raise RuntimeError("boom")
+
+        compositor, outputs = manual_compositor()
+        compositor.add_layer(EffectLayer("base", RGB(5, 5, 5)))
+        compositor.add_layer(EffectLayer("broken", broken(), z=1))
+
+        compositor._render_frame()
+        compositor._render_frame()
+
+        assert [layer.name for layer in compositor.layers] == ["base"]
+        assert outputs[-1] == RGB(5, 5, 5)
+
+    def test_single_layer_yields_shared_color(self):
+        """An opaque top layer's color object is output as is."""
+        color = RGB(7, 8, 9)
+        compositor, outputs = manual_compositor()
+        compositor.add_layer(EffectLayer("base", RGB(0, 0, 0)))
+        compositor.add_layer(EffectLayer("top", color, z=1))
+
+        assert outputs[-1] is color
+
+
+class TestCompositorThread:
+    """Test the persistent frame loop."""
+
+    def test_thread_survives_layer_changes(self):
+        """Adding and removing animated layers reuses one thread."""
+        outputs = []
+        compositor = LEDCompositor(outputs.append, fps=100)
+        compositor.add_layer(EffectLayer("base", iter(lambda: RGB(0, 0, 1), None)))
+        thread = compositor._thread
+
+        flash = compositor.add_layer(EffectLayer("flash", iter([RGB(9, 0, 0)] * 3), z=10))
+        assert flash.finished.wait(2)
+        compositor.remove_layer("base")
+        compositor.add_layer(EffectLayer("base", iter(lambda: RGB(0, 0, 2), None)))
+        assert wait_until(lambda: outputs[-1] == RGB(0, 0, 2))
+
+        assert compositor._thread is thread
+        compositor.stop()
+        assert not compositor.is_running
+
+    def test_parks_when_static(self):
+        """With only static layers left the loop stops producing frames."""
+        outputs = []
+        compositor = LEDCompositor(outputs.append, fps=100)
+        compositor.add_layer(EffectLayer("base", RGB(0, 0, 1)))
+        compositor.add_layer(EffectLayer("flash", iter([RGB(9, 0, 0)] * 2), z=10))
+        assert compositor.get_layer("flash").finished.wait(2)
+        count = len(outputs)
+
+        time.sleep(0.05)
+
+        assert len(outputs) == count
+        assert compositor.is_running
+        compositor.stop()
+
+    def test_idles_while_passive_layers_are_transparent(self):
+        """Transparent passive layers need no frames until wake()."""
+        steps = []
+        lit = threading.Event()
+
+        def reactive():
+            while True:
+                steps.append(1)
+                yield RGB(9, 0, 0) if lit.is_set() else None
+
+        outputs = []
+        compositor = LEDCompositor(outputs.append, fps=100)
+        compositor.add_layer(EffectLayer("base", RGB(0, 0, 1)))
+        compositor.add_layer(EffectLayer("reactive", reactive(), z=10, passive=True))
+        assert wait_until(lambda: steps)
+        time.sleep(0.05)  # Settle: at most a frame for the wake from add_layer
+        count = len(steps)
+
+        time.sleep(0.05)
+        assert len(steps) == count
+
+        lit.set()
+        compositor.wake()
+        assert wait_until(lambda: outputs[-1] == RGB(9, 0, 0))
+        time.sleep(0.05)
+        assert len(steps) > count + 1  # Lit again: frames keep coming
+        compositor.stop()
+
+    def test_wake_signals_only_while_parked(self):
+        """wake() while frames run stores a flag; the event is set only when parked."""
+        lit = threading.Event()
+        steps = []
+
+        def reactive():
+            while True:
+                steps.append(1)
+                yield RGB(9, 0, 0) if lit.is_set() else None
+
+        compositor = LEDCompositor(lambda color: None, fps=100)
+        compositor.add_layer(EffectLayer("reactive", reactive(), passive=True))
+        assert wait_until(lambda: compositor._parked)
+        wake_event = compositor._wake
+        wake_event.set = MagicMock(wraps=wake_event.set)
+
+        lit.set()
+        compositor.wake()
+        assert wait_until(lambda: not compositor._parked)
+        for _ in range(5):
+            compositor.wake()
+        assert wake_event.set.call_count == 1
+
+        lit.clear()
+        assert wait_until(lambda: compositor._parked)
+        compositor.wake()
+        assert wake_event.set.call_count == 2
+        compositor.stop()
+
+    def test_wake_during_frame_is_not_lost(self):
+        """A wake() that finds the loop running still keeps it from parking."""
+        compositor, _ = manual_compositor()
+        frames = []
+
+        def reactive():
+            frames.append(1)
+            compositor.wake()  # A press while the frame renders
+            yield None
+            frames.append(2)
+            compositor._stop.set()
+            yield None
+
+        compositor.add_layer(EffectLayer("reactive", reactive(), passive=True))
+        compositor._wake.wait = MagicMock(side_effect=lambda: compositor._stop.set())
+
+        compositor._run()
+
+        assert frames == [1, 2]
+        compositor._wake.wait.assert_not_called()
+
+    def test_clock_continues_across_parks(self):
+        """The frame clock keeps one time base when the loop parks and wakes."""
+        clocks = []
+        lit = threading.Event()
+        compositor = LEDCompositor(lambda color: None, fps=100)
+
+        def reactive():
+            while True:
+                clocks.append(compositor.clock())
+                yield RGB(9, 0, 0) if lit.is_set() else None
+
+        compositor.add_layer(EffectLayer("reactive", reactive(), passive=True))
+        runs = []
+        for _ in range(3):
+            first = len(clocks)
+            lit.set()
+            compositor.wake()
+            assert wait_until(lambda: len(clocks) > first + 3)
+            lit.clear()
+            time.sleep(0.05)  # Parks after the first transparent frame
+            runs.append(clocks[first:])
+        compositor.stop()
+
+        assert clocks == sorted(clocks)
+        # Parked time counts toward the clock
+        for before, after in zip(runs, runs[1:]):
+            assert after[0] - before[-1] >= 0.02
+
+    def test_transparent_active_layer_keeps_frames(self):
+        """Layers that aren't passive keep the loop running while transparent."""
+        steps = []
+
+        def blank():
+            while True:
+                steps.append(1)
+                yield None
+
+        compositor = LEDCompositor(lambda color: None, fps=100)
+        compositor.add_layer(EffectLayer("blank", blank()))
+        assert wait_until(lambda: len(steps) > 3)
+        compositor.stop()
+
+
+class TestControllerLayers:
+    """Test LEDController on the compositor."""
+
+    def test_alert_plays_over_effect(self):
+        """run_alert() doesn't stop the running effect."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+        controller.start_effect(EffectType.RAINBOW)
+        thread = controller.compositor._thread
+
+        controller.run_alert(RGB(255, 0, 0), count=1, blocking=True)
+
+        assert controller.current_effect is EffectType.RAINBOW
+        assert controller.compositor._thread is thread
+        assert [layer.name for layer in controller.compositor.layers] == ["base"]
+        controller.close()
+
+    def test_tint_blends_over_color(self):
+        """A tint mixes into the base color."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+        controller.set_color(0, 0, 200)
+
+        controller.set_tint(RGB(200, 0, 0), opacity=0.5)
+        backlight.set_color.assert_called_with(100, 0, 100)
+
+        controller.clear_tint()
+        backlight.set_color.assert_called_with(0, 0, 200)
+
+    def test_stop_effect_holds_color(self):
+        """stop_effect() leaves the last effect color as a static base."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+        controller.start_effect(EffectType.RAINBOW)
+        assert wait_until(lambda: backlight.set_color.call_count >= 2)
+
+        controller.stop_effect()
+
+        base = controller.compositor.get_layer(controller.BASE_LAYER)
+        assert not base.animated
+        assert controller.current_effect is None
+        assert wait_until(lambda: not controller.compositor.animated)
+        controller.close()
+
+    def test_set_color_from_other_thread(self):
+        """Colors set while an alert plays show once it ends."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+        controller.run_alert(RGB(255, 0, 0), count=1, blocking=False)
+
+        setter = threading.Thread(target=controller.set_color, args=(0, 50, 0))
+        setter.start()
+        setter.join()
+        assert controller.compositor.get_layer(controller.ALERT_LAYER).finished.wait(2)
+
+        backlight.set_color.assert_called_with(0, 50, 0)
+        controller.close()
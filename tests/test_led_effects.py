@@ -0,0 +1,285 @@
+"""Tests for LED effect timing."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from g13_linux.led.colors import RGB, hsv_to_rgb
+from g13_linux.led.controller import LEDController
+from g13_linux.led.effects import (
+    EffectType,
+    alert,
+    candle,
+    fade,
+    play,
+    pulse,
+    rainbow,
+    strobe,
+)
+from g13_linux.led.scheduler import FrameScheduler
+from g13_linux.led.tables import ColorTable
+
+
+class FakeClock:
+    """Manual clock; wait() advances it instead of sleeping."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.waits = []
+
+    def __call__(self):
+        return self.now
+
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        self.now += timeout
+        return False
+
+
+class TestFrameScheduler:
+    """Test deadline pacing."""
+
+    def test_deadlines_do_not_drift(self):
+        """Work time is absorbed: frame n is due at start + n / fps."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(10, clock=clock, wait=clock.wait)
+
+        for _ in range(5):
+            scheduler.wait()
+            clock.now += 0.03  # Frame work
+
+        assert scheduler.frame_time == pytest.approx(100.4)
+        assert clock.waits[1:] == pytest.approx([0.07] * 4)
+        assert scheduler.late_frames == 0
+
+    def test_skips_when_behind(self):
+        """A long stall skips the missed frames instead of queueing them."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(10, clock=clock, wait=clock.wait)
+        scheduler.wait()
+
+        clock.now += 0.35  # Stall through frames 1-3
+        scheduler.wait()
+
+        assert scheduler.frame_index == 3
+        assert scheduler.skipped_frames == 2
+        assert scheduler.late_frames == 1
+        assert scheduler.max_lateness == pytest.approx(0.05)
+
+        scheduler.wait()
+        assert scheduler.frame_index == 4
+        assert clock.waits[-1] == pytest.approx(0.05)
+
+    def test_offset_carries_time_base(self):
+        """clock() starts from offset, so a new scheduler continues an old one."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(10, clock=clock, wait=clock.wait, offset=2.5)
+
+        scheduler.wait()
+        assert scheduler.clock() == pytest.approx(2.5)
+        scheduler.wait()
+        assert scheduler.clock() == pytest.approx(2.6)
+
+    def test_stop_interrupts(self):
+        """A wait function returning True ends the loop."""
+        stop = threading.Event()
+        scheduler = FrameScheduler(30, wait=stop.wait)
+        assert scheduler.wait() is True
+
+        stop.set()
+
+        assert scheduler.wait() is False
+
+    def test_stop_seen_when_late(self):
+        """Stop is honored even when no sleep is needed."""
+        clock = FakeClock()
+        stop = threading.Event()
+        scheduler = FrameScheduler(10, clock=clock, wait=stop.wait)
+        scheduler.wait()
+        clock.now += 5
+        stop.set()
+
+        assert scheduler.wait() is False
+
+    def test_stats(self):
+        """Achieved FPS comes from frames over elapsed time."""
+        clock = FakeClock()
+        scheduler = FrameScheduler(20, clock=clock, wait=clock.wait)
+        for _ in range(21):
+            scheduler.wait()
+
+        stats = scheduler.stats()
+
+        assert stats["frames"] == 21
+        assert stats["achieved_fps"] == pytest.approx(20)
+        assert stats["skipped_frames"] == 0
+
+
+class TestClockedEffects:
+    """Effects computed from the frame clock are exactly periodic."""
+
+    def run(self, effect, frames, fps=30):
+        clock = FakeClock()
+        scheduler = FrameScheduler(fps, clock=clock, wait=clock.wait)
+        generator = effect(scheduler.clock)
+        colors = []
+        while scheduler.wait() and len(colors) < frames:
+            try:
+                colors.append(next(generator))
+            except StopIteration:
+                break
+            clock.now += 0.02  # Uneven work must not change the output
+        return colors
+
+    def test_strobe_even(self):
+        """A 5 Hz strobe at 30 FPS is 3 frames on, 3 off."""
+        red = RGB(255, 0, 0)
+        colors = self.run(lambda clock: strobe(red, 5.0, clock=clock), 12)
+
+        assert [c == red for c in colors] == [True] * 3 + [False] * 3 + [True] * 3 + [False] * 3
+
+    def test_alert_finishes(self):
+        """Alert lasts count * 0.3 s of frame time, then ends."""
+        colors = self.run(lambda clock: alert(RGB(0, 255, 0), 2, clock=clock), 100)
+
+        assert len(colors) == 18
+        assert colors[0] == RGB(0, 255, 0)
+        assert colors[5] == RGB(0, 0, 0)
+
+    def test_pulse_periodic(self):
+        """Pulse repeats every 1 / speed seconds of frame time."""
+        colors = self.run(lambda clock: pulse(RGB(0, 0, 255), 1.0, clock=clock), 31)
+
+        assert all(abs(a - b) <= 1 for a, b in zip(colors[0], colors[30]))
+        assert colors[7] != colors[0]
+
+    @pytest.mark.parametrize("speed", [0.0, -1.0])
+    def test_non_positive_speed_is_solid(self, speed):
+        """Speed <= 0 holds one color instead of dividing by zero."""
+        blue, red = RGB(0, 0, 255), RGB(255, 0, 0)
+        effects = [
+            lambda clock: pulse(blue, speed, clock=clock),
+            lambda clock: rainbow(speed, clock=clock),
+            lambda clock: fade(red, blue, speed, clock=clock),
+            lambda clock: strobe(red, speed, clock=clock),
+        ]
+
+        for effect in effects:
+            colors = self.run(effect, 10)
+            assert len(colors) == 10
+            assert colors == [colors[0]] * 10
+
+        assert self.run(lambda clock: rainbow(speed, clock=clock), 1) == [hsv_to_rgb(0.0, 1.0, 1.0)]
+        assert self.run(lambda clock: strobe(red, speed, clock=clock), 1) == [red]
+
+
+class TestColorTable:
+    """Test compiled effect tables."""
+
+    def test_compile_samples_each_step(self):
+        """Each step holds the color sampled at its phase."""
+        table = ColorTable.compile(lambda phase: RGB(int(phase * 4), 0, 255), 1.0, steps=4)
+
+        assert len(table) == 4
+        assert table.colors == tuple(RGB(i, 0, 255) for i in range(4))
+
+    def test_index_wraps_per_period(self):
+        """The step index follows elapsed time and wraps each period."""
+        table = ColorTable.compile(lambda phase: RGB(0, 0, 0), 2.0, steps=8)
+
+        assert table.index(0.0) == 0
+        assert table.index(0.25) == 1
+        assert table.index(1.99) == 7
+        assert table.index(2.0) == 0
+
+    def test_play_follows_index(self):
+        """play() yields the color at index() of the elapsed time."""
+        clock = FakeClock()
+        table = ColorTable.compile(lambda phase: RGB(int(phase * 8), 0, 0), 2.0, steps=8)
+        effect = play(table, clock=clock)
+        start = clock.now
+
+        for elapsed in (0.0, 0.25, 0.5, 1.99, 2.0, 3.3):
+            clock.now = start + elapsed
+            assert next(effect) is table.colors[table.index(elapsed)]
+
+    def test_equal_steps_share_color(self):
+        """Steps with the same color share one RGB instance."""
+        table = ColorTable.compile(lambda phase: RGB(9, 9, 9), 1.0, steps=16)
+
+        assert len({id(color) for color in table.colors}) == 1
+
+    def test_invalid_tables(self):
+        """Empty data and non-positive periods are rejected."""
+        with pytest.raises(ValueError):
+            ColorTable.compile(lambda phase: RGB(0, 0, 0), 1.0, steps=0)
+        with pytest.raises(ValueError):
+            ColorTable.compile(lambda phase: RGB(0, 0, 0), 0.0)
+
+    def test_effects_reuse_table_colors(self):
+        """Steady-state frames yield prebuilt colors, not new objects."""
+        clock = FakeClock()
+        effect = rainbow(1.0, clock=clock, steps=32)
+        frames = []
+        for _ in range(200):
+            frames.append(next(effect))
+            clock.now += 1 / 30
+
+        assert len({id(color) for color in frames}) <= 32
+
+    def test_rainbow_matches_hue(self):
+        """Table colors equal the directly computed hue."""
+        clock = FakeClock()
+        effect = rainbow(1.0, clock=clock, steps=64)
+        next(effect)
+        clock.now += 0.25
+
+        assert next(effect) == hsv_to_rgb(0.25, 1.0, 1.0)
+
+    def test_candle_levels(self):
+        """Candle picks from precomputed brightness levels."""
+        base = RGB(200, 100, 0)
+        effect = candle(base, flicker_intensity=0.5, steps=8)
+
+        for _ in range(50):
+            color = next(effect)
+            assert 100 <= color.r <= 200
+
+
+class TestControllerEffects:
+    """Test LEDController running effects on the scheduler."""
+
+    @pytest.mark.parametrize("effect", list(EffectType))
+    def test_every_effect_runs(self, effect):
+        """Each effect type starts, produces frames and stops."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+
+        controller.start_effect(effect)
+        deadline = time.monotonic() + 2
+        while backlight.set_color.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        controller.stop_effect()
+
+        assert backlight.set_color.call_count >= 2
+        assert controller.frame_stats["frames"] >= 2
+
+    def test_finite_effect_clears_current(self):
+        """A finished alert resets current_effect."""
+        controller = LEDController(backlight=MagicMock())
+
+        controller.start_effect(EffectType.ALERT, count=1)
+        assert controller._effect_layer.finished.wait(timeout=2)
+
+        assert controller.current_effect is None
+
+    def test_blocking_alert(self):
+        """run_alert(blocking=True) plays the whole alert."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+
+        controller.run_alert(RGB(255, 0, 0), count=1)
+
+        assert 8 <= backlight.set_color.call_count <= 10
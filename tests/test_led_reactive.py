@@ -0,0 +1,207 @@
+"""Tests for input-reactive LED effects."""
+
+from unittest.mock import MagicMock
+
+from g13_linux.input.report_bus import DecodedReport, ReportBus
+from g13_linux.led.colors import RGB
+from g13_linux.led.compositor import BlendMode
+from g13_linux.led.controller import LEDController
+from g13_linux.led.reactive import InputActivity, key_flash, record_indicator, typing_heat
+
+
+def report(*pressed):
+    """Decoded report with the given buttons going down."""
+    return DecodedReport(0, 128, 128, tuple(pressed), ())
+
+
+class ManualClock:
+    """Clock advanced by the test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInputActivity:
+    """Test the report bus subscriber."""
+
+    def test_counts_g_keys(self):
+        """G-key presses are counted; other buttons are not."""
+        activity = InputActivity()
+
+        activity.on_report(report("G1", "G22"))
+        activity.on_report(report("M1", "STICK"))
+        activity.on_report(DecodedReport(0, 128, 128, (), ("G1",)))
+
+        assert activity.presses == 2
+
+    def test_mr_toggles_recording(self):
+        """Each MR press toggles record mode."""
+        activity = InputActivity()
+
+        activity.on_report(report("MR"))
+        assert activity.recording is True
+        activity.on_report(report("MR"))
+        assert activity.recording is False
+
+    def test_set_recording(self):
+        """Record mode can be set directly."""
+        activity = InputActivity()
+        activity.set_recording(True)
+
+        assert activity.recording is True
+
+
+class TestReactiveEffects:
+    """Test the effects polling InputActivity."""
+
+    def test_key_flash_fades(self):
+        """A press flashes at full color and fades out over the duration."""
+        activity = InputActivity()
+        clock = ManualClock()
+        flash = key_flash(activity, RGB(200, 200, 200), duration=0.2, clock=clock)
+        assert next(flash) is None
+
+        activity.on_report(report("G5"))
+        assert next(flash) == RGB(200, 200, 200)
+        clock.now = 0.1
+        middle = next(flash)
+        clock.now = 0.25
+
+        assert 0 < middle.r < 200
+        assert next(flash) is None
+
+    def test_key_flash_restarts_on_new_press(self):
+        """A new press restarts the flash at full color."""
+        activity = InputActivity()
+        clock = ManualClock()
+        flash = key_flash(activity, RGB(100, 0, 0), duration=0.2, clock=clock)
+        activity.on_report(report("G1"))
+        next(flash)
+        clock.now = 0.15
+        next(flash)
+
+        activity.on_report(report("G2"))
+
+        assert next(flash) == RGB(100, 0, 0)
+
+    def test_typing_heat_follows_rate(self):
+        """Heat rises while typing and cools down afterwards."""
+        activity = InputActivity()
+        clock = ManualClock()
+        heat = typing_heat(activity, RGB(255, 0, 0), full_rate=10.0, clock=clock)
+        assert next(heat) is None
+
+        for frame in range(1, 61):
+            clock.now = frame / 30
+            if frame % 3 == 0:  # 10 presses per second
+                activity.on_report(report("G3"))
+            hot = next(heat)
+        for frame in range(61, 181):
+            clock.now = frame / 30
+            cold = next(heat)
+
+        assert hot.r > 150
+        assert cold is None
+
+    def test_record_indicator(self):
+        """The indicator shows only while recording."""
+        activity = InputActivity()
+        clock = ManualClock()
+        indicator = record_indicator(activity, RGB(0, 0, 255), clock=clock)
+        assert next(indicator) is None
+
+        activity.set_recording(True)
+
+        assert next(indicator).b > 0
+
+
+class TestControllerReactive:
+    """Test reactive layers on LEDController."""
+
+    def test_enable_and_disable(self):
+        """enable_reactive() adds three layers above the base, disable removes them."""
+        controller = LEDController(backlight=MagicMock())
+        controller.set_color(0, 0, 100)
+
+        controller.enable_reactive(InputActivity())
+        layers = {layer.name: layer for layer in controller.compositor.layers}
+        assert layers[controller.FLASH_LAYER].mode is BlendMode.ADD
+        assert layers[controller.HEAT_LAYER].mode is BlendMode.ADD
+        assert layers[controller.RECORD_LAYER].z > layers[controller.FLASH_LAYER].z
+
+        controller.disable_reactive()
+        assert [layer.name for layer in controller.compositor.layers] == ["base"]
+        controller.close()
+
+    def test_flash_adds_to_base(self):
+        """A key press adds the flash color onto the base color."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+        compositor = controller.compositor
+        compositor._start = lambda: None
+        activity = InputActivity()
+        controller.set_color(0, 0, 100)
+        controller.enable_reactive(activity, heat=False, recording=False)
+
+        compositor._render_frame()
+        backlight.set_color.assert_called_with(0, 0, 100)
+        activity.on_report(report("G1"))
+        compositor._render_frame()
+
+        backlight.set_color.assert_called_with(255, 255, 255)
+
+    def test_record_color_replaces_base(self):
+        """While recording, the record color covers the base."""
+        backlight = MagicMock()
+        controller = LEDController(backlight=backlight)
+        compositor = controller.compositor
+        compositor._start = lambda: None
+        activity = InputActivity()
+        controller.set_color(0, 100, 0)
+        controller.enable_reactive(activity, flash=False, heat=False)
+
+        activity.on_report(report("MR"))
+        compositor._render_frame()
+
+        r, g, b = backlight.set_color.call_args.args
+        assert r > 0 and g == 0 and b == 0
+
+    def test_bus_subscribed_only_while_enabled(self):
+        """The activity follows the report bus from enable to disable."""
+        controller = LEDController(backlight=MagicMock())
+        bus = ReportBus(MagicMock())
+        activity = InputActivity()
+
+        controller.enable_reactive(activity, bus=bus)
+        controller.enable_reactive(activity, bus=bus)  # Re-enabling doesn't subscribe twice
+        bus.publish(bytes([0x01, 128, 128, 0x01, 0, 0x80, 0, 0]))  # G1 down
+        assert activity.presses == 1
+        assert bus._subscribers == (activity.on_report,)
+
+        controller.disable_reactive()
+        bus.publish(bytes([0x01, 128, 128, 0x00, 0, 0x80, 0, 0]))
+        bus.publish(bytes([0x01, 128, 128, 0x01, 0, 0x80, 0, 0]))
+        assert activity.presses == 1
+        assert bus._subscribers == ()
+        controller.close()
+
+    def test_activity_wakes_compositor(self):
+        """Presses and MR toggles wake the idle compositor until disabled."""
+        controller = LEDController(backlight=MagicMock())
+        wake = controller.compositor.wake = MagicMock()
+        activity = InputActivity()
+        controller.enable_reactive(activity)
+
+        activity.on_report(report("G5"))
+        activity.on_report(report("M1"))  # Not a reactive input
+        activity.set_recording(True)
+        assert wake.call_count == 2
+
+        controller.disable_reactive()
+        activity.on_report(report("G5"))
+        assert wake.call_count == 2
+        assert all(not layer.animated for layer in controller.compositor.layers)
+        controller.close()
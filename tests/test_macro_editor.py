@@ -77,6 +77,20 @@ class TestMacroEditorWidget:
         assert widget.macro_player is not None
         assert widget._current_macro is None
 
+    def test_player_uses_shared_output(self, qapp, mock_dependencies):
+        """Test playback goes through the output service it is given."""
+        from g13_linux.gui.views.macro_editor import MacroEditorWidget
+
+        output = MagicMock()
+        widget = MacroEditorWidget(output=output)
+
+        mock_dependencies["player_cls"].assert_called_once_with(output=output)
+
+        shared = MagicMock()
+        widget.set_output(shared)
+
+        assert widget.macro_player.output is shared
+
     def test_has_signals(self, qapp, mock_dependencies):
         """Test MacroEditorWidget has required signals."""
         from g13_linux.gui.views.macro_editor import MacroEditorWidget
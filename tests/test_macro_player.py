@@ -38,6 +38,43 @@ class TestPlaybackState:
         assert PlaybackState.STOPPING.value == "stopping"
 
 
+class TestMacroPlayerOutputService:
+    """Tests for playback through a shared UInputService."""
+
+    def test_init_uses_shared_keyboard(self):
+        """The thread asks the service for the macro's keys instead of a new UInput."""
+        from evdev import ecodes
+
+        macro = Macro(
+            name="Test",
+            steps=[
+                MacroStep(MacroStepType.KEY_PRESS, "KEY_A", True, 0),
+                MacroStep(MacroStepType.KEY_RELEASE, "B", False, 10),
+                MacroStep(MacroStepType.DELAY, 5, True, 20),
+            ],
+        )
+        output = MagicMock()
+        thread = MacroPlayerThread(macro, output=output)
+
+        with patch("evdev.UInput") as mock_uinput:
+            thread._init_uinput()
+
+        mock_uinput.assert_not_called()
+        assert set(output.keyboard.call_args.args[0]) == {ecodes.KEY_A, ecodes.KEY_B}
+        assert thread._uinput is output.keyboard.return_value
+
+    def test_player_passes_output_to_thread(self):
+        """MacroPlayer hands its service to each playback thread."""
+        output = MagicMock()
+        player = MacroPlayer(output=output)
+        macro = Macro(name="Test", steps=[MacroStep(MacroStepType.DELAY, 1, True, 0)])
+
+        with patch("g13_linux.gui.models.macro_player.MacroPlayerThread") as mock_thread:
+            player.play(macro)
+
+        assert mock_thread.call_args.kwargs["output"] is output
+
+
 class TestMacroPlayerThreadInit:
     """Tests for MacroPlayerThread initialization."""
 
@@ -1,9 +1,12 @@
 """Tests for G13 button mapper."""
 
+import struct
 from unittest.mock import MagicMock, patch
 
 from evdev import ecodes as e
 
+from g13_linux.gui.models.event_decoder import EventDecoder
+
 
 class TestMapperParsing:
     """Test mapping format parsing without hardware."""
@@ -107,14 +110,36 @@ class TestProfileLoading:
             assert mapper.button_map["G2"] == [e.KEY_LEFTALT, e.KEY_F4]
 
 
+def written_batches(mock_write) -> list[list[tuple[int, int, int]]]:
+    """Decode each os.write() payload into (type, code, value) events."""
+    return [
+        [
+            (etype, code, value)
+            for _, _, etype, code, value in struct.iter_unpack("llHHi", call[0][1])
+        ]
+        for call in mock_write.call_args_list
+    ]
+
+
+SYN = (e.EV_SYN, e.SYN_REPORT, 0)
+
+
+def report(byte3: int = 0, byte6: int = 0) -> bytes:
+    """Build an 8-byte G13 report (G1-G8 in byte 3, BD/M-keys in byte 6)."""
+    return bytes([0x01, 128, 128, byte3, 0, 0x80, byte6, 0])
+
+
 class TestButtonEvents:
     """Test button event handling."""
 
     def test_button_press_emits_keys(self):
-        """Button press emits all keys in order."""
+        """Button press emits all keys in order, then one sync."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
@@ -122,18 +147,20 @@ class TestButtonEvents:
 
             mapper.handle_button_event("G1", True)
 
-            # Should write Ctrl, then B, then sync
-            calls = mock_uinput.write.call_args_list
-            assert len(calls) == 2
-            assert calls[0][0] == (e.EV_KEY, e.KEY_LEFTCTRL, 1)
-            assert calls[1][0] == (e.EV_KEY, e.KEY_B, 1)
-            mock_uinput.syn.assert_called_once()
+            # Should write Ctrl, then B, then sync - in one write
+            assert mock_write.call_args[0][0] is mock_uinput.fd
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_LEFTCTRL, 1), (e.EV_KEY, e.KEY_B, 1), SYN]
+            ]
 
     def test_button_release_emits_keys_reversed(self):
         """Button release emits keys in reverse order."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
@@ -142,16 +169,18 @@ class TestButtonEvents:
             mapper.handle_button_event("G1", False)
 
             # Should release B first, then Ctrl
-            calls = mock_uinput.write.call_args_list
-            assert len(calls) == 2
-            assert calls[0][0] == (e.EV_KEY, e.KEY_B, 0)
-            assert calls[1][0] == (e.EV_KEY, e.KEY_LEFTCTRL, 0)
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_B, 0), (e.EV_KEY, e.KEY_LEFTCTRL, 0), SYN]
+            ]
 
     def test_unmapped_button_does_nothing(self):
         """Unmapped button press does nothing."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
@@ -159,8 +188,26 @@ class TestButtonEvents:
 
             mapper.handle_button_event("G99", True)
 
-            mock_uinput.write.assert_not_called()
-            mock_uinput.syn.assert_not_called()
+            mock_write.assert_not_called()
+
+    def test_button_changes_share_one_sync(self):
+        """Several name-based changes go out as one input frame."""
+        mock_uinput = MagicMock()
+
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.button_map = {"G1": [e.KEY_1], "G2": [e.KEY_2]}
+
+            mapper.handle_button_changes(["G1"], ["G2", "G99"])
+
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_1, 1), (e.EV_KEY, e.KEY_2, 0), SYN]
+            ]
 
 
 class TestMapperClose:
@@ -186,104 +233,465 @@ class TestMapperSendKey:
         """send_key emits press + release + sync."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
             mapper.send_key(e.KEY_A)
 
-            calls = mock_uinput.write.call_args_list
-            assert len(calls) == 2
-            assert calls[0][0] == (e.EV_KEY, e.KEY_A, 1)  # Press
-            assert calls[1][0] == (e.EV_KEY, e.KEY_A, 0)  # Release
-            mock_uinput.syn.assert_called_once()
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_A, 1), (e.EV_KEY, e.KEY_A, 0), SYN]
+            ]
 
 
 class TestMapperHandleRawReport:
     """Test raw HID report handling."""
 
-    def test_handle_raw_report_calls_decoder(self):
-        """Raw report is passed to EventDecoder."""
+    def test_handle_raw_report_button_press(self):
+        """Raw report press emits the mapped key."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
             mapper.button_map = {"G1": [e.KEY_1]}
 
-            # Mock decoder to return button press
-            with (
-                patch.object(mapper.decoder, "decode_report") as mock_decode,
-                patch.object(mapper.decoder, "get_button_changes") as mock_changes,
-            ):
-                mock_changes.return_value = (["G1"], [])  # G1 pressed
-
-                mapper.handle_raw_report(bytes([0x00] * 8))
+            mapper.handle_raw_report(list(report(byte3=0x01)))
 
-                mock_decode.assert_called_once()
-                mock_changes.assert_called_once()
-                # Should have emitted key press
-                mock_uinput.write.assert_called()
+            assert written_batches(mock_write) == [[(e.EV_KEY, e.KEY_1, 1), SYN]]
 
     def test_handle_raw_report_button_release(self):
         """Raw report handles button release."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
             mapper.button_map = {"G2": [e.KEY_2]}
 
-            with (
-                patch.object(mapper.decoder, "decode_report"),
-                patch.object(mapper.decoder, "get_button_changes") as mock_changes,
-            ):
-                mock_changes.return_value = ([], ["G2"])  # G2 released
+            mapper.handle_raw_report(report(byte3=0x02))
+            mapper.handle_raw_report(report())
 
-                mapper.handle_raw_report(bytes([0x00] * 8))
-
-                # Should have emitted key release
-                calls = mock_uinput.write.call_args_list
-                assert any(call[0][2] == 0 for call in calls)  # Release state
+            assert written_batches(mock_write)[1] == [(e.EV_KEY, e.KEY_2, 0), SYN]
 
     def test_handle_raw_report_invalid_report(self):
         """Invalid report is silently ignored."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
 
-            with patch.object(mapper.decoder, "decode_report", side_effect=ValueError("bad")):
-                # Should not raise
-                mapper.handle_raw_report(bytes([0xFF]))
+            # Should not raise
+            mapper.handle_raw_report(bytes([0xFF]))
 
-            mock_uinput.write.assert_not_called()
+            mock_write.assert_not_called()
 
     def test_handle_raw_report_combo_keys(self):
         """Raw report handles combo key mappings."""
         mock_uinput = MagicMock()
 
-        with patch("g13_linux.mapper.UInput", return_value=mock_uinput):
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
             from g13_linux.mapper import G13Mapper
 
             mapper = G13Mapper()
             mapper.button_map = {"G3": [e.KEY_LEFTCTRL, e.KEY_C]}
 
-            with (
-                patch.object(mapper.decoder, "decode_report"),
-                patch.object(mapper.decoder, "get_button_changes") as mock_changes,
-            ):
-                mock_changes.return_value = (["G3"], [])
+            mapper.handle_raw_report(report(byte3=0x04))
+
+            # Should emit both keys
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_LEFTCTRL, 1), (e.EV_KEY, e.KEY_C, 1), SYN]
+            ]
+
+    def test_handle_raw_report_unchanged_state_is_silent(self):
+        """Joystick-only reports don't write anything."""
+        mock_uinput = MagicMock()
+
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.button_map = {"G1": [e.KEY_1]}
+
+            mapper.handle_raw_report(report(byte3=0x01))
+            mapper.handle_raw_report(report(byte3=0x01))
+
+            assert mock_write.call_count == 1
+
+
+class TestMapperHandleReport:
+    """Test handling reports already decoded by the ReportBus."""
+
+    def test_handle_report_single_sync_per_report(self):
+        """All changes from one report share a single write and SYN."""
+        mock_uinput = MagicMock()
+
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile({"mappings": {"G1": "KEY_1", "G2": "KEY_2", "M1": "KEY_F1"}})
+            g1, g2, m1 = (EventDecoder.button_mask(b) for b in ("G1", "G2", "M1"))
+
+            with patch.object(mapper.decoder, "decode_report") as mock_decode:
+                mapper.handle_report(MagicMock(buttons=g1))
+                mapper.handle_report(MagicMock(buttons=g2 | m1))
+
+                mock_decode.assert_not_called()
+
+            batches = written_batches(mock_write)
+            assert batches[0] == [(e.EV_KEY, e.KEY_1, 1), SYN]
+            # Presses first, then releases, one SYN for the whole report
+            assert batches[1] == [
+                (e.EV_KEY, e.KEY_2, 1),
+                (e.EV_KEY, e.KEY_F1, 1),
+                (e.EV_KEY, e.KEY_1, 0),
+                SYN,
+            ]
+
+    def test_button_map_assignment_recompiles(self):
+        """Replacing button_map rebuilds the per-bit tables."""
+        mock_uinput = MagicMock()
+
+        with (
+            patch("g13_linux.mapper.UInput", return_value=mock_uinput),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.button_map = {"G1": [e.KEY_1]}
+            mapper.button_map = {"G1": [e.KEY_A]}
+
+            mapper.handle_buttons(EventDecoder.button_mask("G1"))
+
+            assert written_batches(mock_write) == [[(e.EV_KEY, e.KEY_A, 1), SYN]]
+
+
+class TestMapperModeLayers:
+    """Test per-mode (M1/M2/M3) mapping layers."""
+
+    PROFILE = {
+        "mappings": {"G1": "KEY_1", "G2": "KEY_2"},
+        "mode_mappings": {"M2": {"G1": "KEY_F1"}, "M3": {"G2": "KEY_F2"}},
+    }
+
+    def test_layers_override_base(self):
+        """A mode layer overrides only the buttons it lists."""
+        with patch("g13_linux.mapper.UInput"), patch("g13_linux.mapper.os.write"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+
+            assert mapper.mode == "M1"
+            assert mapper.button_map == {"G1": [e.KEY_1], "G2": [e.KEY_2]}
+
+            assert mapper.set_mode("M2")
+            assert mapper.button_map == {"G1": [e.KEY_F1], "G2": [e.KEY_2]}
+
+            assert mapper.set_mode("M3")
+            assert mapper.button_map == {"G1": [e.KEY_1], "G2": [e.KEY_F2]}
+
+    def test_modes_without_layer_share_base_table(self):
+        """Modes without overrides reuse the compiled base layer."""
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile({"mappings": {"G1": "KEY_1"}})
+
+            assert mapper._layers["M1"] is mapper._layers["M2"] is mapper._layers["M3"]
+
+    def test_set_mode_invalid(self):
+        """Unknown modes are rejected."""
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+
+            assert mapper.set_mode("M4") is False
+            assert mapper.mode == "M1"
+
+    def test_switch_emits_new_layer(self):
+        """Presses after a switch use the new layer."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+            mapper.set_mode("M2")
+
+            mapper.handle_raw_report(report(byte3=0x01))
+
+            assert written_batches(mock_write) == [[(e.EV_KEY, e.KEY_F1, 1), SYN]]
+
+    def test_switch_releases_held_keys(self):
+        """Keys held across a switch are released once, via the old layer."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+
+            mapper.handle_raw_report(report(byte3=0x01))  # G1 down (KEY_1)
+            mapper.set_mode("M2")
+            mapper.handle_raw_report(report(byte3=0x01))  # still held: nothing
+            mapper.handle_raw_report(report())  # G1 up: already released
+            mapper.handle_raw_report(report(byte3=0x01))  # new press: KEY_F1
+
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_1, 1), SYN],
+                [(e.EV_KEY, e.KEY_1, 0), SYN],
+                [(e.EV_KEY, e.KEY_F1, 1), SYN],
+            ]
+
+    def test_switch_releases_held_button_events(self):
+        """Name-based events follow the same stale-key path as reports."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+
+            mapper.handle_button_event("G1", True)  # KEY_1 down
+            mapper.set_mode("M2")
+            mapper.handle_button_event("G1", False)  # already released
+            mapper.handle_button_changes(["G1"], [])  # new press: KEY_F1
+            mapper.handle_button_changes([], ["G1"])  # KEY_F1 up
+
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_1, 1), SYN],
+                [(e.EV_KEY, e.KEY_1, 0), SYN],
+                [(e.EV_KEY, e.KEY_F1, 1), SYN],
+                [(e.EV_KEY, e.KEY_F1, 0), SYN],
+            ]
+
+    def test_button_events_use_locked_keymap(self):
+        """Name-based events read the keymap under the layer lock."""
+        with patch("g13_linux.mapper.UInput"), patch("g13_linux.mapper.os.write"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+            mapper._lock = MagicMock()
+
+            mapper.handle_button_event("G1", True)
+
+            mapper._lock.__enter__.assert_called_once()
+
+    def test_reload_keeps_mode(self):
+        """Reloading a profile keeps the active mode."""
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.set_mode("M2")
+            mapper.load_profile(self.PROFILE)
+
+            assert mapper.button_map["G1"] == [e.KEY_F1]
+
+
+class TestMapperUpdateMapping:
+    """Test incremental single-button mapping edits."""
+
+    PROFILE = TestMapperModeLayers.PROFILE
+
+    def test_update_patches_base_and_shared_layers(self):
+        """A base edit reaches every mode that doesn't override the button."""
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+
+            assert mapper.update_mapping("G1", "KEY_A") is True
+
+            assert mapper.button_map["G1"] == [e.KEY_A]
+            mapper.set_mode("M3")
+            assert mapper.button_map == {"G1": [e.KEY_A], "G2": [e.KEY_F2]}
+            mapper.set_mode("M2")
+            assert mapper.button_map["G1"] == [e.KEY_F1]  # overridden
+
+    def test_update_keeps_layers(self):
+        """The compiled layers are patched, not rebuilt."""
+        with patch("g13_linux.mapper.UInput"):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+            layers = dict(mapper._layers)
+
+            mapper.update_mapping("G3", {"keys": ["KEY_LEFTCTRL", "KEY_B"]})
+
+            assert mapper._layers == layers
+            assert mapper.button_map["G3"] == [e.KEY_LEFTCTRL, e.KEY_B]
+
+    def test_update_emits_new_mapping(self):
+        """Presses after an edit use the recompiled events."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+            mapper.update_mapping("G1", "KEY_A")
+
+            mapper.handle_raw_report(report(byte3=0x01))
+            mapper.handle_raw_report(report())
+
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_A, 1), SYN],
+                [(e.EV_KEY, e.KEY_A, 0), SYN],
+            ]
+
+    def test_invalid_mapping_unmaps(self):
+        """A mapping without valid keys removes the button."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+
+            assert mapper.update_mapping("G1", "NOT_A_KEY") is False
+
+            assert "G1" not in mapper.button_map
+            mapper.handle_raw_report(report(byte3=0x01))
+            mock_write.assert_not_called()
+
+    def test_update_releases_held_key(self):
+        """Editing a held button releases its old keys exactly once."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+
+            mapper.handle_raw_report(report(byte3=0x01))  # G1 down (KEY_1)
+            mapper.update_mapping("G1", "KEY_A")  # KEY_1 released now
+            mapper.handle_raw_report(report())  # G1 up: nothing
+            mapper.handle_raw_report(report(byte3=0x01))  # new press: KEY_A
+
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_1, 1), SYN],
+                [(e.EV_KEY, e.KEY_1, 0), SYN],
+                [(e.EV_KEY, e.KEY_A, 1), SYN],
+            ]
+
+    def test_update_overridden_in_active_mode_keeps_held_key(self):
+        """A base edit hidden by the active layer doesn't touch held keys."""
+        with (
+            patch("g13_linux.mapper.UInput"),
+            patch("g13_linux.mapper.os.write") as mock_write,
+        ):
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper()
+            mapper.load_profile(self.PROFILE)
+            mapper.set_mode("M2")
+
+            mapper.handle_raw_report(report(byte3=0x01))  # G1 down (KEY_F1)
+            mapper.update_mapping("G1", "KEY_A")
+            mapper.handle_raw_report(report())  # G1 up (KEY_F1)
+
+            assert written_batches(mock_write) == [
+                [(e.EV_KEY, e.KEY_F1, 1), SYN],
+                [(e.EV_KEY, e.KEY_F1, 0), SYN],
+            ]
+
+
+class TestMapperOutputService:
+    """Test the mapper on a shared UInputService."""
+
+    def test_no_private_device(self):
+        """With a service the mapper doesn't open its own UInput."""
+        with patch("g13_linux.mapper.UInput") as mock_uinput:
+            from g13_linux.mapper import G13Mapper
+
+            mapper = G13Mapper(output=MagicMock())
+            mapper.close()
+
+            mock_uinput.assert_not_called()
+            assert mapper.ui is None
+
+    def test_registers_layer_keys(self):
+        """Loading a profile registers the keys of every layer."""
+        from g13_linux.mapper import G13Mapper
+
+        output = MagicMock()
+        mapper = G13Mapper(output=output)
+        mapper.load_profile(TestMapperModeLayers.PROFILE)
+
+        keys = set(output.require_keys.call_args[0][0])
+        assert keys == {e.KEY_1, e.KEY_2, e.KEY_F1, e.KEY_F2}
+
+    def test_update_registers_new_key(self):
+        """An incremental edit registers its new key."""
+        from g13_linux.mapper import G13Mapper
+
+        output = MagicMock()
+        mapper = G13Mapper(output=output)
+        mapper.load_profile({"mappings": {"G1": "KEY_1"}})
+
+        mapper.update_mapping("G2", "KEY_Z")
+
+        assert e.KEY_Z in output.require_keys.call_args[0][0]
+
+    def test_report_written_through_service(self):
+        """Key events go to the service as one frame."""
+        from g13_linux.mapper import G13Mapper
+
+        output = MagicMock()
+        mapper = G13Mapper(output=output)
+        mapper.load_profile({"mappings": {"G1": {"keys": ["KEY_LEFTCTRL", "KEY_B"]}}})
 
-                mapper.handle_raw_report(bytes([0x00] * 8))
+        mapper.handle_raw_report(report(byte3=0x01))
 
-                # Should emit both keys
-                calls = mock_uinput.write.call_args_list
-                assert len(calls) == 2
+        payload = output.write.call_args[0][0]
+        events = [ev[2:] for ev in struct.iter_unpack("llHHi", payload)]
+        assert events == [(e.EV_KEY, e.KEY_LEFTCTRL, 1), (e.EV_KEY, e.KEY_B, 1), SYN]
 
 
 class TestMapperInit:
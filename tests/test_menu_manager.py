@@ -0,0 +1,137 @@
+"""Tests for ScreenManager layer compositing."""
+
+from unittest.mock import MagicMock
+
+from g13_linux.lcd.canvas import Canvas
+from g13_linux.menu.layers import Layer, compose
+from g13_linux.menu.manager import ScreenManager
+from g13_linux.menu.screen import Screen
+
+
+class CountingScreen(Screen):
+    """Screen that fills a rectangle and counts renders."""
+
+    def __init__(self, manager, rect, on=True):
+        super().__init__(manager)
+        self.rect = rect
+        self.on = on
+        self.renders = 0
+
+    def on_input(self, event):
+        return False
+
+    def render(self, canvas):
+        self.renders += 1
+        canvas.draw_rect(*self.rect, filled=True, on=self.on)
+
+
+def expected_frame(*draws) -> bytes:
+    """Draw (rect, on) pairs onto one canvas, in order."""
+    canvas = Canvas()
+    for rect, on in draws:
+        canvas.draw_rect(*rect, filled=True, on=on)
+    return canvas.to_bytes()
+
+
+class TestLayers:
+    """Test layer capture and composition."""
+
+    def test_transparent_where_untouched(self):
+        """An overlay only covers the pixels it drew, on or off."""
+        base = Layer("base", opaque=True)
+        base.attach(CountingScreen(None, (0, 0, 160, 43)))
+        base.render()
+        overlay = Layer("overlay")
+        overlay.attach(CountingScreen(None, (10, 10, 20, 8), on=False))
+        overlay.render()
+
+        assert compose([base, overlay]) == expected_frame(
+            ((0, 0, 160, 43), True), ((10, 10, 20, 8), False)
+        )
+
+    def test_empty_layer_skipped(self):
+        """A layer without a screen doesn't affect the frame."""
+        base = Layer("base", opaque=True)
+        base.attach(CountingScreen(None, (5, 5, 10, 10)))
+        base.render()
+
+        assert compose([base, Layer("overlay")]) == expected_frame(((5, 5, 10, 10), True))
+
+
+class TestScreenManagerCompositing:
+    """Test that only dirty layers are re-rendered."""
+
+    def make_manager(self):
+        lcd = MagicMock()
+        manager = ScreenManager(lcd=lcd)
+        base = CountingScreen(manager, (0, 20, 160, 10))
+        manager.push(base)
+        manager.render()
+        return manager, base, lcd
+
+    def test_toast_cycle_does_not_rerender_base(self):
+        """Showing and dismissing an overlay reuses the cached base."""
+        manager, base, lcd = self.make_manager()
+        toast = CountingScreen(manager, (40, 15, 80, 12), on=False)
+
+        manager.show_overlay(toast)
+        assert manager.render() is True
+        shown = lcd.write_bitmap.call_args[0][0]
+        manager.dismiss_overlay()
+        assert manager.render() is True
+        dismissed = lcd.write_bitmap.call_args[0][0]
+
+        assert base.renders == 1
+        assert toast.renders == 2  # Off and on passes
+        assert shown == expected_frame(((0, 20, 160, 10), True), ((40, 15, 80, 12), False))
+        assert dismissed == expected_frame(((0, 20, 160, 10), True))
+
+    def test_dirty_base_keeps_overlay(self):
+        """Re-rendering the base still shows the overlay on top."""
+        manager, base, lcd = self.make_manager()
+        toast = CountingScreen(manager, (40, 15, 80, 12), on=False)
+        manager.show_overlay(toast)
+        manager.render()
+
+        base.rect = (0, 0, 160, 5)
+        base.mark_dirty()
+        manager.render()
+
+        assert toast.renders == 2
+        assert lcd.write_bitmap.call_args[0][0] == expected_frame(
+            ((0, 0, 160, 5), True), ((40, 15, 80, 12), False)
+        )
+
+    def test_nothing_dirty_skips_render(self):
+        """No dirty layer and no layer change means no frame."""
+        manager, base, lcd = self.make_manager()
+
+        assert manager.render() is False
+        lcd.write_bitmap.assert_called_once()
+
+    def test_indicator_above_overlay(self):
+        """Indicators are composited above overlays."""
+        manager, _, lcd = self.make_manager()
+        manager.show_overlay(CountingScreen(manager, (0, 0, 20, 20)))
+        manager.show_indicator(CountingScreen(manager, (5, 5, 5, 5), on=False))
+        manager.render()
+
+        assert lcd.write_bitmap.call_args[0][0] == expected_frame(
+            ((0, 20, 160, 10), True), ((0, 0, 20, 20), True), ((5, 5, 5, 5), False)
+        )
+
+        manager.hide_indicator()
+        assert manager.render() is True
+
+    def test_new_screen_renders(self):
+        """Pushing a screen renders it even if the base layer had one."""
+        manager, base, lcd = self.make_manager()
+        menu = CountingScreen(manager, (0, 0, 10, 10))
+
+        manager.push(menu)
+        manager.render()
+        manager.pop()
+        manager.render()
+
+        assert menu.renders == 1
+        assert base.renders == 2  # pop() marks the revealed screen dirty
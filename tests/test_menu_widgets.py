@@ -0,0 +1,402 @@
+"""Tests for retained screen widgets and partial redraws."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from g13_linux.lcd.canvas import Canvas
+from g13_linux.lcd.fonts import FONT_4X6, FONT_5X7
+from g13_linux.menu.items import MenuItem
+from g13_linux.menu.layers import Layer
+from g13_linux.menu.screen import InputEvent
+from g13_linux.menu.screens.base_menu import MenuScreen
+from g13_linux.menu.screens.idle import ClockScreen, IdleScreen
+from g13_linux.menu.screens.led_settings import BrightnessScreen
+from g13_linux.menu.widgets import (
+    Clock,
+    Counter,
+    Label,
+    ListView,
+    ProgressBar,
+    Widget,
+    WidgetScreen,
+)
+
+
+class LabelScreen(WidgetScreen):
+    """Screen with a static title and two labels."""
+
+    def __init__(self):
+        super().__init__(None)
+        self.left = self.add(Label(0, 12, 60, "left"))
+        self.right = self.add(Label(80, 12, 80, "right", align="right"))
+
+    def on_input(self, event):
+        return False
+
+    def render_static(self, canvas):
+        canvas.draw_text(0, 0, "TITLE")
+
+
+def full_render(screen) -> bytes:
+    """Render a screen from scratch."""
+    canvas = Canvas()
+    screen.render(canvas)
+    return canvas.to_bytes()
+
+
+def changed_bytes(before: bytes, after: bytes) -> int:
+    """Count framebuffer bytes that differ."""
+    return sum(a != b for a, b in zip(before, after))
+
+
+class TestLabel:
+    """Test label drawing and invalidation."""
+
+    def test_matches_draw_text(self):
+        """A left-aligned label draws like Canvas.draw_text."""
+        canvas = Canvas()
+        expected = Canvas()
+
+        Label(3, 5, 100, "Hello", font=FONT_5X7).render(canvas)
+        expected.draw_text(3, 5, "Hello", FONT_5X7)
+
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_clips_to_box(self):
+        """Text longer than the box doesn't draw outside it."""
+        canvas = Canvas()
+        Label(0, 0, 12, "Too long for the box").render(canvas)
+
+        assert not any(canvas.get_pixel(x, y) for x in range(12, 160) for y in range(43))
+
+    def test_render_clears_old_text(self):
+        """Redrawing replaces the old text within the box."""
+        canvas = Canvas()
+        label = Label(0, 0, 60, "8888")
+        label.render(canvas)
+
+        label.set_text("1")
+        label.render(canvas)
+
+        expected = Canvas()
+        expected.draw_text(0, 0, "1", label.font)
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_same_text_does_not_invalidate(self):
+        """Setting unchanged text leaves the label clean."""
+        label = Label(0, 0, 60, "same")
+        label.render(Canvas())
+
+        label.set_text("same")
+
+        assert label.dirty is False
+
+    def test_inverted_fills_box(self):
+        """An inverted label fills its box and draws text off."""
+        canvas = Canvas()
+        Label(8, 34, 20, "M1", inverted=True, height=8, padding=(2, 1)).render(canvas)
+
+        expected = Canvas()
+        expected.draw_rect(8, 34, 20, 8, filled=True)
+        expected.draw_text(10, 35, "M1", FONT_4X6, on=False)
+        assert canvas.to_bytes() == expected.to_bytes()
+
+
+class TestValueWidgets:
+    """Test counter, clock and progress bar."""
+
+    def test_counter_formats(self):
+        """Counters format their value."""
+        counter = Counter(0, 0, 80, "Keys: {:,}", 1234)
+
+        counter.set_value(1234567)
+
+        assert counter.text == "Keys: 1,234,567"
+        assert counter.dirty is True
+
+    def test_clock_changes_only_on_new_text(self):
+        """A minute clock ignores second changes."""
+        clock = Clock(0, 0, 40, "%H:%M")
+        clock.set_time(datetime(2026, 1, 1, 12, 30, 5))
+        clock.render(Canvas())
+
+        clock.set_time(datetime(2026, 1, 1, 12, 30, 6))
+        assert clock.dirty is False
+        clock.set_time(datetime(2026, 1, 1, 12, 31, 0))
+        assert clock.dirty is True
+
+    def test_progress_fill(self):
+        """The fill is proportional to value / maximum."""
+        canvas = Canvas()
+        ProgressBar(10, 38, 50, 4, value=255, maximum=255).render(canvas)
+
+        assert canvas.get_pixel(59, 41)
+        assert not canvas.get_pixel(60, 41)
+
+    def test_progress_same_fill_does_not_invalidate(self):
+        """Values that round to the same fill don't redraw."""
+        bar = ProgressBar(0, 0, 10, 4, value=0, maximum=255)
+        bar.render(Canvas())
+
+        bar.set_value(5)
+
+        assert bar.dirty is False
+
+
+class TestListView:
+    """Test row-level redraws."""
+
+    def make_list(self, rows):
+        state = {"selected": 0}
+
+        def draw_row(canvas, index, y):
+            canvas.draw_text(0, y, rows[index], on=index != state["selected"])
+
+        view = ListView(
+            0,
+            0,
+            100,
+            8,
+            3,
+            row_count=lambda: len(rows),
+            row_key=lambda i: (rows[i], i == state["selected"]),
+            draw_row=draw_row,
+        )
+        return view, state
+
+    def test_only_changed_rows_redrawn(self):
+        """Moving the selection redraws the old and new rows."""
+        view, state = self.make_list(["a", "b", "c"])
+        canvas = Canvas()
+        view.render(canvas)
+        assert view.rows_drawn == 3
+
+        state["selected"] = 1
+        view.render(canvas)
+
+        assert view.rows_drawn == 5
+
+    def test_reset_redraws_all(self):
+        """After reset() every row is drawn again."""
+        view, _ = self.make_list(["a", "b"])
+        view.render(Canvas())
+
+        view.reset()
+        view.render(Canvas())
+
+        assert view.rows_drawn == 6  # 2 rows + 1 empty slot, twice
+
+    def test_list_invalidate_during_draw_is_kept(self):
+        """ListView keeps an invalidate() made while its rows are drawn."""
+        view = ListView(
+            0,
+            0,
+            100,
+            8,
+            2,
+            row_count=lambda: 1,
+            row_key=lambda i: i,
+            draw_row=lambda canvas, index, y: view.invalidate(),
+        )
+
+        view.render(Canvas())
+
+        assert view.dirty
+
+
+class TestWidgetScreen:
+    """Test full and partial screen rendering."""
+
+    def test_widget_requires_draw(self):
+        """Widget is abstract until draw() is implemented."""
+        with pytest.raises(TypeError):
+            Widget(0, 0, 10, 10)
+
+    def test_add_returns_widget(self):
+        """add() hands back the same widget, owned by the screen."""
+        screen = LabelScreen()
+        clock = Clock(0, 30, 40)
+
+        assert screen.add(clock) is clock
+        assert clock._owner is screen
+        assert screen.widgets[-1] is clock
+
+    def test_partial_redraws_dirty_widgets_only(self):
+        """A widget change redraws that widget, not the others."""
+        screen = LabelScreen()
+        canvas = Canvas()
+        screen.render(canvas)
+
+        screen.left.set_text("changed")
+        assert screen.is_dirty
+        assert screen.render_partial(canvas) is True
+
+        assert screen.left.render_count == 2
+        assert screen.right.render_count == 1
+        assert canvas.to_bytes() == full_render(screen)
+
+    def test_invalidate_during_draw_is_kept(self):
+        """A change that lands while a widget draws is redrawn next frame."""
+
+        class RacingLabel(Label):
+            def draw(self, canvas):
+                super().draw(canvas)
+                if self.render_count == 0:
+                    # As if another thread changed the value mid-draw
+                    self.invalidate()
+
+        screen = LabelScreen()
+        racing = screen.add(RacingLabel(0, 24, 60, "race"))
+        canvas = Canvas()
+        screen.render(canvas)
+
+        assert racing.dirty
+        assert screen.render_partial(canvas) is True
+        assert racing.render_count == 2
+        assert not racing.dirty
+
+    def test_mark_dirty_requires_full_render(self):
+        """mark_dirty() makes render_partial() decline."""
+        screen = LabelScreen()
+        screen.render(Canvas())
+
+        screen.mark_dirty()
+
+        assert screen.render_partial(Canvas()) is False
+
+    def test_layer_uses_partial_render(self):
+        """Opaque layers only fully render when the screen asks for it."""
+        screen = LabelScreen()
+        layer = Layer("base", opaque=True)
+        layer.attach(screen)
+        layer.render()
+
+        screen.right.set_text("new")
+        layer.render()
+
+        assert screen.left.render_count == 1
+        assert layer.pixels == int.from_bytes(full_render(screen), "little")
+
+    def test_reattached_screen_renders_fully(self):
+        """A screen shown again in a layer isn't drawn on a stale canvas."""
+        first = LabelScreen()
+        second = LabelScreen()
+        second.left.set_text("other")
+        layer = Layer("base", opaque=True)
+        layer.attach(first)
+        layer.render()
+        layer.attach(second)
+        layer.render()
+
+        layer.attach(first)
+        layer.render()
+
+        assert layer.pixels == int.from_bytes(full_render(first), "little")
+
+
+class TestPortedScreens:
+    """Steady-state frames on ported screens touch only what changed."""
+
+    def test_idle_clock_tick_redraws_clock_only(self):
+        """A new second redraws the clock label, nothing else."""
+        manager = MagicMock()
+        manager.daemon = MagicMock(uptime="0:10", key_count=42)
+        screen = IdleScreen(manager)
+        canvas = Canvas()
+        screen.render(canvas)
+        before = canvas.to_bytes()
+        screen.clock.set_text("99:99:99")
+
+        assert screen.render_partial(canvas) is True
+
+        assert screen.clock.render_count == 2
+        assert all(w.render_count == 1 for w in screen.widgets if w is not screen.clock)
+        assert changed_bytes(before, canvas.to_bytes()) <= screen.clock.width
+
+    def test_idle_m_state_change(self):
+        """Switching M-mode redraws just the two affected indicators."""
+        manager = MagicMock()
+        manager.daemon = None
+        profile_manager = MagicMock()
+        profile_manager.current = MagicMock(m_state=1)
+        screen = IdleScreen(manager, profile_manager)
+        screen.render(Canvas())
+
+        profile_manager.current.m_state = 3
+        screen.update(0.1)
+
+        assert [label.dirty for label in screen.m_labels] == [True, False, True]
+
+    def test_idle_format_change_relayouts(self):
+        """Changing clock settings rebuilds the layout with a full render."""
+        manager = MagicMock()
+        manager.daemon = None
+        settings = MagicMock(clock_format="24h", clock_show_seconds=True)
+        screen = IdleScreen(manager, settings_manager=settings)
+        screen.render(Canvas())
+
+        settings.clock_format = "12h"
+        screen.update(0.1)
+
+        assert screen.render_partial(Canvas()) is False
+        assert screen.clock.width == 66
+
+    def test_idle_render_needs_no_second_frame(self):
+        """Laying out and filling the widgets inside render() is drawn right away."""
+        manager = MagicMock()
+        manager.daemon = MagicMock(uptime="0:10", key_count=42)
+        screen = IdleScreen(manager)
+        screen._dirty = False  # As ScreenManager.render() does
+
+        screen.render(Canvas())
+
+        assert not screen.is_dirty
+        assert screen.render_partial(Canvas()) is True
+        assert all(w.render_count == 1 for w in screen.widgets)
+
+    def test_clock_screen_widgets(self):
+        """The date label is optional."""
+        assert ClockScreen(MagicMock(), show_date=False).date_label is None
+        assert len(ClockScreen(MagicMock()).widgets) == 2
+
+    def test_menu_move_redraws_two_rows(self):
+        """Moving the selection redraws the old and new rows."""
+        items = [MenuItem(id=str(i), label=f"Item {i}", action=lambda: None) for i in range(3)]
+        screen = MenuScreen(MagicMock(), "Menu", items)
+        canvas = Canvas()
+        screen.render(canvas)
+        drawn = screen.list.rows_drawn
+
+        screen.on_input(InputEvent.STICK_DOWN)
+        assert screen.render_partial(canvas) is True
+
+        assert screen.list.rows_drawn == drawn + 2
+        assert canvas.to_bytes() == full_render(screen)
+
+    def test_menu_scroll_matches_full_render(self):
+        """Scrolling past the visible rows stays pixel-identical."""
+        items = [MenuItem(id=str(i), label=f"Item {i}", action=lambda: None) for i in range(7)]
+        screen = MenuScreen(MagicMock(), "Menu", items)
+        canvas = Canvas()
+        screen.render(canvas)
+
+        for _ in range(9):
+            screen.on_input(InputEvent.STICK_DOWN)
+            screen.render_partial(canvas)
+            assert canvas.to_bytes() == full_render(screen)
+
+    def test_brightness_step(self):
+        """Adjusting brightness redraws the value and bar."""
+        manager = MagicMock()
+        manager.led_controller = MagicMock(brightness=50)
+        screen = BrightnessScreen(manager)
+        canvas = Canvas()
+        screen.render(canvas)
+
+        screen.on_input(InputEvent.STICK_RIGHT)
+        assert screen.render_partial(canvas) is True
+
+        assert screen.value_label.text == "60%"
+        assert canvas.to_bytes() == full_render(screen)
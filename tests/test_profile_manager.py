@@ -1,7 +1,12 @@
 """Tests for G13 profile manager."""
 
+import json
+import os
+import stat
 import tempfile
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -80,6 +85,19 @@ class TestProfileManager:
         assert loaded.mappings["G1"] == "KEY_F1"
         assert loaded.mappings["G2"] == {"keys": ["KEY_LEFTCTRL", "KEY_C"]}
 
+    def test_save_and_load_mode_mappings(self, manager):
+        """Per-mode mapping layers survive a save/load round trip."""
+        profile = ProfileData(
+            name="Layers",
+            mappings={"G1": "KEY_1"},
+            mode_mappings={"M2": {"G1": "KEY_F1"}},
+        )
+
+        manager.save_profile(profile, "layers")
+        loaded = manager.load_profile("layers")
+
+        assert loaded.mode_mappings == {"M2": {"G1": "KEY_F1"}}
+
     def test_list_profiles_after_save(self, manager):
         """List includes saved profiles."""
         profile = ProfileData(name="Listed")
@@ -140,6 +158,115 @@ class TestProfileManager:
         assert manager.current_profile is None
 
 
+class TestProfileDeferredSave:
+    """Test debounced, atomic profile persistence."""
+
+    @pytest.fixture
+    def temp_profiles_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    @pytest.fixture
+    def manager(self, temp_profiles_dir):
+        manager = ProfileManager(temp_profiles_dir)
+        manager.SAVE_DEBOUNCE = 60  # Only flush() writes during tests
+        yield manager
+        manager.flush()
+
+    def test_save_is_atomic(self, manager, temp_profiles_dir):
+        """save_profile replaces the file and leaves no temp files."""
+        manager.save_profile(ProfileData(name="atomic", mappings={"G1": "KEY_1"}))
+        manager.save_profile(ProfileData(name="atomic", mappings={"G1": "KEY_2"}))
+
+        assert sorted(p.name for p in Path(temp_profiles_dir).iterdir()) == ["atomic.json"]
+        data = json.loads((Path(temp_profiles_dir) / "atomic.json").read_text())
+        assert data["mappings"] == {"G1": "KEY_2"}
+
+    def test_save_keeps_file_mode(self, manager, temp_profiles_dir):
+        """Rewriting a profile keeps its permissions."""
+        path = Path(temp_profiles_dir) / "shared.json"
+        manager.save_profile(ProfileData(name="shared"))
+        path.chmod(0o640)
+
+        manager.save_profile(ProfileData(name="shared", mappings={"G1": "KEY_1"}))
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_new_file_uses_umask(self, manager, temp_profiles_dir):
+        """New profiles get the umask-derived mode, not mkstemp's 0600."""
+        umask = os.umask(0)
+        os.umask(umask)
+
+        manager.save_profile(ProfileData(name="fresh"))
+
+        path = Path(temp_profiles_dir) / "fresh.json"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    def test_failed_write_keeps_old_file(self, manager, temp_profiles_dir):
+        """A failed write leaves the previous profile and no temp file."""
+        manager.save_profile(ProfileData(name="keep", mappings={"G1": "KEY_1"}))
+
+        with patch("g13_linux.gui.models.profile_manager.json.dump", side_effect=OSError):
+            with pytest.raises(OSError):
+                manager.save_profile(ProfileData(name="keep", mappings={"G1": "KEY_2"}))
+
+        assert sorted(p.name for p in Path(temp_profiles_dir).iterdir()) == ["keep.json"]
+        assert manager.load_profile("keep").mappings == {"G1": "KEY_1"}
+
+    def test_update_mapping_defers_write(self, manager, temp_profiles_dir):
+        """Mapping edits are batched until flush()."""
+        manager.save_profile(ProfileData(name="live", mappings={"G1": "KEY_1"}), "live")
+        manager.current_name = "live"
+
+        with patch.object(manager, "_write_atomic", wraps=manager._write_atomic) as write:
+            manager.update_mapping("G1", "KEY_A")
+            manager.update_mapping("G2", "KEY_B")
+
+            assert manager.has_pending_saves
+            write.assert_not_called()
+
+            manager.flush()
+
+            write.assert_called_once()
+        assert not manager.has_pending_saves
+        data = json.loads((Path(temp_profiles_dir) / "live.json").read_text())
+        assert data["mappings"] == {"G1": "KEY_A", "G2": "KEY_B"}
+
+    def test_update_mapping_without_profile_raises(self, manager):
+        """Editing a mapping requires a loaded profile."""
+        with pytest.raises(ValueError):
+            manager.update_mapping("G1", "KEY_A")
+
+    def test_debounce_timer_flushes(self, temp_profiles_dir):
+        """The debounce timer writes pending profiles on its own."""
+        manager = ProfileManager(temp_profiles_dir)
+        manager.SAVE_DEBOUNCE = 0.01
+        done = threading.Event()
+
+        with patch.object(manager, "flush", side_effect=done.set):
+            manager.schedule_save(ProfileData(name="timed"))
+            assert done.wait(2.0)
+
+    def test_load_flushes_pending_edits(self, manager):
+        """Loading a profile with pending edits reads them back."""
+        manager.save_profile(ProfileData(name="reload"), "reload")
+        manager.current_name = "reload"
+        manager.update_mapping("G1", "KEY_A")
+
+        assert manager.load_profile("reload").mappings == {"G1": "KEY_A"}
+
+    def test_delete_drops_pending_save(self, manager, temp_profiles_dir):
+        """A deleted profile isn't recreated by a later flush."""
+        profile = ProfileData(name="gone")
+        manager.save_profile(profile)
+        manager.schedule_save(profile)
+
+        manager.delete_profile("gone")
+        manager.flush()
+
+        assert not (Path(temp_profiles_dir) / "gone.json").exists()
+
+
 class TestProfileValidation:
     """Test profile JSON validation."""
 
@@ -0,0 +1,161 @@
+"""Tests for event/deadline driven render scheduling."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from g13_linux.menu.manager import ScreenManager
+from g13_linux.menu.scheduler import RenderScheduler, next_wall_tick
+from g13_linux.menu.screens.idle import ClockScreen, IdleScreen
+from g13_linux.menu.screens.toast import ToastScreen
+
+from .test_menu_manager import CountingScreen
+
+
+def from_thread(func):
+    """Call func on another thread (the test thread is the render loop)."""
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+class TestRenderScheduler:
+    """Test wakeups."""
+
+    def test_wake_returns_immediately(self):
+        """A request ends the wait without waiting for the deadline."""
+        scheduler = RenderScheduler(lambda: None)
+        threading.Timer(0.01, scheduler.wake).start()
+
+        start = time.monotonic()
+        assert scheduler.wait() is True
+
+        assert time.monotonic() - start < 0.5
+        assert scheduler.stats() == {"requested_wakeups": 1, "deadline_wakeups": 0}
+
+    def test_deadline_wakeup(self):
+        """Without requests the wait ends at the deadline."""
+        deadline = time.monotonic() + 0.02
+        scheduler = RenderScheduler(lambda: deadline)
+
+        assert scheduler.wait() is False
+        assert time.monotonic() >= deadline
+
+    def test_past_deadline_does_not_block(self):
+        """An overdue deadline wakes at once."""
+        scheduler = RenderScheduler(lambda: 0.0)
+
+        assert scheduler.sleep_time() == 0.0
+        assert scheduler.wait() is False
+
+    def test_no_deadline_sleeps_until_woken(self):
+        """Nothing time-based means an unbounded sleep (or max_sleep)."""
+        assert RenderScheduler(lambda: None).sleep_time() is None
+        assert RenderScheduler(lambda: None, max_sleep=5.0).sleep_time() == 5.0
+
+    def test_requests_merge(self):
+        """Several requests before a wait give one wakeup."""
+        scheduler = RenderScheduler(lambda: 0.0)
+        for _ in range(5):
+            scheduler.wake()
+
+        assert scheduler.wait() is True
+        assert scheduler.wait() is False
+
+    def test_loop_thread_requests_ignored(self):
+        """Dirty marks made by the loop's own update pass don't wake it again."""
+        deadline = time.monotonic() + 0.02
+        scheduler = RenderScheduler(lambda: deadline)
+        scheduler.wait()
+
+        scheduler.wake()
+
+        assert scheduler.wait() is False
+
+    def test_min_interval_caps_rate(self):
+        """Back-to-back requests are spaced by min_interval."""
+        scheduler = RenderScheduler(lambda: None, min_interval=0.03)
+        scheduler.wake()
+        scheduler.wait()
+        from_thread(scheduler.wake)
+
+        start = time.monotonic()
+        scheduler.wait()
+
+        assert time.monotonic() - start >= 0.02
+
+    def test_next_wall_tick(self):
+        """Deadlines land just after a wall-clock boundary."""
+        now = time.monotonic()
+        deadline = next_wall_tick(1)
+
+        assert now < deadline <= now + 1.01
+        fraction = (time.time() + deadline - time.monotonic()) % 1
+        assert fraction < 0.01
+
+
+class TestManagerScheduling:
+    """Test how the ScreenManager drives the scheduler."""
+
+    def test_mark_dirty_wakes(self):
+        """Marking a screen dirty requests a render."""
+        manager = ScreenManager()
+        screen = CountingScreen(manager, (0, 0, 1, 1))
+        manager.push(screen)
+        manager.scheduler.wait()
+
+        from_thread(screen.mark_dirty)
+
+        assert manager.scheduler.wait() is True
+
+    def test_static_screen_has_no_deadline(self):
+        """A screen without time-based content lets the loop sleep."""
+        manager = ScreenManager()
+        manager.push(CountingScreen(manager, (0, 0, 1, 1)))
+
+        assert manager.next_deadline() is None
+
+    def test_clock_screen_deadline(self):
+        """The clock reports the next second or minute."""
+        manager = ScreenManager()
+        manager.push(ClockScreen(manager, show_seconds=False))
+
+        assert manager.next_deadline() - time.monotonic() <= 60.01
+
+    def test_overlay_expiry(self):
+        """A timed overlay is a deadline and is dismissed by update()."""
+        manager = ScreenManager(lcd=MagicMock())
+        manager.push(CountingScreen(manager, (0, 0, 1, 1)))
+        manager.show_overlay(ToastScreen(manager, "Saved"), duration=0.01)
+        deadline = manager.next_deadline()
+        assert deadline is not None
+
+        time.sleep(0.02)
+        manager.update(0.02)
+
+        assert manager.overlay is None
+        assert manager.next_deadline() is None
+
+    def test_manual_dismiss_wakes(self):
+        """Dismissing an overlay requests a render to uncover the screen."""
+        manager = ScreenManager()
+        manager.show_overlay(ToastScreen(manager, "Hi"))
+        manager.scheduler.wait()
+
+        from_thread(manager.dismiss_overlay)
+
+        assert manager.scheduler.wait() is True
+
+    def test_idle_clock_tick_end_to_end(self):
+        """A deadline wakeup updates the clock label only."""
+        manager = ScreenManager(lcd=MagicMock())
+        idle = IdleScreen(manager)
+        manager.push(idle)
+        manager.render()
+
+        idle.clock.set_time(datetime(2026, 1, 1, 0, 0, 0))
+        manager.render()
+
+        assert idle.clock.render_count == 2
+        assert idle.profile_label.render_count == 1
@@ -0,0 +1,285 @@
+"""Tests for the single-reader HID report bus."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from g13_linux.input.report_bus import DecodedReport, ReportBus, ReportRing
+
+
+def make_report(g_byte: int = 0) -> bytes:
+    """Build an 8-byte G13 report with the given G1-G8 byte."""
+    return bytes([0x01, 128, 128, g_byte, 0, 0x80, 0, 0])
+
+
+class TestReportRing:
+    """Test the ring buffer subscriber."""
+
+    def test_put_get_order(self):
+        """Reports come out in arrival order."""
+        ring = ReportRing()
+        first = MagicMock()
+        second = MagicMock()
+        ring.put(first)
+        ring.put(second)
+
+        assert ring.get(timeout=0) is first
+        assert ring.get(timeout=0) is second
+
+    def test_get_timeout_returns_none(self):
+        """Empty ring returns None after the timeout."""
+        ring = ReportRing()
+
+        assert ring.get(timeout=0.01) is None
+
+    def test_overflow_drops_oldest(self):
+        """Full ring overwrites the oldest report and counts the drop."""
+        ring = ReportRing(capacity=2)
+        reports = [MagicMock() for _ in range(3)]
+        for report in reports:
+            ring.put(report)
+
+        assert ring.dropped == 1
+        assert len(ring) == 2
+        assert ring.get(timeout=0) is reports[1]
+
+    def test_close_wakes_blocked_consumer(self):
+        """close() releases a consumer waiting without a timeout."""
+        ring = ReportRing()
+        result = []
+
+        thread = threading.Thread(target=lambda: result.append(ring.get()))
+        thread.start()
+        time.sleep(0.05)
+        ring.close()
+        thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+        assert result == [None]
+        assert ring.closed
+
+    def test_put_wakes_blocked_consumer(self):
+        """put() from another thread wakes a waiting consumer."""
+        ring = ReportRing()
+        report = MagicMock()
+
+        timer = threading.Timer(0.05, ring.put, args=(report,))
+        timer.start()
+
+        assert ring.get(timeout=1.0) is report
+
+
+class TestReportBusPublish:
+    """Test decoding and fan-out."""
+
+    def test_publish_decodes_once_for_all_subscribers(self):
+        """Every subscriber receives the same decoded report."""
+        bus = ReportBus(MagicMock())
+        first = MagicMock()
+        second = MagicMock()
+        bus.subscribe(first)
+        bus.subscribe(second)
+
+        report = bus.publish(make_report(0x01))
+
+        assert isinstance(report, DecodedReport)
+        assert report.pressed == ("G1",)
+        assert report.released == ()
+        first.assert_called_once_with(report)
+        second.assert_called_once_with(report)
+        assert bus.report_count == 1
+
+    def test_report_is_immutable_snapshot(self):
+        """Reports don't change when the bus decodes the next one."""
+        bus = ReportBus(MagicMock())
+        first = bus.publish(bytes([0x01, 10, 20, 0x01, 0, 0x80, 0, 0]))
+        bus.publish(bytes([0x01, 200, 210, 0x00, 0, 0x80, 0x01, 0]))
+
+        assert first.buttons == 0x01
+        assert (first.joystick_x, first.joystick_y) == (10, 20)
+        assert first.pressed == ("G1",)
+
+    def test_publish_tracks_releases(self):
+        """Button releases are reported relative to the previous report."""
+        bus = ReportBus(MagicMock())
+        bus.publish(make_report(0x01))
+
+        report = bus.publish(make_report(0x00))
+
+        assert report.pressed == ()
+        assert report.released == ("G1",)
+
+    def test_publish_invalid_report(self):
+        """Short reports are dropped without reaching subscribers."""
+        bus = ReportBus(MagicMock())
+        callback = MagicMock()
+        bus.subscribe(callback)
+
+        assert bus.publish(b"\x01\x02") is None
+        callback.assert_not_called()
+
+    def test_subscriber_error_does_not_stop_others(self):
+        """A failing subscriber doesn't block later subscribers."""
+        bus = ReportBus(MagicMock())
+        bus.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        callback = MagicMock()
+        bus.subscribe(callback)
+
+        bus.publish(make_report())
+
+        callback.assert_called_once()
+
+    def test_unsubscribe(self):
+        """Unsubscribed callbacks no longer receive reports."""
+        bus = ReportBus(MagicMock())
+        callback = MagicMock()
+        bus.subscribe(callback)
+        bus.unsubscribe(callback)
+
+        bus.publish(make_report())
+
+        callback.assert_not_called()
+
+    def test_subscribe_ring(self):
+        """Ring subscribers receive reports for another thread."""
+        bus = ReportBus(MagicMock())
+        ring = bus.subscribe_ring()
+
+        report = bus.publish(make_report(0x02))
+
+        assert ring.get(timeout=0) is report
+
+        bus.unsubscribe_ring(ring)
+        bus.publish(make_report())
+        assert len(ring) == 0
+
+    def test_uses_shared_decoder(self):
+        """Bus decodes with the decoder it was given."""
+        decoder = MagicMock()
+        decoder.diff_buttons.return_value = ((), ())
+        bus = ReportBus(MagicMock(), decoder=decoder)
+
+        bus.publish(make_report())
+
+        decoder.decode_report.assert_called_once()
+
+
+class TestReportBusThread:
+    """Test the reader loop."""
+
+    def test_reader_publishes_device_reports(self):
+        """Background reader publishes each report read from the device."""
+        device = MagicMock()
+        reports = [make_report(0x01), make_report(0x00)]
+
+        def readinto(buf, timeout_ms=None):
+            if reports:
+                report = reports.pop(0)
+                buf[: len(report)] = report
+                return len(report)
+            time.sleep(0.005)
+            return 0
+
+        device.readinto.side_effect = readinto
+        bus = ReportBus(device)
+        ring = bus.subscribe_ring()
+
+        bus.start()
+        try:
+            first = ring.get(timeout=1.0)
+            second = ring.get(timeout=1.0)
+        finally:
+            bus.stop()
+
+        assert first.pressed == ("G1",)
+        assert second.released == ("G1",)
+        assert not bus.is_running
+        # Every read lands in the same preallocated slot
+        assert device.readinto.call_args[0][0] is bus._slot
+        assert device.readinto.call_args[1] == {"timeout_ms": ReportBus.READ_TIMEOUT_MS}
+
+    def test_read_errors_are_counted(self):
+        """Read errors don't kill the reader loop."""
+        device = MagicMock()
+        device.readinto.side_effect = OSError("gone")
+        bus = ReportBus(device)
+
+        bus.start()
+        time.sleep(0.05)
+        bus.stop()
+
+        assert bus.error_count > 0
+
+    def test_start_twice_keeps_one_thread(self):
+        """Calling start() while running doesn't spawn a second reader."""
+        device = MagicMock()
+        device.readinto.side_effect = lambda buf, timeout_ms=None: time.sleep(0.005) or 0
+        bus = ReportBus(device)
+
+        bus.start()
+        thread = bus._thread
+        bus.start()
+
+        assert bus._thread is thread
+        bus.stop()
+
+    def test_stop_before_run_sticks(self):
+        """A stop() before the reader enters run() isn't undone by run()."""
+        device = MagicMock()
+        device.readinto.return_value = 0
+        bus = ReportBus(device)
+        gate = threading.Event()
+        run = bus.run
+        bus.run = lambda: gate.wait(1.0) and run()
+
+        bus.start()
+        thread = bus._thread
+        threading.Timer(0.05, gate.set).start()
+        bus.stop()
+        thread.join(1.0)
+
+        assert not thread.is_alive()
+        assert not bus.is_running
+        device.readinto.assert_not_called()
+
+    def test_run_after_stop_returns(self):
+        """Calling run() directly after stop() returns at once."""
+        device = MagicMock()
+        bus = ReportBus(device)
+
+        bus.stop()
+        bus.run()
+
+        device.readinto.assert_not_called()
+
+
+class TestInputHandlerOnBus:
+    """Test InputHandler consuming decoded reports from the bus."""
+
+    def test_handler_receives_button_events(self):
+        """Handler turns bus reports into navigation events."""
+        from g13_linux.input.handler import InputHandler
+        from g13_linux.menu.screen import InputEvent
+
+        device = MagicMock()
+        bus = ReportBus(device)
+        events = []
+        got_event = threading.Event()
+
+        def callback(event):
+            events.append(event)
+            got_event.set()
+
+        handler = InputHandler(device, callback, bus=bus)
+        handler.start()
+        try:
+            # BD button is byte 6 bit 0
+            bus.publish(bytes([0x01, 128, 128, 0, 0, 0x80, 0x01, 0]))
+            assert got_event.wait(1.0)
+        finally:
+            handler.stop()
+
+        assert InputEvent.BUTTON_BD in events
+        # The handler must never read the device itself
+        device.readinto.assert_not_called()
+        assert bus._subscribers == ()
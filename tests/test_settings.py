@@ -24,6 +24,7 @@ class TestSettingsDataclass:
         assert settings.stick_deadzone == 20
         assert settings.lcd_brightness == 100
         assert settings.led_brightness == 100
+        assert settings.led_reactive is False
         assert settings.last_profile == ""
 
     def test_custom_values(self):
@@ -0,0 +1,152 @@
+"""Tests for pre-shifted LCD sprites."""
+
+import pytest
+
+from g13_linux.lcd.canvas import Canvas
+from g13_linux.lcd.fonts import FONT_5X7
+from g13_linux.lcd.icons import ICON_CLOCK, ICON_PROFILE, Icon
+from g13_linux.lcd.sprites import Sprite, SpriteMode, icon_sprite
+
+POSITIONS = [(0, 0), (5, 3), (20, 8), (33, 13), (-3, -2), (155, 38), (100, 41), (-9, 0)]
+
+
+def reference_draw_icon(canvas, x, y, icon, on=True):
+    """The per-pixel draw_icon sprites replace."""
+    for row in range(icon.height):
+        for col in range(icon.width):
+            byte_idx = col + (row // 8) * icon.width
+            if byte_idx >= len(icon.data):
+                continue
+            pixel_on = bool(icon.data[byte_idx] & (1 << (row % 8)))
+            canvas.set_pixel(x + col, y + row, pixel_on if on else not pixel_on)
+
+
+def background():
+    """Canvas with a pattern so untouched and cleared pixels differ."""
+    canvas = Canvas()
+    for y in range(0, 43, 3):
+        canvas.draw_hline(0, y, 160)
+    canvas.draw_rect(40, 10, 30, 20, filled=True)
+    return canvas
+
+
+class TestDrawIcon:
+    """draw_icon through sprites must match per-pixel drawing."""
+
+    @pytest.mark.parametrize("x,y", POSITIONS)
+    @pytest.mark.parametrize("on", [True, False])
+    def test_matches_reference(self, x, y, on):
+        """Opaque and inverted icons match the old renderer, clipped."""
+        canvas = background()
+        expected = background()
+
+        canvas.draw_icon(x, y, ICON_CLOCK, on=on)
+        reference_draw_icon(expected, x, y, ICON_CLOCK, on=on)
+
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_tall_icon_with_short_data(self):
+        """Rows without data are left untouched."""
+        icon = Icon(width=4, height=12, data=bytes([0xFF, 0x81, 0x81, 0xFF, 0x0F]))
+        canvas = background()
+        expected = background()
+
+        canvas.draw_icon(30, 5, icon)
+        reference_draw_icon(expected, 30, 5, icon)
+
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_icon_sprite_is_cached(self):
+        """The same icon reuses its sprite until its data changes."""
+        icon = Icon(width=2, height=2, data=bytes([1, 2]))
+        sprite = icon_sprite(icon)
+
+        assert icon_sprite(icon) is sprite
+        icon.data = bytes([3, 3])
+        assert icon_sprite(icon) is not sprite
+
+
+class TestSpriteModes:
+    """Test how sprite pixels combine with the framebuffer."""
+
+    def sprite(self):
+        return Sprite.from_icon(ICON_PROFILE)
+
+    @pytest.mark.parametrize("x,y", POSITIONS)
+    def test_transparent(self, x, y):
+        """Set pixels turn on; everything else is untouched."""
+        canvas = background()
+        expected = background()
+
+        canvas.draw_sprite(x, y, self.sprite())
+        for row in range(8):
+            for col in range(8):
+                if ICON_PROFILE.data[col] & (1 << row):
+                    expected.set_pixel(x + col, y + row, True)
+
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    @pytest.mark.parametrize("x,y", POSITIONS)
+    def test_erase_and_xor(self, x, y):
+        """ERASE clears set pixels; XOR toggles them."""
+        erased = background()
+        toggled = background()
+        expected_erased = background()
+        expected_toggled = background()
+
+        erased.draw_sprite(x, y, self.sprite(), SpriteMode.ERASE)
+        toggled.draw_sprite(x, y, self.sprite(), SpriteMode.XOR)
+        for row in range(8):
+            for col in range(8):
+                if ICON_PROFILE.data[col] & (1 << row):
+                    px, py = x + col, y + row
+                    expected_erased.set_pixel(px, py, False)
+                    expected_toggled.set_pixel(px, py, not expected_toggled.get_pixel(px, py))
+
+        assert erased.to_bytes() == expected_erased.to_bytes()
+        assert toggled.to_bytes() == expected_toggled.to_bytes()
+
+    def test_xor_twice_restores(self):
+        """Drawing an XOR sprite twice leaves the canvas unchanged."""
+        canvas = background()
+        before = canvas.to_bytes()
+
+        canvas.draw_sprite(21, 17, self.sprite(), SpriteMode.XOR)
+        canvas.draw_sprite(21, 17, self.sprite(), SpriteMode.XOR)
+
+        assert canvas.to_bytes() == before
+
+
+class TestSpriteSources:
+    """Test building sprites from glyphs and canvases."""
+
+    def test_from_glyph_matches_text(self):
+        """A glyph sprite draws like draw_text for one character."""
+        canvas = Canvas()
+        expected = Canvas()
+
+        canvas.draw_sprite(10, 12, Sprite.from_glyph(FONT_5X7, "G"))
+        expected.draw_text(10, 12, "G")
+
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_from_canvas(self):
+        """A canvas sprite blits like Canvas.blit."""
+        source = Canvas(width=16, height=6)
+        source.draw_progress_bar(0, 0, 16, 6, 60)
+        canvas = background()
+        expected = background()
+
+        canvas.draw_sprite(70, 29, Sprite.from_canvas(source))
+        expected.blit(source, 70, 29)
+
+        assert Sprite.from_canvas(source).width == 16
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_all_shifts_precomputed(self):
+        """Each vertical offset has its own block split."""
+        sprite = Sprite([0xFF], 8)
+
+        assert len(sprite._shifts) == 8
+        assert len(sprite._shifts[0][0]) == 1
+        assert len(sprite._shifts[1][0]) == 2
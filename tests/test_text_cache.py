@@ -0,0 +1,166 @@
+"""Tests for the rasterized text cache."""
+
+import pytest
+
+from g13_linux.hardware.lcd import G13LCD
+from g13_linux.lcd.canvas import Canvas
+from g13_linux.lcd.fonts import FONT_4X6, FONT_5X7, FONT_8X8
+from g13_linux.lcd.text_cache import TEXT_CACHE, TextCache, rasterize
+
+
+def reference_draw_text(canvas, x, y, text, font, on=True):
+    """The per-pixel draw_text the cache replaces."""
+    cursor_x = x
+    for char in text:
+        glyph = font.get_glyph(char)
+        if glyph is None:
+            continue
+        for col_idx, col_data in enumerate(glyph):
+            px = cursor_x + col_idx
+            if px >= canvas.width:
+                break
+            for row in range(font.char_height):
+                py = y + row
+                if py >= canvas.height:
+                    continue
+                if col_data & (1 << row):
+                    canvas.set_pixel(px, py, on)
+        cursor_x += font.char_width + 1
+        if cursor_x >= canvas.width:
+            break
+    return cursor_x - x
+
+
+class TestRasterize:
+    """Test string rasterization."""
+
+    def test_single_block(self):
+        """A 7-row glyph at bit offset 0 fits in one block."""
+        raster = rasterize(FONT_5X7, "A", 0)
+
+        assert raster.blocks == (bytes(FONT_5X7.glyphs[65]) + b"\x00",)
+        assert raster.chars == 1
+        assert raster.advance == 6
+
+    def test_shift_spans_two_blocks(self):
+        """An offset glyph spills into the next block."""
+        raster = rasterize(FONT_5X7, "A", 3)
+
+        top, bottom = raster.blocks
+        for col, glyph_col in enumerate(FONT_5X7.glyphs[65]):
+            assert top[col] | bottom[col] << 8 == glyph_col << 3
+
+    def test_empty_string(self):
+        """Nothing to draw, zero width."""
+        raster = rasterize(FONT_5X7, "", 0)
+
+        assert raster.chars == 0
+        assert raster.drawn_width(0, 160) == 0
+
+
+class TestTextCache:
+    """Test the LRU cache."""
+
+    def test_hit_returns_same_raster(self):
+        """A repeated string is served from the cache."""
+        cache = TextCache()
+
+        first = cache.get(FONT_5X7, "Profile", 2)
+        second = cache.get(FONT_5X7, "Profile", 2)
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_includes_font_and_shift(self):
+        """Different fonts and bit offsets are separate entries."""
+        cache = TextCache()
+
+        cache.get(FONT_5X7, "Hi", 0)
+        cache.get(FONT_4X6, "Hi", 0)
+        cache.get(FONT_5X7, "Hi", 1)
+
+        assert len(cache) == 3
+        assert cache.hits == 0
+
+    def test_lru_eviction(self):
+        """The least recently used raster is evicted first."""
+        cache = TextCache(maxsize=2)
+        cache.get(FONT_5X7, "a", 0)
+        cache.get(FONT_5X7, "b", 0)
+        cache.get(FONT_5X7, "a", 0)
+        cache.get(FONT_5X7, "c", 0)
+
+        cache.get(FONT_5X7, "a", 0)
+        assert cache.hits == 2
+        cache.get(FONT_5X7, "b", 0)
+        assert cache.misses == 4
+
+    def test_clear(self):
+        """clear() empties the cache."""
+        cache = TextCache()
+        cache.get(FONT_5X7, "x", 0)
+        cache.clear()
+
+        assert cache.stats()["size"] == 0
+
+
+class TestCachedDrawing:
+    """Cached drawing must match per-pixel rendering exactly."""
+
+    @pytest.mark.parametrize("font", [FONT_5X7, FONT_4X6, FONT_8X8])
+    @pytest.mark.parametrize(
+        "x,y",
+        [(0, 0), (3, 5), (10, 13), (-7, 20), (150, 38), (40, -3), (0, 40), (165, 0)],
+    )
+    def test_matches_reference(self, font, x, y):
+        """Pixels and returned width match the old renderer."""
+        text = "Uptime 12:34 {}~"
+        canvas = Canvas()
+        canvas.draw_rect(0, 0, 160, 43, filled=True)
+        expected = Canvas()
+        expected.draw_rect(0, 0, 160, 43, filled=True)
+
+        width = canvas.draw_text(x, y, text, font, on=False)
+        expected_width = reference_draw_text(expected, x, y, text, font, on=False)
+
+        assert canvas.to_bytes() == expected.to_bytes()
+        assert width == expected_width
+
+    def test_long_text_width(self):
+        """Text running off the right edge reports the clipped width."""
+        text = "A very long line that will not fit on the screen"
+        canvas = Canvas()
+        expected = Canvas()
+
+        assert canvas.draw_text(4, 0, text) == reference_draw_text(expected, 4, 0, text, FONT_5X7)
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_small_canvas_clips(self):
+        """Text clips to a custom canvas size."""
+        canvas = Canvas(width=20, height=5)
+        expected = Canvas(width=20, height=5)
+
+        canvas.draw_text(0, 0, "Hello")
+        reference_draw_text(expected, 0, 0, "Hello", FONT_5X7)
+
+        assert canvas.to_bytes() == expected.to_bytes()
+
+    def test_redraw_hits_cache(self):
+        """Drawing the same label again is a cache hit."""
+        canvas = Canvas()
+        canvas.draw_text(0, 9, "cache-test-label")
+        hits = TEXT_CACHE.hits
+
+        canvas.draw_text(30, 17, "cache-test-label")
+
+        assert TEXT_CACHE.hits == hits + 1
+
+    def test_lcd_write_text_matches_canvas(self):
+        """G13LCD.write_text renders like Canvas.draw_text with 5x7."""
+        lcd = G13LCD()
+        canvas = Canvas()
+
+        lcd.write_text("Hi \x01", 7, 11, send=False)
+        canvas.draw_text(7, 11, "Hi \x01")
+
+        assert bytes(lcd._framebuffer) == canvas.to_bytes()
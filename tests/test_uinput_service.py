@@ -0,0 +1,300 @@
+"""Tests for the shared uinput output service."""
+
+import struct
+import threading
+from unittest.mock import MagicMock, patch
+
+from evdev import ecodes as e
+
+from g13_linux.uinput_service import (
+    _FLUSH,
+    KEYBOARD,
+    SYN_REPORT,
+    RecordingOutput,
+    UInputService,
+    pack_events,
+)
+
+SYN = (e.EV_SYN, e.SYN_REPORT, 0)
+
+
+def decode(payload: bytes) -> list[tuple[int, int, int]]:
+    """Unpack input_event records into (type, code, value) tuples."""
+    return [
+        (etype, code, value) for _, _, etype, code, value in struct.iter_unpack("llHHi", payload)
+    ]
+
+
+def make_service():
+    """Service whose factory returns a distinct mock device per call."""
+    devices = []
+
+    def factory(capabilities, **options):
+        ui = MagicMock()
+        ui.fd = 100 + len(devices)
+        ui.capabilities = capabilities
+        ui.options = options
+        devices.append(ui)
+        return ui
+
+    return UInputService(uinput_factory=factory), devices
+
+
+class TestPackEvents:
+    """Test input_event packing helpers."""
+
+    def test_pack_round_trip(self):
+        """Packed events decode back to the same tuples."""
+        events = [(e.EV_KEY, e.KEY_A, 1), (e.EV_KEY, e.KEY_A, 0)]
+
+        assert decode(pack_events(events)) == events
+
+    def test_syn_report(self):
+        """SYN_REPORT is one EV_SYN record."""
+        assert decode(SYN_REPORT) == [SYN]
+
+
+class TestKeyboardCapabilities:
+    """Test capability scoping of the shared keyboard device."""
+
+    def test_no_device_until_needed(self):
+        """Creating the service opens nothing and starts no thread."""
+        service, devices = make_service()
+
+        assert devices == []
+        assert not service.is_running
+
+    def test_require_keys_creates_scoped_device(self):
+        """The keyboard only advertises the requested keys."""
+        service, devices = make_service()
+
+        assert service.require_keys([e.KEY_B, e.KEY_A]) is True
+        service.flush()
+
+        assert len(devices) == 1
+        assert devices[0].capabilities == {e.EV_KEY: [e.KEY_A, e.KEY_B]}
+        assert devices[0].options == {"name": UInputService.KEYBOARD_NAME}
+        service.close()
+
+    def test_known_keys_do_not_recreate(self):
+        """Requiring a subset of the advertised keys is a no-op."""
+        service, devices = make_service()
+        service.require_keys([e.KEY_A, e.KEY_B])
+
+        assert service.require_keys([e.KEY_A]) is False
+        service.flush()
+
+        assert len(devices) == 1
+        service.close()
+
+    def test_new_key_grows_capabilities(self):
+        """A new key recreates the keyboard with the union of keys."""
+        service, devices = make_service()
+        service.require_keys([e.KEY_A])
+        service.require_keys([e.KEY_C])
+        service.flush()
+
+        assert len(devices) == 2
+        devices[0].close.assert_called_once()
+        assert devices[1].capabilities == {e.EV_KEY: [e.KEY_A, e.KEY_C]}
+        assert service.keys == {e.KEY_A, e.KEY_C}
+        service.close()
+
+    def test_recreate_waits_for_held_keys(self):
+        """The keyboard is replaced only once every held key is released."""
+        service, devices = make_service()
+        service.require_keys([e.KEY_A, e.KEY_B])
+
+        with patch("g13_linux.uinput_service.os.write") as mock_write:
+            service.write_events([(e.EV_KEY, e.KEY_A, 1), (e.EV_KEY, e.KEY_B, 1)])
+            service.require_keys([e.KEY_C])
+            service.write_events([(e.EV_KEY, e.KEY_A, 0)])
+            service.flush()
+
+            assert len(devices) == 1
+            devices[0].close.assert_not_called()
+
+            service.write_events([(e.EV_KEY, e.KEY_B, 0)])
+            service.write_events([(e.EV_KEY, e.KEY_C, 1), (e.EV_KEY, e.KEY_C, 0)])
+            service.flush()
+
+        # Every release reached the device that saw the press
+        fds = [c[0][0] for c in mock_write.call_args_list]
+        assert fds[-1] == devices[1].fd
+        assert devices[0].fd in fds[:-1] and devices[1].fd not in fds[:-1]
+        assert len(devices) == 2
+        assert devices[1].capabilities == {e.EV_KEY: sorted([e.KEY_A, e.KEY_B, e.KEY_C])}
+        service.close()
+
+    def test_recreate_without_held_keys_is_immediate(self):
+        """Released keys don't hold back a capability change."""
+        service, devices = make_service()
+        service.require_keys([e.KEY_A])
+
+        with patch("g13_linux.uinput_service.os.write"):
+            service.write_events([(e.EV_KEY, e.KEY_A, 1), (e.EV_KEY, e.KEY_A, 0)])
+            service.require_keys([e.KEY_C])
+            service.flush()
+
+        assert len(devices) == 2
+        service.close()
+
+
+class TestWriter:
+    """Test the ordered, batching writer thread."""
+
+    def test_queued_writes_are_batched_in_order(self):
+        """Writes queued while the writer is busy share one write()."""
+        service, devices = make_service()
+        service.require_keys([e.KEY_A, e.KEY_B])
+        service.flush()
+
+        gate = threading.Event()
+        with patch("g13_linux.uinput_service.os.write") as mock_write:
+            # Park the writer so the next writes queue up behind it
+            service._submit((_FLUSH, None, MagicMock(set=lambda: gate.wait(1.0)), None))
+            service.write_events([(e.EV_KEY, e.KEY_A, 1)])
+            service.write_events([(e.EV_KEY, e.KEY_B, 1)])
+            gate.set()
+            service.flush()
+
+        mock_write.assert_called_once()
+        fd, payload = mock_write.call_args[0]
+        assert fd == devices[0].fd
+        assert decode(payload) == [(e.EV_KEY, e.KEY_A, 1), SYN, (e.EV_KEY, e.KEY_B, 1), SYN]
+        service.close()
+
+    def test_writes_follow_reconfiguration(self):
+        """Writes queued after a capability change go to the new device."""
+        service, devices = make_service()
+
+        with patch("g13_linux.uinput_service.os.write") as mock_write:
+            service.require_keys([e.KEY_A])
+            service.write_events([(e.EV_KEY, e.KEY_A, 1), (e.EV_KEY, e.KEY_A, 0)])
+            service.require_keys([e.KEY_B])
+            service.write_events([(e.EV_KEY, e.KEY_B, 1)])
+            service.flush()
+
+        assert [c[0][0] for c in mock_write.call_args_list] == [devices[0].fd, devices[1].fd]
+        service.close()
+
+    def test_write_without_device_is_dropped(self):
+        """Events for a device that doesn't exist are discarded."""
+        service, _ = make_service()
+
+        with patch("g13_linux.uinput_service.os.write") as mock_write:
+            service.write_events([(e.EV_KEY, e.KEY_A, 1)])
+            service.flush()
+
+        mock_write.assert_not_called()
+        service.close()
+
+    def test_write_error_is_counted(self):
+        """A failed write is logged and counted; the writer keeps going."""
+        service, _ = make_service()
+        service.require_keys([e.KEY_A])
+
+        with patch("g13_linux.uinput_service.os.write", side_effect=OSError("gone")):
+            service.write_events([(e.EV_KEY, e.KEY_A, 1)])
+            service.flush()
+
+        assert service.error_count == 1
+        assert service.is_running
+        service.close()
+
+    def test_device_creation_error_is_counted(self):
+        """A device that can't be created is counted, not raised."""
+        service = UInputService(uinput_factory=MagicMock(side_effect=PermissionError))
+
+        service.require_keys([e.KEY_A])
+        service.flush()
+
+        assert service.error_count == 1
+        service.close()
+
+    def test_close_closes_devices_and_stops(self):
+        """close() closes every device and stops the writer thread."""
+        service, devices = make_service()
+        service.require_keys([e.KEY_A])
+        service.open_device("joystick", {e.EV_ABS: []}, name="G13 Joystick")
+
+        service.close()
+
+        assert not service.is_running
+        for ui in devices:
+            ui.close.assert_called_once()
+
+    def test_submit_after_close_is_ignored(self):
+        """Nothing is queued once the service is closed."""
+        service, devices = make_service()
+        service.close()
+
+        assert service.require_keys([e.KEY_A]) is True
+        assert devices == []
+        assert service.flush() is True
+
+
+class TestHandles:
+    """Test UInput-like handles."""
+
+    def test_keyboard_handle_writes_on_syn(self):
+        """Events are queued as one frame on syn()."""
+        service, devices = make_service()
+        handle = service.keyboard([e.KEY_A])
+
+        with patch("g13_linux.uinput_service.os.write") as mock_write:
+            handle.write(e.EV_KEY, e.KEY_A, 1)
+            service.flush()
+            mock_write.assert_not_called()
+
+            handle.syn()
+            service.flush()
+
+        assert decode(mock_write.call_args[0][1]) == [(e.EV_KEY, e.KEY_A, 1), SYN]
+        handle.close()
+        service.flush()
+        devices[0].close.assert_not_called()
+        service.close()
+
+    def test_owned_handle_close_removes_device(self):
+        """Closing a handle from open_device() closes that device."""
+        service, devices = make_service()
+        handle = service.open_device("joystick", {e.EV_ABS: []}, name="G13 Joystick")
+
+        handle.close()
+        service.flush()
+
+        devices[0].close.assert_called_once()
+        assert devices[0].options == {"name": "G13 Joystick"}
+        service.close()
+
+    def test_keyboard_constant(self):
+        """Keyboard handles target the shared keyboard device."""
+        service, _ = make_service()
+
+        assert service.keyboard()._device == KEYBOARD
+        service.close()
+
+
+class TestRecordingOutput:
+    """Test the recording stand-in used for replays."""
+
+    def test_records_handle_writes(self):
+        """Events written through a handle are recorded without SYN_REPORT."""
+        output = RecordingOutput()
+        handle = output.keyboard([e.KEY_A])
+        handle.write(e.EV_KEY, e.KEY_A, 1)
+        handle.syn()
+        output.write_events([(e.EV_KEY, e.KEY_A, 0)])
+
+        assert output.events == [(KEYBOARD, e.EV_KEY, e.KEY_A, 1), (KEYBOARD, e.EV_KEY, e.KEY_A, 0)]
+        assert output.write_count == 2
+        assert output.flush() is True
+
+    def test_require_keys_grows(self):
+        """require_keys() reports growth like the real service."""
+        output = RecordingOutput()
+
+        assert output.require_keys([e.KEY_A]) is True
+        assert output.require_keys([e.KEY_A]) is False
+        assert output.keys == {e.KEY_A}
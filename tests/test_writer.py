@@ -0,0 +1,185 @@
+"""Tests for the latest-value writer thread."""
+
+import threading
+import time
+
+from g13_linux.hardware.writer import LatestValueWriter
+
+
+class BlockingSink:
+    """Sink that records values and can be held mid-write."""
+
+    def __init__(self):
+        self.values = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, value):
+        self.entered.set()
+        self.release.wait(2.0)
+        self.values.append(value)
+
+
+class TestLatestValueWriter:
+    """Test the one-slot mailbox."""
+
+    def test_values_are_delivered(self):
+        """Submitted values reach the sink on the writer thread."""
+        threads = []
+        writer = LatestValueWriter(lambda v: threads.append(threading.current_thread().name))
+        writer.start()
+
+        writer.submit(1)
+        assert writer.flush()
+
+        assert threads == ["Writer"]
+        assert writer.written == 1
+        writer.stop()
+        assert not writer.is_running
+
+    def test_newer_value_replaces_unsent(self):
+        """While the sink is busy only the newest value is kept."""
+        sink = BlockingSink()
+        writer = LatestValueWriter(sink)
+        writer.start()
+
+        sink.release.clear()
+        writer.submit("a")
+        assert sink.entered.wait(1.0)
+        assert writer.submit("b") is False
+        assert writer.submit("c") is True
+        sink.release.set()
+        writer.flush()
+
+        assert sink.values == ["a", "c"]
+        assert writer.dropped == 1
+        assert writer.submitted == 3
+        writer.stop()
+
+    def test_merge(self):
+        """merge() decides what replaces an unsent value."""
+        sink = BlockingSink()
+        writer = LatestValueWriter(sink, merge=lambda old, new: old + new)
+        writer.start()
+
+        sink.release.clear()
+        writer.submit([0])
+        sink.entered.wait(1.0)
+        writer.submit([1])
+        writer.submit([2])
+        sink.release.set()
+        writer.flush()
+
+        assert sink.values == [[0], [1, 2]]
+        writer.stop()
+
+    def test_submit_does_not_block(self):
+        """A stalled sink never blocks the producer."""
+        sink = BlockingSink()
+        writer = LatestValueWriter(sink)
+        writer.start()
+        sink.release.clear()
+
+        for i in range(100):
+            writer.submit(i)
+
+        assert writer.flush(timeout=0.01) is False
+        sink.release.set()
+        assert writer.flush()
+        assert sink.values[-1] == 99
+        writer.stop()
+
+    def test_stop_writes_pending_value(self):
+        """stop() delivers the value still in the mailbox."""
+        sink = BlockingSink()
+        writer = LatestValueWriter(sink)
+        writer.start()
+        sink.release.clear()
+        writer.submit("a")
+        sink.entered.wait(1.0)
+        writer.submit("last")
+
+        sink.release.set()
+        writer.stop()
+
+        assert sink.values == ["a", "last"]
+
+    def test_sink_error_is_counted(self):
+        """A failing sink is counted and the writer keeps going."""
+        calls = []
+
+        def sink(value):
+            calls.append(value)
+            if value == "bad":
+                raise OSError("USB error")
+
+        writer = LatestValueWriter(sink)
+        writer.start()
+        writer.submit("bad")
+        writer.flush()
+        writer.submit("good")
+        writer.flush()
+
+        assert calls == ["bad", "good"]
+        assert writer.errors == 1
+        assert writer.written == 1
+        writer.stop()
+
+    def test_stats(self):
+        """Latency is recorded for written values."""
+        writer = LatestValueWriter(lambda v: None)
+        writer.start()
+        writer.submit(1)
+        writer.flush()
+        writer.stop()
+
+        stats = writer.stats()
+        assert stats["written"] == 1
+        assert stats["dropped"] == 0
+        assert stats["max_latency_ms"] >= stats["avg_latency_ms"] >= 0
+
+    def test_flush_without_thread(self):
+        """flush() reports an unsent value when no thread is running."""
+        writer = LatestValueWriter(lambda v: None)
+
+        assert writer.flush() is True
+        writer.submit(1)
+        assert writer.flush() is False
+
+    def test_min_interval_merges_bursts(self):
+        """Values submitted during the rate limit collapse into the newest."""
+        times = []
+        values = []
+
+        def sink(value):
+            times.append(time.monotonic())
+            values.append(value)
+
+        writer = LatestValueWriter(sink, min_interval=0.1)
+        writer.start()
+        writer.submit(1)
+        assert writer.flush()
+
+        for value in (2, 3, 4):
+            writer.submit(value)
+        assert writer.flush()
+        writer.stop()
+
+        assert values == [1, 4]
+        assert times[1] - times[0] >= 0.09
+
+    def test_stop_skips_rate_limit(self):
+        """stop() writes the pending value without waiting out the interval."""
+        sink = BlockingSink()
+        writer = LatestValueWriter(sink, min_interval=5.0)
+        writer.start()
+        writer.submit(1)
+        writer.flush()
+        writer.submit(2)
+
+        start = time.monotonic()
+        writer.stop()
+
+        assert sink.values == [1, 2]
+        assert time.monotonic() - start < 1.0